@@ -10,6 +10,7 @@ class Settings(BaseSettings):
     kiwoom_app_key: Optional[str] = None
     kiwoom_secret_key: Optional[str] = None
     kiwoom_env: Literal["dev", "prod"] = "dev"
+    kiwoom_hedge_quotes: bool = False
 
     # DART API settings
     dart_auth_key: Optional[str] = None
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
 import pandas as pd
+from cluefin_openapi import HedgePolicy
 from cluefin_openapi.kiwoom._auth import Auth as KiwoomAuth
 from cluefin_openapi.kiwoom._client import Client as KiwoomClient
 from pydantic import SecretStr
@@ -36,6 +37,7 @@ class DomesticDataFetcher:
         self.kiwoom_client = KiwoomClient(
             token=token.get_token(),
             env=settings.kiwoom_env,
+            hedge_policy=HedgePolicy() if settings.kiwoom_hedge_quotes else None,
         )
 
     # ──────────────────────────────────────
@@ -0,0 +1,130 @@
+"""Concurrent batch execution of many commands in one process.
+
+Each input line is one JSON object:
+
+    {"id": "q1", "command": "kis stock current-price", "params": {"stock_code": "005930"}}
+
+`command` is the broker-first CLI path, either as a string or a list of
+segments. Commands run on a thread pool over the registry's shared broker
+sessions, so each broker client (and its rate limiter) is created once and
+every request still waits for its broker's rate-limit tokens. Results are
+written as compact JSON lines in completion order, tagged with the input id.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from cluefin_openapi_cli.output import to_jsonable
+from cluefin_openapi_cli.registry import CommandSpec, RegistryProtocol
+
+DEFAULT_CONCURRENCY = 8
+
+
+class BatchItemError(Exception):
+    """Raised when one batch line cannot be resolved to a command."""
+
+
+@dataclass(slots=True)
+class BatchSummary:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+
+
+def _resolve_item(registry: RegistryProtocol, item: Any) -> tuple[CommandSpec, dict[str, Any]]:
+    if not isinstance(item, dict):
+        raise BatchItemError("Batch item must be a JSON object.")
+
+    raw_command = item.get("command")
+    if isinstance(raw_command, str):
+        path = tuple(raw_command.split())
+    elif isinstance(raw_command, list) and all(isinstance(segment, str) for segment in raw_command):
+        path = tuple(raw_command)
+    else:
+        raise BatchItemError("`command` must be a CLI path string or a list of path segments.")
+
+    command = registry.resolve_command(path)
+    if command is None:
+        raise BatchItemError(f"Unknown command path: {' '.join(path)}")
+
+    params = item.get("params", {})
+    if not isinstance(params, dict):
+        raise BatchItemError("`params` must be an object.")
+    missing = [key for key in command.parameters.get("required", []) if params.get(key) is None]
+    if missing:
+        raise BatchItemError(f"Missing required parameters: {', '.join(missing)}")
+    return command, params
+
+
+def _error_record(item_id: Any, exc: Exception, command: CommandSpec | None = None) -> dict[str, Any]:
+    error: dict[str, Any] = {"type": type(exc).__name__, "message": str(exc)}
+    if command is not None:
+        error["command"] = command.qualified_name
+    return {"id": item_id, "ok": False, "error": error}
+
+
+def run_batch(
+    lines: Iterable[str],
+    *,
+    registry: RegistryProtocol,
+    write: Callable[[str], None],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> BatchSummary:
+    """Run every command in `lines` and write one JSON result line per input line.
+
+    Lines without an `id` are tagged with their 1-based line number. Blank
+    lines are skipped. Records are written from worker threads under a lock,
+    so `write` only needs to handle whole lines.
+    """
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    summary = BatchSummary()
+    write_lock = threading.Lock()
+    # Bound queued work so large inputs are read incrementally instead of all at once.
+    slots = threading.BoundedSemaphore(concurrency * 2)
+
+    def emit(record: dict[str, Any]) -> None:
+        text = json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+        with write_lock:
+            if record["ok"]:
+                summary.succeeded += 1
+            else:
+                summary.failed += 1
+            write(text + "\n")
+
+    def execute(item_id: Any, command: CommandSpec, params: dict[str, Any]) -> None:
+        try:
+            result = registry.invoke_command(command, params)
+            record = {"id": item_id, "ok": True, "command": command.qualified_name, "result": to_jsonable(result)}
+        except Exception as exc:
+            record = _error_record(item_id, exc, command)
+        try:
+            emit(record)
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cluefin-batch") as executor:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            summary.total += 1
+            item_id: Any = line_number
+            try:
+                item = json.loads(line)
+                if isinstance(item, dict):
+                    item_id = item.get("id", line_number)
+                command, params = _resolve_item(registry, item)
+            except (ValueError, BatchItemError) as exc:
+                emit(_error_record(item_id, exc))
+                continue
+            slots.acquire()
+            executor.submit(execute, item_id, command, params)
+
+    return summary
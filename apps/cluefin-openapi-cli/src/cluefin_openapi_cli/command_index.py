@@ -0,0 +1,130 @@
+"""Precomputed command index so discovery never imports handler modules.
+
+`command_index.json` holds every command's path, schemas, and agent metadata
+plus a `module:function` reference to its handler. `RpcRegistry` serves
+`list`, `describe`, `domains`, and help from it and imports only the handler
+module of the command being invoked.
+
+The index carries a fingerprint of the handler, registry, and metadata sources. When the
+sources change without regenerating it, it is ignored and the registry falls
+back to importing every handler. Regenerate it with:
+
+    uv run python -m cluefin_openapi_cli.command_index
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+from cluefin_openapi_cli.registry import CommandSpec
+
+INDEX_VERSION = 1
+INDEX_PATH = Path(__file__).with_name("command_index.json")
+
+_PACKAGE_DIR = Path(__file__).parent
+
+
+# Modules outside `handlers/` that shape the index: spec construction, agent metadata, and serialization.
+_INDEX_MODULES = ("command_index.py", "metadata.py", "registry.py")
+
+
+def _source_files() -> list[Path]:
+    return [*sorted((_PACKAGE_DIR / "handlers").rglob("*.py")), *(_PACKAGE_DIR / name for name in _INDEX_MODULES)]
+
+
+def source_fingerprint() -> str:
+    """Hash the sources that determine the index content."""
+
+    digest = hashlib.sha256()
+    for path in _source_files():
+        digest.update(path.relative_to(_PACKAGE_DIR).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_command_index() -> dict[str, Any]:
+    """Import every handler and serialize the resulting command specs."""
+
+    from cluefin_openapi_cli.registry import build_cli_registry
+
+    commands = []
+    for spec in build_cli_registry().values():
+        executor = spec.executor
+        commands.append(
+            {
+                "broker": spec.broker,
+                "category": spec.category,
+                "name": spec.name,
+                "description": spec.description,
+                "path_segments": list(spec.path_segments),
+                "parameters": spec.parameters,
+                "returns": spec.returns,
+                "domains": list(spec.domains),
+                "tags": list(spec.tags),
+                "use_cases": list(spec.use_cases),
+                "examples": list(spec.examples),
+                "agent_notes": spec.agent_notes,
+                "required_credentials": list(spec.required_credentials),
+                "side_effect": spec.side_effect,
+                "handler": f"{executor.__module__}:{executor.__qualname__}" if executor is not None else None,
+            }
+        )
+    return {"version": INDEX_VERSION, "fingerprint": source_fingerprint(), "commands": commands}
+
+
+def write_command_index(path: Path = INDEX_PATH) -> int:
+    """Regenerate the index file and return the number of commands written."""
+
+    index = build_command_index()
+    path.write_text(json.dumps(index, ensure_ascii=False, indent=1) + "\n", encoding="utf-8")
+    return len(index["commands"])
+
+
+def load_command_index(path: Path = INDEX_PATH) -> dict[tuple[str, ...], CommandSpec] | None:
+    """Return command specs from the index, or None when it is missing or stale."""
+
+    try:
+        index = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION or index.get("fingerprint") != source_fingerprint():
+        return None
+
+    registry: dict[tuple[str, ...], CommandSpec] = {}
+    for entry in index["commands"]:
+        path_segments = tuple(entry["path_segments"])
+        registry[path_segments] = CommandSpec(
+            broker=entry["broker"],
+            category=entry["category"],
+            name=entry["name"],
+            description=entry["description"],
+            path_segments=path_segments,
+            parameters=entry["parameters"],
+            returns=entry["returns"],
+            domains=tuple(entry["domains"]),
+            tags=tuple(entry["tags"]),
+            use_cases=tuple(entry["use_cases"]),
+            examples=tuple(entry["examples"]),
+            agent_notes=entry["agent_notes"],
+            required_credentials=tuple(entry["required_credentials"]),
+            side_effect=entry["side_effect"],
+            handler=entry["handler"],
+        )
+    return registry
+
+
+def load_handler(reference: str) -> Callable[..., Any]:
+    """Import one handler from its `module:function` reference."""
+
+    module_name, _, attribute = reference.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+if __name__ == "__main__":
+    sys.stdout.write(f"Wrote {write_command_index()} commands to {INDEX_PATH}\n")
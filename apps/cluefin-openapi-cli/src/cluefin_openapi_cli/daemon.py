@@ -0,0 +1,373 @@
+"""Long-lived daemon that serves CLI commands over a Unix socket.
+
+`serve` keeps one registry and its authenticated broker clients (and their
+HTTP connection pools) warm. The console entry point `launch` forwards each
+invocation to a running daemon and falls back to in-process execution only
+when none accepts the connection; once a request is sent, failures are
+reported instead of running the command a second time. This module stays
+import-light so forwarding never pays for the registry or broker SDK imports.
+
+Broker credentials come from the environment and `.env` in the working
+directory, so every `run` request carries a fingerprint of the caller's broker
+settings. The daemon refuses a request whose fingerprint differs from its own
+and `launch` then runs the command in-process under the caller's settings.
+
+Wire protocol: one connection per request and one JSON line per message.
+`run` answers with `{"stream": "stdout"|"stderr", "data": ...}` frames as the
+command writes each line, followed by one final response carrying `exit_code`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+SOCKET_ENV = "CLUEFIN_OPENAPI_CLI_SOCKET"
+DISABLE_ENV = "CLUEFIN_OPENAPI_CLI_NO_DAEMON"
+
+_CONNECT_TIMEOUT = 0.5
+# Commands that must run in the calling process: `serve` starts the daemon and `batch` reads the caller's stdin.
+_LOCAL_COMMANDS = frozenset({"serve", "batch"})
+_MAX_REQUEST_BYTES = 16 * 1024 * 1024
+# Settings `BrokerClientConfig.from_env` reads; kept here so forwarding never imports the broker SDK.
+_BROKER_CONFIG_KEYS = (
+    "KIS_APP_KEY",
+    "KIS_SECRET_KEY",
+    "KIS_ENV",
+    "KIWOOM_APP_KEY",
+    "KIWOOM_SECRET_KEY",
+    "KIWOOM_ENV",
+    "DART_AUTH_KEY",
+    "CLUEFIN_OPENAPI_CACHE_DIR",
+    "CLUEFIN_OPENAPI_DEBUG",
+)
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be started or fails after accepting a request."""
+
+
+def default_socket_path() -> str:
+    """Return the per-user socket path, honoring `CLUEFIN_OPENAPI_CLI_SOCKET`."""
+
+    configured = os.environ.get(SOCKET_ENV)
+    if configured:
+        return str(Path(configured).expanduser())
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    user = os.getuid() if hasattr(os, "getuid") else os.environ.get("USERNAME", "user")
+    return str(Path(runtime_dir) / f"cluefin-openapi-cli-{user}.sock")
+
+
+def _connect(path: str) -> socket.socket | None:
+    """Return a socket connected to the daemon, or None when nothing accepts on `path`."""
+
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _messages(sock: socket.socket, payload: dict[str, Any], *, timeout: float | None) -> Iterator[dict[str, Any]]:
+    """Send `payload` and yield each reply line; any failure after connecting raises `DaemonError`."""
+
+    try:
+        sock.settimeout(timeout)
+        sock.sendall(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            while True:
+                line = reader.readline()
+                if not line:
+                    raise DaemonError("Daemon closed the connection before replying.")
+                try:
+                    message = json.loads(line)
+                except ValueError as exc:
+                    raise DaemonError("Daemon sent a malformed reply.") from exc
+                if not isinstance(message, dict):
+                    raise DaemonError("Daemon sent a malformed reply.")
+                yield message
+    except OSError as exc:
+        raise DaemonError(f"Daemon request failed: {exc}") from exc
+
+
+def broker_config_fingerprint() -> str:
+    """Hash the broker settings a command in this process would run with.
+
+    Covers the broker environment variables and the `.env` file in the working directory,
+    which `BrokerClientConfig.from_env` merges; any difference means a different account
+    or environment may be used.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps({key: os.environ.get(key) for key in _BROKER_CONFIG_KEYS}, sort_keys=True).encode())
+    dotenv = Path.cwd() / ".env"
+    if dotenv.is_file():
+        digest.update(b"\0")
+        digest.update(dotenv.read_bytes())
+    return digest.hexdigest()
+
+
+def _request(path: str, payload: dict[str, Any], *, timeout: float | None) -> dict[str, Any] | None:
+    """Send one request and return its reply; return None when no daemon accepts on `path`."""
+
+    sock = _connect(path)
+    if sock is None:
+        return None
+    try:
+        return next(_messages(sock, payload, timeout=timeout))
+    finally:
+        sock.close()
+
+
+def _stdout_is_tty() -> bool:
+    try:
+        return sys.stdout.isatty()
+    except Exception:
+        return False
+
+
+def forward(argv: list[str], socket_path: str | None = None) -> int | None:
+    """Run `argv` on the daemon and stream its output; return None if no daemon is available.
+
+    None is also returned when the daemon runs with different broker settings, since the
+    command has not started then. Once the daemon has accepted the command it may already
+    be running, so a failure from then on is reported on stderr with exit code 1.
+    """
+
+    if os.environ.get(DISABLE_ENV, "").lower() in {"1", "true", "yes", "on"}:
+        return None
+
+    sock = _connect(socket_path or default_socket_path())
+    if sock is None:
+        return None
+
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    request = {"op": "run", "argv": argv, "tty": _stdout_is_tty(), "config": broker_config_fingerprint()}
+    try:
+        for message in _messages(sock, request, timeout=None):
+            stream = streams.get(message.get("stream", ""))
+            if stream is not None:
+                stream.write(str(message.get("data", "")))
+                stream.flush()
+            elif "exit_code" in message:
+                return int(message["exit_code"])
+            elif message.get("config_mismatch"):
+                return None
+            else:
+                raise DaemonError(str(message.get("error") or "Daemon sent an unexpected reply."))
+    except DaemonError as exc:
+        sys.stderr.write(f"cluefin-openapi-cli: {exc}\n")
+        return 1
+    finally:
+        sock.close()
+    return 1
+
+
+def launch(argv: list[str] | None = None) -> None:
+    """Console entry point: forward to the daemon when it is running, else run in-process."""
+
+    args = list(sys.argv[1:] if argv is None else argv)
+    if not args or args[0] not in _LOCAL_COMMANDS:
+        exit_code = forward(args)
+        if exit_code is not None:
+            raise SystemExit(exit_code)
+
+    from cluefin_openapi_cli.main import main
+
+    main(args)
+
+
+def daemon_status(socket_path: str | None = None) -> dict[str, Any]:
+    """Return whether a daemon answers on the socket, with its runtime counters."""
+
+    path = socket_path or default_socket_path()
+    try:
+        response = _request(path, {"op": "ping"}, timeout=_CONNECT_TIMEOUT)
+    except DaemonError as exc:
+        return {"running": False, "socket": path, "error": str(exc)}
+    status: dict[str, Any] = {"running": response is not None, "socket": path}
+    if response is not None:
+        status.update({key: value for key, value in response.items() if key != "ok"})
+    return status
+
+
+def stop_daemon(socket_path: str | None = None) -> bool:
+    """Ask a running daemon to shut down; return False if none was running."""
+
+    path = socket_path or default_socket_path()
+    return _request(path, {"op": "shutdown"}, timeout=_CONNECT_TIMEOUT) is not None
+
+
+def _connect_probe(path: str) -> bool:
+    sock = _connect(path)
+    if sock is None:
+        return False
+    sock.close()
+    return True
+
+
+class _ForwardingStream(io.TextIOBase):
+    """Text stream that sends each completed line to the client as soon as it is written."""
+
+    def __init__(self, name: str, send: Callable[[dict[str, Any]], None], *, tty: bool) -> None:
+        super().__init__()
+        self._name = name
+        self._send = send
+        self._tty = tty
+        self._pending = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def write(self, text: str) -> int:
+        self._pending += text
+        head, newline, tail = self._pending.rpartition("\n")
+        if newline:
+            self._pending = tail
+            self._send({"stream": self._name, "data": head + newline})
+        return len(text)
+
+    def flush(self) -> None:
+        if self._pending:
+            data, self._pending = self._pending, ""
+            self._send({"stream": self._name, "data": data})
+
+
+class _DaemonServer(socketserver.UnixStreamServer):
+    """Serial Unix socket server; `run_cli` swaps process-wide stdio, so requests never overlap."""
+
+    def __init__(self, path: str, config_fingerprint: str) -> None:
+        super().__init__(path, _DaemonRequestHandler)
+        self.started_at = time.time()
+        self.commands_served = 0
+        self.config_fingerprint = config_fingerprint
+
+    def request_shutdown(self) -> None:
+        threading.Thread(target=self.shutdown, daemon=True).start()
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    server: _DaemonServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline(_MAX_REQUEST_BYTES)
+        try:
+            request = json.loads(line)
+        except ValueError:
+            request = None
+        if not isinstance(request, dict):
+            self._respond({"ok": False, "error": "Malformed request."})
+            return
+
+        op = request.get("op")
+        if op == "ping":
+            self._respond(
+                {
+                    "ok": True,
+                    "pid": os.getpid(),
+                    "started_at": self.server.started_at,
+                    "commands_served": self.server.commands_served,
+                }
+            )
+        elif op == "shutdown":
+            self._respond({"ok": True})
+            self.server.request_shutdown()
+        elif op == "run":
+            self._respond(self._run(request))
+        else:
+            self._respond({"ok": False, "error": f"Unknown op `{op}`."})
+
+    def _run(self, request: dict[str, Any]) -> dict[str, Any]:
+        from cluefin_openapi_cli.main import run_cli
+
+        argv = request.get("argv")
+        if not isinstance(argv, list) or not all(isinstance(item, str) for item in argv):
+            return {"ok": False, "error": "`argv` must be a list of strings."}
+        if argv and argv[0] in _LOCAL_COMMANDS:
+            return {"ok": False, "error": f"`{argv[0]}` cannot be forwarded to the daemon."}
+        if request.get("config") != self.server.config_fingerprint:
+            return {
+                "ok": False,
+                "config_mismatch": True,
+                "error": "Broker settings differ from the daemon's; run the command in-process.",
+            }
+
+        tty = bool(request.get("tty", False))
+        stdout = _ForwardingStream("stdout", self._respond, tty=tty)
+        stderr = _ForwardingStream("stderr", self._respond, tty=tty)
+        result = run_cli(argv, tty=tty, stdout=stdout, stderr=stderr)
+        stdout.flush()
+        stderr.flush()
+        self.server.commands_served += 1
+        return {"ok": True, "exit_code": result.exit_code}
+
+    def _respond(self, payload: dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+def serve(socket_path: str | None = None) -> None:
+    """Warm the registry and broker clients, then serve commands until stopped."""
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonError("Daemon mode requires Unix domain socket support.")
+
+    from cluefin_openapi_cli.registry import get_registry
+
+    path = socket_path or default_socket_path()
+    if os.path.exists(path):
+        if _connect_probe(path):
+            raise DaemonError(f"A daemon is already listening on {path}.")
+        os.unlink(path)
+
+    # The warmed clients are built from these settings; forwarded commands must match them.
+    config_fingerprint = broker_config_fingerprint()
+    registry = get_registry()
+    warmed = registry.warm() if hasattr(registry, "warm") else []
+
+    # Only the owning user may connect: the daemon runs commands with their broker credentials.
+    previous_umask = os.umask(0o177)
+    try:
+        server = _DaemonServer(path, config_fingerprint)
+    finally:
+        os.umask(previous_umask)
+
+    in_main_thread = threading.current_thread() is threading.main_thread()
+    if in_main_thread:
+        previous_sigterm = signal.signal(signal.SIGTERM, lambda *_: server.request_shutdown())
+    sys.stderr.write(f"cluefin-openapi-cli daemon listening on {path} (warm brokers: {', '.join(warmed) or '-'})\n")
+    sys.stderr.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if in_main_thread:
+            signal.signal(signal.SIGTERM, previous_sigterm)
+        server.server_close()
+        if hasattr(registry, "close"):
+            registry.close()
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
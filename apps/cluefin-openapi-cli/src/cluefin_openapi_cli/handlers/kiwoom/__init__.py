@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from cluefin_openapi_cli.handlers.kiwoom.domestic_chart import _ALL_HANDLERS as CHART_HANDLERS
-from cluefin_openapi_cli.handlers.kiwoom.domestic_etf import _ALL_HANDLERS as ETF_HANDLERS
-from cluefin_openapi_cli.handlers.kiwoom.domestic_foreign import _ALL_HANDLERS as FOREIGN_HANDLERS
-from cluefin_openapi_cli.handlers.kiwoom.domestic_market_condition import _ALL_HANDLERS as MARKET_CONDITION_HANDLERS
-from cluefin_openapi_cli.handlers.kiwoom.domestic_rank_info import _ALL_HANDLERS as RANK_INFO_HANDLERS
-from cluefin_openapi_cli.handlers.kiwoom.domestic_sector import _ALL_HANDLERS as SECTOR_HANDLERS
-from cluefin_openapi_cli.handlers.kiwoom.domestic_stock_info import _ALL_HANDLERS as STOCK_INFO_HANDLERS
-from cluefin_openapi_cli.handlers.kiwoom.domestic_theme import _ALL_HANDLERS as THEME_HANDLERS
-
 
 def get_kiwoom_handlers():
+    # Imported on demand so invoking one command only loads that command's module.
+    from cluefin_openapi_cli.handlers.kiwoom.domestic_chart import _ALL_HANDLERS as CHART_HANDLERS
+    from cluefin_openapi_cli.handlers.kiwoom.domestic_etf import _ALL_HANDLERS as ETF_HANDLERS
+    from cluefin_openapi_cli.handlers.kiwoom.domestic_foreign import _ALL_HANDLERS as FOREIGN_HANDLERS
+    from cluefin_openapi_cli.handlers.kiwoom.domestic_market_condition import _ALL_HANDLERS as MARKET_CONDITION_HANDLERS
+    from cluefin_openapi_cli.handlers.kiwoom.domestic_rank_info import _ALL_HANDLERS as RANK_INFO_HANDLERS
+    from cluefin_openapi_cli.handlers.kiwoom.domestic_sector import _ALL_HANDLERS as SECTOR_HANDLERS
+    from cluefin_openapi_cli.handlers.kiwoom.domestic_stock_info import _ALL_HANDLERS as STOCK_INFO_HANDLERS
+    from cluefin_openapi_cli.handlers.kiwoom.domestic_theme import _ALL_HANDLERS as THEME_HANDLERS
+
     return [
         *CHART_HANDLERS,
         *ETF_HANDLERS,
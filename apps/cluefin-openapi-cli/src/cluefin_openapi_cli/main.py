@@ -5,10 +5,10 @@ import json
 import sys
 from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, TextIO
 
 from cluefin_openapi_cli.metadata import build_taxonomy_entry
-from cluefin_openapi_cli.output import render_output, stdout_is_tty, to_jsonable
+from cluefin_openapi_cli.output import render_ndjson, render_output, stdout_is_tty, to_jsonable
 from cluefin_openapi_cli.recipes import get_recipe, recipe_summaries
 from cluefin_openapi_cli.registry import CommandSpec, get_registry
 
@@ -45,12 +45,12 @@ def _command_summary(command: CommandSpec) -> dict[str, Any]:
         "agent_notes": command.agent_notes,
         "required_credentials": list(command.required_credentials),
         "side_effect": command.side_effect,
-        "has_executor": command.executor is not None,
+        "has_executor": command.executor is not None or command.handler is not None,
     }
 
 
 def _json_requested(argv: list[str]) -> bool:
-    return "--json" in argv or not stdout_is_tty()
+    return "--json" in argv or "--ndjson" in argv or not stdout_is_tty()
 
 
 def _write_stderr(message: str) -> None:
@@ -123,7 +123,7 @@ def _parse_named_options(argv: list[str]) -> tuple[list[str], dict[str, str | bo
             index += 1
             continue
 
-        if token in {"--json", "--help"}:
+        if token in {"--json", "--help", "--ndjson"}:
             options[token[2:].replace("-", "_")] = True
             index += 1
             continue
@@ -192,6 +192,7 @@ def _render_leaf_help(command: CommandSpec, *, force_json: bool) -> None:
             "command": _command_summary(command),
             "options": options,
             "supports_params_json": True,
+            "supports_ndjson": True,
         },
         force_json=force_json,
     )
@@ -238,7 +239,7 @@ def _run_root(argv: list[str]) -> None:
         "app": "cluefin-openapi-cli",
         "interactive": stdout_is_tty(),
         "brokers": list(registry.iter_brokers()),
-        "commands": ["list", "describe", "domains", "tags", "recipes", "recipe"],
+        "commands": ["list", "describe", "domains", "tags", "recipes", "recipe", "batch", "serve"],
     }
     if bool(options.get("help", False)):
         payload["usage"] = [
@@ -250,8 +251,11 @@ def _run_root(argv: list[str]) -> None:
             "cluefin-openapi-cli tags [--json]",
             "cluefin-openapi-cli recipes [--json]",
             "cluefin-openapi-cli recipe <name> [--json]",
-            "cluefin-openapi-cli <broker> <category> <name> [--params-json JSON] [schema options] [--json]",
-            "cluefin-openapi-cli dart <name> [--params-json JSON] [schema options] [--json]",
+            "cluefin-openapi-cli recipe run <name> [--<input> VALUE ...] [--concurrency N] [--json]",
+            "cluefin-openapi-cli batch [--input FILE] [--concurrency N]",
+            "cluefin-openapi-cli serve [start|status|stop] [--socket PATH] [--json]",
+            "cluefin-openapi-cli <broker> <category> <name> [--params-json JSON] [schema options] [--json|--ndjson]",
+            "cluefin-openapi-cli dart <name> [--params-json JSON] [schema options] [--json|--ndjson]",
         ]
     render_output(payload, force_json=force_json)
 
@@ -301,6 +305,9 @@ def _run_recipes(argv: list[str]) -> None:
 
 def _run_recipe(argv: list[str]) -> None:
     positional, options = _parse_named_options(argv)
+    if positional and positional[0] == "run":
+        _run_recipe_run(positional[1:], options)
+        return
     if len(positional) != 1:
         raise CliError("Usage: recipe <name>.", exit_code=2)
 
@@ -311,6 +318,100 @@ def _run_recipe(argv: list[str]) -> None:
     render_output({"recipe": to_jsonable(recipe)}, force_json=bool(options.get("json", False)))
 
 
+def _run_recipe_run(positional: list[str], options: dict[str, str | bool]) -> None:
+    from cluefin_openapi_cli.recipe_runner import DEFAULT_CONCURRENCY, RecipeRunError, run_recipe
+
+    if len(positional) != 1:
+        raise CliError(
+            "Usage: recipe run <name> [--<input> VALUE ...] [--params-json JSON] [--concurrency N].", exit_code=2
+        )
+
+    recipe = get_recipe(positional[0])
+    if recipe is None:
+        raise CliError(f"Unknown recipe `{positional[0]}`.", exit_code=2)
+
+    force_json = bool(options.pop("json", False))
+    raw_concurrency = options.pop("concurrency", str(DEFAULT_CONCURRENCY))
+    try:
+        concurrency = int(raw_concurrency)
+    except (TypeError, ValueError) as exc:
+        raise CliError(f"Invalid integer value `{raw_concurrency}`.", exit_code=2) from exc
+    if concurrency < 1:
+        raise CliError("`--concurrency` must be at least 1.", exit_code=2)
+
+    params_json = options.pop("params_json", None)
+    inputs = _load_params_json(params_json if isinstance(params_json, str) else None)
+    inputs.update({name: value for name, value in options.items() if not isinstance(value, bool)})
+
+    try:
+        document = run_recipe(recipe, inputs, registry=get_registry(), concurrency=concurrency)
+    except RecipeRunError as exc:
+        raise CliError(str(exc), exit_code=2, data=exc.data) from exc
+
+    render_output(document, force_json=force_json)
+    if not document["ok"]:
+        raise SystemExit(1)
+
+
+def _run_batch(argv: list[str]) -> None:
+    from cluefin_openapi_cli.batch import DEFAULT_CONCURRENCY, run_batch
+
+    positional, options = _parse_named_options(argv)
+    if positional:
+        raise CliError("Usage: batch [--input FILE] [--concurrency N].", exit_code=2)
+
+    raw_concurrency = options.get("concurrency", str(DEFAULT_CONCURRENCY))
+    try:
+        concurrency = int(raw_concurrency)
+    except (TypeError, ValueError) as exc:
+        raise CliError(f"Invalid integer value `{raw_concurrency}`.", exit_code=2) from exc
+    if concurrency < 1:
+        raise CliError("`--concurrency` must be at least 1.", exit_code=2)
+
+    def write(line: str) -> None:
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+    input_path = options.get("input")
+    if not isinstance(input_path, str) or input_path == "-":
+        summary = run_batch(sys.stdin, registry=get_registry(), write=write, concurrency=concurrency)
+    else:
+        try:
+            handle = open(input_path, encoding="utf-8")
+        except OSError as exc:
+            raise CliError(f"Cannot read batch input `{input_path}`: {exc.strerror}.", exit_code=2) from exc
+        with handle:
+            summary = run_batch(handle, registry=get_registry(), write=write, concurrency=concurrency)
+
+    # Per-command errors are already in the result stream; keep stdout pure JSONL.
+    if summary.failed:
+        _write_stderr(f"{summary.failed} of {summary.total} batch commands failed.")
+        raise SystemExit(1)
+
+
+def _run_serve(argv: list[str]) -> None:
+    from cluefin_openapi_cli import daemon
+
+    positional, options = _parse_named_options(argv)
+    if len(positional) > 1 or (positional and positional[0] not in {"start", "status", "stop"}):
+        raise CliError("Usage: serve [start|status|stop] [--socket PATH].", exit_code=2)
+
+    action = positional[0] if positional else "start"
+    socket_option = options.get("socket")
+    socket_path = socket_option if isinstance(socket_option, str) else None
+    force_json = bool(options.get("json", False))
+
+    try:
+        if action == "status":
+            render_output(daemon.daemon_status(socket_path), force_json=force_json)
+        elif action == "stop":
+            render_output({"stopped": daemon.stop_daemon(socket_path)}, force_json=force_json)
+        else:
+            daemon.serve(socket_path)
+    except daemon.DaemonError as exc:
+        raise CliError(str(exc)) from exc
+
+
 def _run_describe(argv: list[str]) -> None:
     positional, options = _parse_named_options(argv)
     force_json = bool(options.get("json", False))
@@ -395,6 +496,7 @@ def _run_dynamic(argv: list[str]) -> None:
         _render_leaf_help(command, force_json=bool(options.get("json", False)))
         return
 
+    ndjson = bool(options.pop("ndjson", False))
     force_json, params = _merge_params(command, options)
     try:
         result = registry.invoke_command(command, params)
@@ -403,6 +505,9 @@ def _run_dynamic(argv: list[str]) -> None:
             f"Command `{command.qualified_name}` failed: {exc}",
             data={"command": command.qualified_name},
         ) from exc
+    if ndjson:
+        render_ndjson(result)
+        return
     render_output(result, force_json=force_json)
 
 
@@ -431,6 +536,12 @@ def dispatch(argv: list[str] | None = None) -> None:
     if command == "recipe":
         _run_recipe(args[1:])
         return
+    if command == "batch":
+        _run_batch(args[1:])
+        return
+    if command == "serve":
+        _run_serve(args[1:])
+        return
 
     _run_dynamic(args)
 
@@ -444,9 +555,28 @@ def main(argv: list[str] | None = None) -> None:
         raise SystemExit(exc.exit_code) from exc
 
 
-def run_cli(argv: list[str] | None = None) -> CLIResult:
-    stdout = io.StringIO()
-    stderr = io.StringIO()
+class _CapturedStream(io.StringIO):
+    """In-memory stream that reports the caller's terminal state to `stdout_is_tty`."""
+
+    def __init__(self, *, tty: bool = False) -> None:
+        super().__init__()
+        self._tty = tty
+
+    def isatty(self) -> bool:
+        return self._tty
+
+
+def run_cli(
+    argv: list[str] | None = None,
+    *,
+    tty: bool = False,
+    stdout: TextIO | None = None,
+    stderr: TextIO | None = None,
+) -> CLIResult:
+    """Run the CLI in-process, capturing its output unless `stdout`/`stderr` streams are given."""
+
+    stdout = stdout if stdout is not None else _CapturedStream(tty=tty)
+    stderr = stderr if stderr is not None else _CapturedStream(tty=tty)
     old_argv = sys.argv[:]
     sys.argv = [old_argv[0] if old_argv else "cluefin-openapi-cli", *(argv or [])]
 
@@ -460,7 +590,11 @@ def run_cli(argv: list[str] | None = None) -> CLIResult:
     finally:
         sys.argv = old_argv
 
-    return CLIResult(exit_code=exit_code, stdout=stdout.getvalue(), stderr=stderr.getvalue())
+    return CLIResult(exit_code=exit_code, stdout=_captured_text(stdout), stderr=_captured_text(stderr))
+
+
+def _captured_text(stream: TextIO) -> str:
+    return stream.getvalue() if isinstance(stream, io.StringIO) else ""
 
 
 if __name__ == "__main__":
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import json
 import sys
-from dataclasses import asdict, is_dataclass
-from typing import Any
+from collections.abc import Iterator
+from dataclasses import fields, is_dataclass
+from typing import Any, TextIO
 
 
 def stdout_is_tty() -> bool:
@@ -18,8 +19,8 @@ def stdout_is_tty() -> bool:
 def to_jsonable(value: Any) -> Any:
     """Convert dataclasses and nested objects into JSON-safe structures."""
 
-    if is_dataclass(value):
-        return {key: to_jsonable(item) for key, item in asdict(value).items()}
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: to_jsonable(getattr(value, field.name)) for field in fields(value)}
     if isinstance(value, dict):
         return {str(key): to_jsonable(item) for key, item in value.items()}
     if isinstance(value, (list, tuple)):
@@ -44,7 +45,7 @@ def render_output(payload: Any, *, force_json: bool = False, console: Any | None
     use_json = force_json or not stdout_is_tty()
 
     if use_json:
-        text = dump_json(data)
+        text = json.dumps(data, ensure_ascii=False, indent=2, default=str)
     elif isinstance(data, dict):
         rows = []
         for key, value in data.items():
@@ -55,10 +56,60 @@ def render_output(payload: Any, *, force_json: bool = False, console: Any | None
             rows.append(f"{key}: {rendered}")
         text = "\n".join(rows)
     else:
-        text = dump_json(data)
+        text = json.dumps(data, ensure_ascii=False, indent=2, default=str)
 
     if console is not None and hasattr(console, "print"):
         console.print(text)
     else:
         sys.stdout.write(text)
         sys.stdout.write("\n")
+
+
+def _row_fields(payload: Any) -> dict[str, Any] | None:
+    if isinstance(payload, dict):
+        return payload
+    if is_dataclass(payload) and not isinstance(payload, type):
+        return {field.name: getattr(payload, field.name) for field in fields(payload)}
+    model_fields = getattr(type(payload), "model_fields", None)
+    if isinstance(model_fields, dict):
+        return {name: getattr(payload, name, None) for name in model_fields}
+    return None
+
+
+def iter_rows(payload: Any) -> Iterator[Any]:
+    """Yield the row records of a command result without converting the whole payload.
+
+    Sequences and iterators yield their items. Objects with exactly one
+    list-valued field (the usual page-of-rows response) yield that list's
+    items, preceded by a ``{"_meta": {...}}`` record holding the other fields
+    when there are any, so a summary next to the rows is never dropped.
+    Anything else is a single record.
+    """
+
+    if isinstance(payload, (list, tuple, Iterator)):
+        yield from payload
+        return
+
+    values = _row_fields(payload)
+    if values is not None:
+        row_fields = [name for name, value in values.items() if isinstance(value, (list, tuple))]
+        if len(row_fields) == 1:
+            meta = {name: value for name, value in values.items() if name != row_fields[0]}
+            if meta:
+                yield {"_meta": meta}
+            yield from values[row_fields[0]]
+            return
+    yield payload
+
+
+def render_ndjson(payload: Any, *, stream: TextIO | None = None) -> int:
+    """Write one compact JSON record per row as rows are converted; return the record count."""
+
+    out = stream if stream is not None else sys.stdout
+    count = 0
+    for row in iter_rows(payload):
+        out.write(json.dumps(to_jsonable(row), ensure_ascii=False, separators=(",", ":"), default=str))
+        out.write("\n")
+        out.flush()
+        count += 1
+    return count
@@ -0,0 +1,190 @@
+"""Run workflow recipes as a dependency graph of concurrent commands.
+
+Steps that only read recipe inputs start immediately and run in parallel over
+the registry's shared broker sessions; a step that references another step's
+result (`$steps.<key>...`) starts once that step has finished. The outcome of
+every step is merged into one document.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any
+
+from cluefin_openapi_cli.output import to_jsonable
+from cluefin_openapi_cli.recipes import RecipeStep, WorkflowRecipe
+from cluefin_openapi_cli.registry import CommandSpec, RegistryProtocol
+
+DEFAULT_CONCURRENCY = 8
+
+_INPUT_PREFIX = "$input."
+_STEPS_PREFIX = "$steps."
+_MISSING = object()
+
+
+class RecipeRunError(Exception):
+    """Raised when a recipe cannot be run with the given inputs."""
+
+    def __init__(self, message: str, data: dict[str, Any] | None = None) -> None:
+        super().__init__(message)
+        self.data = data or {}
+
+
+class _SkipStep(Exception):
+    """Raised while binding a step whose required parameters are unavailable."""
+
+
+def step_dependencies(step: RecipeStep) -> tuple[str, ...]:
+    """Return the keys of the steps whose results `step` reads."""
+
+    keys = []
+    for value in step.params.values():
+        if isinstance(value, str) and value.startswith(_STEPS_PREFIX):
+            key = value[len(_STEPS_PREFIX) :].split(".", 1)[0]
+            if key not in keys:
+                keys.append(key)
+    return tuple(keys)
+
+
+def _lookup(value: Any, path: str) -> Any:
+    for part in path.split(".") if path else ():
+        if isinstance(value, dict):
+            value = value.get(part, _MISSING)
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        else:
+            return _MISSING
+        if value is _MISSING:
+            return _MISSING
+    return value
+
+
+def _bind_params(
+    step: RecipeStep,
+    command: CommandSpec,
+    inputs: dict[str, Any],
+    outputs: dict[str, Any],
+) -> dict[str, Any]:
+    required = set(command.parameters.get("required", []))
+    params: dict[str, Any] = {}
+    for name, binding in step.params.items():
+        if isinstance(binding, str) and binding.startswith(_INPUT_PREFIX):
+            value = inputs.get(binding[len(_INPUT_PREFIX) :], _MISSING)
+        elif isinstance(binding, str) and binding.startswith(_STEPS_PREFIX):
+            key, _, path = binding[len(_STEPS_PREFIX) :].partition(".")
+            value = _lookup(outputs[key], path)
+        else:
+            value = binding
+
+        if value is _MISSING or value is None:
+            if name in required:
+                raise _SkipStep(f"`{name}` is unavailable: `{binding}` did not resolve.")
+            continue
+        params[name] = value
+    return params
+
+
+def _validate(recipe: WorkflowRecipe, registry: RegistryProtocol) -> dict[str, CommandSpec]:
+    commands: dict[str, CommandSpec] = {}
+    for step in recipe.steps:
+        if step.key in commands:
+            raise RecipeRunError(f"Recipe `{recipe.name}` has duplicate step key `{step.key}`.")
+        command = registry.resolve_command(step.command)
+        if command is None:
+            raise RecipeRunError(f"Recipe step `{step.key}` references unknown command `{' '.join(step.command)}`.")
+        for dependency in step_dependencies(step):
+            # Referencing only earlier steps keeps the graph acyclic.
+            if dependency not in commands:
+                raise RecipeRunError(f"Recipe step `{step.key}` depends on unknown or later step `{dependency}`.")
+        commands[step.key] = command
+    return commands
+
+
+def _invoke(registry: RegistryProtocol, command: CommandSpec, params: dict[str, Any]) -> dict[str, Any]:
+    started = time.monotonic()
+    try:
+        result = registry.invoke_command(command, params)
+        outcome: dict[str, Any] = {"status": "ok", "result": to_jsonable(result)}
+    except Exception as exc:
+        outcome = {"status": "failed", "error": {"type": type(exc).__name__, "message": str(exc)}}
+    outcome["elapsed_ms"] = round((time.monotonic() - started) * 1000, 3)
+    return outcome
+
+
+def run_recipe(
+    recipe: WorkflowRecipe,
+    inputs: dict[str, Any],
+    *,
+    registry: RegistryProtocol,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> dict[str, Any]:
+    """Run every step of `recipe` and return the merged document.
+
+    Each step ends as `ok`, `failed`, or `skipped` (a required parameter did
+    not resolve, or a step it depends on did not succeed). One step failing
+    does not stop independent steps.
+
+    Raises:
+        RecipeRunError: Required inputs are missing, unknown inputs are given,
+            or the recipe references unknown commands or steps.
+    """
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    missing = [name for name in recipe.inputs if inputs.get(name) is None]
+    if missing:
+        raise RecipeRunError("Missing required recipe inputs.", data={"missing": missing})
+    unknown = sorted(set(inputs) - set(recipe.inputs) - set(recipe.optional_inputs))
+    if unknown:
+        raise RecipeRunError(f"Unknown recipe inputs: {', '.join(unknown)}.", data={"unknown": unknown})
+
+    commands = _validate(recipe, registry)
+    dependencies = {step.key: step_dependencies(step) for step in recipe.steps}
+    steps = {step.key: step for step in recipe.steps}
+    outcomes: dict[str, dict[str, Any]] = {}
+    outputs: dict[str, Any] = {}
+    waiting = [step.key for step in recipe.steps]
+    running: dict[Future[dict[str, Any]], str] = {}
+    started = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cluefin-recipe") as executor:
+        while waiting or running:
+            for key in [key for key in waiting if all(dep in outcomes for dep in dependencies[key])]:
+                waiting.remove(key)
+                blocked = [dep for dep in dependencies[key] if outcomes[dep]["status"] != "ok"]
+                if blocked:
+                    outcomes[key] = {"status": "skipped", "reason": f"Depends on unsuccessful step `{blocked[0]}`."}
+                    continue
+                try:
+                    params = _bind_params(steps[key], commands[key], inputs, outputs)
+                except _SkipStep as exc:
+                    outcomes[key] = {"status": "skipped", "reason": str(exc)}
+                    continue
+                running[executor.submit(_invoke, registry, commands[key], params)] = key
+
+            if not running:
+                # Skips above may have unblocked more steps; dependencies on earlier steps rule out a stall.
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = running.pop(future)
+                outcomes[key] = future.result()
+                if outcomes[key]["status"] == "ok":
+                    outputs[key] = outcomes[key]["result"]
+
+    return {
+        "recipe": recipe.name,
+        "inputs": inputs,
+        "ok": all(outcome["status"] != "failed" for outcome in outcomes.values()),
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 3),
+        "steps": {
+            step.key: {
+                "command": commands[step.key].qualified_name,
+                "depends_on": list(dependencies[step.key]),
+                **outcomes[step.key],
+            }
+            for step in recipe.steps
+        },
+    }
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Iterable
 
 from cluefin_openapi_cli.registry import RegistryProtocol
 
 
 @dataclass(frozen=True, slots=True)
 class RecipeStep:
+    """One command in a recipe.
+
+    `params` maps command parameters to literals or references: `$input.<name>`
+    reads a recipe input and `$steps.<key>.<path>` reads a dotted path (list
+    indexes allowed) from an earlier step's result, which makes this step wait
+    for that one when the recipe is run.
+    """
+
+    key: str
     title: str
     command: tuple[str, ...]
     purpose: str
     agent_notes: str
+    params: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass(frozen=True, slots=True)
@@ -23,6 +33,8 @@ class WorkflowRecipe:
     tags: tuple[str, ...]
     steps: tuple[RecipeStep, ...]
     agent_notes: str
+    inputs: tuple[str, ...] = ()
+    optional_inputs: tuple[str, ...] = ()
 
 
 _RECIPES: tuple[WorkflowRecipe, ...] = (
@@ -34,37 +46,49 @@ _RECIPES: tuple[WorkflowRecipe, ...] = (
         tags=("current-price", "financial-statement", "disclosure", "foreign", "institution"),
         steps=(
             RecipeStep(
+                key="quote",
                 title="Get current quote",
                 command=("kis", "stock", "current-price"),
                 purpose="Start with the latest KIS current-price snapshot.",
                 agent_notes="Use the target stock code as a required parameter.",
+                params={"stock_code": "$input.stock_code"},
             ),
             RecipeStep(
+                key="basic-info",
                 title="Get company basics",
                 command=("kis", "stock", "basic-info"),
                 purpose="Resolve basic stock identity and listing context.",
                 agent_notes="Compare with DART corp-code lookup when a DART workflow needs corp_code.",
+                params={"pdno": "$input.stock_code"},
             ),
             RecipeStep(
+                key="balance-sheet",
                 title="Get financial statement",
                 command=("kis", "financial", "balance-sheet"),
                 purpose="Fetch statement context before ratios or valuation notes.",
                 agent_notes="Follow with income-statement or ratio commands when deeper financial context is needed.",
+                params={"stock_code": "$input.stock_code"},
             ),
             RecipeStep(
+                key="disclosures",
                 title="Search disclosures",
                 command=("dart", "disclosure-search"),
                 purpose="Find recent DART disclosures for the issuer.",
                 agent_notes="Use corp_code or date filters to reduce result size.",
+                params={"corp_code": "$input.corp_code", "bgn_de": "$input.start_date", "end_de": "$input.end_date"},
             ),
             RecipeStep(
+                key="investor-flow",
                 title="Check investor flow",
                 command=("kis", "analysis", "institutional-foreign"),
                 purpose="Add foreign and institutional trading-flow context.",
                 agent_notes="Check date fields before comparing with price movement.",
+                params={"user_id": "$input.user_id", "group_code": "$input.group_code"},
             ),
         ),
         agent_notes="Use this recipe as a broad first pass, then narrow by domain/tag for detailed follow-up.",
+        inputs=("stock_code",),
+        optional_inputs=("corp_code", "start_date", "end_date", "user_id", "group_code"),
     ),
     WorkflowRecipe(
         name="technical-analysis",
@@ -74,25 +98,37 @@ _RECIPES: tuple[WorkflowRecipe, ...] = (
         tags=("ohlcv", "daily", "minute"),
         steps=(
             RecipeStep(
+                key="daily",
                 title="Fetch daily OHLCV",
                 command=("kis", "chart", "period"),
                 purpose="Retrieve period chart data suitable for daily indicators.",
                 agent_notes="Run `cluefin-cli ta <stock_code>` for the corresponding technical-indicator report (SMA/EMA/RSI/MACD/Bollinger/Stochastic/ADX/ATR/OBV plus risk metrics).",
+                params={
+                    "stock_code": "$input.stock_code",
+                    "start_date": "$input.start_date",
+                    "end_date": "$input.end_date",
+                },
             ),
             RecipeStep(
+                key="minute",
                 title="Fetch intraday OHLCV",
                 command=("kis", "chart", "minute"),
                 purpose="Retrieve minute chart data when intraday analysis is needed.",
                 agent_notes="Keep interval and date window consistent before comparing to daily signals.",
+                params={"stock_code": "$input.stock_code", "hour": "$input.hour"},
             ),
             RecipeStep(
+                key="tick",
                 title="Fallback chart source",
                 command=("kiwoom", "chart", "tick"),
                 purpose="Use Kiwoom chart data when KIS coverage or parameters are insufficient.",
                 agent_notes="Normalize provider response shape before TA calculation.",
+                params={"stock_code": "$input.stock_code", "tic_scope": "1"},
             ),
         ),
         agent_notes="Recipes do not run TA indicators directly; use `cluefin-cli ta <stock_code>` after collecting OHLCV arrays.",
+        inputs=("stock_code", "start_date", "end_date"),
+        optional_inputs=("hour",),
     ),
     WorkflowRecipe(
         name="market-scan",
@@ -102,22 +138,34 @@ _RECIPES: tuple[WorkflowRecipe, ...] = (
         tags=("ranking", "volume-rank", "sector-index", "theme-group"),
         steps=(
             RecipeStep(
+                key="volume-rank",
                 title="Volume ranking",
                 command=("kis", "ranking", "volume"),
                 purpose="Find high-volume stocks from KIS ranking data.",
                 agent_notes="Use market and ranking parameters to keep scans comparable.",
+                params={"market": "J"},
             ),
             RecipeStep(
+                key="sector-index",
                 title="Sector index",
                 command=("kis", "sector", "current-index"),
                 purpose="Add sector-level market context.",
                 agent_notes="Combine with sector daily or period commands for trend context.",
+                params={"sector_code": "0001"},
             ),
             RecipeStep(
+                key="theme-groups",
                 title="Theme groups",
                 command=("kiwoom", "theme", "group"),
                 purpose="Discover Kiwoom theme groups for thematic scans.",
                 agent_notes="Follow with theme group-stocks for constituents.",
+                params={
+                    "query_type": "0",
+                    "date_type": "1",
+                    "theme_name": "",
+                    "fluctuation_type": "1",
+                    "exchange_type": "1",
+                },
             ),
         ),
         agent_notes="Use ranking outputs as candidates; verify with quote/chart commands before drawing conclusions.",
@@ -130,31 +178,57 @@ _RECIPES: tuple[WorkflowRecipe, ...] = (
         tags=("dividend", "capital-increase", "capital-reduction", "merger-split", "shareholder-meeting"),
         steps=(
             RecipeStep(
+                key="dividend",
                 title="Dividend decisions",
                 command=("kis", "schedule", "dividend"),
                 purpose="Find cash dividend decision events.",
                 agent_notes="Use date ranges to scope event searches.",
+                params={
+                    "start_date": "$input.start_date",
+                    "end_date": "$input.end_date",
+                    "stock_code": "$input.stock_code",
+                },
             ),
             RecipeStep(
+                key="capital-increase",
                 title="Capital increase",
                 command=("kis", "schedule", "capital-increase"),
                 purpose="Find paid-in capital increase schedules.",
                 agent_notes="Cross-check with disclosure search for issuer filings.",
+                params={
+                    "start_date": "$input.start_date",
+                    "end_date": "$input.end_date",
+                    "stock_code": "$input.stock_code",
+                },
             ),
             RecipeStep(
+                key="merger-split",
                 title="Merger or split",
                 command=("kis", "schedule", "merger-split"),
                 purpose="Find merger and split decision schedules.",
                 agent_notes="Use DART disclosures for original filings when material.",
+                params={
+                    "start_date": "$input.start_date",
+                    "end_date": "$input.end_date",
+                    "stock_code": "$input.stock_code",
+                },
             ),
             RecipeStep(
+                key="shareholder-meeting",
                 title="Shareholder meeting",
                 command=("kis", "schedule", "shareholder-meeting"),
                 purpose="Find shareholder meeting schedules.",
                 agent_notes="Useful for governance and event monitoring workflows.",
+                params={
+                    "start_date": "$input.start_date",
+                    "end_date": "$input.end_date",
+                    "stock_code": "$input.stock_code",
+                },
             ),
         ),
         agent_notes="Corporate-action APIs are event oriented; always include date windows where the schema supports them.",
+        inputs=("start_date", "end_date"),
+        optional_inputs=("stock_code",),
     ),
     WorkflowRecipe(
         name="disclosure-monitoring",
@@ -164,25 +238,33 @@ _RECIPES: tuple[WorkflowRecipe, ...] = (
         tags=("announcement", "disclosure"),
         steps=(
             RecipeStep(
+                key="announcements",
                 title="Market announcements",
                 command=("kis", "market", "announcement"),
                 purpose="Fetch KIS market news and announcement titles.",
                 agent_notes="Use as a quick title-level monitor.",
+                params={"stock_code": "$input.stock_code"},
             ),
             RecipeStep(
+                key="disclosures",
                 title="DART disclosure search",
                 command=("dart", "disclosure-search"),
                 purpose="Search formal DART disclosures.",
                 agent_notes="Use corp_code and date filters when monitoring a specific issuer.",
+                params={"corp_code": "$input.corp_code", "bgn_de": "$input.start_date", "end_de": "$input.end_date"},
             ),
             RecipeStep(
+                key="company",
                 title="DART company overview",
                 command=("dart", "company-overview"),
                 purpose="Resolve issuer context for DART results.",
                 agent_notes="Requires corp_code from lookup or known issuer mapping.",
+                params={"corp_code": "$steps.disclosures.result.list.0.corp_code"},
             ),
         ),
         agent_notes="Use KIS for title-level discovery and DART for formal disclosure records.",
+        inputs=(),
+        optional_inputs=("stock_code", "corp_code", "start_date", "end_date"),
     ),
 )
 
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
-from typing import Any, Callable, Iterable, Protocol
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Protocol
 
-from cluefin_openapi import BrokerClientFactory
-
-from cluefin_openapi_cli.handlers.dart import _ALL_HANDLERS as DART_HANDLERS
-from cluefin_openapi_cli.handlers.kis import get_kis_handlers
-from cluefin_openapi_cli.handlers.kiwoom import get_kiwoom_handlers
 from cluefin_openapi_cli.metadata import build_agent_notes, build_command_examples, get_command_metadata
 
+if TYPE_CHECKING:
+    from cluefin_openapi import BrokerClientFactory
+
 
 @dataclass(frozen=True, slots=True)
 class CommandSpec:
@@ -30,6 +29,7 @@ class CommandSpec:
     required_credentials: tuple[str, ...] = ()
     side_effect: str = "read"
     executor: Callable[[dict[str, Any], Any], Any] | None = None
+    handler: str | None = None
 
     @property
     def path(self) -> tuple[str, ...]:
@@ -90,16 +90,41 @@ class EmptyRegistry:
         raise RuntimeError("No registry is configured.")
 
 
+def _default_client_factory() -> BrokerClientFactory:
+    # Deferred: the broker SDK is only needed once a command actually runs.
+    from cluefin_openapi import BrokerClientFactory
+
+    return BrokerClientFactory()
+
+
+def _authentication_errors() -> tuple[type[Exception], ...]:
+    from cluefin_openapi.dart._exceptions import DartAuthenticationError
+    from cluefin_openapi.kis._exceptions import KISAuthenticationError
+    from cluefin_openapi.kiwoom._exceptions import KiwoomAuthenticationError
+
+    return (KISAuthenticationError, KiwoomAuthenticationError, DartAuthenticationError)
+
+
 class _BrokerSession:
     def __init__(self, broker: str, client_factory: BrokerClientFactory | None = None) -> None:
         self._broker = broker
-        self._client_factory = client_factory or BrokerClientFactory()
+        self._client_factory = client_factory or _default_client_factory()
         self._client = None
+        self._lock = threading.Lock()
 
     def _get_client(self):
-        if self._client is None:
-            self._client = self._client_factory.create(self._broker)
-        return self._client
+        with self._lock:
+            if self._client is None:
+                self._client = self._client_factory.create(self._broker)
+            return self._client
+
+    def reset(self) -> None:
+        """Drop the cached client so the next call re-authenticates."""
+
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None and hasattr(client, "close"):
+            client.close()
 
     def get_kis(self):
         if self._broker != "kis":
@@ -122,6 +147,10 @@ def _kebab_case(value: str) -> str:
 
 
 def _iter_broker_handlers() -> Iterable[Callable[..., Any]]:
+    from cluefin_openapi_cli.handlers.dart import _ALL_HANDLERS as DART_HANDLERS
+    from cluefin_openapi_cli.handlers.kis import get_kis_handlers
+    from cluefin_openapi_cli.handlers.kiwoom import get_kiwoom_handlers
+
     yield from get_kis_handlers()
     yield from get_kiwoom_handlers()
     yield from DART_HANDLERS
@@ -178,11 +207,19 @@ def build_cli_registry() -> dict[tuple[str, ...], CommandSpec]:
 
 
 class RpcRegistry:
-    """CLI command registry with broker metadata and executors."""
+    """CLI command registry with broker metadata and executors.
+
+    Commands come from the precomputed index when it matches the sources, so
+    discovery does not import handlers; otherwise every handler is imported.
+    """
 
     def __init__(self, client_factory: BrokerClientFactory | None = None) -> None:
-        self._client_factory = client_factory or BrokerClientFactory()
-        self._commands = build_cli_registry()
+        from cluefin_openapi_cli.command_index import load_command_index
+
+        self._client_factory = client_factory
+        self._commands = load_command_index() or build_cli_registry()
+        self._sessions: dict[str, _BrokerSession] = {}
+        self._sessions_lock = threading.Lock()
 
     def list_commands(
         self,
@@ -213,11 +250,56 @@ class RpcRegistry:
         return sorted({command.broker for command in self._commands.values()})
 
     def invoke_command(self, command: CommandSpec, params: dict[str, Any]) -> Any:
-        if command.executor is None:
+        executor = self._get_executor(command)
+        session = self.get_session(command.broker)
+        try:
+            return executor(params, session)
+        except _authentication_errors():
+            # Cached tokens can expire in long-lived processes; re-authenticate once.
+            session.reset()
+            return executor(params, session)
+
+    def _get_executor(self, command: CommandSpec) -> Callable[[dict[str, Any], Any], Any]:
+        if command.executor is not None:
+            return command.executor
+        if command.handler is None:
             raise RuntimeError(f"Command `{command.qualified_name}` has no executor.")
 
-        session = _BrokerSession(command.broker, client_factory=self._client_factory)
-        return command.executor(params, session)
+        from cluefin_openapi_cli.command_index import load_handler
+
+        return load_handler(command.handler)
+
+    def get_session(self, broker: str) -> _BrokerSession:
+        """Return the shared session for one broker, keeping its client warm across commands."""
+
+        with self._sessions_lock:
+            session = self._sessions.get(broker)
+            if session is None:
+                if self._client_factory is None:
+                    self._client_factory = _default_client_factory()
+                session = _BrokerSession(broker, client_factory=self._client_factory)
+                self._sessions[broker] = session
+            return session
+
+    def warm(self) -> list[str]:
+        """Create broker clients up front, skipping brokers whose credentials are not configured."""
+
+        warmed = []
+        for broker in self.iter_brokers():
+            try:
+                self.get_session(broker)._get_client()
+            except Exception:
+                continue
+            warmed.append(broker)
+        return warmed
+
+    def close(self) -> None:
+        """Close every cached broker client."""
+
+        with self._sessions_lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            session.reset()
 
 
 _registry_provider: Callable[[], RegistryProtocol] = RpcRegistry
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+
+from cluefin_openapi_cli.batch import run_batch
+from cluefin_openapi_cli.main import run_cli
+from cluefin_openapi_cli.registry import CommandSpec, EmptyRegistry, set_registry_provider
+
+
+class _QuoteRegistry:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._commands = {
+            ("kis", "stock", "current-price"): CommandSpec(
+                broker="kis",
+                category="stock",
+                name="current-price",
+                description="Get current stock price.",
+                path_segments=("kis", "stock", "current-price"),
+                parameters={"type": "object", "required": ["stock_code"]},
+                executor=self._quote,
+            ),
+            ("dart", "failing-command"): CommandSpec(
+                broker="dart",
+                category="dart",
+                name="failing-command",
+                description="Raise an executor error.",
+                path_segments=("dart", "failing-command"),
+                executor=lambda params: (_ for _ in ()).throw(RuntimeError("broker unavailable")),
+            ),
+        }
+
+    def _quote(self, params):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+        return {"stock_code": params["stock_code"], "price": 70000}
+
+    def list_commands(self, **filters):
+        return list(self._commands.values())
+
+    def get_command(self, broker: str, category: str, name: str):
+        return self._commands.get((broker, category, name))
+
+    def resolve_command(self, path_segments: tuple[str, ...]):
+        return self._commands.get(path_segments)
+
+    def iter_brokers(self):
+        return ["dart", "kis"]
+
+    def invoke_command(self, command: CommandSpec, params: dict[str, object]):
+        assert command.executor is not None
+        return command.executor(params)
+
+
+def _collect(lines: list[str], registry, concurrency: int = 4) -> tuple[list[dict], object]:
+    output: list[str] = []
+    summary = run_batch(lines, registry=registry, write=output.append, concurrency=concurrency)
+    return [json.loads(line) for line in output], summary
+
+
+def test_run_batch_runs_concurrently_and_tags_results_by_id() -> None:
+    registry = _QuoteRegistry()
+    lines = [
+        json.dumps({"id": f"q{i}", "command": "kis stock current-price", "params": {"stock_code": f"{i:06d}"}})
+        for i in range(12)
+    ]
+
+    records, summary = _collect(lines, registry, concurrency=4)
+
+    assert (summary.total, summary.succeeded, summary.failed) == (12, 12, 0)
+    assert {record["id"] for record in records} == {f"q{i}" for i in range(12)}
+    assert all(record["result"]["stock_code"] == f"{int(record['id'][1:]):06d}" for record in records)
+    assert 1 < registry.peak <= 4
+
+
+def test_run_batch_reports_per_item_errors_without_stopping() -> None:
+    lines = [
+        "not json",
+        json.dumps({"id": "missing", "command": ["kis", "stock", "current-price"], "params": {}}),
+        json.dumps({"id": "unknown", "command": "kis stock nope"}),
+        "",
+        json.dumps({"id": "boom", "command": "dart failing-command"}),
+        json.dumps({"command": "kis stock current-price", "params": {"stock_code": "005930"}}),
+    ]
+
+    records, summary = _collect(lines, _QuoteRegistry())
+    by_id = {record["id"]: record for record in records}
+
+    assert (summary.total, summary.succeeded, summary.failed) == (5, 1, 4)
+    assert by_id[1]["error"]["type"] == "JSONDecodeError"
+    assert "stock_code" in by_id["missing"]["error"]["message"]
+    assert by_id["unknown"]["error"]["message"] == "Unknown command path: kis stock nope"
+    assert by_id["boom"]["error"] == {
+        "type": "RuntimeError",
+        "message": "broker unavailable",
+        "command": "dart.failing-command",
+    }
+    assert by_id[6]["ok"] is True
+
+
+def test_batch_command_reads_input_file_and_streams_jsonl(tmp_path) -> None:
+    set_registry_provider(_QuoteRegistry)
+    try:
+        input_path = tmp_path / "batch.jsonl"
+        input_path.write_text(
+            "\n".join(
+                json.dumps({"id": code, "command": "kis stock current-price", "params": {"stock_code": code}})
+                for code in ("005930", "000660")
+            ),
+            encoding="utf-8",
+        )
+
+        result = run_cli(["batch", "--input", str(input_path), "--concurrency", "2"])
+    finally:
+        set_registry_provider(EmptyRegistry)
+
+    assert result.exit_code == 0
+    assert sorted(json.loads(line)["id"] for line in result.stdout.splitlines()) == ["000660", "005930"]
+
+
+def test_batch_command_reads_stdin_and_fails_when_any_item_fails(monkeypatch) -> None:
+    set_registry_provider(_QuoteRegistry)
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps({"id": "x", "command": "dart failing-command"}) + "\n"))
+    try:
+        result = run_cli(["batch"])
+    finally:
+        set_registry_provider(EmptyRegistry)
+
+    assert result.exit_code == 1
+    assert json.loads(result.stdout)["ok"] is False
+    assert "1 of 1 batch commands failed." in result.stderr
+
+
+def test_batch_command_rejects_invalid_concurrency() -> None:
+    result = run_cli(["batch", "--concurrency", "0", "--json"])
+
+    assert result.exit_code == 2
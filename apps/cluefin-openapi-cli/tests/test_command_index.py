@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from cluefin_openapi_cli import command_index
+from cluefin_openapi_cli.registry import RpcRegistry, build_cli_registry
+
+
+def test_shipped_index_matches_handler_sources() -> None:
+    index = command_index.load_command_index()
+
+    assert index is not None, "Run `uv run python -m cluefin_openapi_cli.command_index` to regenerate."
+    built = build_cli_registry()
+    assert index.keys() == built.keys()
+    for path, spec in built.items():
+        entry = index[path]
+        assert entry.executor is None
+        assert command_index.load_handler(entry.handler) is spec.executor
+        assert (entry.parameters, entry.domains, entry.tags, entry.examples, entry.agent_notes) == (
+            spec.parameters,
+            spec.domains,
+            spec.tags,
+            spec.examples,
+            spec.agent_notes,
+        )
+
+
+def test_stale_or_missing_index_is_ignored(tmp_path) -> None:
+    stale = tmp_path / "index.json"
+    stale.write_text(json.dumps({"version": command_index.INDEX_VERSION, "fingerprint": "old", "commands": []}))
+
+    assert command_index.load_command_index(stale) is None
+    assert command_index.load_command_index(tmp_path / "missing.json") is None
+
+
+def test_fingerprint_covers_modules_that_shape_the_index() -> None:
+    fingerprinted = {path.relative_to(command_index._PACKAGE_DIR).as_posix() for path in command_index._source_files()}
+
+    assert {"registry.py", "metadata.py", "command_index.py", "handlers/_base.py"} <= fingerprinted
+
+
+def test_write_command_index_round_trips(tmp_path) -> None:
+    path = tmp_path / "index.json"
+
+    count = command_index.write_command_index(path)
+
+    assert count == len(command_index.load_command_index(path))
+
+
+def test_discovery_does_not_import_handlers_or_broker_sdk() -> None:
+    script = (
+        "import sys\n"
+        "from cluefin_openapi_cli.main import run_cli\n"
+        "for argv in (['list', '--json'], ['describe', 'kis', 'stock', 'current-price', '--json'], ['domains', '--json']):\n"
+        "    assert run_cli(argv).exit_code == 0, argv\n"
+        "loaded = [name for name in sys.modules if name.startswith('cluefin_openapi_cli.handlers.') or name == 'cluefin_openapi']\n"
+        "print(loaded)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_invoke_imports_only_the_command_module() -> None:
+    script = (
+        "import sys\n"
+        "from cluefin_openapi_cli.registry import RpcRegistry\n"
+        "registry = RpcRegistry(client_factory=object())\n"
+        "registry._get_executor(registry.resolve_command(('kiwoom', 'chart', 'tick')))\n"
+        "print(sorted(name for name in sys.modules if name.startswith('cluefin_openapi_cli.handlers.')))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == str(
+        [
+            "cluefin_openapi_cli.handlers._base",
+            "cluefin_openapi_cli.handlers.kiwoom",
+            "cluefin_openapi_cli.handlers.kiwoom.domestic_chart",
+        ]
+    )
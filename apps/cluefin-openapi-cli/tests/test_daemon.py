@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+from cluefin_openapi_cli import daemon
+from cluefin_openapi_cli.registry import CommandSpec, EmptyRegistry, set_registry_provider
+
+
+class _CountingRegistry:
+    instances = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+        self.closed = False
+        self._command = CommandSpec(
+            broker="dart",
+            category="dart",
+            name="company-overview",
+            description="Get company overview.",
+            path_segments=("dart", "company-overview"),
+            parameters={"type": "object", "properties": {"corp_code": {"type": "string"}}},
+            returns={"type": "object"},
+            executor=lambda params: [{"corp_code": params["corp_code"], "row": row} for row in range(3)],
+        )
+
+    def list_commands(self, *, broker=None, category=None, domain=None, tag=None):
+        return [self._command]
+
+    def get_command(self, broker: str, category: str, name: str):
+        return None
+
+    def resolve_command(self, path_segments: tuple[str, ...]):
+        return self._command if path_segments == self._command.path_segments else None
+
+    def iter_brokers(self):
+        return ["dart"]
+
+    def invoke_command(self, command: CommandSpec, params: dict[str, object]):
+        assert command.executor is not None
+        return command.executor(params)
+
+    def warm(self) -> list[str]:
+        return ["dart"]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def socket_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "cli.sock")
+    monkeypatch.setenv(daemon.SOCKET_ENV, path)
+    monkeypatch.delenv(daemon.DISABLE_ENV, raising=False)
+    return path
+
+
+@pytest.fixture
+def running_daemon(socket_path):
+    _CountingRegistry.instances = 0
+    set_registry_provider(_CountingRegistry)
+    thread = threading.Thread(target=daemon.serve, args=(socket_path,), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5.0
+    while not daemon.daemon_status(socket_path)["running"]:
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+
+    yield socket_path
+
+    daemon.stop_daemon(socket_path)
+    thread.join(timeout=5.0)
+    set_registry_provider(EmptyRegistry)
+
+
+def test_forward_returns_none_without_daemon(socket_path) -> None:
+    assert daemon.forward(["domains", "--json"]) is None
+    assert daemon.daemon_status(socket_path) == {"running": False, "socket": socket_path}
+    assert daemon.stop_daemon(socket_path) is False
+
+
+def test_forward_runs_commands_on_shared_registry(running_daemon, capsys) -> None:
+    first = daemon.forward(["dart", "company-overview", "--corp-code", "00126380", "--json"])
+    second = daemon.forward(["list", "--json"])
+    captured = capsys.readouterr()
+
+    assert first == 0
+    assert second == 0
+    assert '"corp_code": "00126380"' in captured.out
+    assert _CountingRegistry.instances == 1
+    assert daemon.daemon_status(running_daemon)["commands_served"] == 2
+
+
+def test_forward_preserves_exit_code_and_error_output(running_daemon, capsys) -> None:
+    exit_code = daemon.forward(["dart", "missing-command", "--json"])
+    captured = capsys.readouterr()
+
+    assert exit_code == 2
+    assert "Unknown command path" in captured.out
+
+
+def test_daemon_rejects_nested_serve_and_second_instance(running_daemon) -> None:
+    response = daemon._request(running_daemon, {"op": "run", "argv": ["serve"]}, timeout=1.0)
+
+    assert response == {"ok": False, "error": "`serve` cannot be forwarded to the daemon."}
+    with pytest.raises(daemon.DaemonError):
+        daemon.serve(running_daemon)
+
+
+def test_disable_env_skips_forwarding(running_daemon, monkeypatch) -> None:
+    monkeypatch.setenv(daemon.DISABLE_ENV, "1")
+
+    assert daemon.forward(["list", "--json"]) is None
+
+
+def test_stop_removes_socket(socket_path) -> None:
+    set_registry_provider(_CountingRegistry)
+    thread = threading.Thread(target=daemon.serve, args=(socket_path,), daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 5.0
+    while not daemon.daemon_status(socket_path)["running"]:
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+
+    assert daemon.daemon_status(socket_path)["running"] is True
+    assert daemon.stop_daemon(socket_path) is True
+    thread.join(timeout=5.0)
+    set_registry_provider(EmptyRegistry)
+
+    assert not thread.is_alive()
+    assert not os.path.exists(socket_path)
+
+
+def test_forward_streams_output_lines_before_exit_code(running_daemon) -> None:
+    sock = daemon._connect(running_daemon)
+    assert sock is not None
+    request = {
+        "op": "run",
+        "argv": ["dart", "company-overview", "--corp-code", "00126380", "--ndjson"],
+        "config": daemon.broker_config_fingerprint(),
+    }
+    try:
+        messages = list(_until_exit(daemon._messages(sock, request, timeout=5.0)))
+    finally:
+        sock.close()
+
+    stdout_frames = [message["data"] for message in messages if message.get("stream") == "stdout"]
+    assert len(stdout_frames) == 3
+    assert all(frame.endswith("\n") for frame in stdout_frames)
+    assert messages[-1] == {"ok": True, "exit_code": 0}
+
+
+def test_failure_after_request_is_sent_is_reported_not_rerun(socket_path, monkeypatch, capsys) -> None:
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+
+    def accept_and_drop() -> None:
+        conn, _ = server.accept()
+        conn.makefile("rb").readline()
+        conn.close()
+
+    thread = threading.Thread(target=accept_and_drop, daemon=True)
+    thread.start()
+    ran_in_process = []
+    monkeypatch.setattr("cluefin_openapi_cli.main.main", lambda args: ran_in_process.append(args))
+    try:
+        with pytest.raises(SystemExit) as exc_info:
+            daemon.launch(["list", "--json"])
+    finally:
+        thread.join(timeout=5.0)
+        server.close()
+
+    assert exc_info.value.code == 1
+    assert ran_in_process == []
+    assert "closed the connection" in capsys.readouterr().err
+
+
+def _until_exit(messages):
+    for message in messages:
+        yield message
+        if "exit_code" in message:
+            return
+
+
+def test_mismatched_broker_settings_run_in_process(running_daemon, monkeypatch) -> None:
+    monkeypatch.setenv("KIS_ENV", "prod")
+    ran_in_process = []
+    monkeypatch.setattr("cluefin_openapi_cli.main.main", lambda args: ran_in_process.append(args))
+
+    assert daemon.forward(["list", "--json"]) is None
+    daemon.launch(["list", "--json"])
+
+    assert ran_in_process == [["list", "--json"]]
+    assert daemon.daemon_status(running_daemon)["commands_served"] == 0
+
+
+def test_fingerprint_covers_dotenv_in_working_directory(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    without_dotenv = daemon.broker_config_fingerprint()
+    (tmp_path / ".env").write_text("KIS_APP_KEY=other-account\n")
+
+    assert daemon.broker_config_fingerprint() != without_dotenv
@@ -252,6 +252,13 @@ def test_leaf_command_merges_flags_and_params_json() -> None:
     assert '"corp_code": "00126380"' in result.stdout
 
 
+def test_leaf_command_streams_ndjson_records() -> None:
+    result = run_cli(["dart", "company-overview", "--corp-code", "00126380", "--ndjson"])
+
+    assert result.exit_code == 0
+    assert result.stdout == '{"corp_code":"00126380"}\n'
+
+
 def test_leaf_command_reports_missing_required_params_as_json_error() -> None:
     result = run_cli(["dart", "company-overview", "--json"])
 
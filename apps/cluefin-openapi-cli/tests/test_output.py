@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import io
+
 from cluefin_openapi_cli.main import _command_summary
-from cluefin_openapi_cli.output import dump_json, render_output, to_jsonable
+from cluefin_openapi_cli.output import dump_json, iter_rows, render_ndjson, render_output, to_jsonable
 from cluefin_openapi_cli.registry import CommandSpec
 
 
@@ -33,3 +35,57 @@ def test_render_output_pretty_mode(monkeypatch, capsys) -> None:
 
 def test_dump_json_is_stable() -> None:
     assert dump_json({"a": 1}) == '{\n  "a": 1\n}'
+
+
+def test_to_jsonable_converts_nested_dataclasses() -> None:
+    spec = CommandSpec(
+        broker="dart",
+        category="dart",
+        name="company-overview",
+        description="Company overview",
+        path_segments=("dart", "company-overview"),
+    )
+
+    data = to_jsonable({"commands": [spec]})
+
+    assert data["commands"][0]["path_segments"] == ["dart", "company-overview"]
+    assert data["commands"][0]["executor"] is None
+
+
+def test_iter_rows_picks_the_single_row_list() -> None:
+    class _Model:
+        model_fields = {"return_code": None, "rows": None}
+
+        def __init__(self) -> None:
+            self.return_code = 0
+            self.rows = [{"a": 1}, {"a": 2}]
+
+    assert list(iter_rows([1, 2])) == [1, 2]
+    assert list(iter_rows(iter([{"a": 1}]))) == [{"a": 1}]
+    assert list(iter_rows({"rows": [{"a": 1}]})) == [{"a": 1}]
+    assert list(iter_rows({"return_code": 0, "rows": [{"a": 1}]})) == [{"_meta": {"return_code": 0}}, {"a": 1}]
+    assert list(iter_rows(_Model())) == [{"_meta": {"return_code": 0}}, {"a": 1}, {"a": 2}]
+    assert list(iter_rows({"output1": [1], "output2": [2]})) == [{"output1": [1], "output2": [2]}]
+    assert list(iter_rows({"price": 1})) == [{"price": 1}]
+
+
+def test_render_ndjson_writes_one_compact_record_per_row() -> None:
+    stream = io.StringIO()
+
+    count = render_ndjson({"list": [{"name": "삼성전자"}, {"name": "SK하이닉스"}]}, stream=stream)
+
+    assert count == 2
+    assert stream.getvalue() == '{"name":"삼성전자"}\n{"name":"SK하이닉스"}\n'
+
+
+def test_render_ndjson_keeps_fields_next_to_the_rows() -> None:
+    stream = io.StringIO()
+
+    count = render_ndjson({"summary": {"bstp_nmix_prpr": "2650.12"}, "data": [{"a": 1}, {"a": 2}]}, stream=stream)
+
+    assert count == 3
+    assert stream.getvalue().splitlines() == [
+        '{"_meta":{"summary":{"bstp_nmix_prpr":"2650.12"}}}',
+        '{"a":1}',
+        '{"a":2}',
+    ]
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from cluefin_openapi_cli.main import run_cli
+from cluefin_openapi_cli.recipe_runner import RecipeRunError, run_recipe, step_dependencies
+from cluefin_openapi_cli.recipes import RecipeStep, WorkflowRecipe, list_recipes
+from cluefin_openapi_cli.registry import CommandSpec, EmptyRegistry, RpcRegistry, set_registry_provider
+
+
+class _RecordingRegistry:
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.calls: list[tuple[str, dict]] = []
+        self.finished: dict[str, float] = {}
+        self.started: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _spec(self, path: tuple[str, ...], required: tuple[str, ...] = ()) -> CommandSpec:
+        return CommandSpec(
+            broker=path[0],
+            category=path[1] if len(path) == 3 else path[0],
+            name=path[-1],
+            description="fake",
+            path_segments=path,
+            parameters={"type": "object", "required": list(required)},
+        )
+
+    def resolve_command(self, path_segments: tuple[str, ...]):
+        if path_segments[-1] == "missing":
+            return None
+        required = ("corp_code",) if path_segments == ("dart", "company-overview") else ()
+        return self._spec(path_segments, required)
+
+    def invoke_command(self, command: CommandSpec, params: dict):
+        with self._lock:
+            self.calls.append((command.qualified_name, params))
+            self.started[command.qualified_name] = time.monotonic()
+        time.sleep(self.delay)
+        if command.name == "fails":
+            raise RuntimeError("upstream error")
+        with self._lock:
+            self.finished[command.qualified_name] = time.monotonic()
+        if command.name == "disclosure-search":
+            return {"result": {"list": [{"corp_code": "00126380"}]}}
+        return {"command": command.qualified_name, "params": params}
+
+
+def _recipe(*steps: RecipeStep, inputs: tuple[str, ...] = (), optional_inputs: tuple[str, ...] = ()) -> WorkflowRecipe:
+    return WorkflowRecipe(
+        name="test",
+        title="Test",
+        description="test",
+        domains=(),
+        tags=(),
+        steps=steps,
+        agent_notes="",
+        inputs=inputs,
+        optional_inputs=optional_inputs,
+    )
+
+
+def _step(key: str, command: tuple[str, ...], **params) -> RecipeStep:
+    return RecipeStep(key=key, title=key, command=command, purpose="", agent_notes="", params=params)
+
+
+def test_independent_steps_run_concurrently() -> None:
+    registry = _RecordingRegistry(delay=0.1)
+    recipe = _recipe(
+        *(_step(f"s{i}", ("kis", "stock", f"cmd{i}"), stock_code="$input.stock_code") for i in range(5)),
+        inputs=("stock_code",),
+    )
+
+    started = time.monotonic()
+    document = run_recipe(recipe, {"stock_code": "005930"}, registry=registry)
+    elapsed = time.monotonic() - started
+
+    assert document["ok"] is True
+    assert elapsed < 0.35
+    assert all(step["status"] == "ok" for step in document["steps"].values())
+    assert all(params == {"stock_code": "005930"} for _, params in registry.calls)
+
+
+def test_dependent_step_waits_for_and_reads_upstream_result() -> None:
+    registry = _RecordingRegistry()
+    recipe = _recipe(
+        _step("disclosures", ("dart", "disclosure-search")),
+        _step("company", ("dart", "company-overview"), corp_code="$steps.disclosures.result.list.0.corp_code"),
+    )
+
+    document = run_recipe(recipe, {}, registry=registry)
+
+    company = document["steps"]["company"]
+    assert company["depends_on"] == ["disclosures"]
+    assert company["result"]["params"] == {"corp_code": "00126380"}
+    assert registry.started["dart.company-overview"] >= registry.finished["dart.disclosure-search"]
+
+
+def test_failures_and_unresolved_params_skip_only_dependents() -> None:
+    registry = _RecordingRegistry(delay=0.0)
+    recipe = _recipe(
+        _step("broken", ("kis", "stock", "fails")),
+        _step("after-broken", ("dart", "company-overview"), corp_code="$steps.broken.corp_code"),
+        _step("no-input", ("dart", "company-overview"), corp_code="$input.corp_code"),
+        _step("optional", ("kis", "stock", "quote"), market="$input.market", stock_code="005930"),
+        optional_inputs=("corp_code", "market"),
+    )
+
+    document = run_recipe(recipe, {}, registry=registry)
+    steps = document["steps"]
+
+    assert document["ok"] is False
+    assert steps["broken"]["status"] == "failed"
+    assert steps["broken"]["error"] == {"type": "RuntimeError", "message": "upstream error"}
+    assert steps["after-broken"]["status"] == "skipped"
+    assert steps["no-input"]["status"] == "skipped"
+    assert steps["optional"]["result"]["params"] == {"stock_code": "005930"}
+
+
+def test_run_recipe_validates_inputs_and_steps() -> None:
+    registry = _RecordingRegistry()
+
+    with pytest.raises(RecipeRunError) as missing:
+        run_recipe(_recipe(inputs=("stock_code",)), {}, registry=registry)
+    assert missing.value.data == {"missing": ["stock_code"]}
+
+    with pytest.raises(RecipeRunError, match="Unknown recipe inputs"):
+        run_recipe(_recipe(), {"bogus": "1"}, registry=registry)
+
+    with pytest.raises(RecipeRunError, match="later step"):
+        run_recipe(_recipe(_step("a", ("kis", "stock", "x"), v="$steps.b.value")), {}, registry=registry)
+
+    with pytest.raises(RecipeRunError, match="unknown command"):
+        run_recipe(_recipe(_step("a", ("kis", "stock", "missing"))), {}, registry=registry)
+
+
+def test_builtin_recipes_bind_real_command_parameters() -> None:
+    registry = RpcRegistry(client_factory=object())
+
+    for recipe in list_recipes():
+        keys = [step.key for step in recipe.steps]
+        assert len(keys) == len(set(keys)), recipe.name
+        declared = set(recipe.inputs) | set(recipe.optional_inputs)
+        for index, step in enumerate(recipe.steps):
+            command = registry.resolve_command(step.command)
+            assert command is not None
+            properties = command.parameters.get("properties", {})
+            assert set(step.params) <= set(properties), (recipe.name, step.key)
+            assert set(step_dependencies(step)) <= set(keys[:index]), (recipe.name, step.key)
+            for binding in step.params.values():
+                if isinstance(binding, str) and binding.startswith("$input."):
+                    assert binding.removeprefix("$input.") in declared, (recipe.name, step.key, binding)
+
+
+def test_recipe_run_command_renders_merged_document() -> None:
+    set_registry_provider(_RecordingRegistry)
+    try:
+        result = run_cli(["recipe", "run", "stock-research", "--stock-code", "005930", "--json"])
+        missing = run_cli(["recipe", "run", "stock-research", "--json"])
+    finally:
+        set_registry_provider(EmptyRegistry)
+
+    document = json.loads(result.stdout)
+    assert result.exit_code == 0
+    assert document["recipe"] == "stock-research"
+    assert document["steps"]["quote"]["result"]["params"] == {"stock_code": "005930"}
+    assert document["steps"]["basic-info"]["result"]["params"] == {"pdno": "005930"}
+    assert missing.exit_code == 2
+    assert '"missing"' in missing.stdout
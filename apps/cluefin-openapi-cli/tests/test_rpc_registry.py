@@ -131,7 +131,7 @@ def test_rpc_registry_resolves_real_command_path() -> None:
 
     assert command is not None
     assert command.broker == "dart"
-    assert command.executor is not None
+    assert command.handler == "cluefin_openapi_cli.handlers.dart:handle_company_overview"
 
 
 def test_rpc_registry_invokes_real_executor_with_fake_client() -> None:
@@ -142,3 +142,33 @@ def test_rpc_registry_invokes_real_executor_with_fake_client() -> None:
     result = registry.invoke_command(command, {"corp_code": "00126380"})
 
     assert result == {"corp_code": "00126380"}
+
+
+def test_rpc_registry_reuses_session_and_reauthenticates_once() -> None:
+    from cluefin_openapi.dart._exceptions import DartAuthenticationError
+
+    class _ExpiringFactory:
+        def __init__(self) -> None:
+            self.created = 0
+
+        def create(self, broker: str):
+            self.created += 1
+            client = _FakeDartClient()
+            if self.created == 2:
+                client.public_disclosure.company_overview = lambda corp_code: (_ for _ in ()).throw(
+                    DartAuthenticationError("expired")
+                )
+            return client
+
+    factory = _ExpiringFactory()
+    registry = RpcRegistry(client_factory=factory)
+    command = registry.resolve_command(("dart", "company-overview"))
+    assert command is not None
+
+    registry.invoke_command(command, {"corp_code": "1"})
+    registry.invoke_command(command, {"corp_code": "2"})
+    assert factory.created == 1
+
+    registry.get_session("dart").reset()
+    assert registry.invoke_command(command, {"corp_code": "3"}) == {"corp_code": "3"}
+    assert factory.created == 3
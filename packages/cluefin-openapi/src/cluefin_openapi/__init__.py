@@ -1,10 +1,17 @@
 # cluefin_openapi package initializer
 
+from cluefin_openapi._hedging import HedgePolicy
 from cluefin_openapi._rate_limiter import TokenBucket
+from cluefin_openapi._retry import CircuitBreaker, DecorrelatedJitterBackoff, RetryBudget, RetryPolicy
 from cluefin_openapi.client_factory import BrokerClientConfig, BrokerClientFactory, create_broker_client
 
 __all__ = [
     "TokenBucket",
+    "HedgePolicy",
+    "CircuitBreaker",
+    "DecorrelatedJitterBackoff",
+    "RetryBudget",
+    "RetryPolicy",
     "BrokerClientConfig",
     "BrokerClientFactory",
     "create_broker_client",
@@ -0,0 +1,158 @@
+"""Hedged requests for latency-critical API calls.
+
+This module provides a HedgePolicy that the kis and kiwoom clients use to
+duplicate slow quote requests: when a request has not returned within a
+percentile of its recent latency, a second identical request is issued and
+whichever finishes first wins.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Iterable, Optional, TypeVar
+
+from cluefin_openapi._rate_limiter import TokenBucket
+
+T = TypeVar("T")
+
+# 주식현재가 시세 (KIS FHKST01010100), 주식기본정보요청 (Kiwoom ka10001)
+DEFAULT_HEDGED_KEYS = frozenset({"FHKST01010100", "ka10001"})
+
+
+class HedgePolicy:
+    """Opt-in hedging policy keyed by endpoint.
+
+    Only requests whose TR/API id is in ``keys`` are hedged; by default these
+    are the KIS current price and Kiwoom stock basic info quotes used by
+    interactive views. Latencies of completed requests are kept in a rolling
+    window per key.
+    Once ``min_samples`` latencies are known, a request that is still running
+    after the ``percentile`` latency gets one duplicate. The duplicate goes
+    through the client's normal request path, so it consumes a rate limiter
+    token like any other request, and it is skipped when the limiter has no
+    token available. The losing request is left to finish in the background.
+    Clients shut the worker threads down from their ``close()``.
+
+    Example:
+        >>> policy = HedgePolicy(percentile=95.0)
+        >>> client = HttpClient(token, app_key, secret_key, hedge_policy=policy)
+        >>> client.domestic_basic_quote.get_stock_current_price("J", "005930")
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        window: int = 200,
+        min_samples: int = 20,
+        min_delay: float = 0.01,
+        max_workers: int = 8,
+        keys: Optional[Iterable[str]] = None,
+    ):
+        """Initialize hedge policy.
+
+        Args:
+            percentile: Latency percentile (0-100] after which a duplicate is sent
+            window: Number of recent latencies kept per key
+            min_samples: Latencies required before hedging starts for a key
+            min_delay: Lower bound for the hedge delay in seconds
+            max_workers: Worker threads used to run primary and hedge requests
+            keys: TR/API ids to hedge (defaults to ``DEFAULT_HEDGED_KEYS``)
+        """
+        if not 0 < percentile <= 100:
+            raise ValueError("percentile must be in (0, 100]")
+        self.percentile = percentile
+        self.window = window
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_workers = max_workers
+        self.keys = frozenset(keys) if keys is not None else DEFAULT_HEDGED_KEYS
+        self.hedged_requests = 0
+        self.hedge_wins = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def applies_to(self, key: Optional[str]) -> bool:
+        """Check whether requests with this TR/API id should be hedged."""
+        return key is not None and key in self.keys
+
+    def record_latency(self, key: str, seconds: float) -> None:
+        """Record the latency of a completed request."""
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = deque(maxlen=self.window)
+                self._latencies[key] = samples
+            samples.append(seconds)
+
+    def hedge_delay(self, key: str) -> Optional[float]:
+        """Get the hedge delay for a key, or None if not enough samples are known."""
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = max(0, math.ceil(self.percentile / 100 * len(ordered)) - 1)
+        return max(self.min_delay, ordered[index])
+
+    def call(self, key: str, fn: Callable[[], T], rate_limiter: Optional[TokenBucket] = None) -> T:
+        """Run ``fn`` with hedging.
+
+        Args:
+            key: Latency tracking key, typically the TR or API id
+            fn: Zero-argument callable performing the request
+            rate_limiter: Limiter checked before issuing the duplicate
+
+        Returns:
+            Result of whichever attempt succeeds first
+
+        Raises:
+            Exception: The error of the last failing attempt if none succeeds
+        """
+        delay = self.hedge_delay(key)
+        if delay is None:
+            return self._timed(key, fn)
+
+        executor = self._get_executor()
+        primary = executor.submit(self._timed, key, fn)
+        done, _ = wait([primary], timeout=delay)
+        if done or (rate_limiter is not None and rate_limiter.available_tokens < 1):
+            return primary.result()
+
+        hedge = executor.submit(self._timed, key, fn)
+        with self._lock:
+            self.hedged_requests += 1
+
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def _timed(self, key: str, fn: Callable[[], T]) -> T:
+        start = time.monotonic()
+        result = fn()
+        self.record_latency(key, time.monotonic() - start)
+        return result
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cluefin-hedge")
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker threads without waiting for in-flight losers."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
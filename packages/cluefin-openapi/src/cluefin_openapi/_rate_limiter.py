@@ -4,6 +4,7 @@ This module provides a thread-safe TokenBucket rate limiter that can be used
 by kis, krx, dart, and kiwoom clients to control API request rates.
 """
 
+import asyncio
 import threading
 import time
 from typing import Optional
@@ -28,6 +29,11 @@ class TokenBucket:
         >>> if limiter.wait_for_tokens(timeout=5.0):
         ...     # Make API request
         ...     pass
+
+        >>> # From a coroutine, wait without blocking the event loop
+        >>> if await limiter.acquire(timeout=5.0):
+        ...     # Send request
+        ...     pass
     """
 
     def __init__(self, capacity: int, refill_rate: float):
@@ -79,18 +85,48 @@ class TokenBucket:
             if timeout is not None and (time.time() - start_time) >= timeout:
                 return False
 
-            # Calculate how long to wait for next token
-            with self._lock:
-                self._refill()
-                if self.tokens >= tokens:
-                    continue
-
-                tokens_needed = tokens - self.tokens
-                wait_time = tokens_needed / self.refill_rate
+            wait_time = self._time_until_available(tokens)
+            if wait_time <= 0:
+                continue
 
             # Sleep for a short period to avoid busy waiting
             time.sleep(min(wait_time, 0.1))
 
+    async def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """Wait until enough tokens are available without blocking the event loop.
+
+        Async counterpart of `wait_for_tokens` for use inside coroutines: it
+        sleeps with `asyncio.sleep`, so other tasks keep running while waiting.
+
+        Args:
+            tokens: Number of tokens needed
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if tokens were acquired, False if timeout occurred
+        """
+        deadline = None if timeout is None else time.time() + timeout
+
+        while True:
+            if self.consume(tokens):
+                return True
+
+            wait_time = self._time_until_available(tokens)
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0 or wait_time > remaining:
+                    return False
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+    def _time_until_available(self, tokens: int) -> float:
+        """Seconds until `tokens` tokens will be in the bucket (0 if already there)."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= tokens:
+                return 0.0
+            return (tokens - self.tokens) / self.refill_rate
+
     def _refill(self) -> None:
         """Refill tokens based on elapsed time.
 
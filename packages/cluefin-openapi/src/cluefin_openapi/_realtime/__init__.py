@@ -0,0 +1 @@
+"""Broker-neutral realtime WebSocket transport shared by the kis and kiwoom socket clients."""
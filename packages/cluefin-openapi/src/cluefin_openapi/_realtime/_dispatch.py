@@ -0,0 +1,151 @@
+"""Callback dispatch for realtime data records.
+
+`RealtimeDispatcher` lets consumers register handlers by ``tr_id`` (and
+optionally ``tr_key``) that the socket client calls straight from its receive
+task, skipping the event queue and the per-event `asyncio.wait_for` of
+`SocketClient.events()`.
+
+Handlers receive each record in the form the broker client decodes it to (a
+`RealtimeFields` view for KIS, the record dict for Kiwoom). Batch handlers
+receive a list of every record that arrived in the same event-loop tick (one
+socket read usually carries many frames during bursts), delivered once the
+receive task yields.
+"""
+
+import asyncio
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from loguru import logger
+
+RealtimeCallback = Callable[[Any], Any]
+RealtimeBatchCallback = Callable[[List[Any]], Any]
+
+
+class _Handler:
+    __slots__ = ("callback", "batch", "pending")
+
+    def __init__(self, callback: Union[RealtimeCallback, RealtimeBatchCallback], batch: bool):
+        self.callback = callback
+        self.batch = batch
+        self.pending: List[Any] = []
+
+
+class RealtimeDispatcher:
+    """Registry of realtime record handlers keyed by ``(tr_id, tr_key)``.
+
+    A ``tr_key`` of None matches every record of the ``tr_id``. Handlers may be
+    plain functions or coroutine functions; per-record coroutines are awaited
+    inline by the receive task, batch coroutines run as tasks.
+    """
+
+    def __init__(self):
+        """Initialize an empty dispatcher."""
+        self._handlers: Dict[Tuple[str, Optional[str]], List[_Handler]] = {}
+        self._pending: List[_Handler] = []
+        self._flush_scheduled = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    def add(
+        self,
+        tr_id: str,
+        tr_key: Optional[str],
+        callback: Union[RealtimeCallback, RealtimeBatchCallback],
+        batch: bool = False,
+    ) -> Callable[[], None]:
+        """Register a handler.
+
+        Args:
+            tr_id: Transaction ID to handle
+            tr_key: Transaction key to handle (None for all keys of `tr_id`)
+            callback: Called with each record, or with a list of records per
+                event-loop tick when `batch` is True
+            batch: Deliver records batched per event-loop tick
+
+        Returns:
+            Function that removes the handler
+        """
+        handler = _Handler(callback, batch)
+        # Lists are replaced, never mutated, so handlers can unregister while being dispatched.
+        self._handlers[(tr_id, tr_key)] = [*self._handlers.get((tr_id, tr_key), []), handler]
+
+        def remove() -> None:
+            self._replace(tr_id, tr_key, lambda other: other is not handler)
+
+        return remove
+
+    def remove(
+        self, tr_id: str, tr_key: Optional[str], callback: Union[RealtimeCallback, RealtimeBatchCallback]
+    ) -> None:
+        """Remove every handler registered with this callback for ``(tr_id, tr_key)``."""
+        self._replace(tr_id, tr_key, lambda handler: handler.callback != callback)
+
+    def _replace(self, tr_id: str, tr_key: Optional[str], keep: Callable[[_Handler], bool]) -> None:
+        handlers = [handler for handler in self._handlers.get((tr_id, tr_key), []) if keep(handler)]
+        if handlers:
+            self._handlers[(tr_id, tr_key)] = handlers
+        else:
+            self._handlers.pop((tr_id, tr_key), None)
+
+    def __bool__(self) -> bool:
+        return bool(self._handlers)
+
+    async def dispatch(self, fields: Any, tr_key: Optional[str], tr_id: Optional[str] = None) -> bool:
+        """Deliver a record to its handlers.
+
+        Args:
+            fields: Record from the receive task (a RealtimeFields view for KIS)
+            tr_key: Record key used for routing (the symbol for quote TRs)
+            tr_id: Transaction ID used for routing (``fields.tr_id`` if omitted)
+
+        Returns:
+            True if at least one handler took the record
+        """
+        if tr_id is None:
+            tr_id = fields.tr_id
+        handlers = self._handlers
+        specific = handlers.get((tr_id, tr_key)) if tr_key is not None else None
+        generic = handlers.get((tr_id, None))
+        if not specific and not generic:
+            return False
+
+        for group in (specific, generic):
+            if not group:
+                continue
+            for handler in group:
+                if handler.batch:
+                    if not handler.pending:
+                        self._pending.append(handler)
+                    handler.pending.append(fields)
+                    continue
+                try:
+                    result = handler.callback(fields)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.error(f"Realtime handler for {tr_id} failed: {e}")
+
+        if self._pending and not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+        return True
+
+    def _flush(self) -> None:
+        """Deliver the records batch handlers collected during this tick."""
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, []
+        for handler in pending:
+            records, handler.pending = handler.pending, []
+            try:
+                result = handler.callback(records)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self._tasks.add(task)
+                    task.add_done_callback(self._task_done)
+            except Exception as e:
+                logger.error(f"Realtime batch handler failed: {e}")
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Realtime batch handler failed: {task.exception()}")
@@ -0,0 +1,195 @@
+"""Per-subscription event queues with configurable backpressure.
+
+`RealtimeEventQueue` replaces a single bounded `asyncio.Queue` for all TRs.
+Each subscription (``tr_id:tr_key``) gets its own channel with a policy chosen
+by ``tr_id``, and consumers are served round-robin across channels so a flood
+of orderbook updates cannot starve trade prints.
+
+Policies:
+- ``DROP_OLDEST``: bounded; the oldest pending event is dropped when full
+- ``LOSSLESS``: unbounded; nothing is dropped
+- ``CONFLATE``: at most one pending event; a newer event replaces it
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import TYPE_CHECKING, Deque, Dict, Mapping, Optional
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from ._socket_client import WebSocketEvent
+
+
+class BackpressurePolicy(str, Enum):
+    """What a channel does when its consumer falls behind."""
+
+    DROP_OLDEST = "drop_oldest"
+    LOSSLESS = "lossless"
+    CONFLATE = "conflate"
+
+
+# Channel for connection and subscription status events.
+CONTROL_CHANNEL = ""
+
+
+@dataclass
+class ChannelStats:
+    """Counters for one event channel."""
+
+    policy: BackpressurePolicy
+    received: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    pending: int = 0
+    high_watermark: int = 0
+
+
+class _Channel:
+    __slots__ = ("key", "tr_id", "policy", "maxsize", "events", "stats")
+
+    def __init__(self, key: str, tr_id: Optional[str], policy: BackpressurePolicy, maxsize: int):
+        self.key = key
+        self.tr_id = tr_id
+        self.policy = policy
+        self.maxsize = maxsize
+        self.events: Deque["WebSocketEvent"] = deque()
+        self.stats = ChannelStats(policy=policy)
+
+    def push(self, event: "WebSocketEvent") -> None:
+        stats = self.stats
+        stats.received += 1
+        events = self.events
+        if self.policy is BackpressurePolicy.CONFLATE and events:
+            events[-1] = event
+            stats.conflated += 1
+            return
+        if self.policy is BackpressurePolicy.DROP_OLDEST and self.maxsize and len(events) >= self.maxsize:
+            events.popleft()
+            stats.dropped += 1
+            if stats.dropped == 1 or stats.dropped % 1000 == 0:
+                logger.warning(f"Event queue for {self.key or 'control'} full, dropped {stats.dropped} events so far")
+        events.append(event)
+        if len(events) > stats.high_watermark:
+            stats.high_watermark = len(events)
+
+    def pop(self) -> "WebSocketEvent":
+        self.stats.delivered += 1
+        return self.events.popleft()
+
+
+class RealtimeEventQueue:
+    """Queue-compatible event buffer with one channel per subscription.
+
+    Exposes the `asyncio.Queue` methods the socket client used
+    (`put_nowait`, `get_nowait`, `get`, `empty`, `qsize`) and adds optional
+    `tr_id`/`tr_key` filters for consumers that read a single subscription.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        policies: Optional[Mapping[str, BackpressurePolicy]] = None,
+        default_policy: BackpressurePolicy = BackpressurePolicy.DROP_OLDEST,
+    ):
+        """Initialize event queue.
+
+        Args:
+            maxsize: Per-channel bound for DROP_OLDEST channels (0 for unlimited)
+            policies: Backpressure policy by tr_id
+            default_policy: Policy for tr_ids without an entry and for status events
+        """
+        self.maxsize = maxsize
+        self.policies: Dict[str, BackpressurePolicy] = dict(policies or {})
+        self.default_policy = default_policy
+        self._channels: Dict[str, _Channel] = {}
+        # Keys of channels with pending events, each at most once, in service order.
+        self._ready: Deque[str] = deque()
+        self._changed = asyncio.Event()
+
+    def _channel(self, event: "WebSocketEvent") -> _Channel:
+        if event.event_type != "data" or not event.tr_id:
+            key, tr_id = CONTROL_CHANNEL, None
+        else:
+            tr_id = event.tr_id
+            key = f"{tr_id}:{event.tr_key}" if event.tr_key else tr_id
+        channel = self._channels.get(key)
+        if channel is None:
+            policy = self.policies.get(tr_id, self.default_policy) if tr_id else self.default_policy
+            channel = _Channel(key, tr_id, policy, self.maxsize)
+            self._channels[key] = channel
+        return channel
+
+    def put_nowait(self, event: "WebSocketEvent") -> None:
+        """Add an event to its channel, applying the channel's policy."""
+        channel = self._channel(event)
+        was_empty = not channel.events
+        channel.push(event)
+        if was_empty:
+            self._ready.append(channel.key)
+        self._changed.set()
+
+    def _matches(self, channel: _Channel, tr_id: Optional[str], tr_key: Optional[str]) -> bool:
+        if tr_id is None:
+            return True
+        if channel.tr_id != tr_id:
+            return False
+        return tr_key is None or channel.key == f"{tr_id}:{tr_key}"
+
+    def _pop(self, tr_id: Optional[str], tr_key: Optional[str]) -> Optional["WebSocketEvent"]:
+        ready = self._ready
+        if tr_id is None:
+            if not ready:
+                return None
+            key = ready.popleft()
+        else:
+            key = next((key for key in ready if self._matches(self._channels[key], tr_id, tr_key)), None)
+            if key is None:
+                return None
+            ready.remove(key)
+        channel = self._channels[key]
+        event = channel.pop()
+        if channel.events:
+            ready.append(key)
+        return event
+
+    def get_nowait(self, tr_id: Optional[str] = None, tr_key: Optional[str] = None) -> "WebSocketEvent":
+        """Return the next event without waiting.
+
+        Args:
+            tr_id: Only consider data events of this tr_id
+            tr_key: Only consider data events of this tr_key (requires tr_id)
+
+        Raises:
+            asyncio.QueueEmpty: If no matching event is pending
+        """
+        event = self._pop(tr_id, tr_key)
+        if event is None:
+            raise asyncio.QueueEmpty
+        return event
+
+    async def get(self, tr_id: Optional[str] = None, tr_key: Optional[str] = None) -> "WebSocketEvent":
+        """Wait for the next event, serving channels round-robin."""
+        while True:
+            event = self._pop(tr_id, tr_key)
+            if event is not None:
+                return event
+            self._changed.clear()
+            await self._changed.wait()
+
+    def empty(self, tr_id: Optional[str] = None, tr_key: Optional[str] = None) -> bool:
+        """Return True if no (matching) events are pending."""
+        if tr_id is None:
+            return not self._ready
+        return not any(self._matches(self._channels[key], tr_id, tr_key) for key in self._ready)
+
+    def qsize(self) -> int:
+        """Number of pending events across all channels."""
+        return sum(len(self._channels[key].events) for key in self._ready)
+
+    def stats(self) -> Dict[str, ChannelStats]:
+        """Snapshot of per-channel counters keyed by ``tr_id:tr_key`` (``""`` for status events)."""
+        return {key: replace(channel.stats, pending=len(channel.events)) for key, channel in self._channels.items()}
@@ -0,0 +1,328 @@
+"""RFC 6455 WebSocket frame codec used by the realtime socket clients.
+
+The codec is transport-agnostic: `encode_frame` builds a complete frame for a
+single `StreamWriter.write`, and `FrameDecoder` is fed raw chunks read from the
+stream and yields complete messages. Fragmented messages are reassembled,
+control frames interleaved between fragments are delivered immediately, and
+payloads compressed with permessage-deflate (RFC 7692) are inflated.
+
+Masking XORs the whole payload as one integer against the repeated 4-byte key,
+so the work happens in C instead of a per-byte Python loop.
+
+Protocol violations raise `WebSocketProtocolError`; `BaseSocketClient` maps it
+to the network error of the broker client that owns the connection.
+"""
+
+import os
+import struct
+import zlib
+from typing import List, Optional, Tuple, Union
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+# Upper bound for a single (reassembled) message; guards against a corrupt length field.
+MAX_MESSAGE_SIZE = 16 * 1024 * 1024
+
+_DATA_OPCODES = (OPCODE_TEXT, OPCODE_BINARY)
+_CONTROL_OPCODES = (OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG)
+_DEFLATE_TAIL = b"\x00\x00\xff\xff"
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class WebSocketProtocolError(Exception):
+    """Raised when a peer violates the WebSocket protocol or its negotiated extensions."""
+
+
+def mask_payload(payload: BytesLike, mask_key: bytes) -> bytes:
+    """Apply (or remove) a WebSocket mask.
+
+    Args:
+        payload: Frame payload
+        mask_key: 4-byte masking key
+
+    Returns:
+        Masked payload; masking is its own inverse
+    """
+    length = len(payload)
+    if length == 0:
+        return b""
+    repeated = (mask_key * (length // 4 + 1))[:length]
+    masked = int.from_bytes(payload, "little") ^ int.from_bytes(repeated, "little")
+    return masked.to_bytes(length, "little")
+
+
+def encode_frame(
+    payload: BytesLike,
+    opcode: int = OPCODE_TEXT,
+    *,
+    fin: bool = True,
+    rsv1: bool = False,
+    mask: bool = True,
+) -> bytes:
+    """Encode a single WebSocket frame.
+
+    Args:
+        payload: Frame payload
+        opcode: WebSocket opcode
+        fin: Whether this is the final frame of the message
+        rsv1: Set the RSV1 bit (marks a permessage-deflate compressed message)
+        mask: Mask the payload; required for client-to-server frames
+
+    Returns:
+        Encoded frame bytes
+    """
+    length = len(payload)
+    first = (0x80 if fin else 0) | (0x40 if rsv1 else 0) | opcode
+    mask_bit = 0x80 if mask else 0
+
+    if length <= 125:
+        header = struct.pack(">BB", first, mask_bit | length)
+    elif length <= 0xFFFF:
+        header = struct.pack(">BBH", first, mask_bit | 126, length)
+    else:
+        header = struct.pack(">BBQ", first, mask_bit | 127, length)
+
+    if not mask:
+        return header + bytes(payload)
+
+    mask_key = os.urandom(4)
+    return header + mask_key + mask_payload(payload, mask_key)
+
+
+class PerMessageDeflate:
+    """permessage-deflate (RFC 7692) state for one connection."""
+
+    OFFER = "permessage-deflate; client_max_window_bits"
+
+    def __init__(
+        self,
+        server_no_context_takeover: bool = False,
+        client_no_context_takeover: bool = False,
+        client_max_window_bits: int = zlib.MAX_WBITS,
+    ):
+        """Initialize compression state.
+
+        Args:
+            server_no_context_takeover: Server resets its compressor after each message
+            client_no_context_takeover: Client must reset its compressor after each message
+            client_max_window_bits: LZ77 window size (base-2 log) the client may compress with
+
+        Raises:
+            WebSocketProtocolError: If the window size is one zlib cannot compress with
+        """
+        # zlib silently widens a raw deflate window of 8 bits to 9, which would exceed the server's limit.
+        if not 9 <= client_max_window_bits <= zlib.MAX_WBITS:
+            raise WebSocketProtocolError(
+                f"Unsupported permessage-deflate client_max_window_bits={client_max_window_bits}"
+            )
+        self.server_no_context_takeover = server_no_context_takeover
+        self.client_no_context_takeover = client_no_context_takeover
+        self.client_max_window_bits = client_max_window_bits
+        self._compressor = zlib.compressobj(wbits=-client_max_window_bits)
+        self._decompressor = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+
+    @classmethod
+    def from_response(cls, response: bytes) -> Optional["PerMessageDeflate"]:
+        """Build the negotiated extension from a handshake response.
+
+        Args:
+            response: Raw HTTP handshake response
+
+        Returns:
+            PerMessageDeflate if the server accepted the extension, otherwise None
+
+        Raises:
+            WebSocketProtocolError: If the server sets a malformed or unsupported client_max_window_bits
+        """
+        for line in response.decode("latin-1").split("\r\n"):
+            name, _, value = line.partition(":")
+            if name.strip().lower() != "sec-websocket-extensions":
+                continue
+            for extension in value.split(","):
+                params = [param.strip().lower() for param in extension.split(";")]
+                if params[0] == "permessage-deflate":
+                    return cls(
+                        server_no_context_takeover="server_no_context_takeover" in params,
+                        client_no_context_takeover="client_no_context_takeover" in params,
+                        client_max_window_bits=cls._window_bits(params[1:]),
+                    )
+        return None
+
+    @staticmethod
+    def _window_bits(params: List[str]) -> int:
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() != "client_max_window_bits" or not value:
+                continue
+            try:
+                return int(value.strip().strip('"'))
+            except ValueError:
+                raise WebSocketProtocolError(f"Malformed permessage-deflate parameter: {param}") from None
+        return zlib.MAX_WBITS
+
+    def compress(self, payload: BytesLike) -> bytes:
+        """Compress one outgoing message payload."""
+        data = self._compressor.compress(payload) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        if self.client_no_context_takeover:
+            self._compressor = zlib.compressobj(wbits=-self.client_max_window_bits)
+        return data[:-4] if data.endswith(_DEFLATE_TAIL) else data
+
+    def decompress(self, payload: BytesLike) -> bytes:
+        """Decompress one incoming message payload."""
+        data = self._decompressor.decompress(bytes(payload) + _DEFLATE_TAIL, MAX_MESSAGE_SIZE)
+        if self._decompressor.unconsumed_tail:
+            raise WebSocketProtocolError("WebSocket message exceeds maximum size after decompression")
+        if self.server_no_context_takeover:
+            self._decompressor = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+        return data
+
+
+class FrameDecoder:
+    """Incremental decoder that turns stream chunks into complete messages.
+
+    Example:
+        ```python
+        decoder = FrameDecoder()
+        decoder.feed(await reader.read(65536))
+        while (message := decoder.next_message()) is not None:
+            opcode, payload = message
+        ```
+    """
+
+    def __init__(self, deflate: Optional[PerMessageDeflate] = None, max_message_size: int = MAX_MESSAGE_SIZE):
+        """Initialize decoder.
+
+        Args:
+            deflate: Negotiated permessage-deflate state, if any
+            max_message_size: Maximum size of a frame or reassembled message
+        """
+        self.deflate = deflate
+        self.max_message_size = max_message_size
+        self._buffer = bytearray()
+        self._fragments: List[bytes] = []
+        self._fragments_size = 0
+        self._fragment_opcode: Optional[int] = None
+        self._fragment_compressed = False
+
+    def feed(self, data: BytesLike) -> None:
+        """Append raw bytes read from the stream."""
+        self._buffer += data
+
+    def reset(self) -> None:
+        """Drop buffered bytes and any partially reassembled message."""
+        self._buffer.clear()
+        self._fragments.clear()
+        self._fragments_size = 0
+        self._fragment_opcode = None
+        self._fragment_compressed = False
+
+    @property
+    def buffered(self) -> int:
+        """Number of bytes fed but not yet consumed."""
+        return len(self._buffer)
+
+    def _next_frame(self) -> Optional[Tuple[bool, bool, int, bytes]]:
+        buffer = self._buffer
+        if len(buffer) < 2:
+            return None
+
+        first, second = buffer[0], buffer[1]
+        length = second & 0x7F
+        offset = 2
+        if length == 126:
+            if len(buffer) < 4:
+                return None
+            (length,) = struct.unpack_from(">H", buffer, 2)
+            offset = 4
+        elif length == 127:
+            if len(buffer) < 10:
+                return None
+            (length,) = struct.unpack_from(">Q", buffer, 2)
+            offset = 10
+
+        if length > self.max_message_size:
+            raise WebSocketProtocolError(f"WebSocket frame too large: {length} bytes")
+
+        mask_key = None
+        if second & 0x80:
+            # Servers should not mask frames, but tolerate it.
+            if len(buffer) < offset + 4:
+                return None
+            mask_key = bytes(buffer[offset : offset + 4])
+            offset += 4
+
+        end = offset + length
+        if len(buffer) < end:
+            return None
+
+        payload = bytes(buffer[offset:end])
+        # bytearray drops a prefix in O(1) by moving its start pointer.
+        del buffer[:end]
+        if mask_key is not None:
+            payload = mask_payload(payload, mask_key)
+        return bool(first & 0x80), bool(first & 0x40), first & 0x0F, payload
+
+    def next_message(self) -> Optional[Tuple[int, bytes]]:
+        """Return the next complete message or control frame.
+
+        Returns:
+            Tuple of (opcode, payload), or None when more data is needed
+
+        Raises:
+            WebSocketProtocolError: If the stream violates the WebSocket protocol
+        """
+        while True:
+            frame = self._next_frame()
+            if frame is None:
+                return None
+            fin, rsv1, opcode, payload = frame
+
+            if opcode in _CONTROL_OPCODES:
+                if not fin or len(payload) > 125:
+                    raise WebSocketProtocolError("WebSocket protocol error: invalid control frame")
+                return opcode, payload
+
+            if rsv1 and self.deflate is None:
+                raise WebSocketProtocolError("WebSocket protocol error: compressed frame without permessage-deflate")
+
+            if opcode in _DATA_OPCODES:
+                if self._fragment_opcode is not None:
+                    raise WebSocketProtocolError("WebSocket protocol error: new message before previous one finished")
+                if fin:
+                    return opcode, self._inflate(payload) if rsv1 else payload
+                self._fragment_opcode = opcode
+                self._fragment_compressed = rsv1
+            elif opcode == OPCODE_CONTINUATION:
+                if self._fragment_opcode is None:
+                    raise WebSocketProtocolError("WebSocket protocol error: unexpected continuation frame")
+            else:
+                raise WebSocketProtocolError(f"WebSocket protocol error: unknown opcode {opcode:#x}")
+
+            self._fragments.append(payload)
+            self._fragments_size += len(payload)
+            if self._fragments_size > self.max_message_size:
+                raise WebSocketProtocolError(f"WebSocket message too large: {self._fragments_size} bytes")
+
+            if fin:
+                message_opcode = self._fragment_opcode
+                message = b"".join(self._fragments)
+                compressed = self._fragment_compressed
+                self._fragments.clear()
+                self._fragments_size = 0
+                self._fragment_opcode = None
+                self._fragment_compressed = False
+                return message_opcode, self._inflate(message) if compressed else message
+
+    def _inflate(self, payload: bytes) -> bytes:
+        if self.deflate is None:
+            raise WebSocketProtocolError("WebSocket protocol error: compressed frame without permessage-deflate")
+        try:
+            return self.deflate.decompress(payload)
+        except zlib.error as e:
+            raise WebSocketProtocolError(f"WebSocket decompression failed: {e}") from e
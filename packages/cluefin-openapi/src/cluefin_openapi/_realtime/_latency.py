@@ -0,0 +1,189 @@
+"""Rolling latency histograms for realtime feeds.
+
+`LatencyMonitor` tracks two latencies per ``tr_id``:
+
+- exchange-to-receive: local receive time minus the exchange time carried in
+  the record. Exchange times usually have one-second resolution and come from
+  the exchange clock, so this measures feed delay in whole seconds plus any
+  clock skew; negative values count as zero.
+- receive-to-dispatch: time from the socket read that completed a frame to
+  its delivery to an `on()` handler or out of `events()`, i.e. how far the
+  consumers and the queue trail the feed.
+
+Histograms use power-of-two microsecond buckets and keep a rolling window
+split into slots; a slot is cleared when the window moves past it.
+"""
+
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+# Bucket i counts latencies below 2**i microseconds (bucket 0: below 1us); the last is open-ended.
+BUCKETS = 36
+
+
+@dataclass
+class LatencyStats:
+    """Summary of a latency histogram in seconds.
+
+    Percentiles are the upper bounds of the buckets they fall in, so they
+    overstate the true value by less than a factor of two.
+    """
+
+    count: int
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class LatencyHistogram:
+    """Rolling histogram of latencies over the last `window` seconds."""
+
+    def __init__(self, window: float = 60.0, slots: int = 6):
+        """Initialize histogram.
+
+        Args:
+            window: Seconds of history to keep
+            slots: Number of slots the window is split into; history expires
+                one slot (window / slots seconds) at a time
+        """
+        if window <= 0 or slots < 1:
+            raise ValueError("Window and slots must be positive")
+        self.window = window
+        self.slots = slots
+        self._slot_width = window / slots
+        self._counts = array("q", bytes(8 * slots * BUCKETS))
+        self._totals = array("d", bytes(8 * slots))
+        self._maxima = array("d", bytes(8 * slots))
+        self._epochs = array("q", [-1]) * slots
+
+    def _slot(self, now: float) -> int:
+        """Slot for time `now`, cleared first if it holds an expired period."""
+        epoch = int(now // self._slot_width)
+        slot = epoch % self.slots
+        if self._epochs[slot] != epoch:
+            start = slot * BUCKETS
+            self._counts[start : start + BUCKETS] = array("q", bytes(8 * BUCKETS))
+            self._totals[slot] = 0.0
+            self._maxima[slot] = 0.0
+            self._epochs[slot] = epoch
+        return slot
+
+    def record(self, latency: float, now: Optional[float] = None) -> None:
+        """Add one latency in seconds (negative values count as zero).
+
+        Args:
+            latency: Latency in seconds
+            now: Monotonic time of the observation (time.monotonic() if omitted)
+        """
+        if latency < 0:
+            latency = 0.0
+        slot = self._slot(time.monotonic() if now is None else now)
+        bucket = min(int(latency * 1e6).bit_length(), BUCKETS - 1)
+        self._counts[slot * BUCKETS + bucket] += 1
+        self._totals[slot] += latency
+        if latency > self._maxima[slot]:
+            self._maxima[slot] = latency
+
+    def stats(self, now: Optional[float] = None) -> LatencyStats:
+        """Summarize the latencies recorded within the window ending at `now`."""
+        now = time.monotonic() if now is None else now
+        oldest = int(now // self._slot_width) - self.slots + 1
+        merged = [0] * BUCKETS
+        total = maximum = 0.0
+        for slot in range(self.slots):
+            if self._epochs[slot] < oldest:
+                continue
+            start = slot * BUCKETS
+            for bucket in range(BUCKETS):
+                merged[bucket] += self._counts[start + bucket]
+            total += self._totals[slot]
+            maximum = max(maximum, self._maxima[slot])
+
+        count = sum(merged)
+        if not count:
+            return LatencyStats(count=0, mean=0.0, p50=0.0, p90=0.0, p99=0.0, max=0.0)
+        return LatencyStats(
+            count=count,
+            mean=total / count,
+            p50=self._percentile(merged, count, 0.50, maximum),
+            p90=self._percentile(merged, count, 0.90, maximum),
+            p99=self._percentile(merged, count, 0.99, maximum),
+            max=maximum,
+        )
+
+    @staticmethod
+    def _percentile(counts: list, count: int, quantile: float, maximum: float) -> float:
+        rank = quantile * count
+        seen = 0
+        for bucket, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return min((1 << bucket) / 1e6, maximum)
+        return maximum
+
+
+class LatencyMonitor:
+    """Per-tr_id exchange-to-receive and receive-to-dispatch latency histograms.
+
+    The socket clients record receive-to-dispatch latencies; broker monitors
+    such as the KIS `FeedLatencyMonitor` also derive exchange-to-receive
+    latencies from the exchange times their records carry.
+
+    Example:
+        ```python
+        monitor = LatencyMonitor(window=60.0)
+        client = SocketClient(..., latency_monitor=monitor)
+        ...
+        for tr_id, stats in monitor.dispatch_latency().items():
+            if stats.p99 > 0.5:
+                logger.warning(f"{tr_id} consumers trail the feed by {stats.p99:.3f}s")
+        ```
+    """
+
+    def __init__(self, window: float = 60.0, slots: int = 6):
+        """Initialize monitor.
+
+        Args:
+            window: Seconds of history each histogram keeps
+            slots: Number of slots each window is split into
+        """
+        self.window = window
+        self.slots = slots
+        self._exchange: Dict[str, LatencyHistogram] = {}
+        self._dispatch: Dict[str, LatencyHistogram] = {}
+
+    def _histogram(self, histograms: Dict[str, LatencyHistogram], tr_id: str) -> LatencyHistogram:
+        histogram = histograms.get(tr_id)
+        if histogram is None:
+            histogram = histograms[tr_id] = LatencyHistogram(self.window, self.slots)
+        return histogram
+
+    def record_exchange(self, tr_id: str, latency: float, now: Optional[float] = None) -> None:
+        """Add an exchange-to-receive latency in seconds."""
+        self._histogram(self._exchange, tr_id).record(latency, now)
+
+    def record_dispatch(self, tr_id: str, latency: float, now: Optional[float] = None) -> None:
+        """Add a receive-to-dispatch latency in seconds."""
+        self._histogram(self._dispatch, tr_id).record(latency, now)
+
+    def record_dispatch_since(self, tr_id: Optional[str], received_monotonic_ns: int) -> None:
+        """Add the receive-to-dispatch latency of a record delivered now.
+
+        Args:
+            tr_id: Transaction ID of the record ("" if None)
+            received_monotonic_ns: `time.monotonic_ns()` of the socket read that completed the record
+        """
+        now_ns = time.monotonic_ns()
+        self.record_dispatch(tr_id or "", (now_ns - received_monotonic_ns) / 1e9, now_ns / 1e9)
+
+    def exchange_latency(self, now: Optional[float] = None) -> Dict[str, LatencyStats]:
+        """Exchange-to-receive latency stats by tr_id."""
+        return {tr_id: histogram.stats(now) for tr_id, histogram in self._exchange.items()}
+
+    def dispatch_latency(self, now: Optional[float] = None) -> Dict[str, LatencyStats]:
+        """Receive-to-dispatch latency stats by tr_id."""
+        return {tr_id: histogram.stats(now) for tr_id, histogram in self._dispatch.items()}
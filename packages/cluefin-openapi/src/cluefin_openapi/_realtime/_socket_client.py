@@ -0,0 +1,824 @@
+"""Broker-neutral WebSocket transport for the realtime socket clients.
+
+`BaseSocketClient` owns everything below the broker protocol: the handshake,
+RFC 6455 framing with permessage-deflate, keepalive pings, supervised
+reconnects with subscription replay, the rate-limited subscription registry,
+the per-subscription event queue and the `on()` handler registry. The KIS and
+Kiwoom socket clients subclass it and supply the registration messages, the
+decoding of incoming text messages and their own exception types.
+"""
+
+import abc
+import asyncio
+import base64
+import hashlib
+import os
+import ssl
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Literal, Optional, Tuple, Type, Union
+
+from loguru import logger
+
+from cluefin_openapi._rate_limiter import TokenBucket
+
+from ._dispatch import RealtimeBatchCallback, RealtimeCallback, RealtimeDispatcher
+from ._event_queue import BackpressurePolicy, ChannelStats, RealtimeEventQueue
+from ._frame import (
+    OPCODE_BINARY,
+    OPCODE_CLOSE,
+    OPCODE_PING,
+    OPCODE_PONG,
+    OPCODE_TEXT,
+    FrameDecoder,
+    PerMessageDeflate,
+    WebSocketProtocolError,
+    encode_frame,
+)
+from ._latency import LatencyMonitor
+
+
+class SubscriptionType(str, Enum):
+    """WebSocket subscription type."""
+
+    SUBSCRIBE = "1"
+    UNSUBSCRIBE = "2"
+
+
+@dataclass
+class WebSocketEvent:
+    """Event emitted from WebSocket for queue-based processing.
+
+    For data events, `data["values"]` holds the decoded record (a
+    `RealtimeFields` view for KIS, the FID dict for Kiwoom) and `raw` is only
+    set when the client was created with `keep_raw=True`. Data events are
+    stamped with the wall-clock (`received_ns`, ns since the epoch) and
+    monotonic (`received_monotonic_ns`) time of the socket read that
+    completed their frame.
+
+    With `reconnect=True`, a "reconnecting" event precedes each reconnect attempt
+    and a "gap" event marks the window in which data may have been missed once
+    the connection and its subscriptions are restored.
+    """
+
+    event_type: Literal[
+        "data", "connected", "disconnected", "error", "subscribed", "unsubscribed", "reconnecting", "gap"
+    ]
+    tr_id: Optional[str] = None
+    tr_key: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[Exception] = None
+    raw: Optional[str] = None
+    received_ns: Optional[int] = None
+    received_monotonic_ns: Optional[int] = None
+
+
+class BaseSocketClient(abc.ABC):
+    """Transport shared by the realtime WebSocket clients.
+
+    Owns the connection (handshake, framing, permessage-deflate, keepalive and
+    supervised reconnects), the subscription registry with its rate limiter,
+    the per-subscription event queue and the `on()` handler registry.
+    Subclasses implement the broker protocol: `_build_subscription_message`
+    for registrations and `_handle_message` for incoming text messages.
+    """
+
+    # Handshake path used when the WebSocket URL has none.
+    WS_PATH = "/"
+
+    # Bytes requested per stream read; one read usually carries many frames during bursts.
+    READ_CHUNK_SIZE = 65536
+
+    # Backpressure policy by tr_id applied before the caller's `backpressure`.
+    DEFAULT_BACKPRESSURE_POLICIES: Dict[str, BackpressurePolicy] = {}
+
+    # Exceptions raised for transport failures and rejected requests; set by each broker client.
+    _network_error: Type[Exception]
+    _api_error: Type[Exception]
+
+    def __init__(
+        self,
+        ws_url: str,
+        debug: bool = False,
+        queue_maxsize: int = 1000,
+        rate_limit_requests_per_second: float = 5.0,
+        rate_limit_burst: int = 3,
+        compression: bool = False,
+        keep_raw: bool = False,
+        backpressure: Optional[Dict[str, BackpressurePolicy]] = None,
+        reconnect: bool = False,
+        reconnect_initial_delay: float = 1.0,
+        reconnect_max_delay: float = 30.0,
+        reconnect_max_attempts: Optional[int] = None,
+        ping_interval: Optional[float] = None,
+        ping_timeout: float = 10.0,
+        event_queue: Optional[RealtimeEventQueue] = None,
+        on_reconnect: Optional[Callable[["BaseSocketClient"], Awaitable[None]]] = None,
+        dispatcher: Optional[RealtimeDispatcher] = None,
+        latency_monitor: Optional[LatencyMonitor] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            ws_url: WebSocket URL (ws:// or wss://, optionally with a path)
+            debug: Enable debug logging
+            queue_maxsize: Maximum pending events per subscription for DROP_OLDEST
+                channels (0 for unlimited)
+            rate_limit_requests_per_second: Rate limit for subscriptions
+            rate_limit_burst: Burst limit for subscriptions
+            compression: Offer permessage-deflate during the handshake
+            keep_raw: Attach the decoded frame text to data events as `raw`
+            backpressure: Backpressure policy by tr_id, merged over DEFAULT_BACKPRESSURE_POLICIES
+            reconnect: Reconnect with exponential backoff and replay all subscriptions
+            reconnect_initial_delay: Delay before the first reconnect attempt in seconds
+            reconnect_max_delay: Maximum delay between reconnect attempts in seconds
+            reconnect_max_attempts: Give up after this many consecutive failed attempts
+            ping_interval: Send a keepalive ping every this many seconds (None disables)
+            ping_timeout: Drop the connection when nothing is received within this
+                many seconds after a keepalive ping
+            event_queue: Emit events into this queue instead of a private one
+            on_reconnect: Coroutine called with this client after a supervised reconnect
+            dispatcher: Dispatch records to the handlers of this dispatcher instead
+                of a private one
+            latency_monitor: Record receive-to-dispatch latencies (and, where the
+                protocol carries exchange times, exchange-to-receive latencies)
+        """
+        self.debug = debug
+
+        self._ws_url = ws_url
+        if event_queue is None:
+            policies = {**self.DEFAULT_BACKPRESSURE_POLICIES, **(backpressure or {})}
+            event_queue = RealtimeEventQueue(maxsize=queue_maxsize, policies=policies)
+        self._event_queue = event_queue
+        self._dispatcher = dispatcher if dispatcher is not None else RealtimeDispatcher()
+        self._subscriptions: Dict[str, str] = {}  # tr_id:tr_key -> subscription key
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connected = False
+        self._receive_task: Optional[asyncio.Task] = None
+        self._rate_limiter = TokenBucket(capacity=rate_limit_burst, refill_rate=rate_limit_requests_per_second)
+        self._compression = compression
+        self._keep_raw = keep_raw
+        self._deflate: Optional[PerMessageDeflate] = None
+        self._decoder = FrameDecoder()
+        self._reconnect = reconnect
+        self._reconnect_initial_delay = reconnect_initial_delay
+        self._reconnect_max_delay = reconnect_max_delay
+        self._reconnect_max_attempts = reconnect_max_attempts
+        self._ping_interval = ping_interval
+        self._ping_timeout = ping_timeout
+        self._on_reconnect = on_reconnect
+        self._closing = False
+        self._reconnecting = False
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._resume_task: Optional[asyncio.Task] = None
+        self._last_received = time.monotonic()
+        self._latency_monitor = latency_monitor
+        self._received_ns = time.time_ns()
+        self._received_monotonic_ns = time.monotonic_ns()
+
+        if debug:
+            logger.enable("cluefin_openapi._realtime")
+        else:
+            logger.disable("cluefin_openapi._realtime")
+
+    async def __aenter__(self) -> "BaseSocketClient":
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def connect(self) -> None:
+        """Connect to WebSocket server.
+
+        Raises:
+            _network_error: If connection fails
+        """
+        try:
+            await self._open_connection()
+        except Exception as e:
+            raise self._network_error(f"Failed to connect to WebSocket: {e}") from e
+
+        self._closing = False
+        self._connected = True
+
+        # Start receive task; in supervised mode it also reconnects
+        self._receive_task = asyncio.create_task(self._supervise() if self._reconnect else self._receive_loop())
+        if self._ping_interval:
+            self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+        # Emit connected event
+        await self._emit_event(WebSocketEvent(event_type="connected"))
+
+        if self.debug:
+            logger.debug("WebSocket connected successfully")
+
+    async def _open_connection(self) -> None:
+        """Open the TCP connection and perform the WebSocket handshake."""
+        # Parse WebSocket URL
+        url = self._ws_url
+        if url.startswith("ws://"):
+            host_port = url[5:]
+            use_ssl = False
+        elif url.startswith("wss://"):
+            host_port = url[6:]
+            use_ssl = True
+        else:
+            raise ValueError(f"Invalid WebSocket URL: {url}")
+
+        host_port, slash, path = host_port.partition("/")
+        path = slash + path if path else self.WS_PATH
+        if ":" in host_port:
+            host, port_str = host_port.split(":", 1)
+            port = int(port_str)
+        else:
+            host = host_port
+            port = 443 if use_ssl else 80
+
+        if self.debug:
+            logger.debug(f"Connecting to {host}:{port} (SSL: {use_ssl})")
+
+        # Create connection
+        ssl_context = ssl.create_default_context() if use_ssl else None
+        self._reader, self._writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        self._last_received = time.monotonic()
+
+        # Perform WebSocket handshake
+        await self._websocket_handshake(host, port, path)
+
+    async def _websocket_handshake(self, host: str, port: int, path: Optional[str] = None) -> None:
+        """Perform WebSocket handshake.
+
+        Args:
+            host: WebSocket server host
+            port: WebSocket server port
+            path: Request path (WS_PATH if omitted)
+        """
+        # Generate WebSocket key
+        ws_key = base64.b64encode(os.urandom(16)).decode()
+
+        # Build handshake request
+        path = path or self.WS_PATH
+        handshake = (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            f"Upgrade: websocket\r\n"
+            f"Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {ws_key}\r\n"
+            f"Sec-WebSocket-Version: 13\r\n"
+        )
+        if self._compression:
+            handshake += f"Sec-WebSocket-Extensions: {PerMessageDeflate.OFFER}\r\n"
+        handshake += "\r\n"
+
+        if self._writer is None or self._reader is None:
+            raise self._network_error("WebSocket handshake failed: connection not initialized")
+
+        self._writer.write(handshake.encode())
+        await self._writer.drain()
+
+        # Read handshake response
+        response = await self._reader.readuntil(b"\r\n\r\n")
+
+        if self.debug:
+            logger.debug(f"Handshake response: {response.decode()}")
+
+        # Verify handshake response
+        if b"101" not in response:
+            raise self._network_error(f"WebSocket handshake failed: {response.decode()}")
+
+        # Verify Sec-WebSocket-Accept (SHA1 is required by RFC 6455 WebSocket protocol)
+        expected_accept = base64.b64encode(
+            hashlib.sha1(
+                (ws_key + "258EAFA5-E914-47DA-95CA-C5AB0DC85B11").encode(),
+                usedforsecurity=False,
+            ).digest()
+        ).decode()
+
+        if expected_accept.encode() not in response:
+            raise self._network_error("WebSocket handshake: invalid Sec-WebSocket-Accept")
+
+        try:
+            self._deflate = PerMessageDeflate.from_response(response) if self._compression else None
+        except WebSocketProtocolError as e:
+            raise self._network_error(f"WebSocket handshake failed: {e}") from e
+        self._decoder = FrameDecoder(deflate=self._deflate)
+
+    async def _send_frame(self, data: bytes, opcode: int = OPCODE_TEXT, drain: bool = True) -> None:
+        """Send a WebSocket frame.
+
+        Data frames are compressed when permessage-deflate was negotiated.
+
+        Args:
+            data: Data to send
+            opcode: WebSocket opcode (0x1 = text, 0x9 = ping, 0xA = pong)
+            drain: Wait for the transport buffer to flush; pass False to
+                pipeline several frames and drain once
+        """
+        if self._writer is None:
+            raise self._network_error("WebSocket send failed: connection not initialized")
+
+        compressed = self._deflate is not None and opcode in (OPCODE_TEXT, OPCODE_BINARY)
+        if compressed:
+            data = self._deflate.compress(data)
+
+        # Client-to-server frames are always masked
+        self._writer.write(encode_frame(data, opcode, rsv1=compressed))
+        if drain:
+            await self._writer.drain()
+
+    async def _drain(self) -> None:
+        """Flush frames written with `drain=False`."""
+        if self._writer is not None:
+            await self._writer.drain()
+
+    async def _receive_frame(self) -> tuple[int, bytes]:
+        """Receive the next complete WebSocket message or control frame.
+
+        Reads the stream in large chunks and decodes every frame already
+        buffered before reading again. Fragmented messages are returned
+        reassembled under their original opcode.
+
+        Returns:
+            Tuple of (opcode, payload)
+
+        Raises:
+            _network_error: If the connection is closed or the stream is malformed
+        """
+        if self._reader is None:
+            raise self._network_error("WebSocket receive failed: connection not initialized")
+
+        while True:
+            try:
+                message = self._decoder.next_message()
+            except WebSocketProtocolError as e:
+                raise self._network_error(str(e)) from e
+            if message is not None:
+                return message
+            chunk = await self._reader.read(self.READ_CHUNK_SIZE)
+            if not chunk:
+                raise self._network_error("WebSocket connection closed by server")
+            self._received_ns = time.time_ns()
+            self._received_monotonic_ns = time.monotonic_ns()
+            self._last_received = self._received_monotonic_ns / 1e9
+            self._decoder.feed(chunk)
+
+    async def _receive_loop(self) -> None:
+        """Main receive loop for WebSocket messages."""
+        try:
+            while self._connected:
+                opcode, payload = await self._receive_frame()
+
+                if opcode == OPCODE_TEXT:
+                    await self._handle_message(payload, self._received_ns, self._received_monotonic_ns)
+                elif opcode == OPCODE_CLOSE:
+                    if self.debug:
+                        logger.debug("Received close frame")
+                    self._connected = False
+                    await self._emit_event(WebSocketEvent(event_type="disconnected"))
+                    break
+                elif opcode == OPCODE_PING:
+                    if self.debug:
+                        logger.debug("Received ping, sending pong")
+                    await self._send_frame(payload, opcode=OPCODE_PONG)
+                elif opcode == OPCODE_PONG:
+                    if self.debug:
+                        logger.debug("Received pong")
+
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            if self._connected:
+                logger.error(f"WebSocket receive error: {e}")
+                await self._emit_event(WebSocketEvent(event_type="error", error=e))
+                self._connected = False
+
+    async def _supervise(self) -> None:
+        """Run the receive loop and reconnect whenever the connection drops."""
+        try:
+            while not self._closing:
+                await self._receive_loop()
+                if self._closing or not await self._reconnect_with_backoff():
+                    break
+        except asyncio.CancelledError:
+            pass
+
+    def _reconnect_delay(self, attempt: int) -> float:
+        """Exponential backoff delay before the given (1-based) reconnect attempt."""
+        return min(self._reconnect_max_delay, self._reconnect_initial_delay * 2 ** min(attempt - 1, 32))
+
+    async def _reconnect_with_backoff(self) -> bool:
+        """Reconnect and start resuming the session in the background.
+
+        Subscription replay and the ``on_reconnect`` callback run in a
+        separate task (see ``_resume_after_reconnect``) so the receive loop
+        restarts as soon as the connection is open and keeps answering
+        PINGPONG while rate-limited replay is in progress.
+
+        Returns:
+            True if the connection was restored, False if attempts are exhausted
+        """
+        # Nothing was received after the last frame, so the gap starts there.
+        gap_start = time.time() - (time.monotonic() - self._last_received)
+        self._reconnecting = True
+        if self._resume_task is not None:
+            self._resume_task.cancel()
+            self._resume_task = None
+        self._drop_transport()
+        attempt = 0
+        try:
+            while not self._closing:
+                attempt += 1
+                if self._reconnect_max_attempts is not None and attempt > self._reconnect_max_attempts:
+                    error = self._network_error(f"WebSocket reconnect failed after {attempt - 1} attempts")
+                    logger.error(str(error))
+                    await self._emit_event(WebSocketEvent(event_type="error", error=error))
+                    return False
+
+                delay = self._reconnect_delay(attempt)
+                await self._emit_event(
+                    WebSocketEvent(event_type="reconnecting", data={"attempt": attempt, "delay": delay})
+                )
+                await asyncio.sleep(delay)
+
+                try:
+                    await self._open_connection()
+                except Exception as e:
+                    logger.warning(f"WebSocket reconnect attempt {attempt} failed: {e}")
+                    self._drop_transport()
+                    continue
+
+                self._connected = True
+                self._resume_task = asyncio.create_task(self._resume_after_reconnect(gap_start, attempt))
+                return True
+            return False
+        finally:
+            self._reconnecting = False
+
+    async def _resume_after_reconnect(self, gap_start: float, attempts: int) -> None:
+        """Replay subscriptions, then report the gap and run ``on_reconnect``.
+
+        A failed replay closes the writer, which ends the receive loop so the
+        supervisor reconnects again.
+        """
+        try:
+            await self._replay_subscriptions()
+        except Exception as e:
+            logger.warning(f"WebSocket subscription replay failed: {e}")
+            if self._writer is not None:
+                self._writer.close()
+            return
+
+        gap_end = time.time()
+        logger.info(f"WebSocket reconnected after {attempts} attempts ({gap_end - gap_start:.1f}s gap)")
+        await self._emit_event(
+            WebSocketEvent(
+                event_type="gap",
+                data={
+                    "start": gap_start,
+                    "end": gap_end,
+                    "duration": gap_end - gap_start,
+                    "attempts": attempts,
+                    "subscriptions": list(self._subscriptions),
+                },
+            )
+        )
+        if self._on_reconnect is not None:
+            try:
+                await self._on_reconnect(self)
+            except Exception as e:
+                logger.error(f"WebSocket on_reconnect callback failed: {e}")
+
+    async def _replay_subscriptions(self) -> None:
+        """Re-send registration messages for every active subscription."""
+        pairs = [(key.split(":", 1)[0], tr_key) for key, tr_key in self._subscriptions.items()]
+        async for _ in self._send_registrations(pairs):
+            pass
+
+    async def _send_registrations(self, pairs: Iterable[Tuple[str, str]]) -> AsyncIterator[Tuple[str, str]]:
+        """Pipeline subscribe messages at the rate limiter's pace.
+
+        Frames are written back to back while tokens are available and the
+        writer is drained only while waiting for tokens and at the end, so a
+        large batch never blocks the event loop or waits per message.
+
+        Yields:
+            Each (tr_id, tr_key) pair once its message has been written
+
+        Raises:
+            _api_error: If no token becomes available within 5 seconds
+        """
+        for tr_id, tr_key in pairs:
+            if not self._rate_limiter.consume():
+                await self._drain()
+                if not await self._rate_limiter.acquire(timeout=5.0):
+                    raise self._api_error("Subscription rate limit exceeded")
+            message = self._build_subscription_message(tr_id, tr_key, SubscriptionType.SUBSCRIBE)
+            await self._send_frame(message.encode(), drain=False)
+            yield tr_id, tr_key
+        await self._drain()
+
+    def _drop_transport(self) -> None:
+        """Close the current transport without a close handshake."""
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = None
+        self._reader = None
+        self._deflate = None
+        self._decoder.reset()
+
+    async def _keepalive_loop(self) -> None:
+        """Ping the server periodically and drop the connection if it stops answering.
+
+        Dropping the transport ends the receive loop, so a supervised client
+        reconnects.
+        """
+        try:
+            while not self._closing:
+                await asyncio.sleep(self._ping_interval)
+                if not self._connected or self._writer is None:
+                    continue
+                sent_at = time.monotonic()
+                try:
+                    await self._send_frame(b"", opcode=OPCODE_PING)
+                except Exception as e:
+                    logger.warning(f"WebSocket keepalive ping failed: {e}")
+                    continue
+                await asyncio.sleep(self._ping_timeout)
+                if self._connected and self._writer is not None and self._last_received < sent_at:
+                    logger.warning(f"No WebSocket traffic within {self._ping_timeout}s of keepalive ping")
+                    self._writer.close()
+        except asyncio.CancelledError:
+            pass
+
+    async def _emit_event(self, event: WebSocketEvent) -> None:
+        """Emit event to its subscription channel.
+
+        Args:
+            event: Event to emit
+        """
+        self._event_queue.put_nowait(event)
+
+    async def subscribe(self, tr_id: str, tr_key: str) -> None:
+        """Subscribe to real-time data.
+
+        Args:
+            tr_id: Transaction ID (e.g., "H0STASP0" for KIS stock quotes)
+            tr_key: Transaction key (e.g., stock code "005930")
+
+        Raises:
+            _api_error: If subscription fails
+        """
+        if not self._connected:
+            raise self._api_error("WebSocket not connected")
+
+        # Rate limiting
+        if not await self._rate_limiter.acquire(timeout=5.0):
+            raise self._api_error("Subscription rate limit exceeded")
+
+        subscription_key = f"{tr_id}:{tr_key}"
+        if subscription_key in self._subscriptions:
+            if self.debug:
+                logger.debug(f"Already subscribed to {subscription_key}")
+            return
+
+        message = self._build_subscription_message(tr_id, tr_key, SubscriptionType.SUBSCRIBE)
+
+        if self.debug:
+            logger.debug(f"Subscribing: {message}")
+
+        await self._send_frame(message.encode())
+        self._subscriptions[subscription_key] = tr_key
+
+        await self._emit_event(WebSocketEvent(event_type="subscribed", tr_id=tr_id, tr_key=tr_key))
+
+    async def subscribe_many(self, subscriptions: Iterable[Tuple[str, str]]) -> None:
+        """Subscribe to many subscriptions at once.
+
+        Registration messages are pipelined at the allowed rate without
+        blocking the event loop, so the receive loop keeps answering PINGPONG
+        while hundreds of symbols are registered. Existing and duplicate
+        subscriptions are skipped.
+
+        Args:
+            subscriptions: (tr_id, tr_key) pairs, e.g. [("H0STCNT0", "005930")]
+
+        Raises:
+            _api_error: If not connected or the rate limit is exceeded; the
+                subscriptions sent before the error remain registered
+        """
+        if not self._connected:
+            raise self._api_error("WebSocket not connected")
+
+        pending: Dict[str, Tuple[str, str]] = {}
+        for tr_id, tr_key in subscriptions:
+            subscription_key = f"{tr_id}:{tr_key}"
+            if subscription_key not in self._subscriptions:
+                pending.setdefault(subscription_key, (tr_id, tr_key))
+
+        if self.debug:
+            logger.debug(f"Subscribing to {len(pending)} subscriptions")
+
+        async for tr_id, tr_key in self._send_registrations(pending.values()):
+            self._subscriptions[f"{tr_id}:{tr_key}"] = tr_key
+            await self._emit_event(WebSocketEvent(event_type="subscribed", tr_id=tr_id, tr_key=tr_key))
+
+    async def unsubscribe(self, tr_id: str, tr_key: str) -> None:
+        """Unsubscribe from real-time data.
+
+        Args:
+            tr_id: Transaction ID
+            tr_key: Transaction key
+        """
+        if not self._connected:
+            raise self._api_error("WebSocket not connected")
+
+        subscription_key = f"{tr_id}:{tr_key}"
+        if subscription_key not in self._subscriptions:
+            if self.debug:
+                logger.debug(f"Not subscribed to {subscription_key}")
+            return
+
+        message = self._build_subscription_message(tr_id, tr_key, SubscriptionType.UNSUBSCRIBE)
+
+        if self.debug:
+            logger.debug(f"Unsubscribing: {message}")
+
+        await self._send_frame(message.encode())
+        del self._subscriptions[subscription_key]
+
+        await self._emit_event(WebSocketEvent(event_type="unsubscribed", tr_id=tr_id, tr_key=tr_key))
+
+    @abc.abstractmethod
+    async def _handle_message(
+        self,
+        raw: Union[str, bytes, memoryview],
+        received_ns: Optional[int] = None,
+        received_monotonic_ns: Optional[int] = None,
+    ) -> None:
+        """Handle an incoming text message.
+
+        Args:
+            raw: Message payload as received
+            received_ns: Wall-clock receive time in ns since the epoch (now if omitted)
+            received_monotonic_ns: Monotonic receive time in ns (now if omitted)
+        """
+
+    @abc.abstractmethod
+    def _build_subscription_message(self, tr_id: str, tr_key: str, tr_type: SubscriptionType) -> str:
+        """Build a subscription/unsubscription message.
+
+        Args:
+            tr_id: Transaction ID
+            tr_key: Transaction key
+            tr_type: Subscription type
+
+        Returns:
+            JSON message string
+        """
+
+    def on(
+        self,
+        tr_id: str,
+        tr_key: Optional[str],
+        callback: Union[RealtimeCallback, RealtimeBatchCallback],
+        batch: bool = False,
+    ) -> Callable[[], None]:
+        """Register a handler called from the receive task for matching records.
+
+        Handlers get each decoded record without a queue round trip;
+        matching records are no longer yielded by `events()`. A coroutine
+        handler is awaited before the next frame is read, so keep it short.
+
+        Args:
+            tr_id: Transaction ID (e.g., "H0STCNT0")
+            tr_key: Transaction key (e.g., "005930"), or None for all keys
+            callback: Called with each record, or with the list of records that
+                arrived in one event-loop tick when `batch` is True
+            batch: Deliver records batched per event-loop tick
+
+        Returns:
+            Function that removes the handler
+
+        Example:
+            ```python
+            def on_ticks(records):
+                for values in records:
+                    strategy.update(values[0], float(values[2]))
+
+
+            client.on("H0STCNT0", None, on_ticks, batch=True)
+            ```
+        """
+        return self._dispatcher.add(tr_id, tr_key, callback, batch=batch)
+
+    def off(self, tr_id: str, tr_key: Optional[str], callback: Union[RealtimeCallback, RealtimeBatchCallback]) -> None:
+        """Remove handlers registered with `on()` for this callback.
+
+        Args:
+            tr_id: Transaction ID
+            tr_key: Transaction key, or None
+            callback: Callback passed to `on()`
+        """
+        self._dispatcher.remove(tr_id, tr_key, callback)
+
+    async def events(self, tr_id: Optional[str] = None, tr_key: Optional[str] = None):
+        """Async generator for receiving events.
+
+        Without filters, yields every event, serving subscriptions round-robin.
+        With `tr_id` (and optionally `tr_key`), yields only data events of those
+        subscriptions, e.g. for one consumer task per subscription.
+
+        Args:
+            tr_id: Only yield data events of this tr_id
+            tr_key: Only yield data events of this tr_key
+
+        Yields:
+            WebSocketEvent objects
+
+        Example:
+            ```python
+            async for event in client.events():
+                if event.event_type == "data":
+                    process_data(event.data)
+            ```
+        """
+        while self._connected or self._reconnecting or not self._event_queue.empty(tr_id, tr_key):
+            try:
+                event = await asyncio.wait_for(self._event_queue.get(tr_id, tr_key), timeout=1.0)
+                if self._latency_monitor is not None and event.received_monotonic_ns is not None:
+                    self._latency_monitor.record_dispatch_since(event.tr_id, event.received_monotonic_ns)
+                yield event
+            except asyncio.TimeoutError:
+                continue
+
+    def queue_stats(self) -> Dict[str, ChannelStats]:
+        """Get per-subscription backpressure counters.
+
+        Returns:
+            ChannelStats keyed by "tr_id:tr_key" ("" for status events)
+        """
+        return self._event_queue.stats()
+
+    async def close(self) -> None:
+        """Close WebSocket connection."""
+        self._closing = True
+        self._connected = False
+
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
+
+        for task in (self._receive_task, self._resume_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._receive_task = None
+        self._resume_task = None
+
+        if self._writer:
+            try:
+                # Send close frame
+                await self._send_frame(b"", opcode=OPCODE_CLOSE)
+            except Exception as exc:
+                if self.debug:
+                    logger.debug("Failed to send close frame: {}", exc)
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except Exception as exc:
+                if self.debug:
+                    logger.debug("Failed to close writer: {}", exc)
+            self._writer = None
+            self._reader = None
+            self._decoder.reset()
+
+        if self.debug:
+            logger.debug("WebSocket closed")
+
+    @property
+    def connected(self) -> bool:
+        """Check if WebSocket is connected."""
+        return self._connected
+
+    @property
+    def reconnecting(self) -> bool:
+        """Check if a supervised reconnect is in progress."""
+        return self._reconnecting
+
+    @property
+    def subscriptions(self) -> Dict[str, str]:
+        """Get current subscriptions."""
+        return dict(self._subscriptions)
@@ -0,0 +1,327 @@
+"""Retry and failure isolation primitives for API clients.
+
+This module provides decorrelated-jitter backoff, a retry budget and
+per-endpoint circuit breakers that the kis, kiwoom, and dart clients use
+around their request retry loops.
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+
+class DecorrelatedJitterBackoff:
+    """Decorrelated-jitter backoff delay generator.
+
+    Each delay is drawn uniformly between ``base_delay`` and three times the
+    previous delay, capped at ``max_delay``. Concurrent callers therefore
+    spread their retries instead of hammering the server in lockstep. With
+    ``max_total_delay`` set, delays are also trimmed so that their sum never
+    exceeds it.
+
+    Example:
+        >>> backoff = DecorrelatedJitterBackoff(base_delay=0.5, max_delay=8.0)
+        >>> delay = backoff.next_delay()  # somewhere in [0.5, 1.5]
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        rng: Optional[random.Random] = None,
+        max_total_delay: Optional[float] = None,
+    ):
+        """Initialize backoff generator.
+
+        Args:
+            base_delay: Minimum delay in seconds
+            max_delay: Maximum delay in seconds
+            rng: Random source, mainly for deterministic tests
+            max_total_delay: Ceiling on the sum of all delays in seconds (unbounded if omitted)
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_total_delay = max_total_delay
+        self._rng = rng or random.Random()
+        self._previous = base_delay
+        self._total = 0.0
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether ``max_total_delay`` is spent, so no further delay can be waited."""
+        return self.max_total_delay is not None and self._total >= self.max_total_delay
+
+    def next_delay(self) -> float:
+        """Return the next delay in seconds (0 once ``max_total_delay`` is spent; see ``exhausted``)."""
+        upper = max(self.base_delay, self._previous * 3)
+        self._previous = min(self.max_delay, self._rng.uniform(self.base_delay, upper))
+        delay = self._previous
+        if self.max_total_delay is not None:
+            delay = max(0.0, min(delay, self.max_total_delay - self._total))
+        self._total += delay
+        return delay
+
+    def reset(self) -> None:
+        """Restart the sequence from ``base_delay``."""
+        self._previous = self.base_delay
+        self._total = 0.0
+
+
+class RetryBudget:
+    """Thread-safe budget that caps retries relative to request volume.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    retries stay bounded to roughly ``ratio`` of the traffic. A small
+    ``min_retries_per_second`` floor keeps low-volume callers able to retry.
+    When the budget is exhausted, callers fail immediately instead of
+    amplifying load on an unhealthy upstream.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries_per_second: float = 1.0, capacity: float = 10.0):
+        """Initialize retry budget.
+
+        Args:
+            ratio: Tokens deposited per request (fraction of requests allowed to retry)
+            min_retries_per_second: Tokens refilled per second regardless of traffic
+            capacity: Maximum number of tokens the budget can hold
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Deposit tokens for one outgoing request."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        """Withdraw one retry token.
+
+        Returns:
+            True if a retry is allowed, False if the budget is exhausted
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+    def _refill(self) -> None:
+        """Refill tokens based on elapsed time.
+
+        This method should only be called while holding the lock.
+        """
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.min_retries_per_second)
+            self.last_refill = now
+
+    @property
+    def available_tokens(self) -> float:
+        """Get current number of available retry tokens."""
+        with self._lock:
+            self._refill()
+            return self.tokens
+
+    @classmethod
+    def for_host(cls, host: str) -> "RetryBudget":
+        """Get the process-wide budget shared by every client calling ``host``.
+
+        Args:
+            host: Network location of the API (e.g. "api.kiwoom.com")
+
+        Returns:
+            The budget registered for the host, created with default settings on first use
+        """
+        with _HOST_BUDGETS_LOCK:
+            budget = _HOST_BUDGETS.get(host)
+            if budget is None:
+                budget = _HOST_BUDGETS[host] = cls()
+            return budget
+
+
+# Budgets shared by all clients of the same host (see RetryBudget.for_host)
+_HOST_BUDGETS: Dict[str, RetryBudget] = {}
+_HOST_BUDGETS_LOCK = threading.Lock()
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for a single endpoint.
+
+    The breaker opens after ``failure_threshold`` consecutive failures and
+    rejects requests until ``recovery_timeout`` seconds have passed. It then
+    lets a single probe request through (half-open); a success closes the
+    circuit and a failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before the circuit opens
+            recovery_timeout: Seconds to stay open before allowing a probe
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent to the endpoint."""
+        with self._lock:
+            now = time.monotonic()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.OPEN:
+                if now - self._opened_at < self.recovery_timeout:
+                    return False
+                self._state = self.HALF_OPEN
+                self._probe_started_at = now
+                return True
+            # Half-open: allow one probe at a time, but never wedge on a lost probe
+            if self._probe_started_at is None or now - self._probe_started_at >= self.recovery_timeout:
+                self._probe_started_at = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a healthy response and close the circuit."""
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        """Record a failed attempt, opening the circuit when the threshold is reached."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+
+    @property
+    def state(self) -> str:
+        """Get the current circuit state."""
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open circuit allows a probe request."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+
+class RetryPolicy:
+    """Retry settings shared by an API client.
+
+    Bundles the backoff parameters, a retry budget, and one circuit breaker
+    per endpoint. Given a ``host`` and no explicit budget, the policy draws
+    from the process-wide budget of that host, so every client of an API
+    shares one budget and an outage cannot multiply retries across clients.
+    The clients create their default policy this way. Circuit breakers stay
+    per policy; pass the same policy to several clients to share them too.
+
+    Backoff sleeps of one request add up to at most ``max_total_delay``
+    (7s by default, the ceiling of the former 1 + 2 + 4s schedule). Waits
+    requested by a server's Retry-After header are honoured as given.
+
+    Example:
+        >>> policy = RetryPolicy(base_delay=0.2, max_delay=4.0)
+        >>> breaker = policy.breaker("/uapi/domestic-stock/v1/quotations/inquire-price")
+        >>> if breaker.allow_request():
+        ...     policy.budget.record_request()
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        budget: Optional[RetryBudget] = None,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        host: Optional[str] = None,
+        max_total_delay: float = 7.0,
+    ):
+        """Initialize retry policy.
+
+        Args:
+            base_delay: Minimum backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+            budget: Retry budget to draw from (defaults to the shared budget of ``host``,
+                or a new private budget when no host is given)
+            failure_threshold: Consecutive failures before an endpoint circuit opens
+            recovery_timeout: Seconds an open circuit waits before a probe request
+            host: Network location whose shared retry budget to use
+            max_total_delay: Ceiling on the summed backoff delays of one request in seconds
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_total_delay = max_total_delay
+        if budget is None:
+            budget = RetryBudget.for_host(host) if host is not None else RetryBudget()
+        self.budget = budget
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def backoff(self) -> DecorrelatedJitterBackoff:
+        """Create a fresh backoff sequence for one request."""
+        return DecorrelatedJitterBackoff(
+            base_delay=self.base_delay, max_delay=self.max_delay, max_total_delay=self.max_total_delay
+        )
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """Get or create the circuit breaker for an endpoint."""
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                )
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def can_retry(
+        self,
+        attempt: int,
+        max_retries: int,
+        breaker: CircuitBreaker,
+        backoff: Optional[DecorrelatedJitterBackoff] = None,
+    ) -> bool:
+        """Check whether another attempt is allowed after a retryable failure.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            max_retries: Maximum number of retries configured on the client
+            breaker: Circuit breaker of the endpoint being called
+            backoff: Backoff sequence of the request; once its total delay is spent
+                no retry is allowed, so a retry never fires without waiting
+
+        Returns:
+            True if the retry limit, total delay, circuit, and retry budget all allow a retry
+        """
+        if attempt >= max_retries or (backoff is not None and backoff.exhausted):
+            return False
+        return breaker.allow_request() and self.budget.try_acquire()
@@ -1,14 +1,17 @@
 import time
 from typing import Dict, Optional
+from urllib.parse import urlparse
 
 import requests
 
 from cluefin_openapi._rate_limiter import TokenBucket
+from cluefin_openapi._retry import RetryPolicy
 
 from ._exceptions import (
     DartAPIError,
     DartAuthenticationError,
     DartAuthorizationError,
+    DartCircuitOpenError,
     DartClientError,
     DartNetworkError,
     DartRateLimitError,
@@ -25,6 +28,7 @@ class Client(object):
         max_retries: int = 3,
         rate_limit_requests_per_second: float = 5.0,
         rate_limit_burst: int = 10,
+        retry_policy: Optional[RetryPolicy] = None,
     ):
         self.auth_key = auth_key
         self.base_url = "https://opendart.fss.or.kr"
@@ -42,6 +46,9 @@ class Client(object):
         # Initialize rate limiter
         self._rate_limiter = TokenBucket(capacity=rate_limit_burst, refill_rate=rate_limit_requests_per_second)
 
+        # Jittered backoff, retry budget, and per-endpoint circuit breakers
+        self._retry_policy = retry_policy or RetryPolicy(host=urlparse(self.base_url).netloc)
+
     @property
     def major_shareholder_disclosure(self):
         from ._major_shareholder_disclosure import MajorShareholderDisclosure
@@ -70,6 +77,14 @@ class Client(object):
 
     def _request(self, path: str, *, params: Optional[Dict] = None, return_json: bool = True):
         """Internal request method with rate limiting and retry logic."""
+        # Fail fast while the endpoint circuit is open
+        breaker = self._retry_policy.breaker(path)
+        if not breaker.allow_request():
+            raise DartCircuitOpenError(
+                f"Circuit open for {path} - endpoint is unhealthy, failing fast",
+                retry_after=breaker.retry_after,
+            )
+
         # Apply rate limiting
         if not self._rate_limiter.wait_for_tokens(timeout=self.timeout):
             raise DartRateLimitError(
@@ -82,10 +97,18 @@ class Client(object):
             params = {}
         params["crtfc_key"] = self.auth_key
 
+        self._retry_policy.budget.record_request()
+        backoff = self._retry_policy.backoff()
+
         for attempt in range(self.max_retries + 1):
             try:
                 response = self._session.get(url, params=params, timeout=self.timeout)
 
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
                 # Handle different HTTP status codes
                 if response.status_code == 200:
                     return response.json() if return_json else response.content
@@ -103,13 +126,13 @@ class Client(object):
                     )
                 elif response.status_code == 429:
                     retry_after = self._get_retry_after(response)
-                    if attempt < self.max_retries:
-                        wait_time = retry_after or (2**attempt)
+                    if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                        wait_time = retry_after or backoff.next_delay()
                         time.sleep(wait_time)
                         continue
                     else:
                         raise DartRateLimitError(
-                            f"Rate limit exceeded after {self.max_retries} retries",
+                            f"Rate limit exceeded after {attempt} retries",
                             status_code=response.status_code,
                             response_data=self._safe_json(response),
                             retry_after=retry_after,
@@ -121,8 +144,8 @@ class Client(object):
                         response_data=self._safe_json(response),
                     )
                 elif 500 <= response.status_code < 600:
-                    if attempt < self.max_retries:
-                        wait_time = 2**attempt
+                    if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                        wait_time = backoff.next_delay()
                         time.sleep(wait_time)
                         continue
                     else:
@@ -139,16 +162,18 @@ class Client(object):
                     )
 
             except requests.exceptions.Timeout as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
+                breaker.record_failure()
+                if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                    wait_time = backoff.next_delay()
                     time.sleep(wait_time)
                     continue
                 else:
-                    raise DartTimeoutError(f"Request timeout after {self.max_retries} retries") from e
+                    raise DartTimeoutError(f"Request timeout after {attempt} retries") from e
 
             except requests.exceptions.ConnectionError as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
+                breaker.record_failure()
+                if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                    wait_time = backoff.next_delay()
                     time.sleep(wait_time)
                     continue
                 else:
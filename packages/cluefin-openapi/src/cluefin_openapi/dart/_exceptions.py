@@ -107,3 +107,17 @@ class DartNetworkError(DartAPIError):
         response_data: Optional[Dict[str, Any]] = None,
     ):
         super().__init__(message, status_code, response_data)
+
+
+class DartCircuitOpenError(DartServerError):
+    """Exception raised when an endpoint circuit breaker is open and the request is not sent."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message, status_code, response_data)
+        self.retry_after = retry_after
@@ -1,8 +1,13 @@
 """Korea Investment & Securities (KIS) API Client"""
 
+from cluefin_openapi._realtime._event_queue import BackpressurePolicy, ChannelStats
+from cluefin_openapi._realtime._latency import LatencyHistogram, LatencyStats
+from cluefin_openapi.kis._bar_aggregator import Bar, BarAggregator, BarSpec, BarType
 from cluefin_openapi.kis._domestic_realtime_quote import DomesticRealtimeQuote
 from cluefin_openapi.kis._domestic_realtime_quote_types import (
+    EXECUTION_FIELD_DTYPES,
     EXECUTION_FIELD_NAMES,
+    ORDERBOOK_FIELD_DTYPES,
     ORDERBOOK_FIELD_NAMES,
     DomesticRealtimeExecutionItem,
     DomesticRealtimeOrderbookItem,
@@ -11,6 +16,7 @@ from cluefin_openapi.kis._exceptions import (
     KISAPIError,
     KISAuthenticationError,
     KISAuthorizationError,
+    KISCircuitOpenError,
     KISNetworkError,
     KISRateLimitError,
     KISServerError,
@@ -18,43 +24,76 @@ from cluefin_openapi.kis._exceptions import (
     KISValidationError,
 )
 from cluefin_openapi.kis._http_client import HttpClient
+from cluefin_openapi.kis._latency import FeedLatencyMonitor
+from cluefin_openapi.kis._local_server import LocalSocketServer
 from cluefin_openapi.kis._onmarket_bond_realtime_quote import OnmarketBondRealtimeQuote
 from cluefin_openapi.kis._onmarket_bond_realtime_quote_types import (
+    BOND_EXECUTION_FIELD_DTYPES,
     BOND_EXECUTION_FIELD_NAMES,
+    BOND_INDEX_EXECUTION_FIELD_DTYPES,
     BOND_INDEX_EXECUTION_FIELD_NAMES,
+    BOND_ORDERBOOK_FIELD_DTYPES,
     BOND_ORDERBOOK_FIELD_NAMES,
     OnmarketBondIndexRealtimeExecutionItem,
     OnmarketBondRealtimeExecutionItem,
     OnmarketBondRealtimeOrderbookItem,
 )
+from cluefin_openapi.kis._order_book import OrderBook, OrderBookEngine
 from cluefin_openapi.kis._overseas_realtime_quote import OverseasRealtimeQuote
 from cluefin_openapi.kis._overseas_realtime_quote_types import (
+    OVERSEAS_DELAYED_ORDERBOOK_FIELD_DTYPES,
     OVERSEAS_DELAYED_ORDERBOOK_FIELD_NAMES,
+    OVERSEAS_EXECUTION_FIELD_DTYPES,
     OVERSEAS_EXECUTION_FIELD_NAMES,
     OVERSEAS_EXECUTION_NOTIFICATION_FIELD_NAMES,
+    OVERSEAS_ORDERBOOK_FIELD_DTYPES,
     OVERSEAS_ORDERBOOK_FIELD_NAMES,
     OverseasRealtimeDelayedOrderbookItem,
     OverseasRealtimeExecutionItem,
     OverseasRealtimeExecutionNotificationItem,
     OverseasRealtimeOrderbookItem,
 )
+from cluefin_openapi.kis._realtime_columns import decode_columns
+from cluefin_openapi.kis._realtime_message import RealtimeFields
 from cluefin_openapi.kis._socket_client import SocketClient, SubscriptionType, WebSocketEvent, WebSocketMessage
+from cluefin_openapi.kis._socket_pool import SocketPool
+from cluefin_openapi.kis._tick_recorder import TickRecorder, TickReplayer
 from cluefin_openapi.kis._token_manager import TokenManager
 
 __all__ = [
+    "BOND_EXECUTION_FIELD_DTYPES",
     "BOND_EXECUTION_FIELD_NAMES",
+    "BOND_INDEX_EXECUTION_FIELD_DTYPES",
     "BOND_INDEX_EXECUTION_FIELD_NAMES",
+    "BOND_ORDERBOOK_FIELD_DTYPES",
     "BOND_ORDERBOOK_FIELD_NAMES",
+    "BackpressurePolicy",
+    "Bar",
+    "BarAggregator",
+    "BarSpec",
+    "BarType",
+    "ChannelStats",
     "DomesticRealtimeExecutionItem",
     "DomesticRealtimeOrderbookItem",
     "DomesticRealtimeQuote",
+    "EXECUTION_FIELD_DTYPES",
     "EXECUTION_FIELD_NAMES",
+    "ORDERBOOK_FIELD_DTYPES",
     "ORDERBOOK_FIELD_NAMES",
+    "OVERSEAS_DELAYED_ORDERBOOK_FIELD_DTYPES",
     "OVERSEAS_DELAYED_ORDERBOOK_FIELD_NAMES",
+    "OVERSEAS_EXECUTION_FIELD_DTYPES",
     "OVERSEAS_EXECUTION_FIELD_NAMES",
     "OVERSEAS_EXECUTION_NOTIFICATION_FIELD_NAMES",
+    "OVERSEAS_ORDERBOOK_FIELD_DTYPES",
     "OVERSEAS_ORDERBOOK_FIELD_NAMES",
     "HttpClient",
+    "FeedLatencyMonitor",
+    "LatencyHistogram",
+    "LatencyStats",
+    "LocalSocketServer",
+    "OrderBook",
+    "OrderBookEngine",
     "OnmarketBondIndexRealtimeExecutionItem",
     "OnmarketBondRealtimeExecutionItem",
     "OnmarketBondRealtimeOrderbookItem",
@@ -64,14 +103,20 @@ __all__ = [
     "OverseasRealtimeExecutionNotificationItem",
     "OverseasRealtimeOrderbookItem",
     "OverseasRealtimeQuote",
+    "RealtimeFields",
     "SocketClient",
+    "SocketPool",
     "SubscriptionType",
+    "TickRecorder",
+    "TickReplayer",
     "TokenManager",
     "WebSocketEvent",
     "WebSocketMessage",
+    "decode_columns",
     "KISAPIError",
     "KISAuthenticationError",
     "KISAuthorizationError",
+    "KISCircuitOpenError",
     "KISNetworkError",
     "KISRateLimitError",
     "KISServerError",
@@ -0,0 +1,391 @@
+"""Incremental OHLCV bars from realtime execution streams.
+
+`BarAggregator` turns domestic (H0UNCNT0/H0STCNT0) and overseas (HDFSCNT0)
+executions into time bars (e.g. 1s, 1m, 5m), volume bars and tick bars for
+every symbol, so strategies no longer poll minute chart endpoints.
+
+Bar state lives in preallocated ``array`` columns indexed by
+``symbol row * bar spec count + spec index``; a `Bar` object is created only
+when a bar completes. Time bars are aligned to the epoch (i.e. to KST clock
+boundaries) and close on the first execution of a later bucket or on
+`flush()`; buckets without executions produce no bar.
+"""
+
+import math
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+
+from ._domestic_realtime_quote_types import EXECUTION_FIELD_NAMES, DomesticRealtimeExecutionItem
+from ._overseas_realtime_quote_types import OVERSEAS_EXECUTION_FIELD_NAMES, OverseasRealtimeExecutionItem
+from ._realtime_message import RealtimeFields
+from ._tick_recorder import KST
+
+if TYPE_CHECKING:
+    from ._socket_client import SocketClient
+
+DOMESTIC_EXECUTION_TR_IDS = ("H0UNCNT0", "H0STCNT0")
+OVERSEAS_EXECUTION_TR_IDS = ("HDFSCNT0",)
+
+_DOMESTIC_STRIDE = len(EXECUTION_FIELD_NAMES)
+_DOMESTIC_SYMBOL = EXECUTION_FIELD_NAMES.index("mksc_shrn_iscd")
+_DOMESTIC_TIME = EXECUTION_FIELD_NAMES.index("stck_cntg_hour")
+_DOMESTIC_PRICE = EXECUTION_FIELD_NAMES.index("stck_prpr")
+_DOMESTIC_VOLUME = EXECUTION_FIELD_NAMES.index("cntg_vol")
+
+_OVERSEAS_STRIDE = len(OVERSEAS_EXECUTION_FIELD_NAMES)
+_OVERSEAS_SYMBOL = OVERSEAS_EXECUTION_FIELD_NAMES.index("rsym")
+_OVERSEAS_DATE = OVERSEAS_EXECUTION_FIELD_NAMES.index("kymd")
+_OVERSEAS_TIME = OVERSEAS_EXECUTION_FIELD_NAMES.index("khms")
+_OVERSEAS_PRICE = OVERSEAS_EXECUTION_FIELD_NAMES.index("last")
+_OVERSEAS_VOLUME = OVERSEAS_EXECUTION_FIELD_NAMES.index("evol")
+
+
+class BarType(str, Enum):
+    """What closes a bar."""
+
+    TIME = "time"
+    VOLUME = "volume"
+    TICK = "tick"
+
+
+@dataclass(frozen=True)
+class BarSpec:
+    """Bar definition: a type and its size (seconds, shares or executions)."""
+
+    kind: BarType
+    size: float
+
+    @classmethod
+    def seconds(cls, seconds: float) -> "BarSpec":
+        return cls(BarType.TIME, seconds)
+
+    @classmethod
+    def volume(cls, shares: float) -> "BarSpec":
+        return cls(BarType.VOLUME, shares)
+
+    @classmethod
+    def ticks(cls, executions: int) -> "BarSpec":
+        return cls(BarType.TICK, executions)
+
+    @property
+    def name(self) -> str:
+        """Short label such as "1s", "5m", "v10000" or "t100"."""
+        if self.kind is BarType.TIME:
+            if self.size % 60 == 0:
+                return f"{self.size // 60:g}m"
+            return f"{self.size:g}s"
+        return f"{'v' if self.kind is BarType.VOLUME else 't'}{self.size:g}"
+
+
+DEFAULT_BAR_SPECS: Tuple[BarSpec, ...] = (BarSpec.seconds(1), BarSpec.seconds(60), BarSpec.seconds(300))
+
+
+@dataclass
+class Bar:
+    """A completed OHLCV bar.
+
+    `start` and `end` are epoch seconds: the bucket boundaries for time bars,
+    the first and last execution times for volume and tick bars.
+    """
+
+    symbol: str
+    spec: BarSpec
+    start: float
+    end: float
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    trades: int
+
+
+BarCallback = Callable[[Bar], None]
+
+
+class BarAggregator:
+    """Builds OHLCV bars for every symbol from realtime executions.
+
+    Example:
+        ```python
+        aggregator = BarAggregator(
+            specs=[BarSpec.seconds(1), BarSpec.seconds(60), BarSpec.volume(10_000), BarSpec.ticks(100)]
+        )
+        aggregator.on_bar(lambda bar: print(bar.symbol, bar.spec.name, bar.close))
+        aggregator.attach(socket_client)  # consume execution TRs from the receive task
+        ```
+    """
+
+    def __init__(
+        self,
+        specs: Sequence[BarSpec] = DEFAULT_BAR_SPECS,
+        session_date: Optional[date] = None,
+        capacity: int = 256,
+    ):
+        """Initialize aggregator.
+
+        Args:
+            specs: Bars to build for every symbol
+            session_date: KST date of domestic executions, whose feed carries
+                only the time of day (today by default)
+            capacity: Number of symbols to preallocate state for; grows as needed
+        """
+        if not specs:
+            raise ValueError("At least one bar spec is required")
+        for spec in specs:
+            if spec.size <= 0:
+                raise ValueError(f"Bar size must be positive: {spec}")
+
+        self.specs: Tuple[BarSpec, ...] = tuple(specs)
+        self._width = len(self.specs)
+        self._symbols: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._listeners: List[BarCallback] = []
+        self._midnights: Dict[str, float] = {}
+        self._session_midnight = self._midnight(session_date or datetime.now(KST).date())
+        self._capacity = 0
+        self._allocate(max(capacity, 1))
+
+    def _allocate(self, capacity: int) -> None:
+        """Grow the state columns to hold `capacity` symbols."""
+        extra = (capacity - self._capacity) * self._width
+        if self._capacity == 0:
+            self._open = array("d", bytes(8 * extra))
+            self._high = array("d", bytes(8 * extra))
+            self._low = array("d", bytes(8 * extra))
+            self._close = array("d", bytes(8 * extra))
+            self._volume = array("d", bytes(8 * extra))
+            self._start = array("d", bytes(8 * extra))
+            self._end = array("d", bytes(8 * extra))
+            self._trades = array("q", bytes(8 * extra))
+        else:
+            padding = array("d", bytes(8 * extra))
+            for column in (self._open, self._high, self._low, self._close, self._volume, self._start, self._end):
+                column.extend(padding)
+            self._trades.extend(array("q", bytes(8 * extra)))
+        self._capacity = capacity
+
+    @staticmethod
+    def _midnight(day: date) -> float:
+        return datetime.combine(day, time.min, tzinfo=KST).timestamp()
+
+    def _row(self, symbol: str) -> int:
+        row = self._rows.get(symbol)
+        if row is None:
+            row = len(self._symbols)
+            if row >= self._capacity:
+                self._allocate(self._capacity * 2)
+            self._symbols.append(symbol)
+            self._rows[symbol] = row
+        return row
+
+    def on_bar(self, callback: BarCallback) -> Callable[[], None]:
+        """Register a callback for completed bars.
+
+        Returns:
+            Function that removes the callback
+        """
+        self._listeners.append(callback)
+
+        def remove() -> None:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+        return remove
+
+    def update(self, symbol: str, timestamp: float, price: float, volume: float) -> List[Bar]:
+        """Add one execution.
+
+        Args:
+            symbol: Symbol code
+            timestamp: Execution time in epoch seconds
+            price: Execution price
+            volume: Executed quantity
+
+        Returns:
+            Bars completed by this execution
+        """
+        base = self._row(symbol) * self._width
+        opens, highs, lows, closes = self._open, self._high, self._low, self._close
+        volumes, starts, ends, trades = self._volume, self._start, self._end, self._trades
+        completed: List[Bar] = []
+
+        for index, spec in enumerate(self.specs):
+            slot = base + index
+            kind, size = spec.kind, spec.size
+            if trades[slot] and kind is BarType.TIME and timestamp >= ends[slot]:
+                completed.append(self._complete(symbol, index, slot))
+
+            if trades[slot]:
+                if price > highs[slot]:
+                    highs[slot] = price
+                elif price < lows[slot]:
+                    lows[slot] = price
+                volumes[slot] += volume
+            else:
+                opens[slot] = highs[slot] = lows[slot] = price
+                volumes[slot] = volume
+                if kind is BarType.TIME:
+                    starts[slot] = math.floor(timestamp / size) * size
+                    ends[slot] = starts[slot] + size
+                else:
+                    starts[slot] = timestamp
+            closes[slot] = price
+            trades[slot] += 1
+
+            if kind is not BarType.TIME:
+                ends[slot] = timestamp
+                if (volumes[slot] if kind is BarType.VOLUME else trades[slot]) >= size:
+                    completed.append(self._complete(symbol, index, slot))
+
+        return completed
+
+    def _snapshot(self, symbol: str, index: int, slot: int) -> Bar:
+        return Bar(
+            symbol=symbol,
+            spec=self.specs[index],
+            start=self._start[slot],
+            end=self._end[slot],
+            open=self._open[slot],
+            high=self._high[slot],
+            low=self._low[slot],
+            close=self._close[slot],
+            volume=self._volume[slot],
+            trades=self._trades[slot],
+        )
+
+    def _complete(self, symbol: str, index: int, slot: int) -> Bar:
+        """Emit the bar in `slot` and reset it."""
+        bar = self._snapshot(symbol, index, slot)
+        self._trades[slot] = 0
+        for listener in self._listeners:
+            try:
+                listener(bar)
+            except Exception as e:
+                logger.error(f"Bar listener failed: {e}")
+        return bar
+
+    def update_domestic(self, item: DomesticRealtimeExecutionItem) -> List[Bar]:
+        """Add a parsed domestic execution (time of day on the session date)."""
+        return self.update(
+            item.mksc_shrn_iscd,
+            self._session_midnight + _seconds_of_day(item.stck_cntg_hour),
+            float(item.stck_prpr),
+            float(item.cntg_vol),
+        )
+
+    def update_overseas(self, item: OverseasRealtimeExecutionItem) -> List[Bar]:
+        """Add a parsed overseas execution (timestamped in KST by kymd/khms)."""
+        return self.update(
+            item.rsym,
+            self._date_midnight(item.kymd) + _seconds_of_day(item.khms),
+            float(item.last),
+            float(item.evol),
+        )
+
+    def _date_midnight(self, yyyymmdd: str) -> float:
+        midnight = self._midnights.get(yyyymmdd)
+        if midnight is None:
+            midnight = self._midnight(datetime.strptime(yyyymmdd, "%Y%m%d").date())
+            self._midnights[yyyymmdd] = midnight
+        return midnight
+
+    def handle_fields(self, fields: Union[RealtimeFields, Sequence[str]], tr_id: Optional[str] = None) -> List[Bar]:
+        """Add every execution record of a realtime frame without building models.
+
+        Args:
+            fields: Values of an execution frame (one or more records)
+            tr_id: Transaction ID; read from `fields` when it is a RealtimeFields
+
+        Returns:
+            Bars completed by these executions
+        """
+        tr_id = tr_id or getattr(fields, "tr_id", None)
+        values = fields.values if isinstance(fields, RealtimeFields) else fields
+        completed: List[Bar] = []
+        if tr_id in DOMESTIC_EXECUTION_TR_IDS:
+            midnight = self._session_midnight
+            for offset in range(0, len(values) - _DOMESTIC_STRIDE + 1, _DOMESTIC_STRIDE):
+                completed += self.update(
+                    values[offset + _DOMESTIC_SYMBOL],
+                    midnight + _seconds_of_day(values[offset + _DOMESTIC_TIME]),
+                    float(values[offset + _DOMESTIC_PRICE]),
+                    float(values[offset + _DOMESTIC_VOLUME]),
+                )
+        elif tr_id in OVERSEAS_EXECUTION_TR_IDS:
+            for offset in range(0, len(values) - _OVERSEAS_STRIDE + 1, _OVERSEAS_STRIDE):
+                completed += self.update(
+                    values[offset + _OVERSEAS_SYMBOL],
+                    self._date_midnight(values[offset + _OVERSEAS_DATE])
+                    + _seconds_of_day(values[offset + _OVERSEAS_TIME]),
+                    float(values[offset + _OVERSEAS_PRICE]),
+                    float(values[offset + _OVERSEAS_VOLUME]),
+                )
+        return completed
+
+    def attach(self, client: "SocketClient") -> Callable[[], None]:
+        """Consume execution TRs straight from a client's receive task.
+
+        Registers `on()` handlers for every domestic and overseas execution
+        tr_id, so those records are aggregated instead of queued.
+
+        Returns:
+            Function that removes the handlers
+        """
+        removers = [
+            client.on(tr_id, None, self.handle_fields)
+            for tr_id in DOMESTIC_EXECUTION_TR_IDS + OVERSEAS_EXECUTION_TR_IDS
+        ]
+
+        def detach() -> None:
+            for remove in removers:
+                remove()
+
+        return detach
+
+    def flush(self, now: Optional[float] = None) -> List[Bar]:
+        """Complete open bars.
+
+        Args:
+            now: Complete time bars whose bucket ended by this epoch time; when
+                omitted, complete every open bar (e.g. at the session close)
+
+        Returns:
+            Bars completed by the flush
+        """
+        completed: List[Bar] = []
+        for row, symbol in enumerate(self._symbols):
+            for index, spec in enumerate(self.specs):
+                slot = row * self._width + index
+                if not self._trades[slot]:
+                    continue
+                if now is None or (spec.kind is BarType.TIME and now >= self._end[slot]):
+                    completed.append(self._complete(symbol, index, slot))
+        return completed
+
+    def current(self, symbol: str, spec: BarSpec) -> Optional[Bar]:
+        """Snapshot of the bar being built for a symbol, or None if it has no executions yet."""
+        row = self._rows.get(symbol)
+        if row is None or spec not in self.specs:
+            return None
+        index = self.specs.index(spec)
+        slot = row * self._width + index
+        if not self._trades[slot]:
+            return None
+        return self._snapshot(symbol, index, slot)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols seen so far."""
+        return list(self._symbols)
+
+
+def _seconds_of_day(hhmmss: str) -> int:
+    """Seconds since midnight of an ``HHMMSS`` time."""
+    value = int(hhmmss[:6])
+    return value // 10000 * 3600 + value // 100 % 100 * 60 + value % 100
@@ -7,18 +7,24 @@ References:
 """
 
 from functools import wraps
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Union
 
 from ._domestic_realtime_quote_types import (
+    EXECUTION_FIELD_DTYPES,
     EXECUTION_FIELD_NAMES,
     EXECUTION_NOTIFICATION_FIELD_NAMES,
+    ORDERBOOK_FIELD_DTYPES,
     ORDERBOOK_FIELD_NAMES,
     DomesticRealtimeExecutionItem,
     DomesticRealtimeExecutionNotificationItem,
     DomesticRealtimeOrderbookItem,
 )
+from ._realtime_columns import RecordData, decode_columns
 from ._socket_client import SocketClient
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def _require_prod_env(func):
     """Decorator that validates production environment before method execution.
@@ -164,6 +170,29 @@ class DomesticRealtimeQuote:
 
         return results
 
+    @staticmethod
+    def decode_execution_columns(
+        data: Union[RecordData, Iterable[RecordData]], *, structured: bool = False
+    ) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+        """Decode 실시간 체결가 records into typed NumPy columns.
+
+        Vectorized alternative to `parse_execution_data` for high-rate feeds: numeric
+        fields are converted per column (see `EXECUTION_FIELD_DTYPES`) instead of
+        validating one model of strings per record. Requires numpy.
+
+        Args:
+            data: `event.data["values"]` of one message, or an iterable of them
+                to decode together
+            structured: Return a NumPy structured array instead of a column dict
+
+        Returns:
+            Dict of field name to array (one element per record), or a structured array
+
+        Raises:
+            ValueError: If a message has fewer fields than one record
+        """
+        return decode_columns(data, EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES, structured=structured)
+
     @_require_prod_env
     async def subscribe_orderbook(self, stock_code: str) -> None:
         """Subscribe to real-time orderbook data.
@@ -247,6 +276,29 @@ class DomesticRealtimeQuote:
 
         return results
 
+    @staticmethod
+    def decode_orderbook_columns(
+        data: Union[RecordData, Iterable[RecordData]], *, structured: bool = False
+    ) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+        """Decode 실시간 호가 records into typed NumPy columns.
+
+        Vectorized alternative to `parse_orderbook_data` for high-rate feeds: numeric
+        fields are converted per column (see `ORDERBOOK_FIELD_DTYPES`) instead of
+        validating one model of strings per record. Requires numpy.
+
+        Args:
+            data: `event.data["values"]` of one message, or an iterable of them
+                to decode together
+            structured: Return a NumPy structured array instead of a column dict
+
+        Returns:
+            Dict of field name to array (one element per record), or a structured array
+
+        Raises:
+            ValueError: If a message has fewer fields than one record
+        """
+        return decode_columns(data, ORDERBOOK_FIELD_NAMES, ORDERBOOK_FIELD_DTYPES, structured=structured)
+
     @_require_prod_env
     async def subscribe_execution_notification(self, hts_id: str) -> None:
         """Subscribe to real-time execution notification.
@@ -280,6 +280,78 @@ ORDERBOOK_FIELD_NAMES: list[str] = [
     "stck_deal_cls_code",
 ]
 
+# 숫자 필드 dtype (decode_columns용, 나머지 필드는 문자열) - 체결가
+EXECUTION_FIELD_DTYPES: dict[str, str] = {
+    **dict.fromkeys(
+        [
+            "stck_prpr",
+            "prdy_vrss",
+            "stck_oprc",
+            "stck_hgpr",
+            "stck_lwpr",
+            "askp1",
+            "bidp1",
+            "cntg_vol",
+            "acml_vol",
+            "acml_tr_pbmn",
+            "seln_cntg_csnu",
+            "shnu_cntg_csnu",
+            "ntby_cntg_csnu",
+            "seln_cntg_smtn",
+            "shnu_cntg_smtn",
+            "oprc_vrss_prpr",
+            "hgpr_vrss_prpr",
+            "lwpr_vrss_prpr",
+            "askp_rsqn1",
+            "bidp_rsqn1",
+            "total_askp_rsqn",
+            "total_bidp_rsqn",
+            "prdy_smns_hour_acml_vol",
+            "vi_stnd_prc",
+        ],
+        "i8",
+    ),
+    **dict.fromkeys(
+        [
+            "prdy_ctrt",
+            "wghn_avrg_stck_prc",
+            "cttr",
+            "shnu_rate",
+            "prdy_vol_vrss_acml_vol_rate",
+            "vol_tnrt",
+            "prdy_smns_hour_acml_vol_rate",
+        ],
+        "f8",
+    ),
+}
+
+# 숫자 필드 dtype (decode_columns용, 나머지 필드는 문자열) - 호가
+ORDERBOOK_FIELD_DTYPES: dict[str, str] = {
+    **dict.fromkeys(
+        [f"{prefix}{level}" for prefix in ("askp", "bidp", "askp_rsqn", "bidp_rsqn") for level in range(1, 11)],
+        "i8",
+    ),
+    **dict.fromkeys(
+        [
+            "total_askp_rsqn",
+            "total_bidp_rsqn",
+            "ovtm_total_askp_rsqn",
+            "ovtm_total_bidp_rsqn",
+            "antc_cnpr",
+            "antc_cnqn",
+            "antc_vol",
+            "antc_cntg_vrss",
+            "acml_vol",
+            "total_askp_rsqn_icdc",
+            "total_bidp_rsqn_icdc",
+            "ovtm_total_askp_icdc",
+            "ovtm_total_bidp_icdc",
+        ],
+        "i8",
+    ),
+    "antc_cntg_prdy_ctrt": "f8",
+}
+
 # 필드 순서 리스트 (WebSocket 데이터 파싱용) - 실시간체결통보
 EXECUTION_NOTIFICATION_FIELD_NAMES: list[str] = [
     "cust_id",
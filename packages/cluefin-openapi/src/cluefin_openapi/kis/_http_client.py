@@ -1,20 +1,25 @@
 import json
 import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Any, Dict, Literal, Optional, Union
+from typing import Any, Callable, Dict, Literal, Optional, Tuple, Union
+from urllib.parse import urlparse
 from uuid import uuid4
 
 import requests
 from loguru import logger
 from pydantic import SecretStr
 
+from cluefin_openapi._hedging import HedgePolicy
 from cluefin_openapi._rate_limiter import TokenBucket
+from cluefin_openapi._retry import RetryPolicy
 
 from ._exceptions import (
     KISAPIError,
     KISAuthenticationError,
     KISAuthorizationError,
+    KISCircuitOpenError,
     KISNetworkError,
     KISRateLimitError,
     KISServerError,
@@ -35,6 +40,8 @@ class HttpClient(object):
         max_retries: int = 3,
         rate_limit_requests_per_second: float = 20.0,
         rate_limit_burst: int = 3,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
     ):
         self.token = token
         self.app_key = app_key
@@ -44,6 +51,8 @@ class HttpClient(object):
         self.timeout = timeout
         self.max_retries = max_retries
         self._last_response_debug: Optional[Dict[str, Any]] = None
+        # Hedged attempts run concurrently; each keeps its debug snapshot here until one wins
+        self._hedge_debug = threading.local()
 
         if self.env == "prod":
             self.base_url = "https://openapi.koreainvestment.com:9443"
@@ -62,6 +71,12 @@ class HttpClient(object):
         # Initialize rate limiter
         self._rate_limiter = TokenBucket(capacity=rate_limit_burst, refill_rate=rate_limit_requests_per_second)
 
+        # Jittered backoff, retry budget, and per-endpoint circuit breakers
+        self._retry_policy = retry_policy or RetryPolicy(host=urlparse(self.base_url).netloc)
+
+        # Opt-in hedging for latency-critical TRs (disabled when None)
+        self._hedge_policy = hedge_policy
+
         if self.debug:
             logger.enable("cluefin_openapi.kis")
         else:
@@ -231,12 +246,33 @@ class HttpClient(object):
         if len(preview) > 4000:
             preview = f"{preview[:4000]}\n... (truncated)"
 
-        self._last_response_debug = {
-            "request": sanitized_context,
-            "status_code": response.status_code,
-            "artifact_path": artifact_path,
-            "preview": preview,
-        }
+        self._set_last_response_debug(
+            {
+                "request": sanitized_context,
+                "status_code": response.status_code,
+                "artifact_path": artifact_path,
+                "preview": preview,
+            }
+        )
+
+    def _set_last_response_debug(self, snapshot: Optional[Dict[str, Any]]) -> None:
+        """Store a response snapshot, or keep it with the current hedged attempt until that attempt wins."""
+        if getattr(self._hedge_debug, "active", False):
+            self._hedge_debug.snapshot = snapshot
+        else:
+            self._last_response_debug = snapshot
+
+    def _hedged_attempt(self, send: Callable[[], requests.Response]) -> Tuple[requests.Response, Optional[dict]]:
+        """Run one hedged attempt, returning its response with the debug snapshot it recorded."""
+        self._hedge_debug.active = True
+        self._hedge_debug.snapshot = None
+        try:
+            return send(), self._hedge_debug.snapshot
+        except Exception as error:
+            error.response_debug = self._hedge_debug.snapshot
+            raise
+        finally:
+            self._hedge_debug.active = False
 
     @property
     def last_response_debug(self) -> Optional[Dict[str, Any]]:
@@ -266,9 +302,36 @@ class HttpClient(object):
         lines.append(self._last_response_debug["preview"])
         return "\n".join(lines)
 
-    # TODO 법인은 추후 필요해지면 구현
     def _get(self, path: str, headers: dict, params: dict) -> requests.Response:
+        """Make a GET request, hedging it when the hedge policy covers its tr_id."""
+        tr_id = headers.get("tr_id")
+        if self._hedge_policy is not None and self._hedge_policy.applies_to(tr_id):
+            # Only the attempt whose outcome is returned describes the last response
+            try:
+                response, snapshot = self._hedge_policy.call(
+                    tr_id,
+                    lambda: self._hedged_attempt(lambda: self._send_get(path, headers=headers, params=params)),
+                    rate_limiter=self._rate_limiter,
+                )
+            except Exception as error:
+                self._last_response_debug = getattr(error, "response_debug", None)
+                raise
+            self._last_response_debug = snapshot
+            return response
+        return self._send_get(path, headers=headers, params=params)
+
+    # TODO 법인은 추후 필요해지면 구현
+    def _send_get(self, path: str, headers: dict, params: dict) -> requests.Response:
         """Make a GET request with rate limiting, retry, and error handling."""
+        # Fail fast while the endpoint circuit is open
+        breaker = self._retry_policy.breaker(path)
+        if not breaker.allow_request():
+            raise KISCircuitOpenError(
+                f"Circuit open for {path} - endpoint is unhealthy, failing fast",
+                request_context={"url": f"{self.base_url}{path}", "path": path},
+                retry_after=breaker.retry_after,
+            )
+
         # Apply rate limiting
         if not self._rate_limiter.wait_for_tokens(timeout=self.timeout):
             raise KISRateLimitError(
@@ -292,7 +355,10 @@ class HttpClient(object):
             "headers": merged_headers,
             "params": params,
         }
-        self._last_response_debug = None
+        self._set_last_response_debug(None)
+
+        self._retry_policy.budget.record_request()
+        backoff = self._retry_policy.backoff()
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -309,6 +375,11 @@ class HttpClient(object):
 
                 self._record_last_response(response, request_context)
 
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
                 # Handle different HTTP status codes
                 if response.status_code == 200:
                     return response
@@ -335,25 +406,25 @@ class HttpClient(object):
                     )
                 elif response.status_code == 429:
                     retry_after = self._get_retry_after(response)
-                    if attempt < self.max_retries:
-                        wait_time = retry_after or (2**attempt)
+                    if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                        wait_time = retry_after or backoff.next_delay()
                         logger.warning(
-                            f"Rate limit hit, waiting {wait_time}s before retry {attempt + 1}/{self.max_retries}"
+                            f"Rate limit hit, waiting {wait_time:.2f}s before retry {attempt + 1}/{self.max_retries}"
                         )
                         time.sleep(wait_time)
                         continue
                     else:
                         raise KISRateLimitError(
-                            f"Rate limit exceeded after {self.max_retries} retries",
+                            f"Rate limit exceeded after {attempt} retries",
                             status_code=response.status_code,
                             response_data=self._safe_json(response),
                             request_context=request_context,
                             retry_after=retry_after,
                         )
                 elif 500 <= response.status_code < 600:
-                    if attempt < self.max_retries:
-                        wait_time = 2**attempt
-                        logger.warning(f"Server error {response.status_code}, retrying in {wait_time}s")
+                    if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                        wait_time = backoff.next_delay()
+                        logger.warning(f"Server error {response.status_code}, retrying in {wait_time:.2f}s")
                         time.sleep(wait_time)
                         continue
                     else:
@@ -372,20 +443,22 @@ class HttpClient(object):
                     )
 
             except requests.exceptions.Timeout as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
-                    logger.warning(f"Request timeout, retrying in {wait_time}s")
+                breaker.record_failure()
+                if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                    wait_time = backoff.next_delay()
+                    logger.warning(f"Request timeout, retrying in {wait_time:.2f}s")
                     time.sleep(wait_time)
                     continue
                 else:
                     raise KISTimeoutError(
-                        f"Request timeout after {self.max_retries} retries",
+                        f"Request timeout after {attempt} retries",
                         request_context=request_context,
                     ) from e
             except requests.exceptions.ConnectionError as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
-                    logger.warning(f"Connection error, retrying in {wait_time}s")
+                breaker.record_failure()
+                if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                    wait_time = backoff.next_delay()
+                    logger.warning(f"Connection error, retrying in {wait_time:.2f}s")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -405,6 +478,15 @@ class HttpClient(object):
     # TODO 법인은 추후 필요해지면 구현
     def _post(self, path: str, headers: dict, body: dict) -> requests.Response:
         """Make a POST request with rate limiting, retry, and error handling."""
+        # Fail fast while the endpoint circuit is open
+        breaker = self._retry_policy.breaker(path)
+        if not breaker.allow_request():
+            raise KISCircuitOpenError(
+                f"Circuit open for {path} - endpoint is unhealthy, failing fast",
+                request_context={"url": f"{self.base_url}{path}", "path": path},
+                retry_after=breaker.retry_after,
+            )
+
         # Apply rate limiting
         if not self._rate_limiter.wait_for_tokens(timeout=self.timeout):
             raise KISRateLimitError(
@@ -428,7 +510,10 @@ class HttpClient(object):
             "headers": merged_headers,
             "body": body,
         }
-        self._last_response_debug = None
+        self._set_last_response_debug(None)
+
+        self._retry_policy.budget.record_request()
+        backoff = self._retry_policy.backoff()
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -445,6 +530,11 @@ class HttpClient(object):
 
                 self._record_last_response(response, request_context)
 
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
                 # Handle different HTTP status codes
                 if response.status_code == 200:
                     return response
@@ -471,25 +561,25 @@ class HttpClient(object):
                     )
                 elif response.status_code == 429:
                     retry_after = self._get_retry_after(response)
-                    if attempt < self.max_retries:
-                        wait_time = retry_after or (2**attempt)
+                    if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                        wait_time = retry_after or backoff.next_delay()
                         logger.warning(
-                            f"Rate limit hit, waiting {wait_time}s before retry {attempt + 1}/{self.max_retries}"
+                            f"Rate limit hit, waiting {wait_time:.2f}s before retry {attempt + 1}/{self.max_retries}"
                         )
                         time.sleep(wait_time)
                         continue
                     else:
                         raise KISRateLimitError(
-                            f"Rate limit exceeded after {self.max_retries} retries",
+                            f"Rate limit exceeded after {attempt} retries",
                             status_code=response.status_code,
                             response_data=self._safe_json(response),
                             request_context=request_context,
                             retry_after=retry_after,
                         )
                 elif 500 <= response.status_code < 600:
-                    if attempt < self.max_retries:
-                        wait_time = 2**attempt
-                        logger.warning(f"Server error {response.status_code}, retrying in {wait_time}s")
+                    if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                        wait_time = backoff.next_delay()
+                        logger.warning(f"Server error {response.status_code}, retrying in {wait_time:.2f}s")
                         time.sleep(wait_time)
                         continue
                     else:
@@ -508,20 +598,22 @@ class HttpClient(object):
                     )
 
             except requests.exceptions.Timeout as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
-                    logger.warning(f"Request timeout, retrying in {wait_time}s")
+                breaker.record_failure()
+                if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                    wait_time = backoff.next_delay()
+                    logger.warning(f"Request timeout, retrying in {wait_time:.2f}s")
                     time.sleep(wait_time)
                     continue
                 else:
                     raise KISTimeoutError(
-                        f"Request timeout after {self.max_retries} retries",
+                        f"Request timeout after {attempt} retries",
                         request_context=request_context,
                     ) from e
             except requests.exceptions.ConnectionError as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
-                    logger.warning(f"Connection error, retrying in {wait_time}s")
+                breaker.record_failure()
+                if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                    wait_time = backoff.next_delay()
+                    logger.warning(f"Connection error, retrying in {wait_time:.2f}s")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -539,6 +631,8 @@ class HttpClient(object):
         raise KISAPIError("Maximum retries exceeded", request_context=request_context)
 
     def close(self):
-        """Close the HTTP session."""
+        """Close the HTTP session and the hedge policy's worker threads."""
         if hasattr(self, "_session"):
             self._session.close()
+        if getattr(self, "_hedge_policy", None) is not None:
+            self._hedge_policy.close()
@@ -0,0 +1,94 @@
+"""Exchange-to-receive latency for KIS realtime feeds.
+
+`FeedLatencyMonitor` extends the transport's `LatencyMonitor` with the
+exchange time fields of the KIS execution and orderbook TRs (e.g.
+``stck_cntg_hour``), so the KIS socket client can record exchange-to-receive
+latencies alongside the receive-to-dispatch ones.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional, Tuple, Union
+
+from cluefin_openapi._realtime._latency import LatencyMonitor
+
+from ._domestic_realtime_quote_types import EXECUTION_FIELD_NAMES, ORDERBOOK_FIELD_NAMES
+from ._overseas_realtime_quote_types import OVERSEAS_EXECUTION_FIELD_NAMES, OVERSEAS_ORDERBOOK_FIELD_NAMES
+from ._realtime_message import RealtimeFields
+from ._tick_recorder import KST
+
+# Position of the exchange time (HHMMSS, KST) and of its date (YYYYMMDD, None for the
+# session date) in the first record of each frame.
+EXCHANGE_TIME_FIELDS: Dict[str, Tuple[int, Optional[int]]] = {
+    "H0UNCNT0": (EXECUTION_FIELD_NAMES.index("stck_cntg_hour"), None),
+    "H0STCNT0": (EXECUTION_FIELD_NAMES.index("stck_cntg_hour"), None),
+    "H0STASP0": (ORDERBOOK_FIELD_NAMES.index("bsop_hour"), None),
+    "HDFSCNT0": (OVERSEAS_EXECUTION_FIELD_NAMES.index("khms"), OVERSEAS_EXECUTION_FIELD_NAMES.index("kymd")),
+    "HDFSASP0": (OVERSEAS_ORDERBOOK_FIELD_NAMES.index("khms"), OVERSEAS_ORDERBOOK_FIELD_NAMES.index("kymd")),
+}
+
+
+class FeedLatencyMonitor(LatencyMonitor):
+    """Latency monitor that also reads exchange times from KIS records.
+
+    Example:
+        ```python
+        monitor = FeedLatencyMonitor(window=60.0)
+        client = SocketClient(..., latency_monitor=monitor)
+        ...
+        for tr_id, stats in monitor.exchange_latency().items():
+            print(f"{tr_id} feed delay p99: {stats.p99:.1f}s")
+        ```
+    """
+
+    def __init__(self, window: float = 60.0, slots: int = 6):
+        """Initialize monitor.
+
+        Args:
+            window: Seconds of history each histogram keeps
+            slots: Number of slots each window is split into
+        """
+        super().__init__(window, slots)
+        self._midnights: Dict[str, float] = {}
+        self._midnight_day = -1
+        self._midnight = 0.0
+
+    def observe_frame(self, fields: Union[RealtimeFields, list], tr_id: str, received_ns: int) -> None:
+        """Record the exchange-to-receive latency of a frame's first record.
+
+        Frames of tr_ids without a known exchange time field are ignored.
+
+        Args:
+            fields: Values of the frame
+            tr_id: Transaction ID
+            received_ns: Wall-clock receive time in ns since the epoch
+        """
+        positions = EXCHANGE_TIME_FIELDS.get(tr_id)
+        if positions is None:
+            return
+        time_index, date_index = positions
+        try:
+            hhmmss = int(fields[time_index][:6])
+            seconds = hhmmss // 10000 * 3600 + hhmmss // 100 % 100 * 60 + hhmmss % 100
+            midnight = self._date_midnight(fields[date_index]) if date_index is not None else None
+        except (IndexError, ValueError):
+            return
+
+        received = received_ns / 1e9
+        if midnight is None:
+            midnight = self._session_midnight(received)
+        self.record_exchange(tr_id, received - (midnight + seconds))
+
+    def _session_midnight(self, received: float) -> float:
+        """KST midnight of the day `received` falls on, cached per day."""
+        day = int((received + 9 * 3600) // 86400)
+        if day != self._midnight_day:
+            self._midnight_day = day
+            self._midnight = day * 86400.0 - 9 * 3600
+        return self._midnight
+
+    def _date_midnight(self, yyyymmdd: str) -> float:
+        midnight = self._midnights.get(yyyymmdd)
+        if midnight is None:
+            midnight = datetime.strptime(yyyymmdd, "%Y%m%d").replace(tzinfo=KST).timestamp()
+            self._midnights[yyyymmdd] = midnight
+        return midnight
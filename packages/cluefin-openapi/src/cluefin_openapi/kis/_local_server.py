@@ -0,0 +1,316 @@
+"""Local stand-in for the KIS realtime WebSocket server.
+
+`LocalSocketServer` speaks the KIS realtime protocol closely enough to
+load-test `SocketClient` and the realtime parsers without a KIS account or
+market hours:
+
+- WebSocket handshake on any path (``/tryitout`` included)
+- JSON acknowledgements for subscribe / unsubscribe requests
+- ``PINGPONG`` heartbeats, counting the echoes the client sends back
+- ``0|TR|count|a^b^c`` data frames for every active subscription at a
+  configurable rate and batch size
+
+Example:
+    ```python
+    async with LocalSocketServer(rate=5000, batch_size=4) as server:
+        client = SocketClient(approval_key="a", app_key="b", secret_key="c", ws_url=server.url)
+        async with client:
+            await client.subscribe("H0UNCNT0", "005930")
+            async for event in client.events():
+                ...
+    ```
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from cluefin_openapi._realtime._frame import (
+    OPCODE_CLOSE,
+    OPCODE_PING,
+    OPCODE_PONG,
+    OPCODE_TEXT,
+    FrameDecoder,
+    encode_frame,
+)
+
+from ._domestic_realtime_quote_types import (
+    EXECUTION_FIELD_NAMES,
+    EXECUTION_NOTIFICATION_FIELD_NAMES,
+    ORDERBOOK_FIELD_NAMES,
+)
+
+RecordFactory = Callable[[str, str, int], List[str]]
+
+# Field counts of the TRs the default record factory knows; others get DEFAULT_FIELD_COUNT.
+FIELD_COUNTS: Dict[str, int] = {
+    "H0UNCNT0": len(EXECUTION_FIELD_NAMES),
+    "H0STCNT0": len(EXECUTION_FIELD_NAMES),
+    "H0STASP0": len(ORDERBOOK_FIELD_NAMES),
+    "H0STCNI0": len(EXECUTION_NOTIFICATION_FIELD_NAMES),
+}
+DEFAULT_FIELD_COUNT = 16
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+# Frames written between drains while publishing at full speed.
+_PUBLISH_CHUNK = 256
+
+
+def default_record(tr_id: str, tr_key: str, seq: int) -> List[str]:
+    """Build a synthetic record: key, HHMMSS time, a moving price, then "1"s.
+
+    Args:
+        tr_id: Transaction ID of the subscription
+        tr_key: Transaction key of the subscription
+        seq: Sequence number of the record within the connection
+
+    Returns:
+        Field values of one record
+    """
+    field_count = FIELD_COUNTS.get(tr_id, DEFAULT_FIELD_COUNT)
+    seconds = 9 * 3600 + seq // 100 % 23400
+    clock = f"{seconds // 3600:02d}{seconds // 60 % 60:02d}{seconds % 60:02d}"
+    return [tr_key, clock, str(70000 + seq % 100 * 10)] + ["1"] * (field_count - 3)
+
+
+class _Connection:
+    """Server side of one client connection."""
+
+    def __init__(self, server: "LocalSocketServer", reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.server = server
+        self.reader = reader
+        self.writer = writer
+        self.subscriptions: Dict[Tuple[str, str], None] = {}
+        self.decoder = FrameDecoder()
+        self.seq = 0
+        self.closed = False
+
+    async def send(self, payload: bytes, opcode: int = OPCODE_TEXT, drain: bool = True) -> None:
+        self.writer.write(encode_frame(payload, opcode, mask=False))
+        if drain:
+            await self.writer.drain()
+
+    async def handshake(self) -> bool:
+        request = await self.reader.readuntil(b"\r\n\r\n")
+        key = ""
+        for line in request.decode("latin-1").split("\r\n"):
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "sec-websocket-key":
+                key = value.strip()
+        if not key:
+            self.writer.write(b"HTTP/1.1 400 Bad Request\r\n\r\n")
+            await self.writer.drain()
+            return False
+
+        accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode(), usedforsecurity=False).digest()).decode()
+        self.writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode()
+        )
+        await self.writer.drain()
+        return True
+
+    async def receive_loop(self) -> None:
+        """Answer subscription requests, PINGPONG echoes and control frames."""
+        while not self.closed:
+            chunk = await self.reader.read(65536)
+            if not chunk:
+                return
+            self.decoder.feed(chunk)
+            while (message := self.decoder.next_message()) is not None:
+                opcode, payload = message
+                if opcode == OPCODE_TEXT:
+                    await self.handle_request(payload)
+                elif opcode == OPCODE_PING:
+                    await self.send(payload, OPCODE_PONG)
+                elif opcode == OPCODE_CLOSE:
+                    await self.send(b"", OPCODE_CLOSE)
+                    return
+
+    async def handle_request(self, payload: bytes) -> None:
+        message = json.loads(payload)
+        header = message.get("header", {})
+        if header.get("tr_id") == "PINGPONG":
+            self.server.pongs_received += 1
+            return
+
+        request = message.get("body", {}).get("input", {})
+        tr_id, tr_key = request.get("tr_id", ""), request.get("tr_key", "")
+        if header.get("tr_type") == "2":
+            self.subscriptions.pop((tr_id, tr_key), None)
+            msg = "UNSUBSCRIBE SUCCESS"
+        else:
+            self.subscriptions[(tr_id, tr_key)] = None
+            msg = "SUBSCRIBE SUCCESS"
+        self.server.requests_received += 1
+        ack = {
+            "header": {"tr_id": tr_id, "tr_key": tr_key, "encrypt": "N"},
+            "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": msg},
+        }
+        await self.send(json.dumps(ack).encode())
+
+    def frame(self, tr_id: str, tr_key: str) -> bytes:
+        server = self.server
+        records = []
+        for _ in range(server.batch_size):
+            records.extend(server.record_factory(tr_id, tr_key, self.seq))
+            self.seq += 1
+        return f"0|{tr_id}|{server.batch_size:03d}|{'^'.join(records)}".encode()
+
+    async def publish_loop(self) -> None:
+        """Send data frames round-robin over the subscriptions at the server's rate."""
+        server = self.server
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        sent = 0
+        while not self.closed and (server.max_frames is None or server.frames_sent < server.max_frames):
+            subscriptions = list(self.subscriptions)
+            if not subscriptions:
+                await asyncio.sleep(0.001)
+                start, sent = loop.time(), 0
+                continue
+
+            if server.rate:
+                due = int((loop.time() - start) * server.rate) - sent
+                if due <= 0:
+                    await asyncio.sleep(max(0.0005, (sent + 1) / server.rate - (loop.time() - start)))
+                    continue
+            else:
+                due = _PUBLISH_CHUNK
+            if server.max_frames is not None:
+                due = min(due, server.max_frames - server.frames_sent)
+
+            for index in range(due):
+                tr_id, tr_key = subscriptions[(sent + index) % len(subscriptions)]
+                await self.send(self.frame(tr_id, tr_key), drain=False)
+            sent += due
+            server.frames_sent += due
+            server.records_sent += due * server.batch_size
+            await self.writer.drain()
+            if not server.rate:
+                await asyncio.sleep(0)
+
+    async def pingpong_loop(self) -> None:
+        """Send a PINGPONG heartbeat every `pingpong_interval` seconds."""
+        while not self.closed:
+            await asyncio.sleep(self.server.pingpong_interval)
+            heartbeat = {"header": {"tr_id": "PINGPONG", "datetime": f"{datetime.now():%Y%m%d%H%M%S}"}}
+            await self.send(json.dumps(heartbeat).encode())
+            self.server.pings_sent += 1
+
+
+class LocalSocketServer:
+    """Local WebSocket server that speaks the KIS realtime protocol.
+
+    Counters (`frames_sent`, `records_sent`, `pings_sent`, `pongs_received`,
+    `requests_received`) cover every connection since the server started, so
+    a benchmark can compare what was published with what a client received.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        rate: Optional[float] = 1000.0,
+        batch_size: int = 1,
+        max_frames: Optional[int] = None,
+        pingpong_interval: Optional[float] = None,
+        record_factory: RecordFactory = default_record,
+    ):
+        """Initialize server.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            rate: Data frames per second per connection; None sends as fast as
+                the connection accepts them
+            batch_size: Records per data frame (the count field of the frame)
+            max_frames: Stop publishing after this many frames in total
+            pingpong_interval: Send PINGPONG every this many seconds (None disables)
+            record_factory: Builds the field values of each record from
+                (tr_id, tr_key, sequence number)
+        """
+        self.host = host
+        self.port = port
+        self.rate = rate
+        self.batch_size = batch_size
+        self.max_frames = max_frames
+        self.pingpong_interval = pingpong_interval
+        self.record_factory = record_factory
+        self.frames_sent = 0
+        self.records_sent = 0
+        self.pings_sent = 0
+        self.pongs_received = 0
+        self.requests_received = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[_Connection] = set()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "LocalSocketServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    @property
+    def url(self) -> str:
+        """WebSocket URL to pass to `SocketClient(ws_url=...)`."""
+        return f"ws://{self.host}:{self.port}"
+
+    @property
+    def connections(self) -> int:
+        """Number of open client connections."""
+        return len(self._connections)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connection = _Connection(self, reader, writer)
+        self._connections.add(connection)
+        tasks: List[asyncio.Task] = []
+        try:
+            if not await connection.handshake():
+                return
+            tasks.append(asyncio.create_task(connection.publish_loop()))
+            if self.pingpong_interval:
+                tasks.append(asyncio.create_task(connection.pingpong_loop()))
+            self._tasks.update(tasks)
+            await connection.receive_loop()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            logger.error(f"Local socket server connection failed: {e}")
+        finally:
+            connection.closed = True
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._tasks.difference_update(tasks)
+            self._connections.discard(connection)
+            writer.close()
+
+    async def close(self) -> None:
+        """Stop listening and drop every connection."""
+        for connection in list(self._connections):
+            connection.closed = True
+            connection.writer.close()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
@@ -7,18 +7,25 @@ References:
 """
 
 from functools import wraps
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Union
 
 from ._onmarket_bond_realtime_quote_types import (
+    BOND_EXECUTION_FIELD_DTYPES,
     BOND_EXECUTION_FIELD_NAMES,
+    BOND_INDEX_EXECUTION_FIELD_DTYPES,
     BOND_INDEX_EXECUTION_FIELD_NAMES,
+    BOND_ORDERBOOK_FIELD_DTYPES,
     BOND_ORDERBOOK_FIELD_NAMES,
     OnmarketBondIndexRealtimeExecutionItem,
     OnmarketBondRealtimeExecutionItem,
     OnmarketBondRealtimeOrderbookItem,
 )
+from ._realtime_columns import RecordData, decode_columns
 from ._socket_client import SocketClient
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def _require_prod_env(func):
     """Decorator that validates production environment before method execution.
@@ -181,6 +188,29 @@ class OnmarketBondRealtimeQuote:
 
         return results
 
+    @staticmethod
+    def decode_execution_columns(
+        data: Union[RecordData, Iterable[RecordData]], *, structured: bool = False
+    ) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+        """Decode 실시간 체결가 records into typed NumPy columns.
+
+        Vectorized alternative to `parse_execution_data` for high-rate feeds: numeric
+        fields are converted per column (see `BOND_EXECUTION_FIELD_DTYPES`) instead of
+        validating one model of strings per record. Requires numpy.
+
+        Args:
+            data: `event.data["values"]` of one message, or an iterable of them
+                to decode together
+            structured: Return a NumPy structured array instead of a column dict
+
+        Returns:
+            Dict of field name to array (one element per record), or a structured array
+
+        Raises:
+            ValueError: If a message has fewer fields than one record
+        """
+        return decode_columns(data, BOND_EXECUTION_FIELD_NAMES, BOND_EXECUTION_FIELD_DTYPES, structured=structured)
+
     @_require_prod_env
     async def subscribe_orderbook(self, bond_code: str) -> None:
         """Subscribe to real-time bond orderbook data.
@@ -263,6 +293,29 @@ class OnmarketBondRealtimeQuote:
 
         return results
 
+    @staticmethod
+    def decode_orderbook_columns(
+        data: Union[RecordData, Iterable[RecordData]], *, structured: bool = False
+    ) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+        """Decode 실시간 호가 records into typed NumPy columns.
+
+        Vectorized alternative to `parse_orderbook_data` for high-rate feeds: numeric
+        fields are converted per column (see `BOND_ORDERBOOK_FIELD_DTYPES`) instead of
+        validating one model of strings per record. Requires numpy.
+
+        Args:
+            data: `event.data["values"]` of one message, or an iterable of them
+                to decode together
+            structured: Return a NumPy structured array instead of a column dict
+
+        Returns:
+            Dict of field name to array (one element per record), or a structured array
+
+        Raises:
+            ValueError: If a message has fewer fields than one record
+        """
+        return decode_columns(data, BOND_ORDERBOOK_FIELD_NAMES, BOND_ORDERBOOK_FIELD_DTYPES, structured=structured)
+
     @_require_prod_env
     async def subscribe_index_execution(self, bond_code: str) -> None:
         """Subscribe to real-time bond index execution data.
@@ -344,3 +397,28 @@ class OnmarketBondRealtimeQuote:
             results.append(item)
 
         return results
+
+    @staticmethod
+    def decode_index_execution_columns(
+        data: Union[RecordData, Iterable[RecordData]], *, structured: bool = False
+    ) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+        """Decode 채권지수 실시간 체결가 records into typed NumPy columns.
+
+        Vectorized alternative to `parse_index_execution_data` for high-rate feeds: numeric
+        fields are converted per column (see `BOND_INDEX_EXECUTION_FIELD_DTYPES`) instead of
+        validating one model of strings per record. Requires numpy.
+
+        Args:
+            data: `event.data["values"]` of one message, or an iterable of them
+                to decode together
+            structured: Return a NumPy structured array instead of a column dict
+
+        Returns:
+            Dict of field name to array (one element per record), or a structured array
+
+        Raises:
+            ValueError: If a message has fewer fields than one record
+        """
+        return decode_columns(
+            data, BOND_INDEX_EXECUTION_FIELD_NAMES, BOND_INDEX_EXECUTION_FIELD_DTYPES, structured=structured
+        )
@@ -196,3 +196,46 @@ BOND_INDEX_EXECUTION_FIELD_NAMES: list[str] = [
     "bond_avrg_ytm_val",
     "bond_avrg_frdl_ytm_val",
 ]
+
+
+# 숫자 필드 dtype (decode_columns용, 나머지 필드는 문자열) - 일반채권 체결가
+BOND_EXECUTION_FIELD_DTYPES: dict[str, str] = {
+    **dict.fromkeys(
+        [
+            "prdy_vrss",
+            "prdy_ctrt",
+            "stck_prpr",
+            "stck_oprc",
+            "stck_hgpr",
+            "stck_lwpr",
+            "stck_prdy_clpr",
+            "bond_cntg_ert",
+            "oprc_ert",
+            "hgpr_ert",
+            "lwpr_ert",
+        ],
+        "f8",
+    ),
+    **dict.fromkeys(["cntg_vol", "acml_vol", "prdy_vol"], "i8"),
+}
+
+# 숫자 필드 dtype (decode_columns용, 나머지 필드는 문자열) - 일반채권 호가
+BOND_ORDERBOOK_FIELD_DTYPES: dict[str, str] = {
+    **dict.fromkeys(
+        [f"{prefix}{level}" for prefix in ("askp_ert", "bidp_ert", "askp", "bidp") for level in range(1, 6)],
+        "f8",
+    ),
+    **dict.fromkeys([f"{prefix}{level}" for prefix in ("askp_rsqn", "bidp_rsqn") for level in range(1, 6)], "i8"),
+    "total_askp_rsqn": "i8",
+    "total_bidp_rsqn": "i8",
+}
+
+# 숫자 필드 dtype (decode_columns용, 나머지 필드는 문자열) - 채권지수 체결가
+BOND_INDEX_EXECUTION_FIELD_DTYPES: dict[str, str] = dict.fromkeys(
+    [
+        name
+        for name in BOND_INDEX_EXECUTION_FIELD_NAMES
+        if name not in ("nmix_id", "stnd_date1", "trnm_hour", "totl_ernn_nmix_prdy_vrss_sign")
+    ],
+    "f8",
+)
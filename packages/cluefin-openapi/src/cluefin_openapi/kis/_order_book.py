@@ -0,0 +1,404 @@
+"""Incremental L2 order books from realtime orderbook streams.
+
+`OrderBookEngine` keeps a 10-level book for every symbol of the domestic
+(H0STASP0) and overseas (HDFSASP0) orderbook streams. Each update overwrites
+the symbol's levels in place and refreshes its derived values (spread, mid,
+microprice, depth imbalance and cumulative depth), so reading them never
+recomputes anything.
+
+Book state lives in preallocated ``array`` columns: level columns are indexed
+by ``symbol row * depth + level`` and per-symbol columns by the row, so
+hundreds of symbols share a handful of flat buffers. `OrderBook` is a
+lightweight view over one row.
+"""
+
+import math
+from array import array
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from loguru import logger
+
+from ._bar_aggregator import _seconds_of_day
+from ._domestic_realtime_quote_types import ORDERBOOK_FIELD_NAMES, DomesticRealtimeOrderbookItem
+from ._overseas_realtime_quote_types import OVERSEAS_ORDERBOOK_FIELD_NAMES
+from ._realtime_message import RealtimeFields
+from ._tick_recorder import KST
+
+if TYPE_CHECKING:
+    from ._socket_client import SocketClient
+
+DOMESTIC_ORDERBOOK_TR_IDS = ("H0STASP0",)
+OVERSEAS_ORDERBOOK_TR_IDS = ("HDFSASP0",)
+
+DEPTH = 10
+
+
+class _Layout:
+    """Field positions of one orderbook record."""
+
+    __slots__ = ("stride", "symbol", "date", "time", "ask_prices", "ask_quantities", "bid_prices", "bid_quantities")
+
+    def __init__(self, names: Sequence[str], symbol: str, time_field: str, date_field: Optional[str], fields: str):
+        ask_price, ask_quantity, bid_price, bid_quantity = fields.split()
+        self.stride = len(names)
+        self.symbol = names.index(symbol)
+        self.time = names.index(time_field)
+        self.date = names.index(date_field) if date_field else None
+        self.ask_prices = [names.index(f"{ask_price}{level}") for level in range(1, DEPTH + 1)]
+        self.ask_quantities = [names.index(f"{ask_quantity}{level}") for level in range(1, DEPTH + 1)]
+        self.bid_prices = [names.index(f"{bid_price}{level}") for level in range(1, DEPTH + 1)]
+        self.bid_quantities = [names.index(f"{bid_quantity}{level}") for level in range(1, DEPTH + 1)]
+
+
+_DOMESTIC = _Layout(ORDERBOOK_FIELD_NAMES, "mksc_shrn_iscd", "bsop_hour", None, "askp askp_rsqn bidp bidp_rsqn")
+_OVERSEAS = _Layout(OVERSEAS_ORDERBOOK_FIELD_NAMES, "rsym", "khms", "kymd", "pask vask pbid vbid")
+
+
+class OrderBook:
+    """Read-only view of one symbol's book in an `OrderBookEngine`.
+
+    Values reflect the latest update; keep the view and read it again after
+    later updates instead of asking the engine for a new one.
+    """
+
+    __slots__ = ("symbol", "_engine", "_row")
+
+    def __init__(self, engine: "OrderBookEngine", symbol: str, row: int):
+        self.symbol = symbol
+        self._engine = engine
+        self._row = row
+
+    @property
+    def time(self) -> float:
+        """Exchange time of the latest update in epoch seconds."""
+        return self._engine._time[self._row]
+
+    @property
+    def updates(self) -> int:
+        """Number of updates applied."""
+        return self._engine._updates[self._row]
+
+    @property
+    def best_ask(self) -> float:
+        return self._engine._ask_price[self._row * self._engine.depth]
+
+    @property
+    def best_bid(self) -> float:
+        return self._engine._bid_price[self._row * self._engine.depth]
+
+    @property
+    def spread(self) -> float:
+        """Best ask minus best bid (NaN while either side is empty)."""
+        return self._engine._spread[self._row]
+
+    @property
+    def mid(self) -> float:
+        """Midpoint of the best ask and bid (NaN while either side is empty)."""
+        return self._engine._mid[self._row]
+
+    @property
+    def microprice(self) -> float:
+        """Top-of-book price weighted toward the side with less quantity."""
+        return self._engine._microprice[self._row]
+
+    @property
+    def imbalance(self) -> float:
+        """Depth imbalance over all levels: (bid - ask) / (bid + ask) quantity, in [-1, 1]."""
+        return self.depth_imbalance(self._engine.depth)
+
+    def depth_imbalance(self, levels: int) -> float:
+        """Depth imbalance over the best `levels` levels of each side."""
+        bid = self.bid_depth(levels)
+        ask = self.ask_depth(levels)
+        total = bid + ask
+        return (bid - ask) / total if total else 0.0
+
+    def ask_depth(self, levels: int) -> float:
+        """Cumulative ask quantity of the best `levels` levels."""
+        return self._engine._ask_cumulative[self._row * self._engine.depth + min(levels, self._engine.depth) - 1]
+
+    def bid_depth(self, levels: int) -> float:
+        """Cumulative bid quantity of the best `levels` levels."""
+        return self._engine._bid_cumulative[self._row * self._engine.depth + min(levels, self._engine.depth) - 1]
+
+    def asks(self) -> List[Tuple[float, float]]:
+        """(price, quantity) of every ask level, best first."""
+        return self._levels(self._engine._ask_price, self._engine._ask_quantity)
+
+    def bids(self) -> List[Tuple[float, float]]:
+        """(price, quantity) of every bid level, best first."""
+        return self._levels(self._engine._bid_price, self._engine._bid_quantity)
+
+    def _levels(self, prices: array, quantities: array) -> List[Tuple[float, float]]:
+        start = self._row * self._engine.depth
+        end = start + self._engine.depth
+        return list(zip(prices[start:end], quantities[start:end], strict=True))
+
+    def __repr__(self) -> str:
+        return f"OrderBook({self.symbol!r}, bid={self.best_bid:g}, ask={self.best_ask:g}, updates={self.updates})"
+
+
+OrderBookCallback = Callable[[OrderBook], None]
+
+
+class OrderBookEngine:
+    """Maintains L2 books for every symbol from realtime orderbook records.
+
+    Example:
+        ```python
+        books = OrderBookEngine()
+        books.attach(socket_client)  # consume orderbook TRs from the receive task
+        await socket_client.subscribe("H0STASP0", "005930")
+
+        book = books.book("005930")
+        print(book.spread, book.microprice, book.depth_imbalance(5))
+        ```
+    """
+
+    def __init__(self, depth: int = DEPTH, capacity: int = 256, session_date: Optional[date] = None):
+        """Initialize engine.
+
+        Args:
+            depth: Levels kept per side (at most 10, the depth of the KIS feeds)
+            capacity: Number of symbols to preallocate state for; grows as needed
+            session_date: KST date of domestic updates, whose feed carries only
+                the time of day (today by default)
+        """
+        if not 1 <= depth <= DEPTH:
+            raise ValueError(f"Depth must be between 1 and {DEPTH}: {depth}")
+
+        self.depth = depth
+        self._symbols: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._books: List[OrderBook] = []
+        self._listeners: List[OrderBookCallback] = []
+        self._midnights: Dict[str, float] = {}
+        self._session_midnight = self._midnight(session_date or datetime.now(KST).date())
+        self._capacity = 0
+        self._allocate(max(capacity, 1))
+
+    def _allocate(self, capacity: int) -> None:
+        """Grow the state columns to hold `capacity` symbols."""
+        extra = capacity - self._capacity
+        levels = array("d", bytes(8 * extra * self.depth))
+        rows = array("d", bytes(8 * extra))
+        nans = array("d", [math.nan]) * extra
+        if self._capacity == 0:
+            self._ask_price, self._ask_quantity = array("d", levels), array("d", levels)
+            self._bid_price, self._bid_quantity = array("d", levels), array("d", levels)
+            self._ask_cumulative, self._bid_cumulative = array("d", levels), array("d", levels)
+            self._time = array("d", rows)
+            self._spread, self._mid, self._microprice = array("d", nans), array("d", nans), array("d", nans)
+            self._updates = array("q", bytes(8 * extra))
+        else:
+            for column in (
+                self._ask_price,
+                self._ask_quantity,
+                self._bid_price,
+                self._bid_quantity,
+                self._ask_cumulative,
+                self._bid_cumulative,
+            ):
+                column.extend(levels)
+            self._time.extend(rows)
+            for column in (self._spread, self._mid, self._microprice):
+                column.extend(nans)
+            self._updates.extend(array("q", bytes(8 * extra)))
+        self._capacity = capacity
+
+    @staticmethod
+    def _midnight(day: date) -> float:
+        return datetime.combine(day, time.min, tzinfo=KST).timestamp()
+
+    def _row(self, symbol: str) -> int:
+        row = self._rows.get(symbol)
+        if row is None:
+            row = len(self._symbols)
+            if row >= self._capacity:
+                self._allocate(self._capacity * 2)
+            self._symbols.append(symbol)
+            self._rows[symbol] = row
+            self._books.append(OrderBook(self, symbol, row))
+        return row
+
+    def on_update(self, callback: OrderBookCallback) -> Callable[[], None]:
+        """Register a callback called with the book after every update.
+
+        Returns:
+            Function that removes the callback
+        """
+        self._listeners.append(callback)
+
+        def remove() -> None:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+        return remove
+
+    def update(
+        self,
+        symbol: str,
+        timestamp: float,
+        ask_prices: Sequence[float],
+        ask_quantities: Sequence[float],
+        bid_prices: Sequence[float],
+        bid_quantities: Sequence[float],
+    ) -> OrderBook:
+        """Replace a symbol's levels with a new snapshot.
+
+        Sides may carry more levels than `depth` (the extra ones are ignored)
+        or fewer (the missing ones are emptied).
+
+        Args:
+            symbol: Symbol code
+            timestamp: Exchange time in epoch seconds
+            ask_prices: Ask prices, best first
+            ask_quantities: Ask quantities, best first
+            bid_prices: Bid prices, best first
+            bid_quantities: Bid quantities, best first
+
+        Returns:
+            The symbol's book
+        """
+        row = self._row(symbol)
+        start = row * self.depth
+        for column, values in (
+            (self._ask_price, ask_prices),
+            (self._ask_quantity, ask_quantities),
+            (self._bid_price, bid_prices),
+            (self._bid_quantity, bid_quantities),
+        ):
+            for level in range(self.depth):
+                column[start + level] = values[level] if level < len(values) else 0.0
+        return self._refresh(row, timestamp)
+
+    def _apply(self, values: Sequence[str], offset: int, layout: _Layout, timestamp: float) -> OrderBook:
+        """Overwrite a row from one record of a realtime frame."""
+        row = self._row(values[offset + layout.symbol])
+        start = row * self.depth
+        depth = self.depth
+        for column, positions in (
+            (self._ask_price, layout.ask_prices),
+            (self._ask_quantity, layout.ask_quantities),
+            (self._bid_price, layout.bid_prices),
+            (self._bid_quantity, layout.bid_quantities),
+        ):
+            for level in range(depth):
+                column[start + level] = float(values[offset + positions[level]] or 0)
+        return self._refresh(row, timestamp)
+
+    def _refresh(self, row: int, timestamp: float) -> OrderBook:
+        """Recompute the derived values of a row after its levels changed."""
+        depth = self.depth
+        start = row * depth
+        ask_quantity, bid_quantity = self._ask_quantity, self._bid_quantity
+        ask_cumulative, bid_cumulative = self._ask_cumulative, self._bid_cumulative
+        ask_total = bid_total = 0.0
+        for slot in range(start, start + depth):
+            ask_total += ask_quantity[slot]
+            bid_total += bid_quantity[slot]
+            ask_cumulative[slot] = ask_total
+            bid_cumulative[slot] = bid_total
+
+        ask, bid = self._ask_price[start], self._bid_price[start]
+        if ask > 0 and bid > 0:
+            self._spread[row] = ask - bid
+            self._mid[row] = (ask + bid) / 2
+            top = ask_quantity[start] + bid_quantity[start]
+            self._microprice[row] = (
+                (ask * bid_quantity[start] + bid * ask_quantity[start]) / top if top else self._mid[row]
+            )
+        else:
+            self._spread[row] = self._mid[row] = self._microprice[row] = math.nan
+        self._time[row] = timestamp
+        self._updates[row] += 1
+
+        book = self._books[row]
+        for listener in self._listeners:
+            try:
+                listener(book)
+            except Exception as e:
+                logger.error(f"Order book listener failed: {e}")
+        return book
+
+    def update_domestic(self, item: DomesticRealtimeOrderbookItem) -> OrderBook:
+        """Apply a parsed domestic orderbook record (time of day on the session date)."""
+        return self._apply(
+            [getattr(item, name) for name in ORDERBOOK_FIELD_NAMES],
+            0,
+            _DOMESTIC,
+            self._session_midnight + _seconds_of_day(item.bsop_hour),
+        )
+
+    def handle_fields(
+        self, fields: Union[RealtimeFields, Sequence[str]], tr_id: Optional[str] = None
+    ) -> List[OrderBook]:
+        """Apply every orderbook record of a realtime frame without building models.
+
+        Args:
+            fields: Values of an orderbook frame (one or more records)
+            tr_id: Transaction ID; read from `fields` when it is a RealtimeFields
+
+        Returns:
+            Books updated by the frame
+        """
+        tr_id = tr_id or getattr(fields, "tr_id", None)
+        values = fields.values if isinstance(fields, RealtimeFields) else fields
+        updated: List[OrderBook] = []
+        if tr_id in DOMESTIC_ORDERBOOK_TR_IDS:
+            layout = _DOMESTIC
+            for offset in range(0, len(values) - layout.stride + 1, layout.stride):
+                timestamp = self._session_midnight + _seconds_of_day(values[offset + layout.time])
+                updated.append(self._apply(values, offset, layout, timestamp))
+        elif tr_id in OVERSEAS_ORDERBOOK_TR_IDS:
+            layout = _OVERSEAS
+            for offset in range(0, len(values) - layout.stride + 1, layout.stride):
+                timestamp = self._date_midnight(values[offset + layout.date]) + _seconds_of_day(
+                    values[offset + layout.time]
+                )
+                updated.append(self._apply(values, offset, layout, timestamp))
+        return updated
+
+    def _date_midnight(self, yyyymmdd: str) -> float:
+        midnight = self._midnights.get(yyyymmdd)
+        if midnight is None:
+            midnight = self._midnight(datetime.strptime(yyyymmdd, "%Y%m%d").date())
+            self._midnights[yyyymmdd] = midnight
+        return midnight
+
+    def attach(self, client: "SocketClient") -> Callable[[], None]:
+        """Consume orderbook TRs straight from a client's receive task.
+
+        Registers `on()` handlers for the domestic and overseas orderbook
+        tr_ids, so those records update books instead of being queued.
+
+        Returns:
+            Function that removes the handlers
+        """
+        removers = [
+            client.on(tr_id, None, self.handle_fields)
+            for tr_id in DOMESTIC_ORDERBOOK_TR_IDS + OVERSEAS_ORDERBOOK_TR_IDS
+        ]
+
+        def detach() -> None:
+            for remove in removers:
+                remove()
+
+        return detach
+
+    def book(self, symbol: str) -> Optional[OrderBook]:
+        """Book of a symbol, or None before its first update."""
+        row = self._rows.get(symbol)
+        return None if row is None else self._books[row]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._rows
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols seen so far."""
+        return list(self._symbols)
@@ -7,20 +7,27 @@ References:
 """
 
 from functools import wraps
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Union
 
 from ._overseas_realtime_quote_types import (
+    OVERSEAS_DELAYED_ORDERBOOK_FIELD_DTYPES,
     OVERSEAS_DELAYED_ORDERBOOK_FIELD_NAMES,
+    OVERSEAS_EXECUTION_FIELD_DTYPES,
     OVERSEAS_EXECUTION_FIELD_NAMES,
     OVERSEAS_EXECUTION_NOTIFICATION_FIELD_NAMES,
+    OVERSEAS_ORDERBOOK_FIELD_DTYPES,
     OVERSEAS_ORDERBOOK_FIELD_NAMES,
     OverseasRealtimeDelayedOrderbookItem,
     OverseasRealtimeExecutionItem,
     OverseasRealtimeExecutionNotificationItem,
     OverseasRealtimeOrderbookItem,
 )
+from ._realtime_columns import RecordData, decode_columns
 from ._socket_client import SocketClient
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def _require_prod_env(func):
     """Decorator that validates production environment before method execution.
@@ -137,6 +144,31 @@ class OverseasRealtimeQuote:
 
         return results
 
+    @staticmethod
+    def decode_columns(
+        data: Union[RecordData, Iterable[RecordData]], *, structured: bool = False
+    ) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+        """Decode 실시간 호가 records into typed NumPy columns.
+
+        Vectorized alternative to `parse_data` for high-rate feeds: numeric
+        fields are converted per column (see `OVERSEAS_ORDERBOOK_FIELD_DTYPES`) instead of
+        validating one model of strings per record. Requires numpy.
+
+        Args:
+            data: `event.data["values"]` of one message, or an iterable of them
+                to decode together
+            structured: Return a NumPy structured array instead of a column dict
+
+        Returns:
+            Dict of field name to array (one element per record), or a structured array
+
+        Raises:
+            ValueError: If a message has fewer fields than one record
+        """
+        return decode_columns(
+            data, OVERSEAS_ORDERBOOK_FIELD_NAMES, OVERSEAS_ORDERBOOK_FIELD_DTYPES, structured=structured
+        )
+
     @_require_prod_env
     async def subscribe_execution(self, tr_key: str) -> None:
         """Subscribe to real-time delayed execution data.
@@ -204,6 +236,31 @@ class OverseasRealtimeQuote:
 
         return results
 
+    @staticmethod
+    def decode_execution_columns(
+        data: Union[RecordData, Iterable[RecordData]], *, structured: bool = False
+    ) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+        """Decode 실시간 체결가 records into typed NumPy columns.
+
+        Vectorized alternative to `parse_execution_data` for high-rate feeds: numeric
+        fields are converted per column (see `OVERSEAS_EXECUTION_FIELD_DTYPES`) instead of
+        validating one model of strings per record. Requires numpy.
+
+        Args:
+            data: `event.data["values"]` of one message, or an iterable of them
+                to decode together
+            structured: Return a NumPy structured array instead of a column dict
+
+        Returns:
+            Dict of field name to array (one element per record), or a structured array
+
+        Raises:
+            ValueError: If a message has fewer fields than one record
+        """
+        return decode_columns(
+            data, OVERSEAS_EXECUTION_FIELD_NAMES, OVERSEAS_EXECUTION_FIELD_DTYPES, structured=structured
+        )
+
     @_require_prod_env
     async def subscribe_delayed_orderbook(self, tr_key: str) -> None:
         """Subscribe to delayed orderbook data (Asia).
@@ -271,6 +328,31 @@ class OverseasRealtimeQuote:
 
         return results
 
+    @staticmethod
+    def decode_delayed_orderbook_columns(
+        data: Union[RecordData, Iterable[RecordData]], *, structured: bool = False
+    ) -> Union[Dict[str, "np.ndarray"], "np.ndarray"]:
+        """Decode 지연호가 records into typed NumPy columns.
+
+        Vectorized alternative to `parse_delayed_orderbook_data` for high-rate feeds: numeric
+        fields are converted per column (see `OVERSEAS_DELAYED_ORDERBOOK_FIELD_DTYPES`) instead of
+        validating one model of strings per record. Requires numpy.
+
+        Args:
+            data: `event.data["values"]` of one message, or an iterable of them
+                to decode together
+            structured: Return a NumPy structured array instead of a column dict
+
+        Returns:
+            Dict of field name to array (one element per record), or a structured array
+
+        Raises:
+            ValueError: If a message has fewer fields than one record
+        """
+        return decode_columns(
+            data, OVERSEAS_DELAYED_ORDERBOOK_FIELD_NAMES, OVERSEAS_DELAYED_ORDERBOOK_FIELD_DTYPES, structured=structured
+        )
+
     @_require_prod_env
     async def subscribe_execution_notification(self, hts_id: str) -> None:
         """Subscribe to real-time execution notification.
@@ -356,3 +356,27 @@ OVERSEAS_EXECUTION_NOTIFICATION_FIELD_NAMES: list[str] = [
     "tm_div_tp",
     "cntg_unpr12",
 ]
+
+
+# 숫자 필드 dtype (decode_columns용, 나머지 필드는 문자열) - 호가
+OVERSEAS_ORDERBOOK_FIELD_DTYPES: dict[str, str] = {
+    **dict.fromkeys(["bvol", "avol", "bdvl", "advl"], "i8"),
+    **dict.fromkeys([f"{prefix}{level}" for prefix in ("pbid", "pask") for level in range(1, 11)], "f8"),
+    **dict.fromkeys(
+        [f"{prefix}{level}" for prefix in ("vbid", "vask", "dbid", "dask") for level in range(1, 11)],
+        "i8",
+    ),
+}
+
+# 숫자 필드 dtype (decode_columns용, 나머지 필드는 문자열) - 지연호가(아시아)
+OVERSEAS_DELAYED_ORDERBOOK_FIELD_DTYPES: dict[str, str] = {
+    name: OVERSEAS_ORDERBOOK_FIELD_DTYPES[name]
+    for name in OVERSEAS_DELAYED_ORDERBOOK_FIELD_NAMES
+    if name in OVERSEAS_ORDERBOOK_FIELD_DTYPES
+}
+
+# 숫자 필드 dtype (decode_columns용, 나머지 필드는 문자열) - 체결가
+OVERSEAS_EXECUTION_FIELD_DTYPES: dict[str, str] = {
+    **dict.fromkeys(["open", "high", "low", "last", "diff", "rate", "pbid", "pask", "tamt", "strn"], "f8"),
+    **dict.fromkeys(["vbid", "vask", "evol", "tvol", "bivl", "asvl"], "i8"),
+}
@@ -0,0 +1,137 @@
+"""Lazy view over KIS realtime data frames.
+
+A realtime data frame has the form ``encrypted|tr_id|count|v1^v2^...``. The
+socket client parses only the small header eagerly and keeps the body as a
+memoryview into the received frame. The ``^`` fields are decoded and split the
+first time they are accessed, so events a consumer filters out by `tr_id` never
+pay for the split, and no second copy of the frame is kept as a ``raw`` string.
+"""
+
+from collections.abc import Sequence
+from typing import Iterator, List, Optional, Union, overload
+
+_PLAIN = 0x30  # b"0"
+_ENCRYPTED = 0x31  # b"1"
+_HEADER_SEARCH_LIMIT = 64
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class RealtimeFields(Sequence):
+    """``^``-separated values of one realtime data frame, split on first access.
+
+    Behaves like the ``List[str]`` the socket client used to emit: it supports
+    ``len()``, indexing, slicing, iteration, and compares equal to a list with
+    the same values, so existing ``parse_*_data`` helpers accept it unchanged.
+
+    Attributes:
+        tr_id: Transaction ID from the frame header
+        encrypted: Whether the body is AES encrypted
+        record_count: Number of records batched in the frame (header count field)
+    """
+
+    __slots__ = ("tr_id", "encrypted", "record_count", "_body", "_values")
+
+    def __init__(self, body: BytesLike, tr_id: str = "", encrypted: bool = False, record_count: int = 1):
+        """Initialize the view.
+
+        Args:
+            body: ``^``-separated frame body; kept without copying
+            tr_id: Transaction ID
+            encrypted: Whether the body is encrypted
+            record_count: Number of batched records
+        """
+        self.tr_id = tr_id
+        self.encrypted = encrypted
+        self.record_count = record_count
+        self._body = body if isinstance(body, memoryview) else memoryview(body)
+        self._values: Optional[List[str]] = None
+
+    @classmethod
+    def from_frame(cls, payload: BytesLike) -> Optional["RealtimeFields"]:
+        """Parse the header of a realtime data frame.
+
+        Args:
+            payload: Complete frame payload as received from the socket
+
+        Returns:
+            RealtimeFields over the frame body, or None if the payload is not a data frame
+        """
+        if not payload or payload[0] not in (_PLAIN, _ENCRYPTED):
+            return None
+        # Header fields are short; search a small prefix copy instead of the whole frame.
+        header = bytes(payload[:_HEADER_SEARCH_LIMIT])
+        first = header.find(b"|")
+        second = header.find(b"|", first + 1) if first > 0 else -1
+        third = header.find(b"|", second + 1) if second > 0 else -1
+        if third < 0:
+            return None
+
+        view = payload if isinstance(payload, memoryview) else memoryview(payload)
+        count = header[second + 1 : third]
+        return cls(
+            view[third + 1 :],
+            tr_id=header[first + 1 : second].decode("ascii"),
+            encrypted=header[0] == _ENCRYPTED,
+            record_count=int(count) if count.isdigit() else 1,
+        )
+
+    @property
+    def body(self) -> memoryview:
+        """Raw ``^``-separated body, without copying."""
+        return self._body
+
+    @property
+    def record_key(self) -> Optional[str]:
+        """First field of the first record (the symbol for quote TRs), or None if encrypted.
+
+        Read from the body without splitting the rest of the values.
+        """
+        if self.encrypted or not self._body.nbytes:
+            return None
+        if self._values is not None:
+            return self._values[0]
+        head = bytes(self._body[:_HEADER_SEARCH_LIMIT])
+        end = head.find(b"^")
+        if end < 0:
+            if self._body.nbytes > _HEADER_SEARCH_LIMIT:
+                return self.values[0]
+            end = len(head)
+        return head[:end].decode("utf-8", "replace")
+
+    @property
+    def values(self) -> List[str]:
+        """All values as a list of strings (decoded and split once, then cached)."""
+        if self._values is None:
+            self._values = str(self._body, "utf-8").split("^") if self._body.nbytes else []
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.values)
+
+    def __bool__(self) -> bool:
+        return self._body.nbytes > 0
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RealtimeFields):
+            return self.values == other.values
+        if isinstance(other, (list, tuple)):
+            return self.values == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"RealtimeFields(tr_id={self.tr_id!r}, record_count={self.record_count}, bytes={self._body.nbytes})"
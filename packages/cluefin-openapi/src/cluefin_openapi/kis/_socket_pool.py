@@ -0,0 +1,374 @@
+"""KIS WebSocket connection pool for large subscription sets.
+
+KIS accepts a limited number of realtime registrations per WebSocket session.
+`SocketPool` spreads subscriptions across several `SocketClient` connections
+("shards") and merges their events into one `RealtimeEventQueue`, so consumers
+read a single stream regardless of which connection carries a symbol.
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Set, Tuple, Union
+
+from loguru import logger
+from pydantic import SecretStr
+
+from cluefin_openapi._realtime._dispatch import RealtimeBatchCallback, RealtimeCallback, RealtimeDispatcher
+from cluefin_openapi._realtime._event_queue import BackpressurePolicy, ChannelStats, RealtimeEventQueue
+from cluefin_openapi._realtime._socket_client import WebSocketEvent
+
+from ._exceptions import KISAPIError
+from ._socket_client import SocketClient
+
+
+class SocketPool:
+    """Async pool of KIS WebSocket connections with a merged event stream.
+
+    `subscribe()` places each subscription on the least loaded connected shard
+    and opens another connection when every shard is full. Shards run
+    supervised (`reconnect=True` by default); when one reconnects, the pool moves
+    subscriptions from the busiest shards onto it until the load is even again.
+
+    Example:
+        ```python
+        async with SocketPool(
+            approval_key=approval.approval_key,
+            app_key="...",
+            secret_key=SecretStr("..."),
+        ) as pool:
+            await pool.subscribe_many([(tr_id, code) for code in codes for tr_id in ("H0STCNT0", "H0STASP0")])
+
+            async for event in pool.events():
+                if event.event_type == "data":
+                    print(f"Received: {event.tr_id} - {event.tr_key}")
+        ```
+    """
+
+    # Realtime registrations KIS accepts per WebSocket session.
+    MAX_SUBSCRIPTIONS_PER_CONNECTION = 41
+
+    def __init__(
+        self,
+        approval_key: str,
+        app_key: str,
+        secret_key: Union[str, SecretStr],
+        env: Literal["prod", "dev"] = "prod",
+        debug: bool = False,
+        max_connections: int = 10,
+        max_subscriptions_per_connection: int = MAX_SUBSCRIPTIONS_PER_CONNECTION,
+        queue_maxsize: int = 1000,
+        backpressure: Optional[Dict[str, BackpressurePolicy]] = None,
+        reconnect: bool = True,
+        **client_options: Any,
+    ):
+        """Initialize connection pool.
+
+        Args:
+            approval_key: WebSocket approval key from Auth.approve()
+            app_key: KIS API app key
+            secret_key: KIS API secret key
+            env: Environment - "prod" for production, "dev" for mock trading
+            debug: Enable debug logging
+            max_connections: Maximum number of WebSocket connections to open
+            max_subscriptions_per_connection: Subscriptions placed on one connection
+                before another one is opened
+            queue_maxsize: Maximum pending events per subscription for DROP_OLDEST
+                channels (0 for unlimited)
+            backpressure: Backpressure policy by tr_id, shared by all shards
+            reconnect: Supervise each shard and rebalance it after it reconnects
+            **client_options: Further SocketClient options applied to every shard
+                (e.g. compression, ping_interval, reconnect_max_attempts); a
+                ``latency_monitor`` also records dispatch latency in `events()`
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        if max_subscriptions_per_connection < 1:
+            raise ValueError("max_subscriptions_per_connection must be at least 1")
+
+        self.approval_key = approval_key
+        self.app_key = app_key
+        self.secret_key = secret_key
+        self.env = env
+        self.debug = debug
+        self.max_connections = max_connections
+        self.max_subscriptions_per_connection = max_subscriptions_per_connection
+
+        policies = {**SocketClient.DEFAULT_BACKPRESSURE_POLICIES, **(backpressure or {})}
+        self._event_queue = RealtimeEventQueue(maxsize=queue_maxsize, policies=policies)
+        self._dispatcher = RealtimeDispatcher()
+        self._reconnect = reconnect
+        self._client_options = client_options
+        self._latency_monitor = client_options.get("latency_monitor")
+        self._shards: List[SocketClient] = []
+        self._lock = asyncio.Lock()
+        self._closing = False
+        self._rebalance_tasks: Set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "SocketPool":
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def connect(self) -> None:
+        """Open the first connection; further shards are opened on demand.
+
+        Raises:
+            KISNetworkError: If connection fails
+        """
+        self._closing = False
+        async with self._lock:
+            if not self._shards:
+                await self._open_shard()
+
+    def _create_client(self) -> SocketClient:
+        """Create a shard that emits into the pool's event queue."""
+        return SocketClient(
+            approval_key=self.approval_key,
+            app_key=self.app_key,
+            secret_key=self.secret_key,
+            env=self.env,
+            debug=self.debug,
+            reconnect=self._reconnect,
+            event_queue=self._event_queue,
+            dispatcher=self._dispatcher,
+            on_reconnect=self._on_shard_reconnect,
+            **self._client_options,
+        )
+
+    async def _open_shard(self) -> SocketClient:
+        """Connect a new shard and add it to the pool."""
+        shard = self._create_client()
+        await shard.connect()
+        self._shards.append(shard)
+        logger.info(f"WebSocket pool opened connection {len(self._shards)}/{self.max_connections}")
+        return shard
+
+    def _shard_for(self, subscription_key: str) -> Optional[SocketClient]:
+        """Return the shard carrying a subscription, if any."""
+        return next((shard for shard in self._shards if subscription_key in shard.subscriptions), None)
+
+    async def _select_shard(self, planned: Optional[Dict[int, List[Tuple[str, str]]]] = None) -> SocketClient:
+        """Pick the least loaded connected shard with room, opening one if needed.
+
+        Args:
+            planned: Subscriptions already assigned but not yet sent, by id(shard)
+
+        Raises:
+            KISAPIError: If every connection is full or unavailable
+        """
+        planned = planned or {}
+
+        def load(shard: SocketClient) -> int:
+            return len(shard.subscriptions) + len(planned.get(id(shard), ()))
+
+        available = [
+            shard for shard in self._shards if shard.connected and load(shard) < self.max_subscriptions_per_connection
+        ]
+        if available:
+            return min(available, key=load)
+        if len(self._shards) < self.max_connections:
+            return await self._open_shard()
+        raise KISAPIError(
+            f"WebSocket pool is full: {len(self._shards)} connections with "
+            f"{self.max_subscriptions_per_connection} subscriptions each"
+        )
+
+    async def subscribe(self, tr_id: str, tr_key: str) -> None:
+        """Subscribe to real-time data on the least loaded connection.
+
+        Args:
+            tr_id: Transaction ID (e.g., "H0STASP0" for stock quotes)
+            tr_key: Transaction key (e.g., stock code "005930")
+
+        Raises:
+            KISAPIError: If the pool is full or subscription fails
+        """
+        async with self._lock:
+            if self._shard_for(f"{tr_id}:{tr_key}") is not None:
+                if self.debug:
+                    logger.debug(f"Already subscribed to {tr_id}:{tr_key}")
+                return
+            shard = await self._select_shard()
+            await shard.subscribe(tr_id, tr_key)
+
+    async def subscribe_many(self, subscriptions: Iterable[Tuple[str, str]]) -> None:
+        """Subscribe to many subscriptions, pipelining them on every connection.
+
+        Subscriptions are assigned to shards up front (opening connections as
+        needed), then each shard registers its share with
+        `SocketClient.subscribe_many` concurrently.
+
+        Args:
+            subscriptions: (tr_id, tr_key) pairs, e.g. [("H0STCNT0", "005930")]
+
+        Raises:
+            KISAPIError: If the pool is full or subscription fails
+        """
+        async with self._lock:
+            planned: Dict[int, List[Tuple[str, str]]] = {}
+            seen = set(self.subscriptions)
+            for tr_id, tr_key in subscriptions:
+                subscription_key = f"{tr_id}:{tr_key}"
+                if subscription_key in seen:
+                    continue
+                seen.add(subscription_key)
+                shard = await self._select_shard(planned)
+                planned.setdefault(id(shard), []).append((tr_id, tr_key))
+
+            shards = {id(shard): shard for shard in self._shards}
+            await asyncio.gather(*(shards[key].subscribe_many(pairs) for key, pairs in planned.items()))
+
+    async def unsubscribe(self, tr_id: str, tr_key: str) -> None:
+        """Unsubscribe from real-time data on whichever connection carries it.
+
+        Args:
+            tr_id: Transaction ID
+            tr_key: Transaction key
+        """
+        async with self._lock:
+            shard = self._shard_for(f"{tr_id}:{tr_key}")
+            if shard is None:
+                if self.debug:
+                    logger.debug(f"Not subscribed to {tr_id}:{tr_key}")
+                return
+            await shard.unsubscribe(tr_id, tr_key)
+
+    async def _on_shard_reconnect(self, shard: SocketClient) -> None:
+        """Schedule a rebalance after a shard has reconnected and replayed its subscriptions.
+
+        The rebalance waits for the pool lock and for rate limit tokens, so it
+        runs in its own task instead of holding up the shard's reconnect.
+        """
+        if self._closing:
+            return
+        task = asyncio.create_task(self._rebalance_when_idle(shard))
+        self._rebalance_tasks.add(task)
+        task.add_done_callback(self._rebalance_tasks.discard)
+
+    async def _rebalance_when_idle(self, shard: SocketClient) -> None:
+        async with self._lock:
+            if not self._closing:
+                await self._rebalance(shard)
+
+    async def _rebalance(self, target: SocketClient) -> None:
+        """Move subscriptions from the busiest connected shards onto `target`.
+
+        While a shard is reconnecting new subscriptions go to the others, so it
+        comes back underloaded. Each move registers on `target` before releasing
+        the old connection, so the symbol is never left without a feed; the
+        event stream sees a "subscribed" event from `target` followed by an
+        "unsubscribed" event from the donor.
+        """
+        connected = [shard for shard in self._shards if shard.connected]
+        if target not in connected or len(connected) < 2:
+            return
+        total = sum(len(shard.subscriptions) for shard in connected)
+        fair_share = min(total // len(connected), self.max_subscriptions_per_connection)
+        moved = 0
+        while len(target.subscriptions) < fair_share:
+            donor = max((shard for shard in connected if shard is not target), key=lambda s: len(s.subscriptions))
+            if len(donor.subscriptions) <= len(target.subscriptions) + 1:
+                break
+            subscription_key, tr_key = next(reversed(donor.subscriptions.items()))
+            tr_id = subscription_key.split(":", 1)[0]
+            try:
+                await self._move(donor, target, tr_id, tr_key)
+            except Exception as e:
+                logger.warning(f"WebSocket pool failed to move {subscription_key}: {e}")
+                break
+            moved += 1
+        if moved:
+            logger.info(f"WebSocket pool moved {moved} subscriptions onto a reconnected connection")
+
+    async def _move(self, source: SocketClient, target: SocketClient, tr_id: str, tr_key: str) -> None:
+        """Move one registration between shards."""
+        await target.subscribe(tr_id, tr_key)
+        try:
+            await source.unsubscribe(tr_id, tr_key)
+        except Exception as e:
+            # The registration is gone once that connection drops anyway.
+            logger.warning(f"WebSocket pool failed to release {tr_id}:{tr_key}: {e}")
+
+    def on(
+        self,
+        tr_id: str,
+        tr_key: Optional[str],
+        callback: Union[RealtimeCallback, RealtimeBatchCallback],
+        batch: bool = False,
+    ) -> Callable[[], None]:
+        """Register a handler for matching records on every connection.
+
+        See `SocketClient.on()`.
+
+        Returns:
+            Function that removes the handler
+        """
+        return self._dispatcher.add(tr_id, tr_key, callback, batch=batch)
+
+    def off(self, tr_id: str, tr_key: Optional[str], callback: Union[RealtimeCallback, RealtimeBatchCallback]) -> None:
+        """Remove handlers registered with `on()` for this callback."""
+        self._dispatcher.remove(tr_id, tr_key, callback)
+
+    def _active(self) -> bool:
+        return any(shard.connected or shard.reconnecting for shard in self._shards)
+
+    async def events(self, tr_id: Optional[str] = None, tr_key: Optional[str] = None):
+        """Async generator for receiving events from every connection.
+
+        Args:
+            tr_id: Only yield data events of this tr_id
+            tr_key: Only yield data events of this tr_key
+
+        Yields:
+            WebSocketEvent objects
+        """
+        while self._active() or not self._event_queue.empty(tr_id, tr_key):
+            try:
+                event: WebSocketEvent = await asyncio.wait_for(self._event_queue.get(tr_id, tr_key), timeout=1.0)
+                if self._latency_monitor is not None and event.received_monotonic_ns is not None:
+                    self._latency_monitor.record_dispatch_since(event.tr_id, event.received_monotonic_ns)
+                yield event
+            except asyncio.TimeoutError:
+                continue
+
+    def queue_stats(self) -> Dict[str, ChannelStats]:
+        """Get per-subscription backpressure counters across all connections.
+
+        Returns:
+            ChannelStats keyed by "tr_id:tr_key" ("" for status events)
+        """
+        return self._event_queue.stats()
+
+    async def close(self) -> None:
+        """Close every connection."""
+        self._closing = True
+        for task in list(self._rebalance_tasks):
+            task.cancel()
+        await asyncio.gather(*self._rebalance_tasks, return_exceptions=True)
+        shards, self._shards = self._shards, []
+        await asyncio.gather(*(shard.close() for shard in shards))
+
+        if self.debug:
+            logger.debug("WebSocket pool closed")
+
+    @property
+    def connected(self) -> bool:
+        """Check if at least one connection is up."""
+        return any(shard.connected for shard in self._shards)
+
+    @property
+    def shards(self) -> List[SocketClient]:
+        """Get the pool's connections."""
+        return list(self._shards)
+
+    @property
+    def subscriptions(self) -> Dict[str, str]:
+        """Get current subscriptions across all connections."""
+        merged: Dict[str, str] = {}
+        for shard in self._shards:
+            merged.update(shard.subscriptions)
+        return merged
@@ -2,28 +2,44 @@
 
 from ._auth import Auth
 from ._client import Client
+from ._domestic_realtime import DomesticRealtime
+from ._domestic_realtime_types import (
+    DomesticRealtimeExecutionItem,
+    DomesticRealtimeOrderbookItem,
+    DomesticRealtimeOrderExecutionItem,
+    DomesticRealtimeViItem,
+)
 from ._exceptions import (
     KiwoomAPIError,
     KiwoomAuthenticationError,
     KiwoomAuthorizationError,
+    KiwoomCircuitOpenError,
     KiwoomNetworkError,
     KiwoomRateLimitError,
     KiwoomServerError,
     KiwoomTimeoutError,
     KiwoomValidationError,
 )
+from ._socket_client import SocketClient
 
 __all__ = [
     "Auth",
     "Client",
+    "DomesticRealtime",
+    "DomesticRealtimeExecutionItem",
+    "DomesticRealtimeOrderbookItem",
+    "DomesticRealtimeOrderExecutionItem",
+    "DomesticRealtimeViItem",
     "KiwoomAPIError",
     "KiwoomAuthenticationError",
     "KiwoomAuthorizationError",
+    "KiwoomCircuitOpenError",
     "KiwoomNetworkError",
     "KiwoomRateLimitError",
     "KiwoomServerError",
     "KiwoomTimeoutError",
     "KiwoomValidationError",
+    "SocketClient",
 ]
 
 
@@ -1,17 +1,21 @@
 import json
 import time
 from typing import Dict, List, Literal, Optional, Tuple
+from urllib.parse import urlparse
 
 import requests
 from loguru import logger
 
+from cluefin_openapi._hedging import HedgePolicy
 from cluefin_openapi._rate_limiter import TokenBucket
+from cluefin_openapi._retry import RetryPolicy
 
 from ._cache import SimpleCache, create_cache_key
 from ._exceptions import (
     KiwoomAPIError,
     KiwoomAuthenticationError,
     KiwoomAuthorizationError,
+    KiwoomCircuitOpenError,
     KiwoomNetworkError,
     KiwoomRateLimitError,
     KiwoomServerError,
@@ -51,6 +55,8 @@ class Client(object):
         rate_limit_burst: int = 1,
         enable_caching: bool = False,
         cache_ttl: int = 300,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
     ):
         self.token = token
         self.timeout = timeout
@@ -80,6 +86,12 @@ class Client(object):
         # Initialize rate limiter
         self._rate_limiter = TokenBucket(capacity=rate_limit_burst, refill_rate=rate_limit_requests_per_second)
 
+        # Jittered backoff, retry budget, and per-endpoint circuit breakers
+        self._retry_policy = retry_policy or RetryPolicy(host=urlparse(self.url).netloc)
+
+        # Opt-in hedging for latency-critical APIs (disabled when None)
+        self._hedge_policy = hedge_policy
+
         # Initialize cache if enabled
         self._cache = SimpleCache(default_ttl=cache_ttl) if enable_caching else None
 
@@ -150,6 +162,17 @@ class Client(object):
         return DomesticTheme(self)
 
     def _post(self, path: str, headers: Dict[str, str], body: Dict[str, str], use_cache: bool = True):
+        """Make a POST request, hedging it when the hedge policy covers its api-id."""
+        api_id = headers.get("api-id")
+        if self._hedge_policy is not None and self._hedge_policy.applies_to(api_id):
+            return self._hedge_policy.call(
+                api_id,
+                lambda: self._send_post(path, headers, body, use_cache=use_cache),
+                rate_limiter=self._rate_limiter,
+            )
+        return self._send_post(path, headers, body, use_cache=use_cache)
+
+    def _send_post(self, path: str, headers: Dict[str, str], body: Dict[str, str], use_cache: bool = True):
         """Make a POST request with improved error handling and logging."""
         # Check cache first if enabled
         cache_key = None
@@ -161,6 +184,15 @@ class Client(object):
                     logger.debug(f"Cache hit for {path}")
                 return cached_response
 
+        # Fail fast while the endpoint circuit is open
+        breaker = self._retry_policy.breaker(path)
+        if not breaker.allow_request():
+            raise KiwoomCircuitOpenError(
+                f"Circuit open for {path} - endpoint is unhealthy, failing fast",
+                request_context={"url": f"{self.url}{path}", "path": path},
+                retry_after=breaker.retry_after,
+            )
+
         # Apply rate limiting
         if not self._rate_limiter.wait_for_tokens(timeout=self.timeout):
             raise KiwoomRateLimitError(
@@ -189,6 +221,9 @@ class Client(object):
             "body": body,
         }
 
+        self._retry_policy.budget.record_request()
+        backoff = self._retry_policy.backoff()
+
         for attempt in range(self.max_retries + 1):
             try:
                 start_time = time.time()
@@ -207,6 +242,11 @@ class Client(object):
                     logger.debug(f"Response received in {duration:.3f}s - Status: {response.status_code}")
                     logger.debug(f"Response headers: {dict(response.headers)}")
 
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
                 # Handle different HTTP status codes
                 if response.status_code == 200:
                     # Cache successful responses if caching is enabled
@@ -246,25 +286,25 @@ class Client(object):
                     )
                 elif response.status_code == 429:
                     retry_after = self._get_retry_after(response)
-                    if attempt < self.max_retries:
-                        wait_time = retry_after or (2**attempt)
+                    if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                        wait_time = retry_after or backoff.next_delay()
                         logger.warning(
-                            f"Rate limit hit, waiting {wait_time}s before retry {attempt + 1}/{self.max_retries}"
+                            f"Rate limit hit, waiting {wait_time:.2f}s before retry {attempt + 1}/{self.max_retries}"
                         )
                         time.sleep(wait_time)
                         continue
                     else:
                         raise KiwoomRateLimitError(
-                            f"Rate limit exceeded after {self.max_retries} retries",
+                            f"Rate limit exceeded after {attempt} retries",
                             status_code=response.status_code,
                             response_data=self._safe_json(response),
                             request_context=request_context,
                             retry_after=retry_after,
                         )
                 elif 500 <= response.status_code < 600:
-                    if attempt < self.max_retries:
-                        wait_time = 2**attempt
-                        logger.warning(f"Server error {response.status_code}, retrying in {wait_time}s")
+                    if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                        wait_time = backoff.next_delay()
+                        logger.warning(f"Server error {response.status_code}, retrying in {wait_time:.2f}s")
                         time.sleep(wait_time)
                         continue
                     else:
@@ -283,20 +323,22 @@ class Client(object):
                     )
 
             except requests.exceptions.Timeout as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
-                    logger.warning(f"Request timeout, retrying in {wait_time}s")
+                breaker.record_failure()
+                if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                    wait_time = backoff.next_delay()
+                    logger.warning(f"Request timeout, retrying in {wait_time:.2f}s")
                     time.sleep(wait_time)
                     continue
                 else:
                     raise KiwoomTimeoutError(
-                        f"Request timeout after {self.max_retries} retries",
+                        f"Request timeout after {attempt} retries",
                         request_context=request_context,
                     ) from e
             except requests.exceptions.ConnectionError as e:
-                if attempt < self.max_retries:
-                    wait_time = 2**attempt
-                    logger.warning(f"Connection error, retrying in {wait_time}s")
+                breaker.record_failure()
+                if self._retry_policy.can_retry(attempt, self.max_retries, breaker, backoff):
+                    wait_time = backoff.next_delay()
+                    logger.warning(f"Connection error, retrying in {wait_time:.2f}s")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -331,9 +373,11 @@ class Client(object):
         return None
 
     def close(self):
-        """Close the HTTP session."""
+        """Close the HTTP session and the hedge policy's worker threads."""
         if hasattr(self, "_session"):
             self._session.close()
+        if getattr(self, "_hedge_policy", None) is not None:
+            self._hedge_policy.close()
 
     def batch_post(self, requests_data: List[Tuple[str, Dict[str, str], Dict[str, str]]]) -> List[requests.Response]:
         """
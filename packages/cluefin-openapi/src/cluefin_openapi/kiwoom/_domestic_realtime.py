@@ -1,22 +1,181 @@
+"""국내주식 실시간시세 WebSocket API.
+
+Kiwoom WebSocket을 통해 주식체결, 호가잔량, 주문체결, VI발동/해제 데이터를
+구독합니다.
+
+References:
+- https://openapi.kiwoom.com/guide/apiguide (실시간시세)
+"""
+
+from typing import Any, Mapping, Type, TypeVar
+
+from pydantic import BaseModel
+
+from ._domestic_realtime_types import (
+    DomesticRealtimeExecutionItem,
+    DomesticRealtimeOrderbookItem,
+    DomesticRealtimeOrderExecutionItem,
+    DomesticRealtimeViItem,
+)
+from ._socket_client import SocketClient
+
+T_RealtimeItem = TypeVar("T_RealtimeItem", bound=BaseModel)
+
+
+def _parse(model: Type[T_RealtimeItem], data: Mapping[str, Any]) -> T_RealtimeItem:
+    """Validate a record's FID ``values`` (or the whole REAL record) into `model`."""
+    values = data.get("values", data)
+    return model.model_validate(values)
+
+
 class DomesticRealtime:
-    pass
-
-
-# 주문체결	OO	get_order_execution
-# 잔고	04	get_balance
-# 주식기세	OA	get_stock_momentum
-# 주식체결	OB	get_stock_execution
-# 주식우선호가	OC	get_stock_priority_quote
-# 주식호가잔량	OD	get_stock_remaining_order_quantity
-# 주식시간외호가	OE	get_stock_after_hours_quote
-# 주식당일거래원	OF	get_stock_current_day_traders
-# ETF NAV	OG	get_etf_nav
-# 주식예상체결	OH	get_stock_expected_execution
-# 업종지수	OJ	get_industry_index
-# 업종등락	OU	get_industry_fluctuation
-# 주식종목정보	Og	get_stock_item_info
-# ELW 이론가	Om	get_elw_theoretical_price
-# 장시작시간	Os	get_market_start_time
-# ELW지표	Ou	get_elw_indicator
-# 종목별프로그램매매	Ow	get_program_trading_by_stock
-# VI발동/해제	1h	get_vi_activation_release
+    """국내주식 실시간시세 WebSocket API.
+
+    SocketClient를 사용하여 실시간 데이터를 구독합니다.
+
+    Example:
+        ```python
+        from cluefin_openapi.kiwoom import DomesticRealtime, SocketClient
+
+        async with SocketClient(token=token.get_token(), env="prod") as socket_client:
+            realtime = DomesticRealtime(socket_client)
+            await realtime.subscribe_execution("005930")
+
+            async for event in socket_client.events():
+                if event.event_type == "data" and event.tr_id == DomesticRealtime.TR_EXECUTION:
+                    execution = realtime.parse_execution(event.data["values"])
+                    print(f"Price: {execution.cur_prc}, Volume: {execution.trde_qty}")
+        ```
+    """
+
+    # Real-time types
+    TR_ORDER_EXECUTION = "00"  # 주문체결
+    TR_BALANCE = "04"  # 잔고
+    TR_MOMENTUM = "0A"  # 주식기세
+    TR_EXECUTION = "0B"  # 주식체결
+    TR_PRIORITY_QUOTE = "0C"  # 주식우선호가
+    TR_ORDERBOOK = "0D"  # 주식호가잔량
+    TR_AFTER_HOURS_QUOTE = "0E"  # 주식시간외호가
+    TR_CURRENT_DAY_TRADERS = "0F"  # 주식당일거래원
+    TR_ETF_NAV = "0G"  # ETF NAV
+    TR_EXPECTED_EXECUTION = "0H"  # 주식예상체결
+    TR_INDUSTRY_INDEX = "0J"  # 업종지수
+    TR_INDUSTRY_FLUCTUATION = "0U"  # 업종등락
+    TR_STOCK_ITEM_INFO = "0g"  # 주식종목정보
+    TR_ELW_THEORETICAL_PRICE = "0m"  # ELW 이론가
+    TR_MARKET_START_TIME = "0s"  # 장시작시간
+    TR_ELW_INDICATOR = "0u"  # ELW지표
+    TR_PROGRAM_TRADING = "0w"  # 종목별프로그램매매
+    TR_VI = "1h"  # VI발동/해제
+
+    def __init__(self, socket_client: SocketClient):
+        """Initialize DomesticRealtime.
+
+        Args:
+            socket_client: Connected SocketClient instance
+        """
+        self.socket_client = socket_client
+
+    async def subscribe_execution(self, stock_code: str) -> None:
+        """Subscribe to 주식체결 (0B).
+
+        Args:
+            stock_code: Stock code (e.g., "005930" for Samsung Electronics)
+        """
+        await self.socket_client.subscribe(self.TR_EXECUTION, stock_code)
+
+    async def unsubscribe_execution(self, stock_code: str) -> None:
+        """Unsubscribe from 주식체결 (0B).
+
+        Args:
+            stock_code: Stock code to unsubscribe
+        """
+        await self.socket_client.unsubscribe(self.TR_EXECUTION, stock_code)
+
+    @staticmethod
+    def parse_execution(data: Mapping[str, Any]) -> DomesticRealtimeExecutionItem:
+        """Parse a 주식체결 (0B) record.
+
+        Args:
+            data: `event.data["values"]`, or the record passed to an `on()` handler
+
+        Returns:
+            Parsed DomesticRealtimeExecutionItem
+        """
+        return _parse(DomesticRealtimeExecutionItem, data)
+
+    async def subscribe_orderbook(self, stock_code: str) -> None:
+        """Subscribe to 주식호가잔량 (0D).
+
+        Args:
+            stock_code: Stock code (e.g., "005930" for Samsung Electronics)
+        """
+        await self.socket_client.subscribe(self.TR_ORDERBOOK, stock_code)
+
+    async def unsubscribe_orderbook(self, stock_code: str) -> None:
+        """Unsubscribe from 주식호가잔량 (0D).
+
+        Args:
+            stock_code: Stock code to unsubscribe
+        """
+        await self.socket_client.unsubscribe(self.TR_ORDERBOOK, stock_code)
+
+    @staticmethod
+    def parse_orderbook(data: Mapping[str, Any]) -> DomesticRealtimeOrderbookItem:
+        """Parse a 주식호가잔량 (0D) record.
+
+        Args:
+            data: `event.data["values"]`, or the record passed to an `on()` handler
+
+        Returns:
+            Parsed DomesticRealtimeOrderbookItem
+        """
+        return _parse(DomesticRealtimeOrderbookItem, data)
+
+    async def subscribe_order_execution(self) -> None:
+        """Subscribe to 주문체결 (00) of the logged-in account."""
+        await self.socket_client.subscribe(self.TR_ORDER_EXECUTION, "")
+
+    async def unsubscribe_order_execution(self) -> None:
+        """Unsubscribe from 주문체결 (00)."""
+        await self.socket_client.unsubscribe(self.TR_ORDER_EXECUTION, "")
+
+    @staticmethod
+    def parse_order_execution(data: Mapping[str, Any]) -> DomesticRealtimeOrderExecutionItem:
+        """Parse a 주문체결 (00) record.
+
+        Args:
+            data: `event.data["values"]`, or the record passed to an `on()` handler
+
+        Returns:
+            Parsed DomesticRealtimeOrderExecutionItem
+        """
+        return _parse(DomesticRealtimeOrderExecutionItem, data)
+
+    async def subscribe_vi(self, stock_code: str = "") -> None:
+        """Subscribe to VI발동/해제 (1h).
+
+        Args:
+            stock_code: Stock code, or "" for every stock
+        """
+        await self.socket_client.subscribe(self.TR_VI, stock_code)
+
+    async def unsubscribe_vi(self, stock_code: str = "") -> None:
+        """Unsubscribe from VI발동/해제 (1h).
+
+        Args:
+            stock_code: Stock code used to subscribe
+        """
+        await self.socket_client.unsubscribe(self.TR_VI, stock_code)
+
+    @staticmethod
+    def parse_vi(data: Mapping[str, Any]) -> DomesticRealtimeViItem:
+        """Parse a VI발동/해제 (1h) record.
+
+        Args:
+            data: `event.data["values"]`, or the record passed to an `on()` handler
+
+        Returns:
+            Parsed DomesticRealtimeViItem
+        """
+        return _parse(DomesticRealtimeViItem, data)
@@ -0,0 +1,216 @@
+"""국내주식 실시간시세 타입 정의.
+
+Kiwoom WebSocket(``trnm: "REAL"``)으로 수신되는 실시간 데이터의 Pydantic 모델을
+정의합니다. 실시간 항목은 FID 코드를 키로 하는 ``values`` 객체로 전달되므로 각
+필드는 FID를 alias로 가집니다.
+
+References:
+- https://openapi.kiwoom.com/guide/apiguide (실시간시세)
+"""
+
+from typing import List, Tuple
+
+from pydantic import BaseModel, Field
+
+_LEVEL_NAMES = ("1st", "2nd", "3rd", "4th", "5th", "6th", "7th", "8th", "9th", "10th")
+
+
+class DomesticRealtimeOrderExecutionItem(BaseModel):
+    """주문체결 - 00."""
+
+    acnt_no: str = Field(default="", alias="9201", title="계좌번호")
+    ord_no: str = Field(default="", alias="9203", title="주문번호")
+    mang_empno: str = Field(default="", alias="9205", title="관리자사번")
+    stk_cd: str = Field(default="", alias="9001", title="종목코드,업종코드")
+    ord_biz_cls: str = Field(default="", alias="912", title="주문업무분류")
+    ord_stt: str = Field(default="", alias="913", title="주문상태")
+    stk_nm: str = Field(default="", alias="302", title="종목명")
+    ord_qty: str = Field(default="", alias="900", title="주문수량")
+    ord_pric: str = Field(default="", alias="901", title="주문가격")
+    oso_qty: str = Field(default="", alias="902", title="미체결수량")
+    cntr_tot_amt: str = Field(default="", alias="903", title="체결누계금액")
+    orig_ord_no: str = Field(default="", alias="904", title="원주문번호")
+    io_tp_nm: str = Field(default="", alias="905", title="주문구분")
+    trde_tp: str = Field(default="", alias="906", title="매매구분")
+    sell_tp: str = Field(default="", alias="907", title="매도수구분")
+    ord_cntr_tm: str = Field(default="", alias="908", title="주문/체결시간")
+    cntr_no: str = Field(default="", alias="909", title="체결번호")
+    cntr_pric: str = Field(default="", alias="910", title="체결가")
+    cntr_qty: str = Field(default="", alias="911", title="체결량")
+    cur_prc: str = Field(default="", alias="10", title="현재가")
+    pri_sel_bid: str = Field(default="", alias="27", title="(최우선)매도호가")
+    pri_buy_bid: str = Field(default="", alias="28", title="(최우선)매수호가")
+    untcntr_pric: str = Field(default="", alias="914", title="단위체결가")
+    untcntr_qty: str = Field(default="", alias="915", title="단위체결량")
+    tdy_trde_cmsn: str = Field(default="", alias="938", title="당일매매수수료")
+    tdy_trde_tax: str = Field(default="", alias="939", title="당일매매세금")
+    rjct_rson: str = Field(default="", alias="919", title="거부사유")
+    scrn_no: str = Field(default="", alias="920", title="화면번호")
+    tmnl_no: str = Field(default="", alias="921", title="터미널번호")
+    crd_tp: str = Field(default="", alias="922", title="신용구분(실시간 체결용)")
+    loan_dt: str = Field(default="", alias="923", title="대출일(실시간 체결용)")
+    ovt_sngl_cur_prc: str = Field(default="", alias="10010", title="시간외단일가_현재가")
+    dmst_stex_tp: str = Field(default="", alias="2134", title="거래소구분")
+    dmst_stex_tp_nm: str = Field(default="", alias="2135", title="거래소구분명")
+    sor_yn: str = Field(default="", alias="2136", title="SOR여부")
+
+
+class DomesticRealtimeExecutionItem(BaseModel):
+    """주식체결 - 0B."""
+
+    cntr_tm: str = Field(default="", alias="20", title="체결시간")
+    cur_prc: str = Field(default="", alias="10", title="현재가")
+    pred_pre: str = Field(default="", alias="11", title="전일대비")
+    flu_rt: str = Field(default="", alias="12", title="등락율")
+    pri_sel_bid: str = Field(default="", alias="27", title="(최우선)매도호가")
+    pri_buy_bid: str = Field(default="", alias="28", title="(최우선)매수호가")
+    trde_qty: str = Field(default="", alias="15", title="거래량(+는 매수체결, -는 매도체결)")
+    acc_trde_qty: str = Field(default="", alias="13", title="누적거래량")
+    acc_trde_prica: str = Field(default="", alias="14", title="누적거래대금")
+    open_pric: str = Field(default="", alias="16", title="시가")
+    high_pric: str = Field(default="", alias="17", title="고가")
+    low_pric: str = Field(default="", alias="18", title="저가")
+    pred_pre_sig: str = Field(default="", alias="25", title="전일대비기호")
+    pred_trde_qty_pre: str = Field(default="", alias="26", title="전일거래량대비(계약,주)")
+    trde_prica_incrs: str = Field(default="", alias="29", title="거래대금증감")
+    pred_trde_qty_rt: str = Field(default="", alias="30", title="전일거래량대비(비율)")
+    trde_tern_rt: str = Field(default="", alias="31", title="거래회전율")
+    trde_cost: str = Field(default="", alias="32", title="거래비용")
+    cntr_str: str = Field(default="", alias="228", title="체결강도")
+    mac: str = Field(default="", alias="311", title="시가총액(억)")
+    mrkt_cls: str = Field(default="", alias="290", title="장구분")
+    ko_accs: str = Field(default="", alias="691", title="KO접근도")
+    upl_pric_tm: str = Field(default="", alias="567", title="상한가발생시간")
+    lol_pric_tm: str = Field(default="", alias="568", title="하한가발생시간")
+    pred_same_tm_trde_qty_rt: str = Field(default="", alias="851", title="전일 동시간 거래량 비율")
+    open_pric_tm: str = Field(default="", alias="1890", title="시가시간")
+    high_pric_tm: str = Field(default="", alias="1891", title="고가시간")
+    low_pric_tm: str = Field(default="", alias="1892", title="저가시간")
+    sel_cntr_qty: str = Field(default="", alias="1030", title="매도체결량")
+    buy_cntr_qty: str = Field(default="", alias="1031", title="매수체결량")
+    buy_rt: str = Field(default="", alias="1032", title="매수비율")
+    sel_cntr_cnt: str = Field(default="", alias="1071", title="매도체결건수")
+    buy_cntr_cnt: str = Field(default="", alias="1072", title="매수체결건수")
+    inst_trde_prica: str = Field(default="", alias="1313", title="순간거래대금")
+    sel_cntr_qty_sngl: str = Field(default="", alias="1315", title="매도체결량_단건")
+    buy_cntr_qty_sngl: str = Field(default="", alias="1316", title="매수체결량_단건")
+    netprps_cntr_qty: str = Field(default="", alias="1314", title="순매수체결량")
+    cfd_mgn: str = Field(default="", alias="1497", title="CFD증거금")
+    mntn_mgn: str = Field(default="", alias="1498", title="유지증거금")
+    tdy_trde_avg_pric: str = Field(default="", alias="620", title="당일거래평균가")
+    cfd_trde_cost: str = Field(default="", alias="732", title="CFD거래비용")
+    stk_lend_trde_cost: str = Field(default="", alias="852", title="대주거래비용")
+    stex_tp: str = Field(default="", alias="9081", title="거래소구분")
+
+
+class DomesticRealtimeOrderbookItem(BaseModel):
+    """주식호가잔량 - 0D.
+
+    호가 1~10단계의 가격과 잔량을 제공합니다. `asks()`/`bids()`로 단계별
+    (가격, 잔량) 목록을 얻을 수 있습니다.
+    """
+
+    bid_req_base_tm: str = Field(default="", alias="21", title="호가시간")
+    sel_1st_pre_bid: str = Field(default="", alias="41", title="매도호가1")
+    sel_1st_pre_req: str = Field(default="", alias="61", title="매도호가수량1")
+    sel_1st_pre_req_pre: str = Field(default="", alias="81", title="매도호가직전대비1")
+    sel_2nd_pre_bid: str = Field(default="", alias="42", title="매도호가2")
+    sel_2nd_pre_req: str = Field(default="", alias="62", title="매도호가수량2")
+    sel_2nd_pre_req_pre: str = Field(default="", alias="82", title="매도호가직전대비2")
+    sel_3rd_pre_bid: str = Field(default="", alias="43", title="매도호가3")
+    sel_3rd_pre_req: str = Field(default="", alias="63", title="매도호가수량3")
+    sel_3rd_pre_req_pre: str = Field(default="", alias="83", title="매도호가직전대비3")
+    sel_4th_pre_bid: str = Field(default="", alias="44", title="매도호가4")
+    sel_4th_pre_req: str = Field(default="", alias="64", title="매도호가수량4")
+    sel_4th_pre_req_pre: str = Field(default="", alias="84", title="매도호가직전대비4")
+    sel_5th_pre_bid: str = Field(default="", alias="45", title="매도호가5")
+    sel_5th_pre_req: str = Field(default="", alias="65", title="매도호가수량5")
+    sel_5th_pre_req_pre: str = Field(default="", alias="85", title="매도호가직전대비5")
+    sel_6th_pre_bid: str = Field(default="", alias="46", title="매도호가6")
+    sel_6th_pre_req: str = Field(default="", alias="66", title="매도호가수량6")
+    sel_6th_pre_req_pre: str = Field(default="", alias="86", title="매도호가직전대비6")
+    sel_7th_pre_bid: str = Field(default="", alias="47", title="매도호가7")
+    sel_7th_pre_req: str = Field(default="", alias="67", title="매도호가수량7")
+    sel_7th_pre_req_pre: str = Field(default="", alias="87", title="매도호가직전대비7")
+    sel_8th_pre_bid: str = Field(default="", alias="48", title="매도호가8")
+    sel_8th_pre_req: str = Field(default="", alias="68", title="매도호가수량8")
+    sel_8th_pre_req_pre: str = Field(default="", alias="88", title="매도호가직전대비8")
+    sel_9th_pre_bid: str = Field(default="", alias="49", title="매도호가9")
+    sel_9th_pre_req: str = Field(default="", alias="69", title="매도호가수량9")
+    sel_9th_pre_req_pre: str = Field(default="", alias="89", title="매도호가직전대비9")
+    sel_10th_pre_bid: str = Field(default="", alias="50", title="매도호가10")
+    sel_10th_pre_req: str = Field(default="", alias="70", title="매도호가수량10")
+    sel_10th_pre_req_pre: str = Field(default="", alias="90", title="매도호가직전대비10")
+    buy_1st_pre_bid: str = Field(default="", alias="51", title="매수호가1")
+    buy_1st_pre_req: str = Field(default="", alias="71", title="매수호가수량1")
+    buy_1st_pre_req_pre: str = Field(default="", alias="91", title="매수호가직전대비1")
+    buy_2nd_pre_bid: str = Field(default="", alias="52", title="매수호가2")
+    buy_2nd_pre_req: str = Field(default="", alias="72", title="매수호가수량2")
+    buy_2nd_pre_req_pre: str = Field(default="", alias="92", title="매수호가직전대비2")
+    buy_3rd_pre_bid: str = Field(default="", alias="53", title="매수호가3")
+    buy_3rd_pre_req: str = Field(default="", alias="73", title="매수호가수량3")
+    buy_3rd_pre_req_pre: str = Field(default="", alias="93", title="매수호가직전대비3")
+    buy_4th_pre_bid: str = Field(default="", alias="54", title="매수호가4")
+    buy_4th_pre_req: str = Field(default="", alias="74", title="매수호가수량4")
+    buy_4th_pre_req_pre: str = Field(default="", alias="94", title="매수호가직전대비4")
+    buy_5th_pre_bid: str = Field(default="", alias="55", title="매수호가5")
+    buy_5th_pre_req: str = Field(default="", alias="75", title="매수호가수량5")
+    buy_5th_pre_req_pre: str = Field(default="", alias="95", title="매수호가직전대비5")
+    buy_6th_pre_bid: str = Field(default="", alias="56", title="매수호가6")
+    buy_6th_pre_req: str = Field(default="", alias="76", title="매수호가수량6")
+    buy_6th_pre_req_pre: str = Field(default="", alias="96", title="매수호가직전대비6")
+    buy_7th_pre_bid: str = Field(default="", alias="57", title="매수호가7")
+    buy_7th_pre_req: str = Field(default="", alias="77", title="매수호가수량7")
+    buy_7th_pre_req_pre: str = Field(default="", alias="97", title="매수호가직전대비7")
+    buy_8th_pre_bid: str = Field(default="", alias="58", title="매수호가8")
+    buy_8th_pre_req: str = Field(default="", alias="78", title="매수호가수량8")
+    buy_8th_pre_req_pre: str = Field(default="", alias="98", title="매수호가직전대비8")
+    buy_9th_pre_bid: str = Field(default="", alias="59", title="매수호가9")
+    buy_9th_pre_req: str = Field(default="", alias="79", title="매수호가수량9")
+    buy_9th_pre_req_pre: str = Field(default="", alias="99", title="매수호가직전대비9")
+    buy_10th_pre_bid: str = Field(default="", alias="60", title="매수호가10")
+    buy_10th_pre_req: str = Field(default="", alias="80", title="매수호가수량10")
+    buy_10th_pre_req_pre: str = Field(default="", alias="100", title="매수호가직전대비10")
+    tot_sel_req: str = Field(default="", alias="121", title="매도호가총잔량")
+    tot_sel_req_jub_pre: str = Field(default="", alias="122", title="매도호가총잔량직전대비")
+    tot_buy_req: str = Field(default="", alias="125", title="매수호가총잔량")
+    tot_buy_req_jub_pre: str = Field(default="", alias="126", title="매수호가총잔량직전대비")
+    exp_cntr_pric: str = Field(default="", alias="23", title="예상체결가")
+    exp_cntr_qty: str = Field(default="", alias="24", title="예상체결수량")
+    netprps_req: str = Field(default="", alias="128", title="순매수잔량")
+    buy_rt: str = Field(default="", alias="129", title="매수비율")
+    netslmt_req: str = Field(default="", alias="138", title="순매도잔량")
+    sel_rt: str = Field(default="", alias="139", title="매도비율")
+    stex_tp: str = Field(default="", alias="9081", title="거래소구분")
+
+    def asks(self) -> List[Tuple[str, str]]:
+        """매도호가 1~10단계의 (가격, 잔량) 목록."""
+        return [(getattr(self, f"sel_{name}_pre_bid"), getattr(self, f"sel_{name}_pre_req")) for name in _LEVEL_NAMES]
+
+    def bids(self) -> List[Tuple[str, str]]:
+        """매수호가 1~10단계의 (가격, 잔량) 목록."""
+        return [(getattr(self, f"buy_{name}_pre_bid"), getattr(self, f"buy_{name}_pre_req")) for name in _LEVEL_NAMES]
+
+
+class DomesticRealtimeViItem(BaseModel):
+    """VI발동/해제 - 1h."""
+
+    stk_cd: str = Field(default="", alias="9001", title="종목코드")
+    stk_nm: str = Field(default="", alias="302", title="종목명")
+    acc_trde_qty: str = Field(default="", alias="13", title="누적거래량")
+    acc_trde_prica: str = Field(default="", alias="14", title="누적거래대금")
+    motn_tp: str = Field(default="", alias="9068", title="VI발동구분")
+    mrkt_tp: str = Field(default="", alias="9008", title="KOSPI,KOSDAQ,전체구분")
+    bf_mkrt_tp: str = Field(default="", alias="9075", title="장전구분")
+    vi_motn_pric: str = Field(default="", alias="1221", title="VI 발동가격")
+    trde_cntr_proc_tm: str = Field(default="", alias="1223", title="매매체결처리시각")
+    vi_rels_tm: str = Field(default="", alias="1224", title="VI 해제시각")
+    vi_aply_tp: str = Field(default="", alias="1225", title="VI 적용구분(정적/동적/동적+정적)")
+    base_pric_static: str = Field(default="", alias="1236", title="기준가격 정적")
+    base_pric_dynm: str = Field(default="", alias="1237", title="기준가격 동적")
+    dvgn_rt_static: str = Field(default="", alias="1238", title="괴리율 정적")
+    dvgn_rt_dynm: str = Field(default="", alias="1239", title="괴리율 동적")
+    vi_pric_flu_rt: str = Field(default="", alias="1489", title="VI발동가 등락율")
+    vi_motn_cnt: str = Field(default="", alias="1490", title="VI발동횟수")
+    motn_drc_tp: str = Field(default="", alias="9069", title="발동방향구분")
+    extra_item: str = Field(default="", alias="1279", title="Extra Item")
@@ -75,3 +75,18 @@ class KiwoomTimeoutError(KiwoomAPIError):
     """Raised when request timeout occurs."""
 
     pass
+
+
+class KiwoomCircuitOpenError(KiwoomServerError):
+    """Raised when an endpoint circuit breaker is open and the request is not sent."""
+
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+        request_context: Optional[Dict[str, Any]] = None,
+        retry_after: Optional[float] = None,
+    ):
+        super().__init__(message, status_code, response_data, request_context)
+        self.retry_after = retry_after
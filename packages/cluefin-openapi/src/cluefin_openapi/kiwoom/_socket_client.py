@@ -0,0 +1,299 @@
+"""Kiwoom WebSocket Client for real-time market data.
+
+This module provides an async WebSocket client for the Kiwoom REST API
+real-time service, built on the same asyncio transport as the KIS client
+(framing, keepalive, supervised reconnects, backpressure and `on()` handlers).
+
+WebSocket URLs:
+- Production: wss://api.kiwoom.com:10000/api/dostk/websocket
+- Development (Mock): wss://mockapi.kiwoom.com:10000/api/dostk/websocket
+
+Protocol (JSON text frames keyed by ``trnm``):
+- ``LOGIN``: sent with the access token right after the handshake
+- ``PING``: sent by the server and echoed back unchanged
+- ``REG`` / ``REMOVE``: register or remove ``{"item": [...], "type": [...]}``
+- ``REAL``: data, ``{"data": [{"type", "name", "item", "values": {FID: value}}]}``
+"""
+
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Literal, Optional, Union
+
+from loguru import logger
+
+from cluefin_openapi._realtime._dispatch import RealtimeDispatcher
+from cluefin_openapi._realtime._event_queue import BackpressurePolicy, RealtimeEventQueue
+from cluefin_openapi._realtime._frame import OPCODE_CLOSE, OPCODE_PING, OPCODE_PONG, OPCODE_TEXT
+from cluefin_openapi._realtime._latency import LatencyMonitor
+from cluefin_openapi._realtime._socket_client import BaseSocketClient, SubscriptionType, WebSocketEvent
+
+from ._exceptions import KiwoomAPIError, KiwoomAuthenticationError, KiwoomNetworkError
+
+
+class SocketClient(BaseSocketClient):
+    """Async WebSocket client for Kiwoom real-time market data.
+
+    Subscriptions are ``(type, item)`` pairs: the real-time type code (e.g. "0B"
+    for 주식체결) and the stock code. Account types such as "00" (주문체결) take
+    an empty item. Data events carry the record's FID ``values`` dict in
+    ``event.data["values"]``; handlers registered with `on()` receive the whole
+    record (``type``, ``name``, ``item`` and ``values``).
+
+    Example:
+        ```python
+        from cluefin_openapi.kiwoom import Auth, DomesticRealtime, SocketClient
+
+        token = auth.generate_token()
+
+        async with SocketClient(token=token.get_token(), env="prod") as client:
+            realtime = DomesticRealtime(client)
+            await realtime.subscribe_execution("005930")
+
+            async for event in client.events():
+                if event.event_type == "data" and event.tr_id == DomesticRealtime.TR_EXECUTION:
+                    execution = realtime.parse_execution(event.data["values"])
+                    print(execution.cur_prc, execution.trde_qty)
+        ```
+
+        Or update a dashboard by push from the receive task:
+        ```python
+        client.on("0B", "005930", lambda record: panel.update(record["values"]["10"]))
+        ```
+
+    Attributes:
+        token: Access token from Auth.generate_token()
+        env: Environment ("prod" or "dev")
+    """
+
+    # WebSocket URLs
+    WS_URL_PROD = "wss://api.kiwoom.com:10000/api/dostk/websocket"
+    WS_URL_DEV = "wss://mockapi.kiwoom.com:10000/api/dostk/websocket"
+
+    _network_error = KiwoomNetworkError
+    _api_error = KiwoomAPIError
+
+    def __init__(
+        self,
+        token: str,
+        env: Literal["prod", "dev"] = "prod",
+        debug: bool = False,
+        group_no: str = "1",
+        login_timeout: float = 10.0,
+        queue_maxsize: int = 1000,
+        rate_limit_requests_per_second: float = 5.0,
+        rate_limit_burst: int = 3,
+        compression: bool = False,
+        keep_raw: bool = False,
+        backpressure: Optional[Dict[str, BackpressurePolicy]] = None,
+        reconnect: bool = False,
+        reconnect_initial_delay: float = 1.0,
+        reconnect_max_delay: float = 30.0,
+        reconnect_max_attempts: Optional[int] = None,
+        ping_interval: Optional[float] = None,
+        ping_timeout: float = 10.0,
+        event_queue: Optional[RealtimeEventQueue] = None,
+        on_reconnect: Optional[Callable[["SocketClient"], Awaitable[None]]] = None,
+        dispatcher: Optional[RealtimeDispatcher] = None,
+        latency_monitor: Optional[LatencyMonitor] = None,
+    ):
+        """Initialize WebSocket client.
+
+        Args:
+            token: Access token from Auth.generate_token()
+            env: Environment - "prod" for production, "dev" for mock trading
+            debug: Enable debug logging
+            group_no: Registration group number sent with REG/REMOVE
+            login_timeout: Seconds to wait for the LOGIN response
+            queue_maxsize: Maximum pending events per subscription for DROP_OLDEST
+                channels (0 for unlimited)
+            rate_limit_requests_per_second: Rate limit for subscriptions
+            rate_limit_burst: Burst limit for subscriptions
+            compression: Offer permessage-deflate during the handshake
+            keep_raw: Attach the message text to data events as `raw`
+            backpressure: Backpressure policy by real-time type
+            reconnect: Reconnect with exponential backoff, log in again and
+                replay all subscriptions
+            reconnect_initial_delay: Delay before the first reconnect attempt in seconds
+            reconnect_max_delay: Maximum delay between reconnect attempts in seconds
+            reconnect_max_attempts: Give up after this many consecutive failed
+                attempts (None retries until close())
+            ping_interval: Send a keepalive ping every this many seconds (None disables)
+            ping_timeout: Drop the connection when nothing is received within this
+                many seconds after a keepalive ping
+            event_queue: Emit events into this queue instead of a private one
+            on_reconnect: Coroutine called with this client after a supervised reconnect
+            dispatcher: Dispatch records to the handlers of this dispatcher instead
+                of a private one
+            latency_monitor: Record receive-to-dispatch latency histograms per
+                real-time type in this monitor
+
+        Raises:
+            ValueError: If env is not "prod" or "dev"
+        """
+        if env == "prod":
+            ws_url = self.WS_URL_PROD
+        elif env == "dev":
+            ws_url = self.WS_URL_DEV
+        else:
+            raise ValueError("Invalid environment")
+
+        super().__init__(
+            ws_url,
+            debug=debug,
+            queue_maxsize=queue_maxsize,
+            rate_limit_requests_per_second=rate_limit_requests_per_second,
+            rate_limit_burst=rate_limit_burst,
+            compression=compression,
+            keep_raw=keep_raw,
+            backpressure=backpressure,
+            reconnect=reconnect,
+            reconnect_initial_delay=reconnect_initial_delay,
+            reconnect_max_delay=reconnect_max_delay,
+            reconnect_max_attempts=reconnect_max_attempts,
+            ping_interval=ping_interval,
+            ping_timeout=ping_timeout,
+            event_queue=event_queue,
+            on_reconnect=on_reconnect,
+            dispatcher=dispatcher,
+            latency_monitor=latency_monitor,
+        )
+        self.token = token
+        self.env = env
+        self.group_no = group_no
+        self._login_timeout = login_timeout
+
+        if debug:
+            logger.enable("cluefin_openapi.kiwoom")
+        else:
+            logger.disable("cluefin_openapi.kiwoom")
+
+    async def _open_connection(self) -> None:
+        """Open the connection, perform the handshake and log in."""
+        await super()._open_connection()
+        await self._login()
+
+    async def _login(self) -> None:
+        """Send LOGIN and wait for its response.
+
+        Server PINGs that arrive first are answered.
+
+        Raises:
+            KiwoomAuthenticationError: If the server rejects the token
+            KiwoomNetworkError: If no response arrives within `login_timeout`
+        """
+        await self._send_frame(json.dumps({"trnm": "LOGIN", "token": self.token}).encode())
+        try:
+            response = await asyncio.wait_for(self._await_login_response(), timeout=self._login_timeout)
+        except asyncio.TimeoutError as e:
+            raise KiwoomNetworkError("WebSocket login timed out") from e
+
+        if str(response.get("return_code", "0")) != "0":
+            raise KiwoomAuthenticationError(f"WebSocket login failed: {response.get('return_msg', '')}")
+
+        if self.debug:
+            logger.debug("WebSocket login succeeded")
+
+    async def _await_login_response(self) -> Dict[str, Any]:
+        """Read messages until the LOGIN response."""
+        while True:
+            opcode, payload = await self._receive_frame()
+            if opcode == OPCODE_CLOSE:
+                raise KiwoomNetworkError("WebSocket closed during login")
+            if opcode == OPCODE_PING:
+                await self._send_frame(payload, opcode=OPCODE_PONG)
+                continue
+            if opcode != OPCODE_TEXT:
+                continue
+            message = json.loads(payload)
+            if message.get("trnm") == "PING":
+                await self._send_frame(payload)
+            elif message.get("trnm") == "LOGIN":
+                return message
+
+    async def _handle_message(
+        self,
+        raw: Union[str, bytes, memoryview],
+        received_ns: Optional[int] = None,
+        received_monotonic_ns: Optional[int] = None,
+    ) -> None:
+        """Handle incoming WebSocket message.
+
+        Each record of a REAL message is routed by its ``(type, item)`` pair.
+        Records taken by a handler registered with `on()` are not queued.
+
+        Args:
+            raw: Message payload as received or already decoded text
+            received_ns: Wall-clock receive time in ns since the epoch (now if omitted)
+            received_monotonic_ns: Monotonic receive time in ns (now if omitted)
+        """
+        payload = raw.encode() if isinstance(raw, str) else bytes(raw)
+
+        if self.debug:
+            logger.debug(f"Received message: {payload[:200].decode('utf-8', 'replace')}...")
+
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            logger.warning(f"Ignoring malformed WebSocket message: {payload[:200]!r}")
+            return
+
+        trnm = message.get("trnm")
+        if trnm == "REAL":
+            if received_ns is None:
+                received_ns = time.time_ns()
+            if received_monotonic_ns is None:
+                received_monotonic_ns = time.monotonic_ns()
+            dispatcher = self._dispatcher
+            monitor = self._latency_monitor
+            text = payload.decode() if self._keep_raw else None
+            for record in message.get("data") or ():
+                tr_id = record.get("type", "")
+                tr_key = record.get("item", "")
+                if dispatcher and await dispatcher.dispatch(record, tr_key, tr_id):
+                    if monitor is not None:
+                        monitor.record_dispatch_since(tr_id, received_monotonic_ns)
+                    continue
+                await self._emit_event(
+                    WebSocketEvent(
+                        event_type="data",
+                        tr_id=tr_id,
+                        tr_key=tr_key,
+                        data={"values": record.get("values", {}), "name": record.get("name", "")},
+                        raw=text,
+                        received_ns=received_ns,
+                        received_monotonic_ns=received_monotonic_ns,
+                    )
+                )
+        elif trnm == "PING":
+            # Echo PING back unchanged
+            if self.debug:
+                logger.debug("Received PING, responding...")
+            await self._send_frame(payload)
+        elif trnm in ("REG", "REMOVE", "LOGIN") and str(message.get("return_code", "0")) != "0":
+            error = KiwoomAPIError(f"WebSocket {trnm} failed: {message.get('return_msg', '')}")
+            logger.error(str(error))
+            await self._emit_event(WebSocketEvent(event_type="error", error=error, data=message))
+
+    def _build_subscription_message(self, tr_id: str, tr_key: str, tr_type: SubscriptionType) -> str:
+        """Build REG/REMOVE message.
+
+        ``refresh`` is always "1" so a registration is added to the group
+        instead of replacing the registrations made before it.
+
+        Args:
+            tr_id: Real-time type (e.g., "0B")
+            tr_key: Item (e.g., stock code "005930"; "" for account types)
+            tr_type: Subscription type
+
+        Returns:
+            JSON message string
+        """
+        message: Dict[str, Any] = {
+            "trnm": "REG" if tr_type == SubscriptionType.SUBSCRIBE else "REMOVE",
+            "grp_no": self.group_no,
+            "data": [{"item": [tr_key], "type": [tr_id]}],
+        }
+        if tr_type == SubscriptionType.SUBSCRIBE:
+            message["refresh"] = "1"
+        return json.dumps(message)
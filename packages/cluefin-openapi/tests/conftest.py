@@ -0,0 +1,13 @@
+"""Shared fixtures for cluefin-openapi unit tests."""
+
+import pytest
+
+import cluefin_openapi._retry as retry_module
+
+
+@pytest.fixture(autouse=True)
+def isolate_host_retry_budgets():
+    """Give each test fresh per-host retry budgets, since clients share them process-wide."""
+    retry_module._HOST_BUDGETS.clear()
+    yield
+    retry_module._HOST_BUDGETS.clear()
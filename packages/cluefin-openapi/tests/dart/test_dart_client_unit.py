@@ -144,9 +144,10 @@ class TestRateLimitHandling:
 
             assert result == {"data": "success"}
             assert mock_sleep.call_count == 2
-            # Exponential backoff: 2^0=1, 2^1=2
-            mock_sleep.assert_any_call(1)
-            mock_sleep.assert_any_call(2)
+            # Decorrelated-jitter backoff stays within [base_delay, max_delay]
+            policy = client._retry_policy
+            for call in mock_sleep.call_args_list:
+                assert policy.base_delay <= call.args[0] <= policy.max_delay
 
     @patch("time.sleep")
     def test_rate_limit_429_with_retry_after_header(self, mock_sleep, client: Client):
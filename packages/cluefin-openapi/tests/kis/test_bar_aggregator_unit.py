@@ -0,0 +1,130 @@
+"""Unit tests for the realtime OHLCV bar aggregator."""
+
+from datetime import date, datetime
+
+import pytest
+
+from cluefin_openapi.kis._bar_aggregator import BarAggregator, BarSpec
+from cluefin_openapi.kis._domestic_realtime_quote_types import EXECUTION_FIELD_NAMES, DomesticRealtimeExecutionItem
+from cluefin_openapi.kis._overseas_realtime_quote_types import OVERSEAS_EXECUTION_FIELD_NAMES
+from cluefin_openapi.kis._realtime_message import RealtimeFields
+from cluefin_openapi.kis._socket_client import SocketClient
+from cluefin_openapi.kis._tick_recorder import KST
+
+SESSION = date(2026, 3, 2)
+NINE = datetime(2026, 3, 2, 9, tzinfo=KST).timestamp()
+
+
+def _domestic(code: str, hhmmss: str, price: str, volume: str) -> list[str]:
+    values = dict.fromkeys(EXECUTION_FIELD_NAMES, "0")
+    values.update(mksc_shrn_iscd=code, stck_cntg_hour=hhmmss, stck_prpr=price, cntg_vol=volume)
+    return list(values.values())
+
+
+def _overseas(symbol: str, kymd: str, khms: str, last: str, evol: str) -> list[str]:
+    values = dict.fromkeys(OVERSEAS_EXECUTION_FIELD_NAMES, "0")
+    values.update(rsym=symbol, kymd=kymd, khms=khms, last=last, evol=evol)
+    return list(values.values())
+
+
+class TestTimeBars:
+    def test_minute_bars_close_on_next_bucket(self):
+        aggregator = BarAggregator(specs=[BarSpec.seconds(60)], session_date=SESSION)
+        emitted = []
+        aggregator.on_bar(emitted.append)
+
+        for second, price, volume in [(1, 100, 10), (20, 105, 5), (45, 98, 7), (59, 101, 1)]:
+            assert aggregator.update("005930", NINE + second, price, volume) == []
+        completed = aggregator.update("005930", NINE + 61, 102, 3)
+
+        assert emitted == completed
+        bar = completed[0]
+        assert (bar.open, bar.high, bar.low, bar.close, bar.volume, bar.trades) == (100, 105, 98, 101, 23, 4)
+        assert (bar.start, bar.end) == (NINE, NINE + 60)
+        assert bar.spec.name == "1m"
+        assert aggregator.current("005930", BarSpec.seconds(60)).open == 102
+
+    def test_symbols_are_aggregated_independently(self):
+        aggregator = BarAggregator(specs=[BarSpec.seconds(1)], session_date=SESSION, capacity=1)
+
+        aggregator.update("005930", NINE, 100, 1)
+        aggregator.update("000660", NINE, 200, 1)
+        completed = aggregator.update("005930", NINE + 1, 101, 1)
+
+        assert [(bar.symbol, bar.close) for bar in completed] == [("005930", 100)]
+        assert aggregator.symbols == ["005930", "000660"]
+
+    def test_flush_closes_elapsed_or_all_bars(self):
+        aggregator = BarAggregator(specs=[BarSpec.seconds(1), BarSpec.seconds(300)], session_date=SESSION)
+        aggregator.update("005930", NINE + 0.5, 100, 1)
+
+        assert [bar.spec.name for bar in aggregator.flush(now=NINE + 1)] == ["1s"]
+        assert [bar.spec.name for bar in aggregator.flush()] == ["5m"]
+        assert aggregator.flush() == []
+
+
+class TestActivityBars:
+    def test_volume_and_tick_bars(self):
+        aggregator = BarAggregator(specs=[BarSpec.volume(10), BarSpec.ticks(3)], session_date=SESSION)
+        completed = []
+        for second, volume in enumerate([4, 4, 4, 1, 9]):
+            completed += aggregator.update("005930", NINE + second, 100 + second, volume)
+
+        assert [(bar.spec.name, bar.volume, bar.trades) for bar in completed] == [
+            ("v10", 12, 3),
+            ("t3", 12, 3),
+            ("v10", 10, 2),
+        ]
+        assert (completed[0].start, completed[0].end) == (NINE, NINE + 2)
+
+
+class TestExecutionStreams:
+    def test_domestic_items_and_frames(self):
+        aggregator = BarAggregator(specs=[BarSpec.seconds(60)], session_date=SESSION)
+        item = DomesticRealtimeExecutionItem(
+            **dict(zip(EXECUTION_FIELD_NAMES, _domestic("005930", "090001", "70000", "10"), strict=True))
+        )
+        aggregator.update_domestic(item)
+
+        frame = _domestic("005930", "090030", "70500", "5") + _domestic("005930", "090101", "70100", "1")
+        completed = aggregator.handle_fields(frame, tr_id="H0UNCNT0")
+
+        assert [(bar.high, bar.volume, bar.start) for bar in completed] == [(70500, 15, NINE)]
+
+    def test_overseas_frames_use_kst_date_and_time(self):
+        aggregator = BarAggregator(specs=[BarSpec.seconds(60)], session_date=SESSION)
+
+        aggregator.handle_fields(_overseas("DNASAAPL", "20260303", "233000", "210.5", "100"), tr_id="HDFSCNT0")
+        completed = aggregator.flush()
+
+        assert completed[0].symbol == "DNASAAPL"
+        assert completed[0].start == datetime(2026, 3, 3, 23, 30, tzinfo=KST).timestamp()
+        assert completed[0].close == 210.5
+
+    @pytest.mark.asyncio
+    async def test_attach_consumes_execution_frames_from_client(self):
+        aggregator = BarAggregator(specs=[BarSpec.ticks(2)], session_date=SESSION)
+        emitted = []
+        aggregator.on_bar(emitted.append)
+        client = SocketClient(approval_key="a", app_key="b", secret_key="c")
+        detach = aggregator.attach(client)
+
+        body = "^".join(_domestic("005930", "090000", "70000", "1") + _domestic("005930", "090001", "70100", "2"))
+        await client._handle_message(f"0|H0UNCNT0|002|{body}".encode())
+        detach()
+        await client._handle_message(f"0|H0UNCNT0|001|{body}".encode())
+
+        assert [(bar.open, bar.close, bar.volume) for bar in emitted] == [(70000, 70100, 3)]
+        assert client._event_queue.qsize() == 1
+
+    def test_rejects_invalid_specs(self):
+        with pytest.raises(ValueError):
+            BarAggregator(specs=[])
+        with pytest.raises(ValueError):
+            BarAggregator(specs=[BarSpec.seconds(0)])
+
+    def test_realtime_fields_are_accepted(self):
+        aggregator = BarAggregator(specs=[BarSpec.ticks(1)], session_date=SESSION)
+        payload = ("0|H0STCNT0|001|" + "^".join(_domestic("005930", "090000", "70000", "1"))).encode()
+
+        assert aggregator.handle_fields(RealtimeFields.from_frame(payload))[0].close == 70000
@@ -13,6 +13,7 @@ from cluefin_openapi.kis._domestic_realtime_quote_types import (
     DomesticRealtimeExecutionNotificationItem,
     DomesticRealtimeOrderbookItem,
 )
+from cluefin_openapi.kis._realtime_message import RealtimeFields
 from cluefin_openapi.kis._socket_client import SocketClient
 
 
@@ -198,6 +199,16 @@ class TestParseExecutionData:
             assert isinstance(item, DomesticRealtimeExecutionItem)
             assert item.stck_prpr == str(70000 + i * 100)
 
+    def test_parse_execution_data_accepts_realtime_fields(self, sample_execution_data):
+        """Test parsing the lazy RealtimeFields view emitted by SocketClient."""
+        payload = ("0|H0STCNT0|002|" + "^".join(sample_execution_data * 2)).encode()
+        fields = RealtimeFields.from_frame(payload)
+
+        result = DomesticRealtimeQuote.parse_execution_data(fields)
+
+        assert len(result) == 2
+        assert result[1].stck_prpr == "70000"
+
     def test_parse_execution_data_single_record_with_extra_fields(self, sample_execution_data):
         """Test single record with extra fields (46 + 3 = 49 fields) - forward compatibility."""
         data = sample_execution_data + ["extra1", "extra2", "extra3"]
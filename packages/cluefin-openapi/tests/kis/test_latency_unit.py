@@ -0,0 +1,197 @@
+"""Unit tests for realtime feed latency instrumentation."""
+
+import time
+from datetime import datetime
+
+import pytest
+from pydantic import SecretStr
+
+from cluefin_openapi._realtime._latency import LatencyHistogram
+from cluefin_openapi.kis._domestic_realtime_quote_types import EXECUTION_FIELD_NAMES
+from cluefin_openapi.kis._latency import FeedLatencyMonitor
+from cluefin_openapi.kis._overseas_realtime_quote_types import OVERSEAS_EXECUTION_FIELD_NAMES
+from cluefin_openapi.kis._socket_client import SocketClient
+from cluefin_openapi.kis._socket_pool import SocketPool
+from cluefin_openapi.kis._tick_recorder import KST
+from cluefin_openapi.kiwoom._socket_client import SocketClient as KiwoomSocketClient
+
+
+def _ns(dt: datetime) -> int:
+    return int(dt.timestamp() * 1e9)
+
+
+def _domestic_frame(hhmmss: str) -> bytes:
+    values = dict.fromkeys(EXECUTION_FIELD_NAMES, "0")
+    values.update(mksc_shrn_iscd="005930", stck_cntg_hour=hhmmss)
+    return f"0|H0STCNT0|001|{'^'.join(values.values())}".encode()
+
+
+@pytest.fixture
+def monitor() -> FeedLatencyMonitor:
+    return FeedLatencyMonitor(window=60.0, slots=6)
+
+
+@pytest.fixture
+def socket_client(monitor) -> SocketClient:
+    return SocketClient(
+        approval_key="test_approval_key",
+        app_key="test_app_key",
+        secret_key=SecretStr("test_key"),
+        env="dev",
+        latency_monitor=monitor,
+    )
+
+
+class TestLatencyHistogram:
+    def test_percentiles_are_bucket_upper_bounds(self):
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(0.0001, now=0.0)
+        for _ in range(10):
+            histogram.record(0.5, now=0.0)
+
+        stats = histogram.stats(now=0.0)
+
+        assert stats.count == 100
+        assert stats.mean == pytest.approx((90 * 0.0001 + 10 * 0.5) / 100)
+        # 100us falls below 2**7 us; the p99 bucket is capped at the observed maximum.
+        assert stats.p50 == stats.p90 == 128e-6
+        assert stats.p99 == stats.max == 0.5
+
+    def test_negative_latency_counts_as_zero(self):
+        histogram = LatencyHistogram()
+        histogram.record(-2.0, now=0.0)
+
+        stats = histogram.stats(now=0.0)
+
+        assert (stats.count, stats.mean, stats.max) == (1, 0.0, 0.0)
+
+    def test_old_slots_expire(self):
+        histogram = LatencyHistogram(window=60.0, slots=6)
+        histogram.record(1.0, now=0.0)
+        histogram.record(0.001, now=30.0)
+
+        assert histogram.stats(now=59.0).count == 2
+        assert histogram.stats(now=65.0).count == 1
+        assert histogram.stats(now=95.0).count == 0
+
+        # A slot reused after a full window starts empty.
+        histogram.record(0.002, now=60.0)
+        assert histogram.stats(now=60.0).max == 0.002
+
+    def test_empty_stats(self):
+        stats = LatencyHistogram().stats(now=0.0)
+
+        assert (stats.count, stats.p99, stats.max) == (0, 0.0, 0.0)
+
+    def test_invalid_window_raises(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram(window=0)
+
+
+class TestFeedLatencyMonitor:
+    def test_domestic_exchange_latency_uses_session_day(self, monitor):
+        values = dict.fromkeys(EXECUTION_FIELD_NAMES, "0")
+        values["stck_cntg_hour"] = "090000"
+
+        monitor.observe_frame(list(values.values()), "H0STCNT0", _ns(datetime(2026, 3, 2, 9, 0, 2, tzinfo=KST)))
+
+        stats = monitor.exchange_latency()["H0STCNT0"]
+        assert stats.count == 1
+        assert stats.max == pytest.approx(2.0)
+
+    def test_overseas_exchange_latency_uses_record_date(self, monitor):
+        values = dict.fromkeys(OVERSEAS_EXECUTION_FIELD_NAMES, "0")
+        values.update(kymd="20260302", khms="235959")
+
+        # Received just after midnight KST: the record date, not the receive day, anchors the time.
+        monitor.observe_frame(list(values.values()), "HDFSCNT0", _ns(datetime(2026, 3, 3, 0, 0, 1, tzinfo=KST)))
+
+        assert monitor.exchange_latency()["HDFSCNT0"].max == pytest.approx(2.0)
+
+    def test_unknown_tr_and_malformed_time_are_ignored(self, monitor):
+        monitor.observe_frame(["a", "b"], "H0STCNI0", time.time_ns())
+        monitor.observe_frame(["005930", "??????"], "H0STCNT0", time.time_ns())
+        monitor.observe_frame(["005930"], "H0STCNT0", time.time_ns())
+
+        assert monitor.exchange_latency() == {}
+
+    def test_dispatch_latency_by_tr_id(self, monitor):
+        monitor.record_dispatch("H0STCNT0", 0.01, now=0.0)
+        monitor.record_dispatch("H0STASP0", 0.2, now=0.0)
+
+        stats = monitor.dispatch_latency(now=0.0)
+
+        assert stats["H0STCNT0"].max == 0.01
+        assert stats["H0STASP0"].max == 0.2
+
+    def test_dispatch_since_receive_time(self, monitor):
+        monitor.record_dispatch_since(None, time.monotonic_ns() - 20_000_000)
+
+        stats = monitor.dispatch_latency()[""]
+        assert stats.count == 1
+        assert 0.02 <= stats.max < 1.0
+
+
+class TestClientLatency:
+    @pytest.mark.asyncio
+    async def test_data_events_are_stamped(self, socket_client, monitor):
+        received_ns = _ns(datetime(2026, 3, 2, 9, 0, 1, tzinfo=KST))
+
+        await socket_client._handle_message(_domestic_frame("090000"), received_ns, 123)
+
+        event = socket_client._event_queue.get_nowait()
+        assert (event.received_ns, event.received_monotonic_ns) == (received_ns, 123)
+        assert monitor.exchange_latency()["H0STCNT0"].max == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_events_record_dispatch_latency(self, socket_client, monitor):
+        await socket_client._handle_message(_domestic_frame("090000"), time.time_ns(), time.monotonic_ns() - 50_000_000)
+
+        async for event in socket_client.events():
+            assert event.tr_id == "H0STCNT0"
+
+        stats = monitor.dispatch_latency()["H0STCNT0"]
+        assert stats.count == 1
+        assert stats.max >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_pool_events_record_dispatch_latency(self, monitor):
+        pool = SocketPool(
+            approval_key="test_approval_key",
+            app_key="test_app_key",
+            secret_key="test_key",
+            env="dev",
+            latency_monitor=monitor,
+        )
+        shard = pool._create_client()
+        await shard._handle_message(_domestic_frame("090000"), time.time_ns(), time.monotonic_ns() - 50_000_000)
+
+        async for event in pool.events():
+            assert event.tr_id == "H0STCNT0"
+
+        stats = monitor.dispatch_latency()["H0STCNT0"]
+        assert stats.count == 1
+        assert stats.max >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_handlers_record_dispatch_latency(self, socket_client, monitor):
+        records = []
+        socket_client.on("H0STCNT0", "005930", records.append)
+
+        await socket_client._handle_message(_domestic_frame("090000"))
+
+        assert len(records) == 1
+        assert socket_client._event_queue.empty()
+        assert monitor.dispatch_latency()["H0STCNT0"].count == 1
+
+    @pytest.mark.asyncio
+    async def test_kiwoom_events_are_stamped(self, monitor):
+        client = KiwoomSocketClient(token="token", env="dev", latency_monitor=monitor)
+        message = b'{"trnm":"REAL","data":[{"type":"0B","name":"x","item":"005930","values":{"10":"70000"}}]}'
+
+        await client._handle_message(message, 1, time.monotonic_ns())
+
+        events = [event async for event in client.events()]
+        assert [event.received_ns for event in events] == [1]
+        assert monitor.dispatch_latency()["0B"].count == 1
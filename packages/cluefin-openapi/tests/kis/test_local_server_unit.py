@@ -0,0 +1,71 @@
+"""Unit tests for the local KIS realtime stand-in server."""
+
+import asyncio
+
+import pytest
+
+from cluefin_openapi.kis._domestic_realtime_quote import DomesticRealtimeQuote
+from cluefin_openapi.kis._domestic_realtime_quote_types import EXECUTION_FIELD_NAMES
+from cluefin_openapi.kis._local_server import LocalSocketServer, default_record
+from cluefin_openapi.kis._socket_client import SocketClient
+
+
+def _client(server: LocalSocketServer, **kwargs) -> SocketClient:
+    return SocketClient(approval_key="a", app_key="b", secret_key="c", ws_url=server.url, **kwargs)
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        if loop.time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.005)
+
+
+class TestLocalSocketServer:
+    def test_default_record_matches_field_layout(self):
+        record = default_record("H0UNCNT0", "005930", 0)
+
+        assert len(record) == len(EXECUTION_FIELD_NAMES)
+        assert record[:3] == ["005930", "090000", "70000"]
+
+    @pytest.mark.asyncio
+    async def test_streams_batched_frames_for_subscriptions(self):
+        async with LocalSocketServer(rate=None, batch_size=3, max_frames=4) as server:
+            async with _client(server) as client:
+                await client.subscribe("H0UNCNT0", "005930")
+                events = []
+                async for event in client.events():
+                    if event.event_type == "data":
+                        events.append(event)
+                        if len(events) == 4:
+                            break
+
+        assert server.requests_received == 1
+        assert server.records_sent == 12
+        executions = DomesticRealtimeQuote.parse_execution_data(events[0].data["values"])
+        assert [item.mksc_shrn_iscd for item in executions] == ["005930"] * 3
+        assert [item.stck_prpr for item in executions] == ["70000", "70010", "70020"]
+
+    @pytest.mark.asyncio
+    async def test_pingpong_is_echoed(self):
+        async with LocalSocketServer(pingpong_interval=0.01) as server:
+            async with _client(server):
+                await _wait_for(lambda: server.pongs_received >= 2)
+
+        assert server.pings_sent >= server.pongs_received
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_stops_the_stream(self):
+        async with LocalSocketServer(rate=2000) as server:
+            async with _client(server) as client:
+                await client.subscribe("H0STASP0", "005930")
+                await _wait_for(lambda: server.frames_sent > 0)
+                await client.unsubscribe("H0STASP0", "005930")
+                await _wait_for(lambda: server.requests_received == 2)
+                await asyncio.sleep(0.01)
+                sent = server.frames_sent
+                await asyncio.sleep(0.02)
+
+                assert server.frames_sent == sent
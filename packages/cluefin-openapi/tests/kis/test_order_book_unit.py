@@ -0,0 +1,125 @@
+"""Unit tests for the incremental L2 order book engine."""
+
+import math
+from datetime import date, datetime
+
+import pytest
+
+from cluefin_openapi.kis._domestic_realtime_quote_types import ORDERBOOK_FIELD_NAMES, DomesticRealtimeOrderbookItem
+from cluefin_openapi.kis._order_book import OrderBookEngine
+from cluefin_openapi.kis._overseas_realtime_quote_types import OVERSEAS_ORDERBOOK_FIELD_NAMES
+from cluefin_openapi.kis._socket_client import SocketClient
+from cluefin_openapi.kis._tick_recorder import KST
+
+SESSION = date(2026, 3, 2)
+NINE = datetime(2026, 3, 2, 9, tzinfo=KST).timestamp()
+
+
+def _domestic(code: str, hhmmss: str, best_ask: int, best_bid: int, tick: int = 100) -> list[str]:
+    values = dict.fromkeys(ORDERBOOK_FIELD_NAMES, "0")
+    values.update(mksc_shrn_iscd=code, bsop_hour=hhmmss)
+    for level in range(1, 11):
+        values[f"askp{level}"] = str(best_ask + (level - 1) * tick)
+        values[f"bidp{level}"] = str(best_bid - (level - 1) * tick)
+        values[f"askp_rsqn{level}"] = str(10 * level)
+        values[f"bidp_rsqn{level}"] = str(30 * level)
+    return list(values.values())
+
+
+def _overseas(symbol: str, kymd: str, khms: str, ask: str, bid: str) -> list[str]:
+    values = dict.fromkeys(OVERSEAS_ORDERBOOK_FIELD_NAMES, "0")
+    values.update(rsym=symbol, kymd=kymd, khms=khms, pask1=ask, pbid1=bid, vask1="300", vbid1="100")
+    return list(values.values())
+
+
+class TestOrderBookEngine:
+    def test_derived_values_follow_updates(self):
+        engine = OrderBookEngine(session_date=SESSION)
+
+        book = engine.update("005930", NINE, [70100, 70200], [10, 20], [70000, 69900], [30, 60])
+
+        assert (book.best_ask, book.best_bid, book.spread, book.mid) == (70100, 70000, 100, 70050)
+        assert book.microprice == pytest.approx((70100 * 30 + 70000 * 10) / 40)
+        assert (book.ask_depth(2), book.bid_depth(2), book.ask_depth(10)) == (30, 90, 30)
+        assert book.depth_imbalance(1) == pytest.approx(0.5)
+        assert book.imbalance == pytest.approx(60 / 120)
+        assert book.asks()[:3] == [(70100, 10), (70200, 20), (0, 0)]
+
+        engine.update("005930", NINE + 1, [70000], [5], [69900], [5])
+
+        assert (book.spread, book.mid, book.microprice, book.updates) == (100, 69950, 69950, 2)
+        assert book.ask_depth(2) == 5
+        assert book.time == NINE + 1
+
+    def test_empty_side_has_no_spread(self):
+        book = OrderBookEngine().update("005930", NINE, [], [], [70000], [10])
+
+        assert math.isnan(book.spread) and math.isnan(book.mid) and math.isnan(book.microprice)
+        assert book.imbalance == 1.0
+
+    def test_symbols_grow_past_capacity(self):
+        engine = OrderBookEngine(capacity=1, depth=5)
+        for index in range(300):
+            engine.update(f"{index:06d}", NINE, [100 + index], [1], [99 + index], [1])
+
+        assert len(engine) == 300
+        assert engine.book("000000").best_ask == 100
+        assert engine.book("000299").mid == 398.5
+        assert len(engine.book("000299").bids()) == 5
+        assert engine.book("999999") is None
+
+    def test_on_update_listeners(self):
+        engine = OrderBookEngine()
+        seen = []
+        remove = engine.on_update(lambda book: seen.append((book.symbol, book.updates)))
+
+        engine.update("005930", NINE, [2], [1], [1], [1])
+        remove()
+        engine.update("005930", NINE, [2], [1], [1], [1])
+
+        assert seen == [("005930", 1)]
+
+    def test_rejects_invalid_depth(self):
+        with pytest.raises(ValueError):
+            OrderBookEngine(depth=11)
+
+
+class TestOrderBookStreams:
+    def test_domestic_frames_and_items(self):
+        engine = OrderBookEngine(session_date=SESSION)
+        frame = _domestic("005930", "090001", 70100, 70000) + _domestic("000660", "090002", 120500, 120000, 500)
+
+        books = engine.handle_fields(frame, tr_id="H0STASP0")
+
+        assert [book.symbol for book in books] == ["005930", "000660"]
+        assert books[1].spread == 500
+        assert books[0].ask_depth(10) == sum(10 * level for level in range(1, 11))
+        assert books[0].time == NINE + 1
+
+        item = DomesticRealtimeOrderbookItem(
+            **dict(zip(ORDERBOOK_FIELD_NAMES, _domestic("005930", "090005", 70200, 70100), strict=True))
+        )
+        assert engine.update_domestic(item).best_bid == 70100
+
+    def test_overseas_frames_use_kst_date_and_time(self):
+        engine = OrderBookEngine()
+
+        (book,) = engine.handle_fields(_overseas("DNASAAPL", "20260303", "233000", "210.5", "210.4"), tr_id="HDFSASP0")
+
+        assert book.spread == pytest.approx(0.1)
+        assert book.microprice == pytest.approx((210.5 * 100 + 210.4 * 300) / 400)
+        assert book.time == datetime(2026, 3, 3, 23, 30, tzinfo=KST).timestamp()
+
+    @pytest.mark.asyncio
+    async def test_attach_consumes_orderbook_frames(self):
+        engine = OrderBookEngine(session_date=SESSION)
+        client = SocketClient(approval_key="a", app_key="b", secret_key="c")
+        detach = engine.attach(client)
+
+        body = "^".join(_domestic("005930", "090000", 70100, 70000))
+        await client._handle_message(f"0|H0STASP0|001|{body}".encode())
+        detach()
+        await client._handle_message(f"0|H0STASP0|001|{body}".encode())
+
+        assert engine.book("005930").updates == 1
+        assert client._event_queue.qsize() == 1
@@ -0,0 +1,190 @@
+"""Unit tests for columnar realtime decoding."""
+
+import pytest
+
+from cluefin_openapi.kis._domestic_realtime_quote import DomesticRealtimeQuote
+from cluefin_openapi.kis._domestic_realtime_quote_types import (
+    EXECUTION_FIELD_DTYPES,
+    EXECUTION_FIELD_NAMES,
+    ORDERBOOK_FIELD_DTYPES,
+    ORDERBOOK_FIELD_NAMES,
+)
+from cluefin_openapi.kis._onmarket_bond_realtime_quote import OnmarketBondRealtimeQuote
+from cluefin_openapi.kis._onmarket_bond_realtime_quote_types import (
+    BOND_EXECUTION_FIELD_DTYPES,
+    BOND_EXECUTION_FIELD_NAMES,
+    BOND_INDEX_EXECUTION_FIELD_DTYPES,
+    BOND_INDEX_EXECUTION_FIELD_NAMES,
+    BOND_ORDERBOOK_FIELD_DTYPES,
+    BOND_ORDERBOOK_FIELD_NAMES,
+)
+from cluefin_openapi.kis._overseas_realtime_quote import OverseasRealtimeQuote
+from cluefin_openapi.kis._overseas_realtime_quote_types import (
+    OVERSEAS_DELAYED_ORDERBOOK_FIELD_DTYPES,
+    OVERSEAS_DELAYED_ORDERBOOK_FIELD_NAMES,
+    OVERSEAS_EXECUTION_FIELD_DTYPES,
+    OVERSEAS_EXECUTION_FIELD_NAMES,
+    OVERSEAS_ORDERBOOK_FIELD_DTYPES,
+    OVERSEAS_ORDERBOOK_FIELD_NAMES,
+)
+from cluefin_openapi.kis._realtime_columns import decode_columns
+from cluefin_openapi.kis._realtime_message import RealtimeFields
+
+np = pytest.importorskip("numpy")
+
+
+def _execution_record(price: int, volume: int) -> list[str]:
+    record = ["0"] * len(EXECUTION_FIELD_NAMES)
+    record[EXECUTION_FIELD_NAMES.index("mksc_shrn_iscd")] = "005930"
+    record[EXECUTION_FIELD_NAMES.index("stck_cntg_hour")] = "093000"
+    record[EXECUTION_FIELD_NAMES.index("stck_prpr")] = str(price)
+    record[EXECUTION_FIELD_NAMES.index("cntg_vol")] = str(volume)
+    record[EXECUTION_FIELD_NAMES.index("prdy_ctrt")] = "1.45"
+    return record
+
+
+def _frame(tr_id: str, records: list[list[str]]) -> RealtimeFields:
+    body = "^".join(value for record in records for value in record)
+    return RealtimeFields.from_frame(f"0|{tr_id}|{len(records):03d}|{body}".encode())
+
+
+class TestDtypeMaps:
+    """Test that declared numeric fields exist in the field lists."""
+
+    @pytest.mark.parametrize(
+        ("names", "dtypes"),
+        [
+            (EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES),
+            (ORDERBOOK_FIELD_NAMES, ORDERBOOK_FIELD_DTYPES),
+            (OVERSEAS_ORDERBOOK_FIELD_NAMES, OVERSEAS_ORDERBOOK_FIELD_DTYPES),
+            (OVERSEAS_DELAYED_ORDERBOOK_FIELD_NAMES, OVERSEAS_DELAYED_ORDERBOOK_FIELD_DTYPES),
+            (OVERSEAS_EXECUTION_FIELD_NAMES, OVERSEAS_EXECUTION_FIELD_DTYPES),
+            (BOND_EXECUTION_FIELD_NAMES, BOND_EXECUTION_FIELD_DTYPES),
+            (BOND_ORDERBOOK_FIELD_NAMES, BOND_ORDERBOOK_FIELD_DTYPES),
+            (BOND_INDEX_EXECUTION_FIELD_NAMES, BOND_INDEX_EXECUTION_FIELD_DTYPES),
+        ],
+    )
+    def test_dtype_keys_are_known_fields(self, names, dtypes):
+        assert set(dtypes) <= set(names)
+        assert set(dtypes.values()) <= {"i8", "f8"}
+
+
+class TestDecodeColumns:
+    """Test decode_columns."""
+
+    def test_single_batched_message_to_typed_columns(self):
+        fields = _frame("H0STCNT0", [_execution_record(70000 + i * 100, i + 1) for i in range(12)])
+
+        columns = decode_columns(fields, EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES)
+
+        assert columns["stck_prpr"].dtype == np.int64
+        assert columns["stck_prpr"].tolist() == [70000 + i * 100 for i in range(12)]
+        assert columns["prdy_ctrt"].dtype == np.float64
+        assert columns["prdy_ctrt"][0] == pytest.approx(1.45)
+        assert columns["mksc_shrn_iscd"].tolist() == ["005930"] * 12
+        assert columns["stck_cntg_hour"][0] == "093000"
+
+    def test_many_messages_decode_together(self):
+        messages = [_frame("H0STCNT0", [_execution_record(70000, 1)]), _execution_record(70100, 2)]
+
+        columns = decode_columns(messages, EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES)
+
+        assert columns["stck_prpr"].tolist() == [70000, 70100]
+        assert columns["cntg_vol"].tolist() == [1, 2]
+
+    def test_structured_array(self):
+        records = decode_columns(
+            [_execution_record(70000, 5)], EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES, structured=True
+        )
+
+        assert records.shape == (1,)
+        assert records.dtype.names == tuple(EXECUTION_FIELD_NAMES)
+        assert records[0]["stck_prpr"] == 70000
+
+    def test_extra_fields_per_record_use_header_count(self):
+        records = [_execution_record(70000, 1) + ["extra"], _execution_record(70100, 2) + ["extra"]]
+
+        columns = decode_columns(_frame("H0STCNT0", records), EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES)
+
+        assert columns["stck_prpr"].tolist() == [70000, 70100]
+        assert columns["vi_stnd_prc"].tolist() == [0, 0]
+
+    def test_empty_and_invalid_numbers(self):
+        record = _execution_record(70000, 1)
+        record[EXECUTION_FIELD_NAMES.index("cntg_vol")] = ""
+        record[EXECUTION_FIELD_NAMES.index("prdy_ctrt")] = ""
+
+        columns = decode_columns(record, EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES)
+
+        assert columns["cntg_vol"].tolist() == [0]
+        assert np.isnan(columns["prdy_ctrt"][0])
+
+    def test_non_ascii_strings(self):
+        record = ["0"] * len(BOND_EXECUTION_FIELD_NAMES)
+        record[BOND_EXECUTION_FIELD_NAMES.index("bond_isnm")] = "국고채권"
+
+        columns = decode_columns(record, BOND_EXECUTION_FIELD_NAMES, BOND_EXECUTION_FIELD_DTYPES)
+
+        assert columns["bond_isnm"].tolist() == ["국고채권"]
+
+    def test_insufficient_fields_raise(self):
+        with pytest.raises(ValueError, match="Expected at least 46 fields, got 3"):
+            decode_columns(["1", "2", "3"], EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES)
+
+    def test_empty_message_raises(self):
+        with pytest.raises(ValueError, match="got 0"):
+            decode_columns([""], EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES)
+
+    @pytest.mark.parametrize("batch", [[], (), iter(())], ids=["list", "tuple", "iterator"])
+    def test_empty_batch_gives_zero_length_typed_columns(self, batch):
+        columns = decode_columns(batch, EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES)
+
+        assert list(columns) == list(EXECUTION_FIELD_NAMES)
+        assert all(len(column) == 0 for column in columns.values())
+        assert columns["stck_prpr"].dtype == np.int64
+        assert columns["prdy_ctrt"].dtype == np.float64
+        assert columns["mksc_shrn_iscd"].dtype.kind == "U"
+
+    def test_empty_batch_structured(self):
+        records = decode_columns([], EXECUTION_FIELD_NAMES, EXECUTION_FIELD_DTYPES, structured=True)
+
+        assert records.shape == (0,)
+        assert records.dtype.names == tuple(EXECUTION_FIELD_NAMES)
+
+
+class TestQuoteDecoders:
+    """Test the per-TR decode helpers on the realtime quote classes."""
+
+    def test_domestic_orderbook(self):
+        record = [str(index) for index in range(len(ORDERBOOK_FIELD_NAMES))]
+        record[0] = "005930"
+
+        columns = DomesticRealtimeQuote.decode_orderbook_columns(record)
+
+        assert columns["askp1"].tolist() == [ORDERBOOK_FIELD_NAMES.index("askp1")]
+        assert columns["mksc_shrn_iscd"].tolist() == ["005930"]
+
+    def test_domestic_execution_matches_parse_execution_data(self):
+        record = _execution_record(70000, 3)
+
+        columns = DomesticRealtimeQuote.decode_execution_columns(record)
+        items = DomesticRealtimeQuote.parse_execution_data(record)
+
+        assert columns["stck_prpr"][0] == int(items[0].stck_prpr)
+
+    @pytest.mark.parametrize(
+        ("decoder", "names"),
+        [
+            (OverseasRealtimeQuote.decode_columns, OVERSEAS_ORDERBOOK_FIELD_NAMES),
+            (OverseasRealtimeQuote.decode_execution_columns, OVERSEAS_EXECUTION_FIELD_NAMES),
+            (OverseasRealtimeQuote.decode_delayed_orderbook_columns, OVERSEAS_DELAYED_ORDERBOOK_FIELD_NAMES),
+            (OnmarketBondRealtimeQuote.decode_execution_columns, BOND_EXECUTION_FIELD_NAMES),
+            (OnmarketBondRealtimeQuote.decode_orderbook_columns, BOND_ORDERBOOK_FIELD_NAMES),
+            (OnmarketBondRealtimeQuote.decode_index_execution_columns, BOND_INDEX_EXECUTION_FIELD_NAMES),
+        ],
+    )
+    def test_other_decoders_return_all_fields(self, decoder, names):
+        records = decoder(["1"] * len(names) * 2, structured=True)
+
+        assert records.shape == (2,)
+        assert records.dtype.names == tuple(names)
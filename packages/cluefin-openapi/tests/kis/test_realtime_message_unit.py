@@ -0,0 +1,76 @@
+"""Unit tests for the lazy realtime frame view."""
+
+import pytest
+
+from cluefin_openapi.kis._realtime_message import RealtimeFields
+
+
+class TestRealtimeFieldsFromFrame:
+    """Test header parsing."""
+
+    def test_parses_header_and_keeps_body_as_view(self):
+        payload = b"0|H0STCNT0|002|005930^093000^70000^000660^093001^180000"
+
+        fields = RealtimeFields.from_frame(payload)
+
+        assert fields is not None
+        assert fields.tr_id == "H0STCNT0"
+        assert fields.encrypted is False
+        assert fields.record_count == 2
+        assert isinstance(fields.body, memoryview)
+        assert fields.body.obj is payload
+        assert fields.body.tobytes() == b"005930^093000^70000^000660^093001^180000"
+
+    def test_encrypted_frame(self):
+        fields = RealtimeFields.from_frame(b"1|H0STCNI0|001|encrypted_data_here")
+
+        assert fields.encrypted is True
+        assert fields == ["encrypted_data_here"]
+
+    @pytest.mark.parametrize("payload", [b"", b"PINGPONG", b'{"header":{}}', b"0|H0STCNT0", b"0|H0STCNT0|001"])
+    def test_non_data_frames_return_none(self, payload):
+        assert RealtimeFields.from_frame(payload) is None
+
+    def test_non_numeric_count_defaults_to_one(self):
+        assert RealtimeFields.from_frame(b"0|H0STASP0|x|1^2").record_count == 1
+
+
+class TestRealtimeFieldsSequence:
+    """Test list compatibility and lazy splitting."""
+
+    def test_splits_lazily_and_caches(self):
+        fields = RealtimeFields(b"a^b^c", tr_id="H0STASP0")
+
+        assert fields._values is None
+        assert len(fields) == 3
+        values = fields._values
+        assert fields[1] == "b"
+        assert fields._values is values
+
+    def test_behaves_like_list(self):
+        fields = RealtimeFields("삼성전자^70000".encode())
+
+        assert list(fields) == ["삼성전자", "70000"]
+        assert fields[0:1] == ["삼성전자"]
+        assert fields[-1] == "70000"
+        assert fields == ("삼성전자", "70000")
+        assert fields == RealtimeFields("삼성전자^70000".encode())
+        assert fields != ["other"]
+
+    def test_empty_body(self):
+        fields = RealtimeFields(b"")
+
+        assert not fields
+        assert fields == []
+        assert len(fields) == 0
+
+    def test_record_key_reads_first_field_without_splitting(self):
+        fields = RealtimeFields.from_frame(b"0|H0STCNT0|001|005930^093000^70000")
+
+        assert fields.record_key == "005930"
+        assert fields._values is None
+
+    def test_record_key_is_none_for_encrypted_or_empty(self):
+        assert RealtimeFields.from_frame(b"1|H0STCNI0|001|abc^def").record_key is None
+        assert RealtimeFields(b"").record_key is None
+        assert RealtimeFields(b"single").record_key == "single"
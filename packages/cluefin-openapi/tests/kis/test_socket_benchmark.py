@@ -0,0 +1,147 @@
+"""
+Performance benchmarks for the KIS realtime path.
+
+These tests stream synthetic frames from `LocalSocketServer` over a loopback
+WebSocket into `SocketClient` and measure messages per second, parse latency
+and drop counts, so regressions in the realtime path show up on a laptop.
+
+Thresholds are set far below what the path achieves on a laptop so they only
+catch major regressions.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from cluefin_openapi._realtime._event_queue import BackpressurePolicy
+from cluefin_openapi.kis._domestic_realtime_quote import DomesticRealtimeQuote
+from cluefin_openapi.kis._local_server import LocalSocketServer
+from cluefin_openapi.kis._socket_client import SocketClient
+
+# Minimum acceptable records per second through the socket client.
+MIN_RECORDS_PER_SECOND = 5000.0
+# Maximum acceptable parse_execution_data latency per record in microseconds.
+MAX_PARSE_LATENCY_US = 500.0
+
+FRAMES = 5000
+BATCH_SIZE = 4
+SYMBOLS = ["005930", "000660", "035420", "051910"]
+
+
+async def _yield() -> None:
+    await asyncio.sleep(0.001)
+
+
+def _client(server: LocalSocketServer, **kwargs) -> SocketClient:
+    return SocketClient(approval_key="a", app_key="b", secret_key="c", ws_url=server.url, **kwargs)
+
+
+async def _stream_into_events(server: LocalSocketServer, **kwargs):
+    """Drain `FRAMES` data frames through `events()`; return (records, seconds, client)."""
+    client = _client(server, **kwargs)
+    records = 0
+    async with client:
+        start = time.perf_counter()
+        await client.subscribe_many([("H0UNCNT0", symbol) for symbol in SYMBOLS])
+        async for event in client.events():
+            if event.event_type == "data":
+                records += event.data["values"].record_count
+                if records >= FRAMES * BATCH_SIZE:
+                    break
+        elapsed = time.perf_counter() - start
+    return records, elapsed, client
+
+
+@pytest.mark.slow
+class TestSocketThroughputBenchmark:
+    """Benchmark messages per second through SocketClient."""
+
+    @pytest.mark.asyncio
+    async def test_events_throughput(self, capsys):
+        async with LocalSocketServer(rate=None, batch_size=BATCH_SIZE, max_frames=FRAMES) as server:
+            records, elapsed, client = await _stream_into_events(server, queue_maxsize=0)
+
+        rate = records / elapsed
+        dropped = sum(stats.dropped for stats in client.queue_stats().values())
+
+        with capsys.disabled():
+            print(f"\n[events()] frames={FRAMES}, batch={BATCH_SIZE}, symbols={len(SYMBOLS)}")
+            print(f"  Throughput: {rate:,.0f} records/s ({FRAMES / elapsed:,.0f} frames/s)")
+            print(f"  Dropped:    {dropped}")
+
+        assert records == server.records_sent
+        assert dropped == 0
+        assert rate > MIN_RECORDS_PER_SECOND, f"{rate:,.0f} records/s (min {MIN_RECORDS_PER_SECOND:,.0f})"
+
+    @pytest.mark.asyncio
+    async def test_batch_handler_throughput(self, capsys):
+        received = []
+
+        async with LocalSocketServer(rate=None, batch_size=BATCH_SIZE, max_frames=FRAMES) as server:
+            async with _client(server) as client:
+                client.on("H0UNCNT0", None, lambda batch: received.extend(batch), batch=True)
+                start = time.perf_counter()
+                await client.subscribe_many([("H0UNCNT0", symbol) for symbol in SYMBOLS])
+                while len(received) < FRAMES:
+                    await _yield()
+                elapsed = time.perf_counter() - start
+                queued = [client._event_queue.get_nowait() for _ in range(client._event_queue.qsize())]
+
+        rate = FRAMES * BATCH_SIZE / elapsed
+        with capsys.disabled():
+            print(f"\n[on(batch=True)] frames={FRAMES}, batch={BATCH_SIZE}")
+            print(f"  Throughput: {rate:,.0f} records/s")
+
+        assert not any(event.event_type == "data" for event in queued)
+        assert rate > MIN_RECORDS_PER_SECOND, f"{rate:,.0f} records/s (min {MIN_RECORDS_PER_SECOND:,.0f})"
+
+
+@pytest.mark.slow
+class TestBackpressureBenchmark:
+    """Benchmark drop accounting when the consumer falls behind."""
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_counts_every_lost_frame(self, capsys):
+        async with LocalSocketServer(rate=None, batch_size=1, max_frames=2000) as server:
+            async with _client(server, queue_maxsize=10) as client:
+                await client.subscribe("H0UNCNT0", "005930")
+                channel = "H0UNCNT0:005930"
+                while channel not in client.queue_stats() or client.queue_stats()[channel].received < 2000:
+                    await _yield()
+                stats = client.queue_stats()[channel]
+
+        with capsys.disabled():
+            print(f"\n[DROP_OLDEST] sent={server.frames_sent}, queued={stats.pending}, dropped={stats.dropped}")
+
+        assert stats.policy == BackpressurePolicy.DROP_OLDEST
+        assert stats.received == server.frames_sent
+        assert stats.dropped == stats.received - stats.pending
+        assert stats.pending == 10
+
+
+@pytest.mark.slow
+class TestParseLatencyBenchmark:
+    """Benchmark per-record parse latency of the realtime parsers."""
+
+    @pytest.mark.asyncio
+    async def test_execution_parse_latency(self, capsys):
+        async with LocalSocketServer(rate=None, batch_size=BATCH_SIZE, max_frames=500) as server:
+            async with _client(server) as client:
+                await client.subscribe("H0UNCNT0", "005930")
+                values = []
+                async for event in client.events(tr_id="H0UNCNT0"):
+                    values.append(event.data["values"])
+                    if len(values) == 500:
+                        break
+
+        start = time.perf_counter()
+        parsed = sum(len(DomesticRealtimeQuote.parse_execution_data(fields)) for fields in values)
+        latency_us = (time.perf_counter() - start) / parsed * 1e6
+
+        with capsys.disabled():
+            print(f"\n[parse_execution_data] records={parsed}")
+            print(f"  Latency: {latency_us:.1f} us/record")
+
+        assert parsed == 500 * BATCH_SIZE
+        assert latency_us < MAX_PARSE_LATENCY_US, f"{latency_us:.1f} us/record (max {MAX_PARSE_LATENCY_US})"
@@ -5,19 +5,19 @@ import base64
 import hashlib
 import json
 import struct
+import zlib
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pydantic import SecretStr
 
+from cluefin_openapi._rate_limiter import TokenBucket
+from cluefin_openapi._realtime._event_queue import BackpressurePolicy
+from cluefin_openapi._realtime._frame import FrameDecoder
+from cluefin_openapi._realtime._socket_client import BaseSocketClient, SubscriptionType, WebSocketEvent
 from cluefin_openapi.kis._exceptions import KISAPIError, KISNetworkError
-from cluefin_openapi.kis._socket_client import (
-    MessageType,
-    SocketClient,
-    SubscriptionType,
-    WebSocketEvent,
-    WebSocketMessage,
-)
+from cluefin_openapi.kis._realtime_message import RealtimeFields
+from cluefin_openapi.kis._socket_client import MessageType, SocketClient, WebSocketMessage
 
 MOCK_CREDENTIAL_VALUE = "test_key"
 
@@ -41,9 +41,10 @@ class FakeWriter:
 
 
 class FakeReader:
-    def __init__(self, data: bytes = b"", handshake_response: bytes | None = None):
+    def __init__(self, data: bytes = b"", handshake_response: bytes | None = None, chunk_size: int = 65536):
         self.data = bytearray(data)
         self.handshake_response = handshake_response or b""
+        self.chunk_size = chunk_size
 
     async def readuntil(self, separator):
         return self.handshake_response
@@ -53,6 +54,13 @@ class FakeReader:
         del self.data[:size]
         return chunk
 
+    async def read(self, size=-1):
+        if size < 0:
+            size = len(self.data)
+        chunk = bytes(self.data[: min(size, self.chunk_size)])
+        del self.data[: len(chunk)]
+        return chunk
+
 
 def _websocket_accept(ws_key: str) -> str:
     return base64.b64encode(
@@ -63,8 +71,10 @@ def _websocket_accept(ws_key: str) -> str:
     ).decode()
 
 
-def _server_frame(payload: bytes, opcode: int = 0x1, mask_key: bytes | None = None) -> bytes:
-    header = bytearray([0x80 | opcode])
+def _server_frame(
+    payload: bytes, opcode: int = 0x1, mask_key: bytes | None = None, fin: bool = True, rsv1: bool = False
+) -> bytes:
+    header = bytearray([(0x80 if fin else 0) | (0x40 if rsv1 else 0) | opcode])
     length = len(payload)
     masked_bit = 0x80 if mask_key else 0
     if length <= 125:
@@ -93,6 +103,11 @@ def socket_client() -> SocketClient:
     )
 
 
+def test_base_socket_client_requires_protocol_methods():
+    with pytest.raises(TypeError, match="_build_subscription_message"):
+        BaseSocketClient(ws_url="ws://example.test")
+
+
 class TestSocketClientInit:
     """Test SocketClient initialization."""
 
@@ -145,54 +160,18 @@ class TestSocketClientInit:
         assert socket_client._reader is None
         assert socket_client._writer is None
 
-
-class TestMessageParsing:
-    """Test WebSocket message parsing."""
-
-    def test_parse_pingpong_message(self, socket_client):
-        """Test PINGPONG message parsing."""
-        raw = "PINGPONG"
-        message = socket_client._parse_message(raw)
-
-        assert message.message_type == MessageType.PINGPONG
-        assert message.raw == raw
-
-    def test_parse_data_message_unencrypted(self, socket_client):
-        """Test unencrypted data message parsing."""
-        # Format: encrypted|tr_id|count|data
-        raw = "0|H0STASP0|001|123000^124000^122000"
-        message = socket_client._parse_message(raw)
-
-        assert message.message_type == MessageType.DATA
-        assert message.tr_id == "H0STASP0"
-        assert message.encrypted is False
-        assert message.data == ["123000", "124000", "122000"]
-
-    def test_parse_data_message_encrypted(self, socket_client):
-        """Test encrypted data message parsing."""
-        raw = "1|H0STCNI0|001|encrypted_data_here"
-        message = socket_client._parse_message(raw)
-
-        assert message.message_type == MessageType.DATA
-        assert message.tr_id == "H0STCNI0"
-        assert message.encrypted is True
-        assert message.data == ["encrypted_data_here"]
-
-    def test_parse_system_message(self, socket_client):
-        """Test unknown/system message parsing."""
-        raw = "some unknown message format"
-        message = socket_client._parse_message(raw)
-
-        assert message.message_type == MessageType.SYSTEM
-        assert message.raw == raw
-
-    def test_parse_empty_data(self, socket_client):
-        """Test message with empty data field."""
-        raw = "0|H0STASP0|000|"
-        message = socket_client._parse_message(raw)
-
-        assert message.message_type == MessageType.DATA
-        assert message.data == []  # Empty string splits to empty list
+    def test_default_backpressure_policies(self):
+        """Test KIS execution notices are lossless and orderbooks conflate unless overridden."""
+        client = SocketClient(
+            approval_key="test",
+            app_key="test",
+            secret_key="test",
+            backpressure={"H0STASP0": BackpressurePolicy.DROP_OLDEST},
+        )
+        policies = client._event_queue.policies
+        assert policies["H0STCNI0"] is BackpressurePolicy.LOSSLESS
+        assert policies["HDFSASP0"] is BackpressurePolicy.CONFLATE
+        assert policies["H0STASP0"] is BackpressurePolicy.DROP_OLDEST
 
 
 class TestSubscriptionMessage:
@@ -320,6 +299,27 @@ class TestWebSocketHandshakeAndFrames:
         assert "GET /tryitout HTTP/1.1" in handshake
         assert f"Sec-WebSocket-Key: {ws_key}" in handshake
 
+    @pytest.mark.asyncio
+    async def test_websocket_handshake_negotiates_client_window_bits(self, socket_client, monkeypatch):
+        ws_key = base64.b64encode(b"0" * 16).decode()
+        accept = _websocket_accept(ws_key)
+        socket_client._compression = True
+        socket_client._reader = FakeReader(
+            handshake_response=(
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n"
+                "Sec-WebSocket-Extensions: permessage-deflate; client_max_window_bits=10\r\n\r\n"
+            ).encode()
+        )
+        socket_client._writer = FakeWriter()
+        monkeypatch.setattr("os.urandom", Mock(return_value=b"0" * 16))
+
+        await socket_client._websocket_handshake("example.test", 80)
+
+        assert "client_max_window_bits" in socket_client._writer.writes[0].decode()
+        assert socket_client._deflate is not None
+        assert socket_client._deflate.client_max_window_bits == 10
+
     @pytest.mark.asyncio
     async def test_websocket_handshake_rejects_invalid_accept(self, socket_client, monkeypatch):
         socket_client._reader = FakeReader(
@@ -377,6 +377,96 @@ class TestWebSocketHandshakeAndFrames:
         with pytest.raises(KISNetworkError, match="connection not initialized"):
             await socket_client._receive_frame()
 
+    @pytest.mark.asyncio
+    async def test_receive_frame_reassembles_fragments_around_control_frames(self, socket_client):
+        stream = (
+            _server_frame(b"0|H0STCNT0|", opcode=0x1, fin=False)
+            + _server_frame(b"ping", opcode=0x9)
+            + _server_frame(b"001|", opcode=0x0, fin=False)
+            + _server_frame(b"005930^70000", opcode=0x0)
+        )
+        socket_client._reader = FakeReader(stream, chunk_size=7)
+
+        assert await socket_client._receive_frame() == (0x9, b"ping")
+        assert await socket_client._receive_frame() == (0x1, b"0|H0STCNT0|001|005930^70000")
+
+    @pytest.mark.asyncio
+    async def test_receive_frame_decodes_many_frames_from_one_read(self, socket_client):
+        socket_client._reader = FakeReader(b"".join(_server_frame(f"msg{i}".encode()) for i in range(50)))
+
+        payloads = [(await socket_client._receive_frame())[1] for _ in range(50)]
+
+        assert payloads == [f"msg{i}".encode() for i in range(50)]
+        assert socket_client._reader.data == bytearray()
+
+    @pytest.mark.asyncio
+    async def test_receive_frame_raises_when_stream_ends(self, socket_client):
+        socket_client._reader = FakeReader(_server_frame(b"partial")[:4])
+
+        with pytest.raises(KISNetworkError, match="closed by server"):
+            await socket_client._receive_frame()
+
+    @pytest.mark.asyncio
+    async def test_send_frame_writes_single_buffer(self, socket_client, monkeypatch):
+        socket_client._writer = FakeWriter()
+        monkeypatch.setattr("os.urandom", Mock(return_value=b"\x01\x02\x03\x04"))
+
+        await socket_client._send_frame(b"hello")
+
+        assert socket_client._writer.writes == [
+            b"\x81\x85\x01\x02\x03\x04" + bytes(b ^ k for b, k in zip(b"hello", b"\x01\x02\x03\x04\x01", strict=True))
+        ]
+
+
+class TestPerMessageDeflate:
+    @pytest.mark.asyncio
+    async def test_handshake_negotiates_and_round_trips_compressed_messages(self, monkeypatch):
+        client = SocketClient("approval", "app", "secret", compression=True)
+        ws_key = base64.b64encode(b"0" * 16).decode()
+        accept = _websocket_accept(ws_key)
+        client._reader = FakeReader(
+            handshake_response=(
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n"
+                "Sec-WebSocket-Extensions: permessage-deflate; server_no_context_takeover\r\n\r\n"
+            ).encode()
+        )
+        client._writer = FakeWriter()
+        monkeypatch.setattr("os.urandom", Mock(return_value=b"0" * 16))
+
+        await client._websocket_handshake("example.test", 80)
+
+        assert "Sec-WebSocket-Extensions: permessage-deflate" in client._writer.writes[0].decode()
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        body = b"0|H0STASP0|001|" + b"^".join([b"70000"] * 60)
+        compressed = (compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH))[:-4]
+        client._reader.data = bytearray(_server_frame(compressed, rsv1=True))
+
+        assert await client._receive_frame() == (0x1, body)
+
+        await client._send_frame(b"PINGPONG")
+        sent = client._writer.writes[-1]
+        assert sent[0] == 0xC1  # FIN + RSV1 + text
+
+    @pytest.mark.asyncio
+    async def test_compression_is_not_used_when_server_declines(self, monkeypatch):
+        client = SocketClient("approval", "app", "secret", compression=True)
+        ws_key = base64.b64encode(b"0" * 16).decode()
+        client._reader = FakeReader(
+            handshake_response=(
+                f"HTTP/1.1 101 Switching Protocols\r\nSec-WebSocket-Accept: {_websocket_accept(ws_key)}\r\n\r\n"
+            ).encode()
+        )
+        client._writer = FakeWriter()
+        monkeypatch.setattr("os.urandom", Mock(return_value=b"0" * 16))
+
+        await client._websocket_handshake("example.test", 80)
+        client._reader.data = bytearray(_server_frame(b"x", rsv1=True))
+
+        assert client._deflate is None
+        with pytest.raises(KISNetworkError, match="without permessage-deflate"):
+            await client._receive_frame()
+
 
 class TestSocketMessageHandling:
     @pytest.mark.asyncio
@@ -387,6 +477,18 @@ class TestSocketMessageHandling:
 
         socket_client._send_frame.assert_awaited_once_with(b"PINGPONG")
 
+    @pytest.mark.asyncio
+    async def test_handle_json_pingpong_echoes_and_acks_are_ignored(self, socket_client):
+        socket_client._writer = FakeWriter()
+        socket_client._send_frame = AsyncMock()
+        pingpong = b'{"header":{"tr_id":"PINGPONG","datetime":"20260302090000"}}'
+
+        await socket_client._handle_message(pingpong)
+        await socket_client._handle_message(b'{"header":{"tr_id":"H0STCNT0"},"body":{"rt_cd":"0"}}')
+
+        socket_client._send_frame.assert_awaited_once_with(pingpong)
+        assert socket_client._event_queue.qsize() == 0
+
     @pytest.mark.asyncio
     async def test_handle_data_message_emits_event(self, socket_client):
         await socket_client._handle_message("0|H0STASP0|001|123^456")
@@ -396,6 +498,85 @@ class TestSocketMessageHandling:
         assert event.tr_id == "H0STASP0"
         assert event.data == {"values": ["123", "456"], "encrypted": False}
 
+    @pytest.mark.asyncio
+    async def test_handle_bytes_data_message_emits_lazy_values_without_raw(self, socket_client):
+        payload = b"0|H0STCNT0|001|005930^093000^70000"
+
+        await socket_client._handle_message(payload)
+
+        event = socket_client._event_queue.get_nowait()
+        values = event.data["values"]
+        assert isinstance(values, RealtimeFields)
+        assert values.body.obj is payload
+        assert values == ["005930", "093000", "70000"]
+        assert event.raw is None
+
+    @pytest.mark.asyncio
+    async def test_data_events_are_routed_per_subscription(self, socket_client):
+        for price in ("70000", "70100"):
+            await socket_client._handle_message(f"0|H0STASP0|001|005930^{price}".encode())
+        await socket_client._handle_message(b"0|H0STCNT0|001|005930^093000")
+
+        stats = socket_client.queue_stats()
+
+        assert stats["H0STASP0:005930"].conflated == 1
+        assert stats["H0STCNT0:005930"].pending == 1
+        event = socket_client._event_queue.get_nowait(tr_id="H0STASP0", tr_key="005930")
+        assert event.tr_key == "005930"
+        assert event.data["values"] == ["005930", "70100"]
+
+    @pytest.mark.asyncio
+    async def test_handled_records_bypass_the_event_queue(self, socket_client):
+        received = []
+        socket_client.on("H0STCNT0", "005930", lambda values: received.append(values[1]))
+
+        await socket_client._handle_message(b"0|H0STCNT0|001|005930^70000")
+        await socket_client._handle_message(b"0|H0STCNT0|001|000660^120000")
+
+        assert received == ["70000"]
+        assert socket_client._event_queue.get_nowait().tr_key == "000660"
+        assert socket_client._event_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_receive_loop_batches_records_read_together(self, socket_client):
+        batches = []
+        socket_client.on("H0STCNT0", None, lambda records: batches.append(len(records)), batch=True)
+        socket_client._connected = True
+        socket_client._reader = FakeReader(
+            _server_frame(b"0|H0STCNT0|001|005930^1")
+            + _server_frame(b"0|H0STCNT0|001|000660^2")
+            + _server_frame(b"", opcode=0x8)
+        )
+
+        await socket_client._receive_loop()
+        await asyncio.sleep(0)
+
+        assert batches == [2]
+
+    @pytest.mark.asyncio
+    async def test_events_filters_by_subscription(self, socket_client):
+        await socket_client._handle_message(b"0|H0STCNT0|001|005930^1")
+        await socket_client._handle_message(b"0|H0STCNT0|001|000660^2")
+
+        events = [event async for event in socket_client.events(tr_id="H0STCNT0", tr_key="000660")]
+
+        assert [event.tr_key for event in events] == ["000660"]
+        assert not socket_client._event_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_handle_data_message_keeps_raw_when_requested(self):
+        client = SocketClient("approval", "app", "secret", keep_raw=True)
+
+        await client._handle_message(b"0|H0STASP0|001|123^456")
+
+        assert client._event_queue.get_nowait().raw == "0|H0STASP0|001|123^456"
+
+    @pytest.mark.asyncio
+    async def test_handle_data_message_without_values_emits_nothing(self, socket_client):
+        await socket_client._handle_message(b"0|H0STASP0|000|")
+
+        assert socket_client._event_queue.empty()
+
     @pytest.mark.asyncio
     async def test_emit_event_drops_oldest_when_queue_is_full(self):
         client = SocketClient("approval", "app", "secret", queue_maxsize=1)
@@ -421,7 +602,9 @@ class TestSocketReceiveLoop:
 
         await socket_client._receive_loop()
 
-        socket_client._handle_message.assert_awaited_once_with("hello")
+        socket_client._handle_message.assert_awaited_once_with(
+            b"hello", socket_client._received_ns, socket_client._received_monotonic_ns
+        )
         assert socket_client.connected is False
         assert socket_client._event_queue.get_nowait().event_type == "disconnected"
 
@@ -501,11 +684,61 @@ class TestSocketSubscriptions:
     @pytest.mark.asyncio
     async def test_subscribe_raises_on_rate_limit(self, socket_client):
         socket_client._connected = True
-        socket_client._rate_limiter.wait_for_tokens = Mock(return_value=False)
+        socket_client._rate_limiter.acquire = AsyncMock(return_value=False)
 
         with pytest.raises(KISAPIError, match="rate limit"):
             await socket_client.subscribe("H0STASP0", "005930")
 
+    @pytest.mark.asyncio
+    async def test_subscribe_many_pipelines_messages_and_skips_duplicates(self, socket_client):
+        writer = FakeWriter()
+        writer.drain = AsyncMock()
+        socket_client._connected = True
+        socket_client._writer = writer
+        socket_client._subscriptions["H0STCNT0:005930"] = "005930"
+        socket_client._rate_limiter = TokenBucket(capacity=100, refill_rate=1.0)
+
+        await socket_client.subscribe_many(
+            [("H0STCNT0", "005930"), ("H0STCNT0", "000660"), ("H0STASP0", "000660"), ("H0STCNT0", "000660")]
+        )
+
+        assert len(writer.writes) == 2
+        writer.drain.assert_awaited_once()
+        assert list(socket_client.subscriptions) == ["H0STCNT0:005930", "H0STCNT0:000660", "H0STASP0:000660"]
+        assert [socket_client._event_queue.get_nowait().tr_key for _ in range(2)] == ["000660", "000660"]
+
+    @pytest.mark.asyncio
+    async def test_subscribe_many_waits_for_tokens_without_blocking_the_loop(self, socket_client):
+        socket_client._connected = True
+        socket_client._writer = FakeWriter()
+        socket_client._rate_limiter = TokenBucket(capacity=1, refill_rate=50.0)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        task = asyncio.create_task(ticker())
+        await socket_client.subscribe_many([("H0STCNT0", code) for code in ["005930", "000660", "035420"]])
+        task.cancel()
+
+        assert len(socket_client._writer.writes) == 3
+        assert ticks > 3
+
+    @pytest.mark.asyncio
+    async def test_subscribe_many_raises_on_rate_limit(self, socket_client):
+        socket_client._connected = True
+        socket_client._writer = FakeWriter()
+        socket_client._rate_limiter = TokenBucket(capacity=1, refill_rate=1.0)
+        socket_client._rate_limiter.acquire = AsyncMock(return_value=False)
+
+        with pytest.raises(KISAPIError, match="rate limit"):
+            await socket_client.subscribe_many([("H0STCNT0", "005930"), ("H0STCNT0", "000660")])
+
+        assert socket_client.subscriptions == {"H0STCNT0:005930": "005930"}
+
     @pytest.mark.asyncio
     async def test_unsubscribe_requires_connection(self, socket_client):
         with pytest.raises(KISAPIError, match="not connected"):
@@ -565,3 +798,163 @@ class TestSocketConnectionLifecycle:
 
         with pytest.raises(KISNetworkError, match="Failed to connect"):
             await socket_client.connect()
+
+
+class BlockingReader(FakeReader):
+    """Reader that serves its data, then waits until released (EOF) instead of ending."""
+
+    def __init__(self, data: bytes = b""):
+        super().__init__(data)
+        self.released = asyncio.Event()
+
+    async def read(self, size=-1):
+        if not self.data:
+            await self.released.wait()
+        return await super().read(size)
+
+
+class TestSupervisedReconnect:
+    """Test reconnect, subscription replay and keepalive."""
+
+    def _client(self, **kwargs) -> SocketClient:
+        return SocketClient(
+            approval_key="test_approval_key",
+            app_key="test_app_key",
+            secret_key=MOCK_CREDENTIAL_VALUE,
+            env="dev",
+            reconnect=True,
+            reconnect_initial_delay=0,
+            **kwargs,
+        )
+
+    def test_reconnect_delay_grows_exponentially_up_to_max(self):
+        client = self._client(reconnect_max_delay=5.0)
+        client._reconnect_initial_delay = 1.0
+
+        assert [client._reconnect_delay(attempt) for attempt in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    @pytest.mark.asyncio
+    async def test_reconnects_replays_subscriptions_and_reports_gap(self):
+        client = self._client()
+        connections = [
+            (BlockingReader(_server_frame(b"0|H0STCNT0|001|005930^1")), FakeWriter()),
+            None,  # first reconnect attempt fails
+            (BlockingReader(_server_frame(b"0|H0STCNT0|001|005930^2")), FakeWriter()),
+        ]
+
+        async def open_connection():
+            connection = connections.pop(0)
+            if connection is None:
+                raise OSError("connection refused")
+            client._reader, client._writer = connection
+
+        client._open_connection = open_connection
+        await client.connect()
+        client._subscriptions["H0STCNT0:005930"] = "005930"
+        first_reader = client._reader
+
+        received = []
+        async for event in client.events():
+            received.append(event)
+            if event.event_type == "data" and event.data["values"][1] == "1":
+                first_reader.released.set()
+            if event.event_type == "gap":
+                break
+
+        # Status and data events live in separate channels, so compare them separately.
+        assert [event.event_type for event in received if event.event_type != "data"] == [
+            "connected",
+            "error",
+            "reconnecting",
+            "reconnecting",
+            "gap",
+        ]
+        gap = received[-1].data
+        assert gap["attempts"] == 2
+        assert gap["subscriptions"] == ["H0STCNT0:005930"]
+        assert gap["end"] >= gap["start"]
+        assert client.connected is True
+
+        replay_writer = client._writer
+        assert len(replay_writer.writes) == 1
+        data = [event for event in received if event.event_type == "data"]
+        if len(data) == 1:
+            data.append(await asyncio.wait_for(client._event_queue.get(tr_id="H0STCNT0"), timeout=1.0))
+        assert [event.data["values"][1] for event in data] == ["1", "2"]
+
+        await client.close()
+        assert replay_writer.closed is True
+
+    @pytest.mark.asyncio
+    async def test_answers_pingpong_while_replay_waits_for_rate_limit(self):
+        client = self._client()
+        pingpong = b'{"header":{"tr_id":"PINGPONG","datetime":"20260101093000"}}'
+        replay_writer = FakeWriter()
+        connections = [
+            (FakeReader(), FakeWriter()),  # dropped by the server right away
+            (BlockingReader(_server_frame(pingpong)), replay_writer),
+        ]
+
+        async def open_connection():
+            client._reader, client._writer = connections.pop(0)
+
+        client._open_connection = open_connection
+        client._subscriptions["H0STCNT0:005930"] = "005930"
+        # The replay has to wait about 2s for a token.
+        client._rate_limiter = TokenBucket(capacity=1, refill_rate=0.5)
+        client._rate_limiter.consume()
+        await client.connect()
+
+        for _ in range(100):
+            if replay_writer.writes:
+                break
+            await asyncio.sleep(0.01)
+
+        assert client._resume_task is not None and not client._resume_task.done()
+        assert len(replay_writer.writes) == 1
+        decoder = FrameDecoder()
+        decoder.feed(replay_writer.writes[0])
+        assert decoder.next_message() == (0x1, pingpong)
+
+        await client.close()
+        assert client._resume_task is None
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        client = self._client(reconnect_max_attempts=2)
+
+        async def open_connection():
+            raise OSError("connection refused")
+
+        client._open_connection = open_connection
+        client._connected = True
+        client._reader, client._writer = FakeReader(), FakeWriter()
+
+        await asyncio.wait_for(client._supervise(), timeout=1.0)
+
+        types = []
+        while not client._event_queue.empty():
+            types.append(client._event_queue.get_nowait().event_type)
+        assert types == ["error", "reconnecting", "reconnecting", "error"]
+        assert client.connected is False
+        assert client._reconnecting is False
+
+    @pytest.mark.asyncio
+    async def test_keepalive_drops_silent_connection(self):
+        client = self._client(ping_interval=0.01, ping_timeout=0.01)
+        writer = FakeWriter()
+        client._writer = writer
+        client._connected = True
+        client._last_received = 0.0
+
+        task = asyncio.create_task(client._keepalive_loop())
+        for _ in range(100):
+            if writer.closed:
+                break
+            await asyncio.sleep(0.01)
+        client._closing = True
+        task.cancel()
+        await task
+
+        assert writer.writes[0][0] == 0x80 | 0x9
+        assert writer.closed is True
@@ -0,0 +1,200 @@
+"""Unit tests for KIS SocketPool module."""
+
+import asyncio
+import json
+
+import pytest
+
+from cluefin_openapi._rate_limiter import TokenBucket
+from cluefin_openapi.kis._exceptions import KISAPIError
+from cluefin_openapi.kis._socket_client import SocketClient, WebSocketEvent
+from cluefin_openapi.kis._socket_pool import SocketPool
+
+
+class FakeWriter:
+    def __init__(self):
+        self.writes = []
+        self.closed = False
+
+    def write(self, data):
+        self.writes.append(data)
+
+    async def drain(self):
+        return None
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        return None
+
+
+def _unmask(frame: bytes) -> dict:
+    """Decode a masked client text frame of up to 64 KiB."""
+    length, offset = frame[1] & 0x7F, 2
+    if length == 126:
+        length, offset = int.from_bytes(frame[2:4], "big"), 4
+    mask = frame[offset : offset + 4]
+    payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(frame[offset + 4 : offset + 4 + length]))
+    return json.loads(payload)
+
+
+class FakePool(SocketPool):
+    """Pool whose shards connect to fake transports without a receive loop."""
+
+    def _create_client(self) -> SocketClient:
+        shard = super()._create_client()
+
+        async def connect():
+            shard._reader, shard._writer = None, FakeWriter()
+            shard._connected = True
+            await shard._emit_event(WebSocketEvent(event_type="connected"))
+
+        shard.connect = connect
+        shard._rate_limiter = TokenBucket(capacity=1000, refill_rate=1000.0)
+        return shard
+
+
+@pytest.fixture
+def pool() -> FakePool:
+    return FakePool(
+        approval_key="test_approval_key",
+        app_key="test_app_key",
+        secret_key="test_key",
+        env="dev",
+        max_connections=3,
+        max_subscriptions_per_connection=2,
+    )
+
+
+def _loads(pool: SocketPool):
+    return [len(shard.subscriptions) for shard in pool.shards]
+
+
+class TestSocketPool:
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            SocketPool(approval_key="a", app_key="b", secret_key="c", max_connections=0)
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_spread_across_connections(self, pool):
+        await pool.connect()
+        for code in ["005930", "000660", "035420", "035720", "051910"]:
+            await pool.subscribe("H0STCNT0", code)
+
+        assert _loads(pool) == [2, 2, 1]
+        assert len(pool.subscriptions) == 5
+
+        await pool.subscribe("H0STCNT0", "005930")
+        assert _loads(pool) == [2, 2, 1]
+
+        await pool.subscribe("H0STCNT0", "000270")
+        with pytest.raises(KISAPIError):
+            await pool.subscribe("H0STCNT0", "068270")
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_routes_to_owning_connection(self, pool):
+        await pool.connect()
+        for code in ["005930", "000660", "035420"]:
+            await pool.subscribe("H0STASP0", code)
+
+        await pool.unsubscribe("H0STASP0", "035420")
+        await pool.unsubscribe("H0STASP0", "999999")
+
+        assert _loads(pool) == [2, 0]
+        last = _unmask(pool.shards[1]._writer.writes[-1])
+        assert last["header"]["tr_type"] == "2"
+        assert last["body"]["input"]["tr_key"] == "035420"
+
+    @pytest.mark.asyncio
+    async def test_events_from_all_connections_share_one_stream(self, pool):
+        await pool.connect()
+        for code in ["005930", "000660", "035420"]:
+            await pool.subscribe("H0STCNT0", code)
+        for shard, code in zip(pool.shards, ["005930", "035420"], strict=True):
+            await shard._handle_message(f"0|H0STCNT0|001|{code}^1".encode())
+
+        assert pool._event_queue.get_nowait(tr_id="H0STCNT0", tr_key="005930").tr_key == "005930"
+        assert pool._event_queue.get_nowait(tr_id="H0STCNT0", tr_key="035420").tr_key == "035420"
+        assert "H0STCNT0:035420" in pool.queue_stats()
+
+    @pytest.mark.asyncio
+    async def test_reconnected_shard_takes_over_subscriptions(self):
+        pool = FakePool(
+            approval_key="test_approval_key",
+            app_key="test_app_key",
+            secret_key="test_key",
+            max_subscriptions_per_connection=4,
+        )
+        await pool.connect()
+        for code in ["005930", "000660"]:
+            await pool.subscribe("H0STCNT0", code)
+        first = pool.shards[0]
+        second = await pool._open_shard()
+
+        # First shard drops: new subscriptions go to the second one meanwhile.
+        first._connected = False
+        for code in ["035420", "035720", "051910", "000270"]:
+            await pool.subscribe("H0STCNT0", code)
+        assert _loads(pool) == [2, 4]
+
+        first._connected = True
+        first_writes, second_writes = len(first._writer.writes), len(second._writer.writes)
+        # The reconnect callback only schedules the rebalance, even while the pool is busy.
+        async with pool._lock:
+            await asyncio.wait_for(pool._on_shard_reconnect(first), timeout=1.0)
+            assert _loads(pool) == [2, 4]
+        await asyncio.gather(*pool._rebalance_tasks)
+
+        assert _loads(pool) == [3, 3]
+        assert len(pool.subscriptions) == 6
+        moved = _unmask(first._writer.writes[first_writes])
+        released = _unmask(second._writer.writes[second_writes])
+        assert moved["header"]["tr_type"] == "1"
+        assert released["header"]["tr_type"] == "2"
+        assert moved["body"]["input"]["tr_key"] == released["body"]["input"]["tr_key"]
+
+        # A move reports the new registration before releasing the old one.
+        types = []
+        while not pool._event_queue.empty():
+            types.append(pool._event_queue.get_nowait().event_type)
+        assert types.count("unsubscribed") == 1
+        assert types[-2:] == ["subscribed", "unsubscribed"]
+
+    @pytest.mark.asyncio
+    async def test_close_closes_every_connection(self, pool):
+        await pool.connect()
+        for code in ["005930", "000660", "035420"]:
+            await pool.subscribe("H0STCNT0", code)
+        writers = [shard._writer for shard in pool.shards]
+
+        await pool.close()
+
+        assert all(writer.closed for writer in writers)
+        assert pool.connected is False
+        assert pool.shards == []
+        events = [event async for event in pool.events()]
+        assert [event.event_type for event in events].count("connected") == 2
+
+    @pytest.mark.asyncio
+    async def test_subscribe_many_fills_connections_in_one_pass(self, pool):
+        await pool.connect()
+        await pool.subscribe("H0STCNT0", "005930")
+
+        await pool.subscribe_many([("H0STCNT0", code) for code in ["005930", "000660", "035420", "035720", "035720"]])
+
+        assert _loads(pool) == [2, 2]
+        assert set(pool.subscriptions) == {f"H0STCNT0:{code}" for code in ["005930", "000660", "035420", "035720"]}
+
+    @pytest.mark.asyncio
+    async def test_handlers_receive_records_from_every_connection(self, pool):
+        await pool.connect()
+        await pool.subscribe_many([("H0STCNT0", code) for code in ["005930", "000660", "035420"]])
+        received = []
+        pool.on("H0STCNT0", None, lambda values: received.append(values[0]))
+
+        for shard, code in zip(pool.shards, ["005930", "035420"], strict=True):
+            await shard._handle_message(f"0|H0STCNT0|001|{code}^1".encode())
+
+        assert received == ["005930", "035420"]
+        assert pool._event_queue.empty(tr_id="H0STCNT0")
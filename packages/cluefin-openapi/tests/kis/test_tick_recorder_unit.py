@@ -0,0 +1,114 @@
+"""Unit tests for tick recording and replay."""
+
+import mmap
+import time
+from datetime import datetime
+
+import pytest
+
+from cluefin_openapi.kis._domestic_realtime_quote import DomesticRealtimeQuote
+from cluefin_openapi.kis._socket_client import SocketClient
+from cluefin_openapi.kis._tick_recorder import KST, MAGIC, TickRecorder, TickReplayer
+
+
+def _ns(year: int, month: int, day: int, hour: int, minute: int = 0) -> int:
+    return int(datetime(year, month, day, hour, minute, tzinfo=KST).timestamp()) * 1_000_000_000
+
+
+EXECUTION = "^".join(["005930", "090000", "70000"] + ["0"] * 43).encode()
+
+FRAMES = [
+    (_ns(2026, 3, 2, 9, 0), b"0|H0STCNT0|001|" + EXECUTION),
+    (_ns(2026, 3, 2, 15, 30), b"0|H0STASP0|001|005930^153000^70100"),
+    (_ns(2026, 3, 3, 9, 0), b"0|H0BJCNT0|001|KR1035027B40^090000^9950"),
+]
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    with TickRecorder(tmp_path) as recorder:
+        for received_ns, payload in FRAMES:
+            recorder.write(payload, received_ns=received_ns)
+    return tmp_path
+
+
+class TestTickRecorder:
+    def test_rotates_files_by_kst_session_date(self, recorded):
+        paths = sorted(path.name for path in recorded.iterdir())
+
+        assert paths == ["kis-20260302.ticklog", "kis-20260303.ticklog"]
+        data = (recorded / "kis-20260302.ticklog").read_bytes()
+        assert data.startswith(MAGIC)
+        assert len(data) == len(MAGIC) + 2 * 12 + len(FRAMES[0][1]) + len(FRAMES[1][1])
+
+    def test_appends_to_existing_log(self, recorded):
+        with TickRecorder(recorded) as recorder:
+            recorder.write(b"0|H0STCNT0|001|000660^093000^120000", received_ns=_ns(2026, 3, 3, 9, 30))
+
+        replayed = [bytes(payload) for _, payload in TickReplayer(recorded / "kis-20260303.ticklog").frames()]
+        assert replayed == [FRAMES[2][1], b"0|H0STCNT0|001|000660^093000^120000"]
+
+    @pytest.mark.asyncio
+    async def test_socket_client_records_data_frames(self, tmp_path):
+        recorder = TickRecorder(tmp_path)
+        client = SocketClient(approval_key="a", app_key="b", secret_key="c", recorder=recorder)
+
+        await client._handle_message(b"0|H0STCNT0|001|005930^090000^70000")
+        await client._handle_message(b'{"header": {"tr_id": "PINGPONG"}}')
+        recorder.close()
+
+        assert [bytes(payload) for _, payload in TickReplayer(tmp_path).frames()] == [
+            b"0|H0STCNT0|001|005930^090000^70000"
+        ]
+
+
+class TestTickReplayer:
+    def test_frames_and_records_replay_in_order(self, recorded):
+        replayer = TickReplayer(recorded)
+
+        assert [(ns, bytes(payload)) for ns, payload in replayer.frames()] == FRAMES
+        records = list(replayer.records())
+        assert [values.tr_id for _, values in records] == ["H0STCNT0", "H0STASP0", "H0BJCNT0"]
+        assert records[0][1][:3] == ["005930", "090000", "70000"]
+
+    def test_truncated_last_record_is_ignored(self, recorded):
+        path = recorded / "kis-20260303.ticklog"
+        path.write_bytes(path.read_bytes()[:-5])
+
+        assert [ns for ns, _ in TickReplayer(path).frames()] == []
+
+    def test_frames_are_views_into_a_memory_map(self, recorded):
+        frames = list(TickReplayer(recorded).frames())
+
+        assert all(isinstance(payload.obj, mmap.mmap) for _, payload in frames)
+
+    @pytest.mark.parametrize("content", [b"not a log", b""])
+    def test_rejects_foreign_files(self, tmp_path, content):
+        path = tmp_path / "other.ticklog"
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError, match="Not a tick log"):
+            list(TickReplayer(path).frames())
+
+    @pytest.mark.asyncio
+    async def test_events_feed_the_parsers(self, recorded):
+        events = [event async for event in TickReplayer(recorded).events(speed=None)]
+
+        assert [event.tr_key for event in events] == ["005930", "005930", "KR1035027B40"]
+        assert [event.received_ns for event in events] == [received_ns for received_ns, _ in FRAMES]
+        executions = DomesticRealtimeQuote.parse_execution_data(events[0].data["values"])
+        assert executions[0].mksc_shrn_iscd == "005930"
+        assert executions[0].stck_prpr == "70000"
+
+    @pytest.mark.asyncio
+    async def test_replay_into_paces_by_speed(self, tmp_path):
+        with TickRecorder(tmp_path) as recorder:
+            start = _ns(2026, 3, 2, 9, 0)
+            for offset_ms in (0, 100, 200):
+                recorder.write(b"0|H0STCNT0|001|005930^090000^70000", received_ns=start + offset_ms * 1_000_000)
+        client = SocketClient(approval_key="a", app_key="b", secret_key="c")
+        received = []
+        client.on("H0STCNT0", None, lambda values: received.append(time.monotonic()))
+
+        assert await TickReplayer(tmp_path).replay_into(client, speed=10.0) == 3
+        assert received[-1] - received[0] == pytest.approx(0.02, abs=0.015)
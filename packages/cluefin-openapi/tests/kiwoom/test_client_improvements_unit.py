@@ -221,7 +221,8 @@ def test_server_error_with_retry(mock_sleep, client):
         response = client._post("/test", {}, {})
         assert response.status_code == 200
         assert response.json() == {"success": True}
-        mock_sleep.assert_called_once_with(1)
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args.args[0] <= client._retry_policy.max_delay
 
 
 @patch("time.sleep")
@@ -241,7 +242,7 @@ def test_server_error_after_retries_raises_server_error(mock_sleep, client):
         with pytest.raises(KiwoomServerError) as exc_info:
             client._post("/test", {}, {})
 
-    mock_sleep.assert_called_once_with(1)
+    mock_sleep.assert_called_once()
     assert exc_info.value.status_code == 503
     assert "Server error: second" in str(exc_info.value)
 
@@ -414,7 +415,7 @@ def test_header_merging(client):
 
 @patch("time.sleep")  # Mock sleep to speed up tests
 def test_rate_limit_retry_logic(mock_sleep, client):
-    """Test rate limit retry logic with exponential backoff."""
+    """Test rate limit retry logic with jittered backoff."""
     client.max_retries = 2
 
     with requests_mock.Mocker() as m:
@@ -433,6 +434,7 @@ def test_rate_limit_retry_logic(mock_sleep, client):
 
         # Verify sleep was called for retries
         assert mock_sleep.call_count == 2
-        # Check exponential backoff: first retry waits 1s, second waits 2s
-        mock_sleep.assert_any_call(1)
-        mock_sleep.assert_any_call(2)
+        # Decorrelated-jitter backoff stays within [base_delay, max_delay]
+        policy = client._retry_policy
+        for call in mock_sleep.call_args_list:
+            assert policy.base_delay <= call.args[0] <= policy.max_delay
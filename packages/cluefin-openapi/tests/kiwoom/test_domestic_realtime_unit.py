@@ -0,0 +1,79 @@
+"""Unit tests for Kiwoom DomesticRealtime."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from cluefin_openapi.kiwoom._domestic_realtime import DomesticRealtime
+
+
+@pytest.fixture
+def realtime() -> DomesticRealtime:
+    socket_client = Mock()
+    socket_client.subscribe = AsyncMock()
+    socket_client.unsubscribe = AsyncMock()
+    return DomesticRealtime(socket_client)
+
+
+class TestSubscriptions:
+    @pytest.mark.asyncio
+    async def test_subscribe_methods_use_type_codes(self, realtime):
+        await realtime.subscribe_execution("005930")
+        await realtime.subscribe_orderbook("005930")
+        await realtime.subscribe_order_execution()
+        await realtime.subscribe_vi()
+        await realtime.unsubscribe_execution("005930")
+
+        assert [call.args for call in realtime.socket_client.subscribe.await_args_list] == [
+            ("0B", "005930"),
+            ("0D", "005930"),
+            ("00", ""),
+            ("1h", ""),
+        ]
+        realtime.socket_client.unsubscribe.assert_awaited_once_with("0B", "005930")
+
+
+class TestParsers:
+    def test_parse_execution(self):
+        item = DomesticRealtime.parse_execution({"20": "090001", "10": "+70000", "15": "-12", "13": "1500", "999": "x"})
+
+        assert (item.cntr_tm, item.cur_prc, item.trde_qty, item.acc_trde_qty) == ("090001", "+70000", "-12", "1500")
+        assert item.open_pric == ""
+
+    def test_parse_orderbook_levels(self):
+        values = {"21": "090001", "121": "900", "125": "700"}
+        for level in range(10):
+            values[str(41 + level)] = str(70100 + level * 100)
+            values[str(61 + level)] = str(10 + level)
+            values[str(51 + level)] = str(70000 - level * 100)
+            values[str(71 + level)] = str(20 + level)
+
+        item = DomesticRealtime.parse_orderbook(values)
+
+        assert item.asks()[0] == ("70100", "10")
+        assert item.asks()[-1] == ("71000", "19")
+        assert item.bids()[:2] == [("70000", "20"), ("69900", "21")]
+        assert (item.tot_sel_req, item.tot_buy_req) == ("900", "700")
+
+    def test_parse_order_execution_accepts_handler_record(self):
+        record = {
+            "type": "00",
+            "name": "주문체결",
+            "item": "005930",
+            "values": {"9201": "1234567890", "9203": "0000123", "9001": "A005930", "913": "체결", "911": "10"},
+        }
+
+        item = DomesticRealtime.parse_order_execution(record)
+
+        assert (item.acnt_no, item.ord_no, item.stk_cd, item.ord_stt, item.cntr_qty) == (
+            "1234567890",
+            "0000123",
+            "A005930",
+            "체결",
+            "10",
+        )
+
+    def test_parse_vi(self):
+        item = DomesticRealtime.parse_vi({"9001": "005930", "9068": "1", "1221": "77000", "1225": "동적", "9069": "1"})
+
+        assert (item.stk_cd, item.motn_tp, item.vi_motn_pric, item.vi_aply_tp) == ("005930", "1", "77000", "동적")
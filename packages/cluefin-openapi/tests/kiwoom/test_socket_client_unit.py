@@ -0,0 +1,256 @@
+"""Unit tests for Kiwoom SocketClient module."""
+
+import base64
+import hashlib
+import json
+import struct
+
+import pytest
+
+from cluefin_openapi._realtime._socket_client import SubscriptionType
+from cluefin_openapi.kiwoom._exceptions import KiwoomAPIError, KiwoomAuthenticationError, KiwoomNetworkError
+from cluefin_openapi.kiwoom._socket_client import SocketClient
+
+
+class FakeWriter:
+    def __init__(self):
+        self.writes = []
+        self.closed = False
+
+    def write(self, data):
+        self.writes.append(data)
+
+    async def drain(self):
+        return None
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        return None
+
+
+class FakeReader:
+    def __init__(self, data: bytes = b""):
+        self.data = bytearray(data)
+
+    async def read(self, size=-1):
+        chunk = bytes(self.data[:size] if size >= 0 else self.data)
+        del self.data[: len(chunk)]
+        return chunk
+
+    async def readuntil(self, separator):
+        end = self.data.index(separator) + len(separator)
+        return await self.read(end)
+
+
+def _server_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    length = len(payload)
+    if length <= 125:
+        return bytes([0x80 | opcode, length]) + payload
+    return bytes([0x80 | opcode, 126]) + struct.pack(">H", length) + payload
+
+
+def _unmask(frame: bytes) -> bytes:
+    length = frame[1] & 0x7F
+    offset = 2
+    if length == 126:
+        length = struct.unpack(">H", frame[2:4])[0]
+        offset = 4
+    mask_key = frame[offset : offset + 4]
+    payload = frame[offset + 4 : offset + 4 + length]
+    return bytes(byte ^ mask_key[index % 4] for index, byte in enumerate(payload))
+
+
+def _sent(writer: FakeWriter) -> list:
+    return [json.loads(_unmask(frame)) for frame in writer.writes]
+
+
+def _real(*records) -> bytes:
+    return json.dumps({"trnm": "REAL", "data": list(records)}).encode()
+
+
+EXECUTION = {
+    "type": "0B",
+    "name": "주식체결",
+    "item": "005930",
+    "values": {"20": "090000", "10": "+70000", "15": "+10"},
+}
+
+
+@pytest.fixture
+def socket_client() -> SocketClient:
+    return SocketClient(token="test_token", env="dev")
+
+
+class TestSocketClientInit:
+    def test_env_selects_url(self):
+        assert SocketClient(token="t", env="prod")._ws_url == SocketClient.WS_URL_PROD
+        assert SocketClient(token="t", env="dev")._ws_url == SocketClient.WS_URL_DEV
+
+    def test_invalid_env_raises(self):
+        with pytest.raises(ValueError, match="Invalid environment"):
+            SocketClient(token="t", env="staging")
+
+    @pytest.mark.asyncio
+    async def test_handshake_uses_url_path(self, socket_client, monkeypatch):
+        calls = []
+
+        async def open_connection(host, port, ssl=None):
+            calls.append((host, port, ssl is not None))
+            return FakeReader(), FakeWriter()
+
+        async def handshake(host, port, path=None):
+            calls.append(path)
+
+        async def login():
+            calls.append("login")
+
+        monkeypatch.setattr("asyncio.open_connection", open_connection)
+        socket_client._websocket_handshake = handshake
+        socket_client._login = login
+
+        await socket_client._open_connection()
+
+        assert calls == [("mockapi.kiwoom.com", 10000, True), "/api/dostk/websocket", "login"]
+
+
+class TestLogin:
+    @pytest.mark.asyncio
+    async def test_login_answers_ping_and_accepts_response(self, socket_client):
+        ping = json.dumps({"trnm": "PING"}).encode()
+        login = json.dumps({"trnm": "LOGIN", "return_code": 0, "return_msg": ""}).encode()
+        socket_client._reader = FakeReader(_server_frame(ping) + _server_frame(login))
+        socket_client._writer = FakeWriter()
+
+        await socket_client._login()
+
+        assert _sent(socket_client._writer) == [{"trnm": "LOGIN", "token": "test_token"}, {"trnm": "PING"}]
+
+    @pytest.mark.asyncio
+    async def test_login_rejected(self, socket_client):
+        login = json.dumps({"trnm": "LOGIN", "return_code": 100013, "return_msg": "invalid token"}).encode()
+        socket_client._reader = FakeReader(_server_frame(login))
+        socket_client._writer = FakeWriter()
+
+        with pytest.raises(KiwoomAuthenticationError, match="invalid token"):
+            await socket_client._login()
+
+    @pytest.mark.asyncio
+    async def test_connect_wraps_errors_in_kiwoom_network_error(self, socket_client):
+        async def fail():
+            raise OSError("refused")
+
+        socket_client._open_connection = fail
+        with pytest.raises(KiwoomNetworkError, match="refused"):
+            await socket_client.connect()
+
+
+class TestTransportErrors:
+    @pytest.mark.asyncio
+    async def test_malformed_deflate_offer_raises_kiwoom_network_error(self, socket_client, monkeypatch):
+        accept = base64.b64encode(
+            hashlib.sha1(
+                (base64.b64encode(b"0" * 16).decode() + "258EAFA5-E914-47DA-95CA-C5AB0DC85B11").encode(),
+                usedforsecurity=False,
+            ).digest()
+        ).decode()
+        socket_client._compression = True
+        socket_client._reader = FakeReader(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n"
+                "Sec-WebSocket-Extensions: permessage-deflate; client_max_window_bits=x\r\n\r\n"
+            ).encode()
+        )
+        socket_client._writer = FakeWriter()
+        monkeypatch.setattr("os.urandom", lambda size: b"0" * size)
+
+        with pytest.raises(KiwoomNetworkError, match="Malformed permessage-deflate"):
+            await socket_client._websocket_handshake("mockapi.kiwoom.com", 10000)
+
+    @pytest.mark.asyncio
+    async def test_protocol_errors_raise_kiwoom_network_error(self, socket_client):
+        socket_client._reader = FakeReader(_server_frame(b"", opcode=0x3))
+        socket_client._writer = FakeWriter()
+
+        with pytest.raises(KiwoomNetworkError, match="unknown opcode"):
+            await socket_client._receive_frame()
+
+
+class TestSubscriptions:
+    def test_build_subscription_messages(self, socket_client):
+        register = json.loads(socket_client._build_subscription_message("0B", "005930", SubscriptionType.SUBSCRIBE))
+        remove = json.loads(socket_client._build_subscription_message("0B", "005930", SubscriptionType.UNSUBSCRIBE))
+
+        assert register == {
+            "trnm": "REG",
+            "grp_no": "1",
+            "refresh": "1",
+            "data": [{"item": ["005930"], "type": ["0B"]}],
+        }
+        assert remove == {"trnm": "REMOVE", "grp_no": "1", "data": [{"item": ["005930"], "type": ["0B"]}]}
+
+    @pytest.mark.asyncio
+    async def test_subscribe_many_pipelines_registrations(self, socket_client):
+        socket_client._writer = FakeWriter()
+        socket_client._connected = True
+
+        await socket_client.subscribe_many([("0B", "005930"), ("0D", "005930"), ("0B", "005930")])
+
+        assert [message["data"][0]["type"] for message in _sent(socket_client._writer)] == [["0B"], ["0D"]]
+        assert socket_client.subscriptions == {"0B:005930": "005930", "0D:005930": "005930"}
+
+    @pytest.mark.asyncio
+    async def test_subscribe_requires_connection(self, socket_client):
+        with pytest.raises(KiwoomAPIError, match="not connected"):
+            await socket_client.subscribe("0B", "005930")
+
+
+class TestHandleMessage:
+    @pytest.mark.asyncio
+    async def test_real_records_become_data_events(self, socket_client):
+        orderbook = {"type": "0D", "name": "주식호가잔량", "item": "000660", "values": {"41": "120100"}}
+
+        await socket_client._handle_message(_real(EXECUTION, orderbook))
+
+        first = await socket_client._event_queue.get("0B", "005930")
+        second = await socket_client._event_queue.get("0D", "000660")
+        assert first.event_type == "data"
+        assert first.data == {"values": EXECUTION["values"], "name": "주식체결"}
+        assert first.raw is None
+        assert second.data["values"] == {"41": "120100"}
+
+    @pytest.mark.asyncio
+    async def test_handlers_take_records_before_the_queue(self, socket_client):
+        received = []
+        socket_client.on("0B", "005930", received.append)
+
+        await socket_client._handle_message(_real(EXECUTION))
+
+        assert received == [EXECUTION]
+        assert socket_client._event_queue.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_ping_is_echoed(self, socket_client):
+        socket_client._writer = FakeWriter()
+
+        await socket_client._handle_message(b'{"trnm":"PING"}')
+
+        assert [_unmask(frame) for frame in socket_client._writer.writes] == [b'{"trnm":"PING"}']
+
+    @pytest.mark.asyncio
+    async def test_rejected_registration_emits_error(self, socket_client):
+        await socket_client._handle_message(b'{"trnm":"REG","return_code":1,"return_msg":"bad item"}')
+        await socket_client._handle_message(b'{"trnm":"REG","return_code":0,"return_msg":""}')
+
+        event = await socket_client._event_queue.get()
+        assert event.event_type == "error"
+        assert isinstance(event.error, KiwoomAPIError)
+        assert socket_client._event_queue.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_malformed_message_is_ignored(self, socket_client):
+        await socket_client._handle_message(b"not json")
+
+        assert socket_client._event_queue.qsize() == 0
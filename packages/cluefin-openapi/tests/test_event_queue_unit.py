@@ -0,0 +1,101 @@
+"""Unit tests for per-subscription realtime event queues."""
+
+import asyncio
+
+import pytest
+
+from cluefin_openapi._realtime._event_queue import BackpressurePolicy, RealtimeEventQueue
+from cluefin_openapi._realtime._socket_client import WebSocketEvent
+
+
+def _data(tr_id: str, tr_key: str, seq: int) -> WebSocketEvent:
+    return WebSocketEvent(event_type="data", tr_id=tr_id, tr_key=tr_key, data={"seq": seq})
+
+
+def _drain(queue: RealtimeEventQueue, **filters) -> list[WebSocketEvent]:
+    events = []
+    while not queue.empty(**filters):
+        events.append(queue.get_nowait(**filters))
+    return events
+
+
+class TestPolicies:
+    """Test per-tr_id backpressure policies."""
+
+    def test_drop_oldest_bounds_each_subscription(self):
+        queue = RealtimeEventQueue(maxsize=2)
+        for seq in range(5):
+            queue.put_nowait(_data("H0STCNT0", "005930", seq))
+
+        assert [event.data["seq"] for event in _drain(queue)] == [3, 4]
+        assert queue.stats()["H0STCNT0:005930"].dropped == 3
+
+    def test_lossless_keeps_every_event(self):
+        queue = RealtimeEventQueue(maxsize=2, policies={"H0STCNI0": BackpressurePolicy.LOSSLESS})
+        for seq in range(5):
+            queue.put_nowait(_data("H0STCNI0", "HTSID", seq))
+
+        assert [event.data["seq"] for event in _drain(queue)] == [0, 1, 2, 3, 4]
+        stats = queue.stats()["H0STCNI0:HTSID"]
+        assert stats.dropped == 0
+        assert stats.high_watermark == 5
+
+    def test_conflate_keeps_latest_per_tr_key(self):
+        queue = RealtimeEventQueue(policies={"H0STASP0": BackpressurePolicy.CONFLATE})
+        for seq in range(3):
+            queue.put_nowait(_data("H0STASP0", "005930", seq))
+            queue.put_nowait(_data("H0STASP0", "000660", seq + 10))
+
+        events = _drain(queue)
+
+        assert {(event.tr_key, event.data["seq"]) for event in events} == {("005930", 2), ("000660", 12)}
+        assert queue.stats()["H0STASP0:005930"].conflated == 2
+
+    def test_custom_policy_overrides_default(self):
+        queue = RealtimeEventQueue(maxsize=1, policies={"H0STCNT0": BackpressurePolicy.LOSSLESS})
+        for seq in range(3):
+            queue.put_nowait(_data("H0STCNT0", "005930", seq))
+
+        assert queue.qsize() == 3
+        assert queue.stats()["H0STCNT0:005930"].policy is BackpressurePolicy.LOSSLESS
+
+
+class TestFairness:
+    """Test round-robin delivery across subscriptions."""
+
+    def test_orderbook_flood_does_not_starve_trades(self):
+        queue = RealtimeEventQueue(maxsize=0, policies={"H0STASP0": BackpressurePolicy.LOSSLESS})
+        for seq in range(100):
+            queue.put_nowait(_data("H0STASP0", "005930", seq))
+        queue.put_nowait(_data("H0STCNT0", "005930", 0))
+
+        first_two = [queue.get_nowait().tr_id for _ in range(2)]
+
+        assert "H0STCNT0" in first_two
+
+    def test_filters_read_one_subscription(self):
+        queue = RealtimeEventQueue()
+        queue.put_nowait(WebSocketEvent(event_type="connected"))
+        queue.put_nowait(_data("H0STCNT0", "005930", 1))
+        queue.put_nowait(_data("H0STCNT0", "000660", 2))
+
+        assert [event.data["seq"] for event in _drain(queue, tr_id="H0STCNT0", tr_key="000660")] == [2]
+        assert [event.data["seq"] for event in _drain(queue, tr_id="H0STCNT0")] == [1]
+        assert queue.get_nowait().event_type == "connected"
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_matching_event(self):
+        queue = RealtimeEventQueue()
+        waiter = asyncio.create_task(queue.get(tr_id="H0STCNT0"))
+        await asyncio.sleep(0)
+
+        queue.put_nowait(_data("H0STASP0", "005930", 1))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        queue.put_nowait(_data("H0STCNT0", "005930", 2))
+        event = await asyncio.wait_for(waiter, timeout=1.0)
+
+        assert event.data["seq"] == 2
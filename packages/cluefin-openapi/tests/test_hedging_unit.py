@@ -0,0 +1,175 @@
+"""Unit tests for hedged requests."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from cluefin_openapi import HedgePolicy, TokenBucket
+from cluefin_openapi.kis._http_client import HttpClient
+from cluefin_openapi.kiwoom._client import Client as KiwoomClient
+
+
+def warm(policy: HedgePolicy, key: str, latency: float = 0.01, count: int = 20) -> None:
+    for _ in range(count):
+        policy.record_latency(key, latency)
+
+
+@pytest.fixture
+def policy():
+    hedge_policy = HedgePolicy(percentile=90.0, min_samples=5, min_delay=0.0, keys={"TR"})
+    yield hedge_policy
+    hedge_policy.close()
+
+
+class TestHedgeDelay:
+    """Tests for latency tracking."""
+
+    def test_no_delay_until_min_samples(self, policy):
+        warm(policy, "TR", count=4)
+        assert policy.hedge_delay("TR") is None
+        policy.record_latency("TR", 0.01)
+        assert policy.hedge_delay("TR") == pytest.approx(0.01)
+
+    def test_delay_uses_percentile(self, policy):
+        for ms in range(1, 11):
+            policy.record_latency("TR", ms / 1000)
+        assert policy.hedge_delay("TR") == pytest.approx(0.009)
+
+    def test_window_drops_old_samples(self):
+        hedge_policy = HedgePolicy(window=3, min_samples=3, min_delay=0.0)
+        for latency in (5.0, 0.1, 0.1, 0.1):
+            hedge_policy.record_latency("TR", latency)
+        assert hedge_policy.hedge_delay("TR") == pytest.approx(0.1)
+
+    def test_invalid_percentile_rejected(self):
+        with pytest.raises(ValueError):
+            HedgePolicy(percentile=0)
+
+    def test_default_keys_cover_quote_endpoints(self):
+        hedge_policy = HedgePolicy()
+        assert hedge_policy.applies_to("FHKST01010100")
+        assert hedge_policy.applies_to("ka10001")
+        assert not hedge_policy.applies_to("FHKST01010400")
+        assert not hedge_policy.applies_to(None)
+
+
+class TestHedgeCall:
+    """Tests for HedgePolicy.call."""
+
+    def test_fast_primary_is_not_hedged(self, policy):
+        warm(policy, "TR", latency=1.0)
+        fn = Mock(return_value="ok")
+
+        assert policy.call("TR", fn) == "ok"
+        assert fn.call_count == 1
+        assert policy.hedged_requests == 0
+
+    def test_slow_primary_is_hedged_and_duplicate_wins(self, policy):
+        warm(policy, "TR")
+        release = threading.Event()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(2.0)
+                return "primary"
+            return "hedge"
+
+        assert policy.call("TR", fn) == "hedge"
+        release.set()
+        assert policy.hedged_requests == 1
+        assert policy.hedge_wins == 1
+
+    def test_failed_hedge_falls_back_to_primary(self, policy):
+        warm(policy, "TR")
+        calls = []
+
+        def fn():
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.1)
+                return "primary"
+            raise RuntimeError("hedge failed")
+
+        assert policy.call("TR", fn) == "primary"
+
+    def test_raises_when_both_attempts_fail(self, policy):
+        warm(policy, "TR")
+
+        def fn():
+            time.sleep(0.05)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            policy.call("TR", fn)
+
+    def test_no_hedge_without_rate_limit_token(self, policy):
+        warm(policy, "TR")
+        limiter = TokenBucket(capacity=1, refill_rate=0.001)
+        limiter.consume()
+        fn = Mock(side_effect=lambda: time.sleep(0.05) or "primary")
+
+        assert policy.call("TR", fn, rate_limiter=limiter) == "primary"
+        assert fn.call_count == 1
+        assert policy.hedged_requests == 0
+
+
+class TestClientIntegration:
+    """Tests for hedging wiring in the broker clients."""
+
+    def test_kis_hedges_only_covered_tr_ids(self, policy):
+        client = HttpClient(token="test_token", app_key="app", secret_key="secret", env="dev", hedge_policy=policy)
+        client._send_get = Mock(return_value="response")
+
+        assert client._get("/quote", headers={"tr_id": "TR"}, params={}) == "response"
+        assert client._get("/other", headers={"tr_id": "OTHER"}, params={}) == "response"
+        assert policy.hedge_delay("TR") is None
+        assert len(policy._latencies["TR"]) == 1
+        assert "OTHER" not in policy._latencies
+
+    def test_kiwoom_hedges_by_api_id(self, policy, requests_mock):
+        client = KiwoomClient(token="token", env="dev", hedge_policy=policy)
+        requests_mock.post("https://mockapi.kiwoom.com/api/dostk/stkinfo", json={"return_code": 0})
+
+        response = client._post("/api/dostk/stkinfo", {"api-id": "TR"}, {"stk_cd": "005930"})
+
+        assert response.status_code == 200
+        assert len(policy._latencies["TR"]) == 1
+
+    def test_kis_debug_snapshot_comes_from_winning_attempt(self, policy):
+        client = HttpClient(token="test_token", app_key="app", secret_key="secret", env="dev", hedge_policy=policy)
+        warm(policy, "TR")
+        release = threading.Event()
+        calls = []
+
+        def send_get(path, headers, params):
+            calls.append(1)
+            name = "primary" if len(calls) == 1 else "hedge"
+            client._set_last_response_debug(None)
+            if name == "primary":
+                release.wait(2.0)
+            client._set_last_response_debug({"attempt": name})
+            return name
+
+        client._send_get = send_get
+
+        assert client._get("/quote", headers={"tr_id": "TR"}, params={}) == "hedge"
+        release.set()
+        time.sleep(0.05)
+        assert client.last_response_debug == {"attempt": "hedge"}
+        client.close()
+
+    def test_client_close_shuts_down_hedge_executor(self, policy):
+        kis = HttpClient(token="test_token", app_key="app", secret_key="secret", env="dev", hedge_policy=policy)
+        kiwoom = KiwoomClient(token="token", env="dev", hedge_policy=policy)
+
+        policy._get_executor()
+        kis.close()
+        assert policy._executor is None
+
+        policy._get_executor()
+        kiwoom.close()
+        assert policy._executor is None
@@ -1,6 +1,9 @@
 """Unit tests for the TokenBucket rate limiter."""
 
 import threading
+from unittest.mock import Mock
+
+import pytest
 
 import cluefin_openapi._rate_limiter as rate_limiter_module
 from cluefin_openapi import TokenBucket
@@ -178,6 +181,47 @@ class TestTokenBucketWaitForTokens:
         assert clock.sleeps == [0.01]
 
 
+class TestTokenBucketAcquire:
+    """Tests for the awaitable TokenBucket.acquire method."""
+
+    @staticmethod
+    def install_fake_async_sleep(monkeypatch, clock: FakeClock) -> None:
+        async def fake_sleep(seconds: float) -> None:
+            clock.sleep(seconds)
+
+        monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", fake_sleep)
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_immediately_when_available(self, monkeypatch):
+        clock = install_fake_clock(monkeypatch)
+        self.install_fake_async_sleep(monkeypatch, clock)
+        bucket = TokenBucket(capacity=10, refill_rate=5.0)
+
+        assert await bucket.acquire() is True
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_acquire_sleeps_asynchronously_until_refill(self, monkeypatch):
+        clock = install_fake_clock(monkeypatch)
+        self.install_fake_async_sleep(monkeypatch, clock)
+        monkeypatch.setattr(rate_limiter_module.time, "sleep", Mock(side_effect=AssertionError("blocking sleep")))
+        bucket = TokenBucket(capacity=10, refill_rate=50.0)
+        bucket.consume(tokens=10)
+
+        assert await bucket.acquire(timeout=1.0) is True
+        assert clock.sleeps == [pytest.approx(0.02)]
+
+    @pytest.mark.asyncio
+    async def test_acquire_fails_fast_when_timeout_is_too_short(self, monkeypatch):
+        clock = install_fake_clock(monkeypatch)
+        self.install_fake_async_sleep(monkeypatch, clock)
+        bucket = TokenBucket(capacity=10, refill_rate=0.1)
+        bucket.consume(tokens=10)
+
+        assert await bucket.acquire(tokens=5, timeout=0.2) is False
+        assert clock.sleeps == []
+
+
 class TestTokenBucketReset:
     """Tests for TokenBucket.reset method."""
 
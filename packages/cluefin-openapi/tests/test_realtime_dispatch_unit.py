@@ -0,0 +1,89 @@
+"""Unit tests for realtime callback dispatch."""
+
+import asyncio
+
+import pytest
+
+from cluefin_openapi._realtime._dispatch import RealtimeDispatcher
+from cluefin_openapi.kis._realtime_message import RealtimeFields
+
+
+def _fields(tr_id: str, tr_key: str, price: str) -> RealtimeFields:
+    return RealtimeFields.from_frame(f"0|{tr_id}|001|{tr_key}^{price}".encode())
+
+
+class TestRealtimeDispatcher:
+    @pytest.mark.asyncio
+    async def test_dispatch_routes_by_key_and_wildcard(self):
+        dispatcher = RealtimeDispatcher()
+        samsung, every = [], []
+        dispatcher.add("H0STCNT0", "005930", lambda values: samsung.append(values[1]))
+        dispatcher.add("H0STCNT0", None, lambda values: every.append(values[0]))
+
+        assert await dispatcher.dispatch(_fields("H0STCNT0", "005930", "70000"), "005930") is True
+        assert await dispatcher.dispatch(_fields("H0STCNT0", "000660", "120000"), "000660") is True
+        assert await dispatcher.dispatch(_fields("H0STASP0", "005930", "70000"), "005930") is False
+
+        assert samsung == ["70000"]
+        assert every == ["005930", "000660"]
+
+    @pytest.mark.asyncio
+    async def test_coroutine_handlers_are_awaited(self):
+        dispatcher = RealtimeDispatcher()
+        received = []
+
+        async def handler(values):
+            await asyncio.sleep(0)
+            received.append(values[1])
+
+        dispatcher.add("H0STCNT0", "005930", handler)
+        await dispatcher.dispatch(_fields("H0STCNT0", "005930", "70000"), "005930")
+
+        assert received == ["70000"]
+
+    @pytest.mark.asyncio
+    async def test_batch_handlers_get_one_list_per_tick(self):
+        dispatcher = RealtimeDispatcher()
+        batches = []
+        dispatcher.add("H0STCNT0", None, lambda records: batches.append([values[1] for values in records]), batch=True)
+
+        for price in ("70000", "70100", "70200"):
+            await dispatcher.dispatch(_fields("H0STCNT0", "005930", price), "005930")
+        assert batches == []
+
+        await asyncio.sleep(0)
+        await dispatcher.dispatch(_fields("H0STCNT0", "005930", "70300"), "005930")
+        await asyncio.sleep(0)
+
+        assert batches == [["70000", "70100", "70200"], ["70300"]]
+
+    @pytest.mark.asyncio
+    async def test_handlers_can_be_removed(self):
+        dispatcher = RealtimeDispatcher()
+        received = []
+
+        def handler(values):
+            received.append(values[1])
+
+        remove = dispatcher.add("H0STCNT0", "005930", handler)
+        dispatcher.add("H0STCNT0", None, handler)
+        remove()
+        dispatcher.remove("H0STCNT0", None, handler)
+
+        assert not dispatcher
+        assert await dispatcher.dispatch(_fields("H0STCNT0", "005930", "70000"), "005930") is False
+        assert received == []
+
+    @pytest.mark.asyncio
+    async def test_failing_handler_does_not_stop_dispatch(self):
+        dispatcher = RealtimeDispatcher()
+        received = []
+
+        def failing(values):
+            raise ValueError("boom")
+
+        dispatcher.add("H0STCNT0", "005930", failing)
+        dispatcher.add("H0STCNT0", None, lambda values: received.append(values[1]))
+
+        assert await dispatcher.dispatch(_fields("H0STCNT0", "005930", "70000"), "005930") is True
+        assert received == ["70000"]
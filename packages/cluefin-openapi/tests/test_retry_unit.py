@@ -0,0 +1,273 @@
+"""Unit tests for retry backoff, retry budget, and circuit breakers."""
+
+import random
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+import cluefin_openapi._retry as retry_module
+from cluefin_openapi import CircuitBreaker, DecorrelatedJitterBackoff, RetryBudget, RetryPolicy
+from cluefin_openapi.dart._client import Client as DartClient
+from cluefin_openapi.dart._exceptions import DartCircuitOpenError, DartServerError
+from cluefin_openapi.kis._exceptions import KISCircuitOpenError, KISServerError, KISTimeoutError
+from cluefin_openapi.kis._http_client import HttpClient
+from cluefin_openapi.kiwoom._client import Client as KiwoomClient
+from cluefin_openapi.kiwoom._exceptions import KiwoomCircuitOpenError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(retry_module.time, "monotonic", fake.monotonic)
+    return fake
+
+
+class TestDecorrelatedJitterBackoff:
+    """Tests for DecorrelatedJitterBackoff."""
+
+    def test_delays_stay_within_bounds(self):
+        backoff = DecorrelatedJitterBackoff(base_delay=0.5, max_delay=4.0, rng=random.Random(7))
+        delays = [backoff.next_delay() for _ in range(50)]
+        assert all(0.5 <= delay <= 4.0 for delay in delays)
+
+    def test_delays_are_not_lockstep(self):
+        first = DecorrelatedJitterBackoff(rng=random.Random(1))
+        second = DecorrelatedJitterBackoff(rng=random.Random(2))
+        assert [first.next_delay() for _ in range(3)] != [second.next_delay() for _ in range(3)]
+
+    def test_reset_restarts_from_base_delay(self):
+        backoff = DecorrelatedJitterBackoff(base_delay=1.0, max_delay=100.0, rng=random.Random(3))
+        for _ in range(10):
+            backoff.next_delay()
+        backoff.reset()
+        assert backoff.next_delay() <= 3.0
+
+    def test_total_delay_is_capped(self):
+        backoff = DecorrelatedJitterBackoff(base_delay=2.0, max_delay=8.0, rng=random.Random(5), max_total_delay=7.0)
+        delays = [backoff.next_delay() for _ in range(10)]
+        assert sum(delays) == pytest.approx(7.0)
+        assert delays[-1] == 0.0
+        assert backoff.exhausted
+
+    def test_exhausted_only_with_total_cap(self):
+        capped = DecorrelatedJitterBackoff(base_delay=1.0, max_delay=1.0, max_total_delay=2.0)
+        uncapped = DecorrelatedJitterBackoff(base_delay=1.0, max_delay=1.0)
+        capped.next_delay()
+        assert not capped.exhausted
+        capped.next_delay()
+        assert capped.exhausted
+        for _ in range(10):
+            uncapped.next_delay()
+        assert not uncapped.exhausted
+        capped.reset()
+        assert not capped.exhausted
+
+
+class TestRetryBudget:
+    """Tests for RetryBudget."""
+
+    def test_budget_starts_full_and_exhausts(self, clock):
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.0, capacity=2)
+        assert budget.try_acquire()
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+
+    def test_requests_deposit_ratio(self, clock):
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0.0, capacity=10)
+        budget.tokens = 0.0
+        budget.record_request()
+        assert not budget.try_acquire()
+        budget.record_request()
+        assert budget.try_acquire()
+
+    def test_minimum_refill_over_time(self, clock):
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=1.0, capacity=5)
+        budget.tokens = 0.0
+        clock.advance(2.0)
+        assert budget.available_tokens == pytest.approx(2.0)
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10.0)
+        for _ in range(3):
+            assert breaker.allow_request()
+            breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.retry_after == pytest.approx(10.0)
+
+    def test_success_resets_failure_count(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_allows_single_probe(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5.0)
+        breaker.record_failure()
+        clock.advance(5.0)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+    def test_probe_success_closes_and_failure_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5.0)
+        breaker.record_failure()
+        clock.advance(5.0)
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        clock.advance(5.0)
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    def test_breakers_are_per_endpoint(self):
+        policy = RetryPolicy()
+        assert policy.breaker("/a") is policy.breaker("/a")
+        assert policy.breaker("/a") is not policy.breaker("/b")
+
+    def test_host_budget_is_shared(self):
+        assert RetryPolicy(host="api.kiwoom.com").budget is RetryPolicy(host="api.kiwoom.com").budget
+        assert RetryPolicy(host="api.kiwoom.com").budget is not RetryPolicy(host="opendart.fss.or.kr").budget
+        assert RetryPolicy().budget is not RetryPolicy().budget
+
+    def test_default_backoff_stays_within_former_ceiling(self):
+        backoff = RetryPolicy().backoff()
+        assert sum(backoff.next_delay() for _ in range(3)) <= 7.0
+
+    def test_can_retry_respects_max_retries_and_budget(self, clock):
+        policy = RetryPolicy(budget=RetryBudget(ratio=0.0, min_retries_per_second=0.0, capacity=1))
+        breaker = policy.breaker("/a")
+        assert not policy.can_retry(3, 3, breaker)
+        assert policy.can_retry(0, 3, breaker)
+        assert not policy.can_retry(1, 3, breaker)
+
+    def test_can_retry_stops_once_total_delay_is_spent(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=1.0, max_total_delay=2.0)
+        breaker = policy.breaker("/a")
+        backoff = policy.backoff()
+        backoff.next_delay()
+        assert policy.can_retry(1, 5, breaker, backoff)
+        tokens = policy.budget.tokens
+        backoff.next_delay()
+        assert not policy.can_retry(2, 5, breaker, backoff)
+        # Refusing on the spent delay does not withdraw a budget token.
+        assert policy.budget.tokens == tokens
+
+    def test_clients_never_retry_without_waiting(self, monkeypatch, requests_mock):
+        sleep = Mock()
+        monkeypatch.setattr("cluefin_openapi.kis._http_client.time.sleep", sleep)
+        client = HttpClient(
+            token="test_token",
+            app_key="test_app_key",
+            secret_key="test_secret_key",
+            env="dev",
+            max_retries=5,
+            retry_policy=RetryPolicy(base_delay=1.0, max_delay=3.0, max_total_delay=2.5, failure_threshold=100),
+        )
+        requests_mock.get("https://openapivts.koreainvestment.com:29443/uapi/down", status_code=503, text="down")
+
+        with pytest.raises(KISServerError):
+            client._get("/uapi/down", headers={"tr_id": "TR"}, params={})
+
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert delays and all(delay > 0 for delay in delays)
+        assert sum(delays) == pytest.approx(2.5)
+        assert requests_mock.call_count == len(delays) + 1
+
+
+class TestClientIntegration:
+    """Tests for retry policy wiring in the broker clients."""
+
+    def test_kis_circuit_opens_and_fails_fast(self, monkeypatch, requests_mock):
+        monkeypatch.setattr("cluefin_openapi.kis._http_client.time.sleep", Mock())
+        client = HttpClient(
+            token="test_token",
+            app_key="test_app_key",
+            secret_key="test_secret_key",
+            env="dev",
+            max_retries=0,
+            retry_policy=RetryPolicy(failure_threshold=2, recovery_timeout=60.0),
+        )
+        requests_mock.get("https://openapivts.koreainvestment.com:29443/uapi/down", status_code=503, text="down")
+
+        for _ in range(2):
+            with pytest.raises(KISServerError):
+                client._get("/uapi/down", headers={"tr_id": "TR"}, params={})
+
+        with pytest.raises(KISCircuitOpenError) as exc_info:
+            client._get("/uapi/down", headers={"tr_id": "TR"}, params={})
+
+        assert requests_mock.call_count == 2
+        assert exc_info.value.retry_after > 0
+
+    def test_kis_circuit_is_isolated_per_endpoint(self, requests_mock):
+        client = HttpClient(
+            token="test_token",
+            app_key="test_app_key",
+            secret_key="test_secret_key",
+            env="dev",
+            max_retries=0,
+            retry_policy=RetryPolicy(failure_threshold=1),
+        )
+        client._session.get = Mock(side_effect=requests.exceptions.Timeout("timeout"))
+        with pytest.raises(KISTimeoutError):
+            client._get("/uapi/down", headers={"tr_id": "TR"}, params={})
+
+        assert client._retry_policy.breaker("/uapi/down").state == CircuitBreaker.OPEN
+        assert client._retry_policy.breaker("/uapi/up").state == CircuitBreaker.CLOSED
+
+    def test_exhausted_budget_stops_retries(self, monkeypatch, requests_mock):
+        sleep = Mock()
+        monkeypatch.setattr("cluefin_openapi.dart._client.time.sleep", sleep)
+        budget = RetryBudget(ratio=0.0, min_retries_per_second=0.0, capacity=1)
+        client = DartClient(auth_key="test-key", max_retries=3, retry_policy=RetryPolicy(budget=budget))
+        requests_mock.get("https://opendart.fss.or.kr/api/test", status_code=500, text="error")
+
+        with pytest.raises(DartServerError):
+            client._get("/api/test")
+
+        assert requests_mock.call_count == 2
+        assert sleep.call_count == 1
+
+    def test_default_policies_share_host_budget(self):
+        first = KiwoomClient(token="token", env="dev")
+        second = KiwoomClient(token="token", env="dev")
+        prod = KiwoomClient(token="token", env="prod")
+
+        assert first._retry_policy.budget is second._retry_policy.budget
+        assert first._retry_policy.budget is not prod._retry_policy.budget
+
+    def test_shared_policy_spans_clients(self):
+        policy = RetryPolicy(failure_threshold=1)
+        dart = DartClient(auth_key="test-key", retry_policy=policy)
+        kiwoom = KiwoomClient(token="token", env="dev", retry_policy=policy)
+        policy.breaker("/api/test").record_failure()
+
+        with pytest.raises(DartCircuitOpenError):
+            dart._get("/api/test")
+        with pytest.raises(KiwoomCircuitOpenError):
+            kiwoom._post("/api/test", {}, {})
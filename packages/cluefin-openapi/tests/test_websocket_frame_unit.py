@@ -0,0 +1,205 @@
+"""Unit tests for the realtime WebSocket frame codec."""
+
+import os
+import zlib
+
+import pytest
+
+from cluefin_openapi._realtime._frame import (
+    OPCODE_BINARY,
+    OPCODE_CLOSE,
+    OPCODE_CONTINUATION,
+    OPCODE_PING,
+    OPCODE_TEXT,
+    FrameDecoder,
+    PerMessageDeflate,
+    WebSocketProtocolError,
+    encode_frame,
+    mask_payload,
+)
+
+
+def _reference_mask(payload: bytes, mask_key: bytes) -> bytes:
+    return bytes(byte ^ mask_key[index % 4] for index, byte in enumerate(payload))
+
+
+class TestMaskPayload:
+    """Test word-at-a-time masking."""
+
+    @pytest.mark.parametrize("length", [0, 1, 3, 4, 5, 125, 126, 4099, 70000])
+    def test_matches_per_byte_reference(self, length):
+        payload = bytes(range(256)) * (length // 256 + 1)
+        payload = payload[:length]
+        mask_key = b"\xa1\x02\xff\x10"
+
+        assert mask_payload(payload, mask_key) == _reference_mask(payload, mask_key)
+
+    def test_masking_is_its_own_inverse(self):
+        payload = b"\x00" * 8 + b"0|H0STCNT0|001|005930"
+
+        assert mask_payload(mask_payload(payload, b"abcd"), b"abcd") == payload
+
+
+class TestEncodeFrame:
+    """Test frame encoding."""
+
+    @pytest.mark.parametrize(
+        ("length", "header_size"),
+        [(10, 2), (125, 2), (126, 4), (65535, 4), (65536, 10)],
+    )
+    def test_length_encoding_round_trips(self, length, header_size):
+        payload = b"x" * length
+        frame = encode_frame(payload, mask=False)
+
+        assert len(frame) == header_size + length
+        decoder = FrameDecoder()
+        decoder.feed(frame)
+        assert decoder.next_message() == (OPCODE_TEXT, payload)
+
+    def test_masked_frame_decodes(self):
+        decoder = FrameDecoder()
+        decoder.feed(encode_frame(b"hello", OPCODE_BINARY))
+
+        assert decoder.next_message() == (OPCODE_BINARY, b"hello")
+
+    def test_flags(self):
+        frame = encode_frame(b"", OPCODE_CONTINUATION, fin=False, rsv1=True, mask=False)
+
+        assert frame[0] == 0x40
+
+
+class TestFrameDecoder:
+    """Test incremental decoding and reassembly."""
+
+    def test_returns_none_until_frame_is_complete(self):
+        frame = encode_frame(b"x" * 300, mask=False)
+        decoder = FrameDecoder()
+
+        for byte in frame[:-1]:
+            decoder.feed(bytes([byte]))
+            assert decoder.next_message() is None
+        decoder.feed(frame[-1:])
+
+        assert decoder.next_message() == (OPCODE_TEXT, b"x" * 300)
+        assert decoder.buffered == 0
+
+    def test_reassembles_fragments_with_interleaved_control_frame(self):
+        decoder = FrameDecoder()
+        decoder.feed(
+            encode_frame(b"ab", OPCODE_TEXT, fin=False, mask=False)
+            + encode_frame(b"", OPCODE_PING, mask=False)
+            + encode_frame(b"cd", OPCODE_CONTINUATION, fin=False, mask=False)
+            + encode_frame(b"ef", OPCODE_CONTINUATION, mask=False)
+            + encode_frame(b"", OPCODE_CLOSE, mask=False)
+        )
+
+        assert decoder.next_message() == (OPCODE_PING, b"")
+        assert decoder.next_message() == (OPCODE_TEXT, b"abcdef")
+        assert decoder.next_message() == (OPCODE_CLOSE, b"")
+        assert decoder.next_message() is None
+
+    @pytest.mark.parametrize(
+        ("stream", "match"),
+        [
+            (encode_frame(b"x", OPCODE_CONTINUATION, mask=False), "unexpected continuation"),
+            (
+                encode_frame(b"a", OPCODE_TEXT, fin=False, mask=False) + encode_frame(b"b", mask=False),
+                "previous one finished",
+            ),
+            (encode_frame(b"", OPCODE_PING, fin=False, mask=False), "invalid control frame"),
+            (encode_frame(b"", 0x3, mask=False), "unknown opcode"),
+        ],
+    )
+    def test_protocol_errors(self, stream, match):
+        decoder = FrameDecoder()
+        decoder.feed(stream)
+
+        with pytest.raises(WebSocketProtocolError, match=match):
+            decoder.next_message()
+
+    def test_rejects_oversized_messages(self):
+        decoder = FrameDecoder(max_message_size=8)
+        decoder.feed(encode_frame(b"x" * 6, fin=False, mask=False) + encode_frame(b"x" * 6, OPCODE_CONTINUATION))
+
+        with pytest.raises(WebSocketProtocolError, match="too large"):
+            decoder.next_message()
+
+    def test_reset_drops_partial_state(self):
+        decoder = FrameDecoder()
+        decoder.feed(encode_frame(b"ab", fin=False, mask=False) + b"\x81")
+        assert decoder.next_message() is None
+
+        decoder.reset()
+        decoder.feed(encode_frame(b"new", mask=False))
+
+        assert decoder.next_message() == (OPCODE_TEXT, b"new")
+
+
+class TestPerMessageDeflate:
+    """Test permessage-deflate negotiation and payload handling."""
+
+    def test_from_response_parses_parameters(self):
+        response = (
+            b"HTTP/1.1 101 Switching Protocols\r\n"
+            b"sec-websocket-extensions: permessage-deflate; client_no_context_takeover\r\n\r\n"
+        )
+
+        deflate = PerMessageDeflate.from_response(response)
+
+        assert deflate is not None
+        assert deflate.client_no_context_takeover is True
+        assert deflate.server_no_context_takeover is False
+
+    def test_compressor_honours_negotiated_window_bits(self):
+        response = (
+            b"HTTP/1.1 101 Switching Protocols\r\n"
+            b"Sec-WebSocket-Extensions: permessage-deflate; client_max_window_bits=10\r\n\r\n"
+        )
+        deflate = PerMessageDeflate.from_response(response)
+        block = os.urandom(2048)
+
+        assert deflate is not None
+        assert deflate.client_max_window_bits == 10
+        # A 1 KiB window cannot reach the repeat 2 KiB back, so the second copy stays uncompressed.
+        compressed = deflate.compress(block + block)
+
+        assert len(compressed) > 2 * len(block)
+        assert PerMessageDeflate().decompress(compressed) == block + block
+        assert len(PerMessageDeflate().compress(block + block)) < 1.5 * len(block)
+
+    @pytest.mark.parametrize("value", ["8", "16", "wide"])
+    def test_from_response_rejects_unusable_window_bits(self, value):
+        response = (
+            f"HTTP/1.1 101 Switching Protocols\r\n"
+            f"Sec-WebSocket-Extensions: permessage-deflate; client_max_window_bits={value}\r\n\r\n"
+        ).encode()
+
+        with pytest.raises(WebSocketProtocolError):
+            PerMessageDeflate.from_response(response)
+
+    def test_from_response_without_extension(self):
+        assert PerMessageDeflate.from_response(b"HTTP/1.1 101 Switching Protocols\r\n\r\n") is None
+
+    def test_round_trip_with_context_takeover(self):
+        sender = PerMessageDeflate()
+        receiver = PerMessageDeflate()
+        messages = [b"0|H0STCNT0|001|005930^093000^70000" for _ in range(3)]
+
+        compressed = [sender.compress(message) for message in messages]
+
+        assert [receiver.decompress(payload) for payload in compressed] == messages
+        # Later messages reuse the shared window and shrink.
+        assert len(compressed[-1]) < len(compressed[0])
+
+    def test_decoder_inflates_fragmented_compressed_message(self):
+        compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        body = b"^".join([b"70000"] * 100)
+        compressed = (compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH))[:-4]
+        half = len(compressed) // 2
+        decoder = FrameDecoder(deflate=PerMessageDeflate())
+        decoder.feed(
+            encode_frame(compressed[:half], fin=False, rsv1=True, mask=False)
+            + encode_frame(compressed[half:], OPCODE_CONTINUATION, mask=False)
+        )
+
+        assert decoder.next_message() == (OPCODE_TEXT, body)
@@ -13,6 +13,9 @@ Usage:
 
 from importlib.metadata import PackageNotFoundError, version
 
+# Kernel backend selection
+from cluefin_ta._core import available_backends, get_backend, set_backend
+
 # Overlap Studies (Moving Averages)
 # Momentum Indicators
 from cluefin_ta.momentum import ADX, CCI, MACD, MFI, MOM, ROC, RSI, STOCH, STOCHF, WILLR
@@ -20,16 +23,68 @@ from cluefin_ta.overlap import BBANDS, DEMA, EMA, KAMA, SMA, TEMA, WMA
 
 # Pattern Recognition (Candlestick)
 from cluefin_ta.pattern import (
+    CDL2CROWS,
+    CDL3BLACKCROWS,
+    CDL3INSIDE,
+    CDL3LINESTRIKE,
+    CDL3OUTSIDE,
+    CDL3STARSINSOUTH,
+    CDL3WHITESOLDIERS,
+    CDL_ALL,
+    CDLABANDONEDBABY,
+    CDLADVANCEBLOCK,
+    CDLBELTHOLD,
+    CDLBREAKAWAY,
+    CDLCLOSINGMARUBOZU,
+    CDLCONCEALBABYSWALL,
+    CDLCOUNTERATTACK,
     CDLDARKCLOUDCOVER,
     CDLDOJI,
+    CDLDOJISTAR,
+    CDLDRAGONFLYDOJI,
     CDLENGULFING,
+    CDLEVENINGDOJISTAR,
     CDLEVENINGSTAR,
+    CDLGAPSIDESIDEWHITE,
+    CDLGRAVESTONEDOJI,
     CDLHAMMER,
     CDLHANGINGMAN,
     CDLHARAMI,
+    CDLHARAMICROSS,
+    CDLHIGHWAVE,
+    CDLHIKKAKE,
+    CDLHIKKAKEMOD,
+    CDLHOMINGPIGEON,
+    CDLIDENTICAL3CROWS,
+    CDLINNECK,
+    CDLINVERTEDHAMMER,
+    CDLKICKING,
+    CDLKICKINGBYLENGTH,
+    CDLLADDERBOTTOM,
+    CDLLONGLEGGEDDOJI,
+    CDLLONGLINE,
+    CDLMARUBOZU,
+    CDLMATCHINGLOW,
+    CDLMATHOLD,
+    CDLMORNINGDOJISTAR,
     CDLMORNINGSTAR,
+    CDLONNECK,
     CDLPIERCING,
+    CDLRICKSHAWMAN,
+    CDLRISEFALL3METHODS,
+    CDLSEPARATINGLINES,
     CDLSHOOTINGSTAR,
+    CDLSHORTLINE,
+    CDLSPINNINGTOP,
+    CDLSTALLEDPATTERN,
+    CDLSTICKSANDWICH,
+    CDLTAKURI,
+    CDLTASUKIGAP,
+    CDLTHRUSTING,
+    CDLTRISTAR,
+    CDLUNIQUE3RIVER,
+    CDLUPSIDEGAP2CROWS,
+    CDLXSIDEGAP3METHODS,
 )
 
 # Portfolio Metrics
@@ -93,6 +148,58 @@ __all__ = [
     "CDLMORNINGSTAR",
     "CDLEVENINGSTAR",
     "CDLDARKCLOUDCOVER",
+    "CDL2CROWS",
+    "CDL3BLACKCROWS",
+    "CDL3INSIDE",
+    "CDL3LINESTRIKE",
+    "CDL3OUTSIDE",
+    "CDL3STARSINSOUTH",
+    "CDL3WHITESOLDIERS",
+    "CDLABANDONEDBABY",
+    "CDLADVANCEBLOCK",
+    "CDLBELTHOLD",
+    "CDLBREAKAWAY",
+    "CDLCLOSINGMARUBOZU",
+    "CDLCONCEALBABYSWALL",
+    "CDLCOUNTERATTACK",
+    "CDLDOJISTAR",
+    "CDLDRAGONFLYDOJI",
+    "CDLEVENINGDOJISTAR",
+    "CDLGAPSIDESIDEWHITE",
+    "CDLGRAVESTONEDOJI",
+    "CDLHARAMICROSS",
+    "CDLHIGHWAVE",
+    "CDLHIKKAKE",
+    "CDLHIKKAKEMOD",
+    "CDLHOMINGPIGEON",
+    "CDLIDENTICAL3CROWS",
+    "CDLINNECK",
+    "CDLINVERTEDHAMMER",
+    "CDLKICKING",
+    "CDLKICKINGBYLENGTH",
+    "CDLLADDERBOTTOM",
+    "CDLLONGLEGGEDDOJI",
+    "CDLLONGLINE",
+    "CDLMARUBOZU",
+    "CDLMATCHINGLOW",
+    "CDLMATHOLD",
+    "CDLMORNINGDOJISTAR",
+    "CDLONNECK",
+    "CDLRICKSHAWMAN",
+    "CDLRISEFALL3METHODS",
+    "CDLSEPARATINGLINES",
+    "CDLSHORTLINE",
+    "CDLSPINNINGTOP",
+    "CDLSTALLEDPATTERN",
+    "CDLSTICKSANDWICH",
+    "CDLTAKURI",
+    "CDLTASUKIGAP",
+    "CDLTHRUSTING",
+    "CDLTRISTAR",
+    "CDLUNIQUE3RIVER",
+    "CDLUPSIDEGAP2CROWS",
+    "CDLXSIDEGAP3METHODS",
+    "CDL_ALL",
     # Portfolio
     "MDD",
     "CAGR",
@@ -107,4 +214,8 @@ __all__ = [
     "REGIME_COMBINED",
     "REGIME_HMM",
     "REGIME_HMM_RETURNS",
+    # Backend
+    "available_backends",
+    "get_backend",
+    "set_backend",
 ]
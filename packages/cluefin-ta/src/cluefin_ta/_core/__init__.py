@@ -1,9 +1,26 @@
 """
 Core implementation module for cluefin-ta.
 
-Provides pure NumPy implementations for technical analysis computations.
+Provides the low-level kernels behind the indicators. The NumPy
+implementations are the reference; when Numba is installed, the sequential
+kernels are replaced by compiled versions that return identical results.
+
+The backend is chosen at import time from the ``CLUEFIN_TA_BACKEND``
+environment variable ("auto", "numpy" or "numba"; default "auto") and can be
+changed later with `set_backend`. Indicators look kernels up on this module
+at call time, so a switch applies to every subsequent call. Numba is only
+imported when the "auto" or "numba" backend is selected (or
+`available_backends` is asked), so ``CLUEFIN_TA_BACKEND=numpy`` keeps it and
+its JIT start-up out of the process.
+
+The O(n) sliding-window kernels (rolling_sum, rolling_var, rolling_max, ...)
+in `window` are vectorized NumPy shared by both backends.
 """
 
+import importlib
+import os
+
+from cluefin_ta._core import numpy_impl
 from cluefin_ta._core.numpy_impl import (
     ad_loop,
     dx_loop,
@@ -16,6 +33,100 @@ from cluefin_ta._core.numpy_impl import (
     true_range_loop,
     wilder_smooth,
 )
+from cluefin_ta._core.window import (
+    rolling_argmax,
+    rolling_argmin,
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_percentile,
+    rolling_sum,
+    rolling_var,
+    rolling_weighted_sum,
+)
+
+# The compiled kernels, imported by _load_numba on first use.
+numba_impl = None
+_numba_missing = False
+
+_KERNELS = (
+    "ema_loop",
+    "rolling_std",
+    "wilder_smooth",
+    "rolling_minmax",
+    "true_range_loop",
+    "obv_loop",
+    "ad_loop",
+    "kama_loop",
+    "dx_loop",
+    "mfi_loop",
+)
+
+_backend = "numpy"
+
+
+def _load_numba():
+    """Import the compiled kernels once; None when Numba is not installed."""
+    global numba_impl, _numba_missing
+
+    if numba_impl is None and not _numba_missing:
+        try:
+            numba_impl = importlib.import_module("cluefin_ta._core.numba_impl")
+        except ImportError:
+            _numba_missing = True
+    return numba_impl
+
+
+def available_backends() -> list[str]:
+    """
+    List the kernel backends that can be selected.
+
+    Returns:
+        ["numpy", "numba"] when Numba is installed, otherwise ["numpy"]
+    """
+    return ["numpy", "numba"] if _load_numba() is not None else ["numpy"]
+
+
+def get_backend() -> str:
+    """
+    Name of the active kernel backend.
+
+    Returns:
+        "numpy" or "numba"
+    """
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the kernel backend.
+
+    Args:
+        name: "numba" to force the compiled kernels, "numpy" to force the
+            NumPy reference, or "auto" for Numba when installed
+
+    Raises:
+        ValueError: If name is not a known backend
+        ImportError: If "numba" is requested but Numba is not installed
+    """
+    global _backend
+
+    if name == "auto":
+        name = "numba" if _load_numba() is not None else "numpy"
+    if name not in ("numpy", "numba"):
+        raise ValueError(f"Unknown backend {name!r}; expected 'auto', 'numpy' or 'numba'")
+    if name == "numba" and _load_numba() is None:
+        raise ImportError("The numba backend requires Numba: pip install cluefin-ta[numba]")
+
+    for kernel in _KERNELS:
+        implementation = getattr(numpy_impl, kernel)
+        if name == "numba":
+            implementation = getattr(numba_impl, kernel, implementation)
+        globals()[kernel] = implementation
+    _backend = name
+
+
+set_backend(os.environ.get("CLUEFIN_TA_BACKEND", "").strip().lower() or "auto")
 
 __all__ = [
     "ema_loop",
@@ -28,4 +139,16 @@ __all__ = [
     "kama_loop",
     "dx_loop",
     "mfi_loop",
+    "rolling_sum",
+    "rolling_mean",
+    "rolling_var",
+    "rolling_weighted_sum",
+    "rolling_max",
+    "rolling_min",
+    "rolling_argmax",
+    "rolling_argmin",
+    "rolling_percentile",
+    "available_backends",
+    "get_backend",
+    "set_backend",
 ]
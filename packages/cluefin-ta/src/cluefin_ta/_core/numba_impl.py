@@ -0,0 +1,383 @@
+"""
+Numba-compiled implementations of the sequential technical analysis kernels.
+
+Each kernel compiles the loop of its NumPy counterpart in numpy_impl with the
+same operations in the same order, so results are bit-for-bit identical.
+Kernels that are already vectorized in NumPy (rolling_std, true_range_loop)
+have no compiled version. rolling_minmax scans a monotonic deque instead of
+the NumPy block scheme; both select exact input values, so they agree too.
+
+Importing this module raises ImportError when Numba is not installed.
+"""
+
+import numba
+import numpy as np
+
+from cluefin_ta._core.numpy_impl import kama_volatility
+
+_jit = numba.njit(cache=True, nogil=True)
+
+
+@_jit
+def ema_loop(close: np.ndarray, period: int, alpha: float, initial_sma: float) -> np.ndarray:
+    """
+    EMA calculation loop.
+
+    Args:
+        close: Array of closing prices
+        period: EMA period
+        alpha: Smoothing factor (2 / (period + 1))
+        initial_sma: Initial SMA value for first EMA
+
+    Returns:
+        Array of EMA values with NaN for initial periods
+    """
+    n = len(close)
+    result = np.full(n, np.nan)
+    if n < period:
+        return result
+    result[period - 1] = initial_sma
+
+    for i in range(period, n):
+        result[i] = alpha * close[i] + (1 - alpha) * result[i - 1]
+
+    return result
+
+
+@_jit
+def wilder_smooth(values: np.ndarray, period: int, initial_value: float, start_idx: int) -> np.ndarray:
+    """
+    Wilder's smoothing method.
+
+    Args:
+        values: Input values to smooth
+        period: Smoothing period
+        initial_value: Initial value (typically SMA of first period)
+        start_idx: Starting index for smoothed values
+
+    Returns:
+        Array of smoothed values with NaN for initial periods
+    """
+    n = len(values)
+    result = np.full(n, np.nan)
+    if start_idx >= n:
+        return result
+    result[start_idx] = initial_value
+
+    for i in range(start_idx + 1, n):
+        result[i] = (result[i - 1] * (period - 1) + values[i]) / period
+
+    return result
+
+
+@_jit
+def _rolling_extreme(data: np.ndarray, period: int, sign: float) -> np.ndarray:
+    """Rolling maximum of sign * data, times sign, over a monotonic deque of indices.
+
+    A window holding NaN yields NaN, as with np.max over the window.
+    """
+    n = len(data)
+    result = np.full(n, np.nan)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_nan = -1
+
+    for i in range(n):
+        value = sign * data[i]
+        if np.isnan(value):
+            last_nan = i
+        else:
+            while tail > head and sign * data[deque[tail - 1]] <= value:
+                tail -= 1
+            deque[tail] = i
+            tail += 1
+        while tail > head and deque[head] <= i - period:
+            head += 1
+
+        if i >= period - 1 and last_nan <= i - period:
+            result[i] = data[deque[head]]
+
+    return result
+
+
+def rolling_minmax(high: np.ndarray, low: np.ndarray, period: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling highest high and lowest low.
+
+    Args:
+        high: Array of high prices
+        low: Array of low prices
+        period: Window size
+
+    Returns:
+        Tuple of (highest_high, lowest_low) arrays
+    """
+    return _rolling_extreme(high, period, 1.0), _rolling_extreme(low, period, -1.0)
+
+
+@_jit
+def obv_loop(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    On Balance Volume calculation loop.
+
+    Args:
+        close: Array of closing prices
+        volume: Array of volume data
+
+    Returns:
+        Array of OBV values
+    """
+    n = len(close)
+    result = np.zeros(n, dtype=np.float64)
+    if n == 0:
+        return result
+    result[0] = volume[0]
+
+    for i in range(1, n):
+        if close[i] > close[i - 1]:
+            result[i] = result[i - 1] + volume[i]
+        elif close[i] < close[i - 1]:
+            result[i] = result[i - 1] - volume[i]
+        else:
+            result[i] = result[i - 1]
+
+    return result
+
+
+@_jit
+def ad_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """
+    Accumulation/Distribution calculation loop.
+
+    Args:
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+        volume: Array of volume data
+
+    Returns:
+        Array of A/D values
+    """
+    n = len(close)
+    result = np.zeros(n, dtype=np.float64)
+
+    for i in range(n):
+        hl_range = high[i] - low[i]
+
+        if hl_range != 0:
+            mfm = ((close[i] - low[i]) - (high[i] - close[i])) / hl_range
+        else:
+            mfm = 0.0
+
+        mfv = mfm * volume[i]
+
+        if i == 0:
+            result[i] = mfv
+        else:
+            result[i] = result[i - 1] + mfv
+
+    return result
+
+
+def kama_loop(close: np.ndarray, period: int, fast_sc: float, slow_sc: float) -> np.ndarray:
+    """
+    Kaufman Adaptive Moving Average calculation loop.
+
+    The volatility window sums come from the shared NumPy kernel, so only
+    the recursion is compiled.
+
+    Args:
+        close: Array of closing prices
+        period: Efficiency ratio period
+        fast_sc: Fast smoothing constant (2 / (fast + 1))
+        slow_sc: Slow smoothing constant (2 / (slow + 1))
+
+    Returns:
+        Array of KAMA values with NaN for initial periods
+    """
+    if len(close) < period:
+        return np.full(len(close), np.nan)
+    return _kama_recursion(close, period, fast_sc, slow_sc, kama_volatility(close, period))
+
+
+@_jit
+def _kama_recursion(
+    close: np.ndarray, period: int, fast_sc: float, slow_sc: float, volatility: np.ndarray
+) -> np.ndarray:
+    """KAMA from precomputed volatility window sums."""
+    n = len(close)
+    result = np.full(n, np.nan)
+    result[period - 1] = close[period - 1]
+
+    for i in range(period, n):
+        change = abs(close[i] - close[i - period])
+
+        if volatility[i] != 0:
+            er = change / volatility[i]
+        else:
+            er = 0.0
+
+        sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
+
+        result[i] = result[i - 1] + sc * (close[i] - result[i - 1])
+
+    return result
+
+
+@_jit
+def _directional_movement(
+    high: np.ndarray, low: np.ndarray, prev_close: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """+DM, -DM and True Range of each bar (first element 0)."""
+    n = len(high)
+    plus_dm = np.zeros(n)
+    minus_dm = np.zeros(n)
+    tr = np.zeros(n)
+
+    for i in range(1, n):
+        up_move = high[i] - high[i - 1]
+        down_move = low[i - 1] - low[i]
+
+        if up_move > down_move and up_move > 0:
+            plus_dm[i] = up_move
+        if down_move > up_move and down_move > 0:
+            minus_dm[i] = down_move
+
+        hl = high[i] - low[i]
+        hc = abs(high[i] - prev_close[i])
+        lc = abs(low[i] - prev_close[i])
+        tr[i] = max(hl, hc, lc)
+
+    return plus_dm, minus_dm, tr
+
+
+@_jit
+def _smoothed_dx(
+    plus_dm: np.ndarray,
+    minus_dm: np.ndarray,
+    tr: np.ndarray,
+    period: int,
+    initial_plus_dm: float,
+    initial_minus_dm: float,
+    initial_tr: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Wilder-smooth +DM, -DM and TR from their initial sums into +DI, -DI and DX."""
+    n = len(plus_dm)
+    plus_di = np.full(n, np.nan)
+    minus_di = np.full(n, np.nan)
+    dx = np.full(n, np.nan)
+
+    smooth_plus_dm = initial_plus_dm
+    smooth_minus_dm = initial_minus_dm
+    smooth_tr = initial_tr
+
+    for i in range(period, n):
+        if i > period:
+            smooth_plus_dm = smooth_plus_dm - (smooth_plus_dm / period) + plus_dm[i]
+            smooth_minus_dm = smooth_minus_dm - (smooth_minus_dm / period) + minus_dm[i]
+            smooth_tr = smooth_tr - (smooth_tr / period) + tr[i]
+
+        if smooth_tr != 0:
+            plus_di[i] = 100.0 * smooth_plus_dm / smooth_tr
+            minus_di[i] = 100.0 * smooth_minus_dm / smooth_tr
+        else:
+            plus_di[i] = 0.0
+            minus_di[i] = 0.0
+
+        di_sum = plus_di[i] + minus_di[i]
+        if di_sum != 0:
+            dx[i] = 100.0 * abs(plus_di[i] - minus_di[i]) / di_sum
+        else:
+            dx[i] = 0.0
+
+    return plus_di, minus_di, dx
+
+
+def dx_loop(
+    high: np.ndarray,
+    low: np.ndarray,
+    prev_close: np.ndarray,
+    period: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Directional Index calculation loop for ADX.
+
+    The initial sums are taken with np.sum outside the compiled code: NumPy
+    sums pairwise, and a compiled sequential sum would differ in the last bits.
+
+    Args:
+        high: Array of high prices
+        low: Array of low prices
+        prev_close: Array of previous close prices (close shifted by 1)
+        period: Smoothing period
+
+    Returns:
+        Tuple of (+DI, -DI, DX) arrays
+    """
+    n = len(high)
+    if n < period + 1:
+        return np.full(n, np.nan), np.full(n, np.nan), np.full(n, np.nan)
+
+    plus_dm, minus_dm, tr = _directional_movement(high, low, prev_close)
+    return _smoothed_dx(
+        plus_dm,
+        minus_dm,
+        tr,
+        period,
+        np.sum(plus_dm[1 : period + 1]),
+        np.sum(minus_dm[1 : period + 1]),
+        np.sum(tr[1 : period + 1]),
+    )
+
+
+@_jit
+def mfi_loop(typical_price: np.ndarray, volume: np.ndarray, period: int) -> np.ndarray:
+    """
+    Money Flow Index calculation loop.
+
+    Args:
+        typical_price: Array of typical prices ((H+L+C)/3)
+        volume: Array of volume data
+        period: MFI period
+
+    Returns:
+        Array of MFI values (0-100) with NaN for initial periods
+    """
+    n = len(typical_price)
+    result = np.full(n, np.nan)
+
+    if n < period + 1:
+        return result
+
+    raw_mf = typical_price * volume
+
+    for i in range(period, n):
+        pos_mf = 0.0
+        neg_mf = 0.0
+
+        for j in range(i - period + 1, i + 1):
+            if typical_price[j] > typical_price[j - 1]:
+                pos_mf += raw_mf[j]
+            elif typical_price[j] < typical_price[j - 1]:
+                neg_mf += raw_mf[j]
+
+        if neg_mf != 0:
+            mf_ratio = pos_mf / neg_mf
+            result[i] = 100.0 - (100.0 / (1.0 + mf_ratio))
+        else:
+            result[i] = 100.0
+
+    return result
+
+
+__all__ = [
+    "ema_loop",
+    "wilder_smooth",
+    "rolling_minmax",
+    "obv_loop",
+    "ad_loop",
+    "kama_loop",
+    "dx_loop",
+    "mfi_loop",
+]
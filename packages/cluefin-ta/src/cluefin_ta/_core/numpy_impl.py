@@ -1,12 +1,15 @@
 """
 Pure NumPy implementations of low-level technical analysis computations.
 
-These functions are used when Numba is not available.
-All functions are designed to match Numba-accelerated versions exactly.
+These are the reference implementations, used when Numba is not available or
+the "numpy" backend is forced. The compiled kernels in numba_impl must match
+them exactly.
 """
 
 import numpy as np
 
+from cluefin_ta._core import window
+
 
 def ema_loop(close: np.ndarray, period: int, alpha: float, initial_sma: float) -> np.ndarray:
     """
@@ -42,27 +45,7 @@ def rolling_std(data: np.ndarray, period: int) -> np.ndarray:
     Returns:
         Array of rolling std values with NaN for initial periods
     """
-    data = np.asarray(data, dtype=np.float64)
-    n = len(data)
-    result = np.full(n, np.nan)
-
-    if n < period:
-        return result
-
-    # Vectorized rolling std using cumulative sums for O(n) performance.
-    cumsum = np.cumsum(np.insert(data, 0, 0.0))
-    cumsum_sq = np.cumsum(np.insert(data * data, 0, 0.0))
-
-    sum_x = cumsum[period:] - cumsum[:-period]
-    sum_x2 = cumsum_sq[period:] - cumsum_sq[:-period]
-
-    mean = sum_x / period
-    mean_sq = sum_x2 / period
-    var = mean_sq - mean * mean
-    var = np.maximum(var, 0.0)  # Numerical guard against small negatives
-
-    result[period - 1 :] = np.sqrt(var)
-    return result
+    return window.rolling_std(data, period)
 
 
 def wilder_smooth(values: np.ndarray, period: int, initial_value: float, start_idx: int) -> np.ndarray:
@@ -102,15 +85,7 @@ def rolling_minmax(high: np.ndarray, low: np.ndarray, period: int) -> tuple[np.n
     Returns:
         Tuple of (highest_high, lowest_low) arrays
     """
-    n = len(high)
-    highest = np.full(n, np.nan)
-    lowest = np.full(n, np.nan)
-
-    for i in range(period - 1, n):
-        highest[i] = np.max(high[i - period + 1 : i + 1])
-        lowest[i] = np.min(low[i - period + 1 : i + 1])
-
-    return highest, lowest
+    return window.rolling_max(high, period), window.rolling_min(low, period)
 
 
 def true_range_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
@@ -230,6 +205,8 @@ def kama_loop(
     if n < period:
         return result
 
+    volatility = kama_volatility(close, period)
+
     # First KAMA value is the first close price after enough data
     result[period - 1] = close[period - 1]
 
@@ -237,14 +214,9 @@ def kama_loop(
         # Change = |close - close[period ago]|
         change = abs(close[i] - close[i - period])
 
-        # Volatility = sum of |close - prev_close| over period
-        volatility = 0.0
-        for j in range(i - period + 1, i + 1):
-            volatility += abs(close[j] - close[j - 1])
-
         # Efficiency Ratio
-        if volatility != 0:
-            er = change / volatility
+        if volatility[i] != 0:
+            er = change / volatility[i]
         else:
             er = 0.0
 
@@ -257,6 +229,22 @@ def kama_loop(
     return result
 
 
+def kama_volatility(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    KAMA volatility: sum of |close - prev_close| over the last `period` bars.
+
+    Args:
+        close: Array of closing prices
+        period: Efficiency ratio period
+
+    Returns:
+        Array of volatility values with NaN for the first `period` elements
+    """
+    volatility = np.full(len(close), np.nan)
+    volatility[1:] = window.rolling_sum(np.abs(np.diff(close)), period)
+    return volatility
+
+
 def dx_loop(
     high: np.ndarray,
     low: np.ndarray,
@@ -0,0 +1,358 @@
+"""
+O(n) sliding-window kernels.
+
+Every kernel costs the same per element whatever the window length. The
+array is split into blocks of `period` elements, so a window ending at index
+i is the suffix of the previous block (the "head", empty when the window is
+block-aligned) followed by the prefix of the current block up to i (the
+"tail"). Prefix and suffix aggregates of each block are computed with one
+vectorized accumulate pass each (the van Herk/Gil-Werman scheme), and each
+window combines one head and one tail value.
+
+Besides being O(n), this keeps sums local: no accumulation runs over more
+than `period` elements, so long series of large KRW prices do not lose the
+precision that differences of global cumulative sums do. Variances merge the
+head and tail moments with Chan's parallel form of Welford's update instead
+of subtracting squared sums.
+
+All kernels return float64 arrays of the input length with NaN for the first
+``period - 1`` elements. A NaN input only affects the windows that contain it.
+"""
+
+import numpy as np
+
+# Rows of sliding windows handed to np.percentile at once (bounds memory to ~8 MB).
+_PERCENTILE_CHUNK_ELEMENTS = 1 << 20
+
+
+def _check_period(period: int) -> None:
+    if period < 1:
+        raise ValueError(f"period must be at least 1, got {period}")
+
+
+def _blocks(data: np.ndarray, period: int, fill: float) -> np.ndarray:
+    """Reshape data into rows of `period` elements, padding the last row with `fill`."""
+    n = len(data)
+    padded = np.full(-(-n // period) * period, fill)
+    padded[:n] = data
+    return padded.reshape(-1, period)
+
+
+def _window_bounds(n: int, period: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Window end indices, window start indices, and whether each window has a head."""
+    end = np.arange(period - 1, n)
+    start = end - period + 1
+    return end, start, start % period != 0
+
+
+def _prefix_suffix_sums(data: np.ndarray, period: int) -> tuple[np.ndarray, np.ndarray]:
+    """Running sums of each block from its start (prefix) and to its end (suffix)."""
+    n = len(data)
+    blocks = _blocks(data, period, 0.0)
+    prefix = np.cumsum(blocks, axis=1).ravel()[:n]
+    suffix = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].ravel()[:n]
+    return prefix, suffix
+
+
+def _head_tail_sums(data: np.ndarray, period: int) -> tuple[np.ndarray, np.ndarray]:
+    """Sum of the head and of the tail of every complete window."""
+    prefix, suffix = _prefix_suffix_sums(data, period)
+    end, start, has_head = _window_bounds(len(data), period)
+    return np.where(has_head, suffix[start], 0.0), prefix[end]
+
+
+def rolling_sum(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling sum.
+
+    Args:
+        data: Input data array
+        period: Window size
+
+    Returns:
+        Array of window sums with NaN for initial periods
+    """
+    _check_period(period)
+    data = np.asarray(data, dtype=np.float64)
+    n = len(data)
+    result = np.full(n, np.nan)
+
+    if n < period:
+        return result
+
+    head, tail = _head_tail_sums(data, period)
+    result[period - 1 :] = head + tail
+    return result
+
+
+def rolling_mean(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling mean.
+
+    Args:
+        data: Input data array
+        period: Window size
+
+    Returns:
+        Array of window means with NaN for initial periods
+    """
+    return rolling_sum(data, period) / period
+
+
+def rolling_var(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling variance (population).
+
+    Each block is centered on the mean of its finite values before squaring,
+    and head and tail moments are merged with Chan's update, so the result
+    stays accurate when the variance is tiny relative to the price level.
+
+    Args:
+        data: Input data array
+        period: Window size
+
+    Returns:
+        Array of rolling variances with NaN for initial periods
+    """
+    _check_period(period)
+    data = np.asarray(data, dtype=np.float64)
+    n = len(data)
+    result = np.full(n, np.nan)
+
+    if n < period:
+        return result
+
+    blocks = _blocks(data, period, np.nan)
+    finite = np.isfinite(blocks)
+    center = np.where(finite, blocks, 0.0).sum(axis=1) / np.maximum(finite.sum(axis=1), 1)
+    deviation = (blocks - center[:, None]).ravel()[:n]
+
+    head_sum, tail_sum = _head_tail_sums(deviation, period)
+    head_sq, tail_sq = _head_tail_sums(deviation * deviation, period)
+
+    end, start, has_head = _window_bounds(n, period)
+    tail_count = end % period + 1.0
+    head_count = period - tail_count
+    safe_head_count = np.maximum(head_count, 1.0)
+
+    tail_mean = tail_sum / tail_count
+    head_mean = head_sum / safe_head_count
+    tail_m2 = tail_sq - tail_sum * tail_mean
+    head_m2 = head_sq - head_sum * head_mean
+
+    # Means relative to each block's center; shift the head onto the tail's center.
+    block = end // period
+    center_shift = center[block] - center[np.maximum(block - 1, 0)]
+    delta = np.where(has_head, tail_mean + center_shift - head_mean, 0.0)
+
+    m2 = head_m2 + tail_m2 + delta * delta * head_count * tail_count / period
+    result[period - 1 :] = np.maximum(m2 / period, 0.0)
+    return result
+
+
+def rolling_std(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling standard deviation (population).
+
+    Args:
+        data: Input data array
+        period: Window size
+
+    Returns:
+        Array of rolling std values with NaN for initial periods
+    """
+    return np.sqrt(rolling_var(data, period))
+
+
+def rolling_weighted_sum(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling linearly weighted sum.
+
+    The oldest value of each window has weight 1 and the newest weight
+    `period`, as in WMA. Weights are kept relative to each block, so the
+    index offsets never grow with the series length.
+
+    Args:
+        data: Input data array
+        period: Window size
+
+    Returns:
+        Array of weighted window sums with NaN for initial periods
+    """
+    _check_period(period)
+    data = np.asarray(data, dtype=np.float64)
+    n = len(data)
+    result = np.full(n, np.nan)
+
+    if n < period:
+        return result
+
+    offset = np.arange(n) % period
+    head_sum, tail_sum = _head_tail_sums(data, period)
+    head_moment, tail_moment = _head_tail_sums(offset * data, period)
+
+    # Window start s has weight 1: a head element at block offset k weighs k - s % period + 1,
+    # a tail element at block offset k weighs k + head length + 1.
+    end, start, _ = _window_bounds(n, period)
+    head_length = period - 1.0 - end % period
+    head = head_moment - (start % period - 1.0) * head_sum
+    tail = tail_moment + (head_length + 1.0) * tail_sum
+    result[period - 1 :] = np.where(head_length > 0, head, 0.0) + tail
+    return result
+
+
+def _rolling_extreme(data: np.ndarray, period: int, accumulate: np.ufunc, fill: float) -> np.ndarray:
+    _check_period(period)
+    data = np.asarray(data, dtype=np.float64)
+    n = len(data)
+    result = np.full(n, np.nan)
+
+    if n < period:
+        return result
+
+    blocks = _blocks(data, period, fill)
+    prefix = accumulate.accumulate(blocks, axis=1).ravel()[:n]
+    suffix = accumulate.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()[:n]
+
+    # A block-aligned window's suffix is the whole window, so no head/tail split is needed.
+    end, start, _ = _window_bounds(n, period)
+    result[period - 1 :] = accumulate(suffix[start], prefix[end])
+    return result
+
+
+def rolling_max(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling maximum.
+
+    Args:
+        data: Input data array
+        period: Window size
+
+    Returns:
+        Array of window maxima with NaN for initial periods (NaN where the window holds NaN)
+    """
+    return _rolling_extreme(data, period, np.maximum, -np.inf)
+
+
+def rolling_min(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Rolling minimum.
+
+    Args:
+        data: Input data array
+        period: Window size
+
+    Returns:
+        Array of window minima with NaN for initial periods (NaN where the window holds NaN)
+    """
+    return _rolling_extreme(data, period, np.minimum, np.inf)
+
+
+def rolling_argmax(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Index of the rolling maximum.
+
+    Ties resolve to the most recent index.
+
+    Args:
+        data: Input data array
+        period: Window size
+
+    Returns:
+        Array of absolute indices (as float64) with NaN for initial periods
+        (NaN where the window holds NaN)
+    """
+    _check_period(period)
+    data = np.asarray(data, dtype=np.float64)
+    n = len(data)
+    result = np.full(n, np.nan)
+
+    if n < period:
+        return result
+
+    blocks = _blocks(data, period, -np.inf)
+    index = np.arange(blocks.size).reshape(blocks.shape)
+
+    # Prefix: the running maximum was last reached where a value equals it.
+    prefix = np.maximum.accumulate(blocks, axis=1)
+    prefix_index = np.maximum.accumulate(np.where(blocks == prefix, index, -1), axis=1)
+
+    # Suffix (scanning back from the block end): the maximum of [s, end] was set at the
+    # nearest index >= s holding a value above everything after it.
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1]
+    after = np.concatenate((suffix[:, 1:], np.full((len(blocks), 1), -np.inf)), axis=1)
+    marks = np.where(blocks > after, index, blocks.size)
+    suffix_index = np.minimum.accumulate(marks[:, ::-1], axis=1)[:, ::-1]
+
+    prefix, prefix_index = prefix.ravel()[:n], prefix_index.ravel()[:n]
+    suffix, suffix_index = suffix.ravel()[:n], suffix_index.ravel()[:n]
+    end, start, has_head = _window_bounds(n, period)
+    use_tail = ~has_head | (prefix[end] >= suffix[start])
+    # NaN propagates through the block maxima, so a window holds NaN exactly when its head or tail maximum is NaN.
+    has_nan = np.isnan(prefix[end]) | (has_head & np.isnan(suffix[start]))
+    result[period - 1 :] = np.where(has_nan, np.nan, np.where(use_tail, prefix_index[end], suffix_index[start]))
+    return result
+
+
+def rolling_argmin(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Index of the rolling minimum.
+
+    Ties resolve to the most recent index.
+
+    Args:
+        data: Input data array
+        period: Window size
+
+    Returns:
+        Array of absolute indices (as float64) with NaN for initial periods
+        (NaN where the window holds NaN)
+    """
+    return rolling_argmax(-np.asarray(data, dtype=np.float64), period)
+
+
+def rolling_percentile(data: np.ndarray, period: int, q: float) -> np.ndarray:
+    """
+    Rolling percentile with linear interpolation (as np.percentile).
+
+    Unlike the other kernels this is O(n * period): windows are partitioned
+    in C over a strided view, a bounded number of rows at a time.
+
+    Args:
+        data: Input data array
+        period: Window size
+        q: Percentile between 0 and 100
+
+    Returns:
+        Array of window percentiles with NaN for initial periods
+    """
+    _check_period(period)
+    if not 0 <= q <= 100:
+        raise ValueError(f"q must be between 0 and 100, got {q}")
+    data = np.asarray(data, dtype=np.float64)
+    n = len(data)
+    result = np.full(n, np.nan)
+
+    if n < period:
+        return result
+
+    windows = np.lib.stride_tricks.sliding_window_view(data, period)
+    rows = max(1, _PERCENTILE_CHUNK_ELEMENTS // period)
+    out = result[period - 1 :]
+    for first in range(0, len(windows), rows):
+        out[first : first + rows] = np.percentile(windows[first : first + rows], q, axis=1)
+    return result
+
+
+__all__ = [
+    "rolling_sum",
+    "rolling_mean",
+    "rolling_var",
+    "rolling_std",
+    "rolling_weighted_sum",
+    "rolling_max",
+    "rolling_min",
+    "rolling_argmax",
+    "rolling_argmin",
+    "rolling_percentile",
+]
@@ -16,7 +16,7 @@ Functions:
 
 import numpy as np
 
-from cluefin_ta._core import dx_loop, mfi_loop, rolling_minmax, wilder_smooth
+from cluefin_ta import _core
 from cluefin_ta.overlap import EMA
 
 
@@ -57,8 +57,8 @@ def RSI(close: np.ndarray, timeperiod: int = 14) -> np.ndarray:
         result[timeperiod] = 100.0 - (100.0 / (1.0 + rs))
 
     # Use Wilder's smoothing for gains and losses
-    smoothed_gains = wilder_smooth(gains, timeperiod, avg_gain, timeperiod - 1)
-    smoothed_losses = wilder_smooth(losses, timeperiod, avg_loss, timeperiod - 1)
+    smoothed_gains = _core.wilder_smooth(gains, timeperiod, avg_gain, timeperiod - 1)
+    smoothed_losses = _core.wilder_smooth(losses, timeperiod, avg_loss, timeperiod - 1)
 
     # Calculate RSI from smoothed values (starting from timeperiod+1)
     for i in range(timeperiod + 1, n):
@@ -121,6 +121,14 @@ def MACD(
     return macd, signal, hist
 
 
+def _stoch_k(close: np.ndarray, highest_high: np.ndarray, lowest_low: np.ndarray) -> np.ndarray:
+    """Fast %K from rolling extremes (50 where the window has no range, NaN during warm-up)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fastk = 100.0 * (close - lowest_low) / (highest_high - lowest_low)
+    # Neutral when no range
+    return np.where(highest_high == lowest_low, 50.0, fastk)
+
+
 def STOCH(
     high: np.ndarray,
     low: np.ndarray,
@@ -159,30 +167,15 @@ def STOCH(
         return slowk, slowd
 
     # Get rolling min/max
-    highest_high, lowest_low = rolling_minmax(high, low, fastk_period)
+    highest_high, lowest_low = _core.rolling_minmax(high, low, fastk_period)
 
     # Calculate Fast %K
-    fastk = np.full(n, np.nan)
-    for i in range(fastk_period - 1, n):
-        hh = highest_high[i]
-        ll = lowest_low[i]
+    fastk = _stoch_k(close, highest_high, lowest_low)
 
-        if hh != ll:
-            fastk[i] = 100.0 * (close[i] - ll) / (hh - ll)
-        else:
-            fastk[i] = 50.0  # Neutral when no range
-
-    # Calculate Slow %K (SMA of Fast %K) - ta-lib starts from first valid fastk
-    valid_start = fastk_period - 1
-    for i in range(valid_start + slowk_period - 1, n):
-        window = fastk[i - slowk_period + 1 : i + 1]
-        slowk[i] = np.mean(window)
-
-    # Calculate Slow %D (SMA of Slow %K)
-    slowk_start = valid_start + slowk_period - 1
-    for i in range(slowk_start + slowd_period - 1, n):
-        window = slowk[i - slowd_period + 1 : i + 1]
-        slowd[i] = np.mean(window)
+    # Calculate Slow %K (SMA of Fast %K) and Slow %D (SMA of Slow %K); warm-up NaNs
+    # only reach the windows that contain them, as ta-lib starts from the first valid value
+    slowk = _core.rolling_mean(fastk, slowk_period)
+    slowd = _core.rolling_mean(slowk, slowd_period)
 
     return slowk, slowd
 
@@ -216,18 +209,12 @@ def WILLR(
         return result
 
     # Get rolling min/max
-    highest_high, lowest_low = rolling_minmax(high, low, timeperiod)
+    highest_high, lowest_low = _core.rolling_minmax(high, low, timeperiod)
 
-    for i in range(timeperiod - 1, n):
-        hh = highest_high[i]
-        ll = lowest_low[i]
-
-        if hh != ll:
-            result[i] = -100.0 * (hh - close[i]) / (hh - ll)
-        else:
-            result[i] = -50.0  # Neutral when no range
-
-    return result
+    with np.errstate(divide="ignore", invalid="ignore"):
+        willr = -100.0 * (highest_high - close) / (highest_high - lowest_low)
+    # Neutral when no range
+    return np.where(highest_high == lowest_low, -50.0, willr)
 
 
 def STOCHF(
@@ -264,23 +251,13 @@ def STOCHF(
         return fastk, fastd
 
     # Get rolling min/max
-    highest_high, lowest_low = rolling_minmax(high, low, fastk_period)
+    highest_high, lowest_low = _core.rolling_minmax(high, low, fastk_period)
 
     # Calculate Fast %K
-    for i in range(fastk_period - 1, n):
-        hh = highest_high[i]
-        ll = lowest_low[i]
-
-        if hh != ll:
-            fastk[i] = 100.0 * (close[i] - ll) / (hh - ll)
-        else:
-            fastk[i] = 50.0  # Neutral when no range
+    fastk = _stoch_k(close, highest_high, lowest_low)
 
     # Calculate Fast %D (SMA of Fast %K)
-    valid_start = fastk_period - 1
-    for i in range(valid_start + fastd_period - 1, n):
-        window = fastk[i - fastd_period + 1 : i + 1]
-        fastd[i] = np.mean(window)
+    fastd = _core.rolling_mean(fastk, fastd_period)
 
     return fastk, fastd
 
@@ -428,7 +405,7 @@ def MFI(
     # Typical Price
     tp = (high + low + close) / 3.0
 
-    return mfi_loop(tp, volume, timeperiod)
+    return _core.mfi_loop(tp, volume, timeperiod)
 
 
 def ADX(
@@ -467,7 +444,7 @@ def ADX(
     prev_close[1:] = close[:-1]
 
     # Get +DI, -DI, DX
-    plus_di, minus_di, dx = dx_loop(high, low, prev_close, timeperiod)
+    plus_di, minus_di, dx = _core.dx_loop(high, low, prev_close, timeperiod)
 
     # ADX = Wilder smoothed average of DX
     # First ADX is the average of first 'period' DX values
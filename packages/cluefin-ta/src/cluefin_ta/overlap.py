@@ -13,7 +13,7 @@ Functions:
 
 import numpy as np
 
-from cluefin_ta._core import ema_loop, kama_loop, rolling_std
+from cluefin_ta import _core
 
 
 def SMA(close: np.ndarray, timeperiod: int = 30) -> np.ndarray:
@@ -29,16 +29,12 @@ def SMA(close: np.ndarray, timeperiod: int = 30) -> np.ndarray:
     """
     close = np.asarray(close, dtype=np.float64)
     n = len(close)
-    result = np.full(n, np.nan)
 
     if n < timeperiod:
-        return result
-
-    # Use cumsum for efficient calculation (already vectorized, no Numba needed)
-    cumsum = np.cumsum(np.insert(close, 0, 0))
-    result[timeperiod - 1 :] = (cumsum[timeperiod:] - cumsum[:-timeperiod]) / timeperiod
+        return np.full(n, np.nan)
 
-    return result
+    # O(n) block sums: no cumulative sum over the whole series, so no precision loss on long series
+    return _core.rolling_mean(close, timeperiod)
 
 
 def EMA(close: np.ndarray, timeperiod: int = 30) -> np.ndarray:
@@ -64,7 +60,7 @@ def EMA(close: np.ndarray, timeperiod: int = 30) -> np.ndarray:
     # Initialize with SMA for the first EMA value
     initial_sma = np.mean(close[:timeperiod])
 
-    return ema_loop(close, timeperiod, alpha, initial_sma)
+    return _core.ema_loop(close, timeperiod, alpha, initial_sma)
 
 
 def WMA(close: np.ndarray, timeperiod: int = 30) -> np.ndarray:
@@ -80,21 +76,14 @@ def WMA(close: np.ndarray, timeperiod: int = 30) -> np.ndarray:
     """
     close = np.asarray(close, dtype=np.float64)
     n = len(close)
-    result = np.full(n, np.nan)
 
     if n < timeperiod:
-        return result
-
-    # Create weights: 1, 2, 3, ..., timeperiod
-    weights = np.arange(1, timeperiod + 1, dtype=np.float64)
-    weight_sum = weights.sum()
+        return np.full(n, np.nan)
 
-    # Calculate WMA for each position
-    for i in range(timeperiod - 1, n):
-        window = close[i - timeperiod + 1 : i + 1]
-        result[i] = np.sum(window * weights) / weight_sum
+    # Weights 1, 2, 3, ..., timeperiod (newest heaviest)
+    weight_sum = timeperiod * (timeperiod + 1) / 2.0
 
-    return result
+    return _core.rolling_weighted_sum(close, timeperiod) / weight_sum
 
 
 def DEMA(close: np.ndarray, timeperiod: int = 30) -> np.ndarray:
@@ -204,7 +193,7 @@ def KAMA(close: np.ndarray, timeperiod: int = 30) -> np.ndarray:
     fast_sc = 2.0 / (2 + 1)  # 2 / 3
     slow_sc = 2.0 / (30 + 1)  # 2 / 31
 
-    return kama_loop(close, timeperiod, fast_sc, slow_sc)
+    return _core.kama_loop(close, timeperiod, fast_sc, slow_sc)
 
 
 def BBANDS(
@@ -238,7 +227,7 @@ def BBANDS(
     middle = SMA(close, timeperiod)
 
     # Calculate rolling standard deviation
-    std = rolling_std(close, timeperiod)
+    std = _core.rolling_std(close, timeperiod)
 
     upper = middle + nbdevup * std
     lower = middle - nbdevdn * std
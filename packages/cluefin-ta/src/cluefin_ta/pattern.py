@@ -12,44 +12,1026 @@ Functions:
     CDLMORNINGSTAR: Morning Star pattern (3-bar)
     CDLEVENINGSTAR: Evening Star pattern (3-bar)
     CDLDARKCLOUDCOVER: Dark Cloud Cover pattern (2-bar)
+    CDL2CROWS: Two Crows pattern (3-bar bearish reversal)
+    CDL3BLACKCROWS: Three Black Crows pattern (4-bar bearish reversal)
+    CDL3INSIDE: Three Inside Up/Down pattern (3-bar reversal)
+    CDL3LINESTRIKE: Three-Line Strike pattern (4-bar)
+    CDL3OUTSIDE: Three Outside Up/Down pattern (3-bar reversal)
+    CDL3STARSINSOUTH: Three Stars In The South pattern (3-bar bullish reversal)
+    CDL3WHITESOLDIERS: Three Advancing White Soldiers pattern (3-bar bullish reversal)
+    CDLABANDONEDBABY: Abandoned Baby pattern (3-bar reversal)
+    CDLADVANCEBLOCK: Advance Block pattern (3-bar bearish)
+    CDLBELTHOLD: Belt-hold pattern
+    CDLBREAKAWAY: Breakaway pattern (5-bar reversal)
+    CDLCLOSINGMARUBOZU: Closing Marubozu pattern
+    CDLCONCEALBABYSWALL: Concealing Baby Swallow pattern (4-bar bullish reversal)
+    CDLCOUNTERATTACK: Counterattack pattern (2-bar reversal)
+    CDLDOJISTAR: Doji Star pattern (2-bar reversal)
+    CDLDRAGONFLYDOJI: Dragonfly Doji pattern
+    CDLEVENINGDOJISTAR: Evening Doji Star pattern (3-bar bearish reversal)
+    CDLGAPSIDESIDEWHITE: Up/Down-gap Side-by-side White Lines pattern (3-bar continuation)
+    CDLGRAVESTONEDOJI: Gravestone Doji pattern
+    CDLHARAMICROSS: Harami Cross pattern (2-bar reversal)
+    CDLHIGHWAVE: High-Wave pattern
+    CDLHIKKAKE: Hikkake pattern (3-bar, with confirmation)
+    CDLHIKKAKEMOD: Modified Hikkake pattern (4-bar, with confirmation)
+    CDLHOMINGPIGEON: Homing Pigeon pattern (2-bar bullish reversal)
+    CDLIDENTICAL3CROWS: Identical Three Crows pattern (3-bar bearish reversal)
+    CDLINNECK: In-Neck pattern (2-bar bearish continuation)
+    CDLINVERTEDHAMMER: Inverted Hammer pattern (2-bar bullish reversal)
+    CDLKICKING: Kicking pattern (2-bar)
+    CDLKICKINGBYLENGTH: Kicking pattern, direction of the longer marubozu (2-bar)
+    CDLLADDERBOTTOM: Ladder Bottom pattern (5-bar bullish reversal)
+    CDLLONGLEGGEDDOJI: Long Legged Doji pattern
+    CDLLONGLINE: Long Line pattern
+    CDLMARUBOZU: Marubozu pattern
+    CDLMATCHINGLOW: Matching Low pattern (2-bar bullish reversal)
+    CDLMATHOLD: Mat Hold pattern (5-bar bullish continuation)
+    CDLMORNINGDOJISTAR: Morning Doji Star pattern (3-bar bullish reversal)
+    CDLONNECK: On-Neck pattern (2-bar bearish continuation)
+    CDLRICKSHAWMAN: Rickshaw Man pattern
+    CDLRISEFALL3METHODS: Rising/Falling Three Methods pattern (5-bar continuation)
+    CDLSEPARATINGLINES: Separating Lines pattern (2-bar continuation)
+    CDLSHORTLINE: Short Line pattern
+    CDLSPINNINGTOP: Spinning Top pattern
+    CDLSTALLEDPATTERN: Stalled pattern (3-bar bearish reversal)
+    CDLSTICKSANDWICH: Stick Sandwich pattern (3-bar bullish reversal)
+    CDLTAKURI: Takuri pattern (Dragonfly Doji with very long lower shadow)
+    CDLTASUKIGAP: Tasuki Gap pattern (3-bar continuation)
+    CDLTHRUSTING: Thrusting pattern (2-bar bearish continuation)
+    CDLTRISTAR: Tristar pattern (3-bar reversal)
+    CDLUNIQUE3RIVER: Unique 3 River pattern (3-bar bullish reversal)
+    CDLUPSIDEGAP2CROWS: Upside Gap Two Crows pattern (3-bar bearish reversal)
+    CDLXSIDEGAP3METHODS: Upside/Downside Gap Three Methods pattern (3-bar continuation)
+    CDL_ALL: Every pattern above in one pass
 
 All pattern functions return:
     +100: Bullish pattern
        0: No pattern
     -100: Bearish pattern
+CDLHARAMICROSS scores ±80 for a doji touching the first body, and
+CDLHIKKAKE / CDLHIKKAKEMOD return ±200 on the confirmation bar, as in TA-Lib.
+
+Patterns are evaluated on whole arrays: the per-candle features (body,
+range, shadows, direction) are computed once in `_CandleFeatures`, earlier
+candles are read through shifted copies of those arrays (`lag`), and each
+pattern combines boolean masks. `CDL_ALL` shares one feature set across
+every pattern.
+
+The patterns from CDL2CROWS on follow TA-Lib's rules: bodies and shadows are
+compared with TA-Lib's default candle settings (trailing averages of the
+preceding candles, see `_CANDLE_SETTINGS`), and the first candles up to
+TA-Lib's lookback are 0. The first ten patterns keep their fixed-ratio rules.
 """
 
+from typing import Callable, Iterable, Optional
+
 import numpy as np
 
+from cluefin_ta import _core
+
+# TA-Lib default candle settings: (range measured, averaging period, factor).
+# A setting's threshold is factor times the average range of the preceding
+# `period` candles ("shadows" averages half the summed shadows), or of the
+# candle itself when the period is 0.
+_CANDLE_SETTINGS: dict[str, tuple[str, int, float]] = {
+    "body_long": ("body", 10, 1.0),
+    "body_very_long": ("body", 10, 3.0),
+    "body_short": ("body", 10, 1.0),
+    "body_doji": ("range", 10, 0.1),
+    "shadow_long": ("body", 0, 1.0),
+    "shadow_very_long": ("body", 0, 2.0),
+    "shadow_short": ("shadows", 10, 1.0),
+    "shadow_very_short": ("range", 10, 0.1),
+    "near": ("range", 5, 0.2),
+    "far": ("range", 5, 0.6),
+    "equal": ("range", 5, 0.05),
+}
+
+
+class _CandleFeatures:
+    """Per-candle arrays shared by the pattern detectors.
+
+    ``lag(k)`` returns the same features shifted k candles back, so index i
+    describes candle i - k. Shifted-in slots hold NaN (False for masks), which
+    fails every comparison; detectors also clear their warm-up candles
+    explicitly.
+    """
+
+    def __init__(self, open_arr: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray):
+        self.open = np.asarray(open_arr, dtype=np.float64)
+        self.high = np.asarray(high, dtype=np.float64)
+        self.low = np.asarray(low, dtype=np.float64)
+        self.close = np.asarray(close, dtype=np.float64)
+        self.size = len(self.close)
+
+        self.body = np.abs(self.close - self.open)
+        self.range = self.high - self.low
+        self.body_high = np.maximum(self.open, self.close)
+        self.body_low = np.minimum(self.open, self.close)
+        self.upper_shadow = self.high - self.body_high
+        self.lower_shadow = self.body_low - self.low
+        self.bullish = self.close > self.open
+        self.bearish = self.close < self.open
+        # TA-Lib candle color: a candle with close == open counts as white
+        self.white = self.close >= self.open
+        self._lags: dict[int, "_CandleFeatures"] = {0: self}
+        self._averages: dict[str, np.ndarray] = {}
+        self._origin: Optional[tuple["_CandleFeatures", int]] = None
+
+    def lag(self, k: int) -> "_CandleFeatures":
+        """Features of the candle k bars back, aligned to the current index."""
+        lagged = self._lags.get(k)
+        if lagged is None:
+            lagged = object.__new__(_CandleFeatures)
+            lagged.size = self.size
+            lagged._lags = {0: lagged}
+            lagged._averages = {}
+            lagged._origin = (self, k)
+            for name, values in vars(self).items():
+                if isinstance(values, np.ndarray):
+                    setattr(lagged, name, _shift(values, k))
+            self._lags[k] = lagged
+        return lagged
+
+    def average(self, setting: str) -> np.ndarray:
+        """TA-Lib candle setting threshold of each candle (see `_CANDLE_SETTINGS`).
+
+        The average covers the candles before the one described, so on
+        ``lag(k)`` it ends k + 1 bars back, as TA-Lib's running totals do.
+        """
+        average = self._averages.get(setting)
+        if average is None:
+            if self._origin is not None:
+                origin, k = self._origin
+                average = _shift(origin.average(setting), k)
+            else:
+                kind, period, factor = _CANDLE_SETTINGS[setting]
+                values = {
+                    "body": self.body,
+                    "range": self.range,
+                    "shadows": self.upper_shadow + self.lower_shadow,
+                }[kind]
+                if period:
+                    values = _shift(_core.rolling_sum(values, period), 1) / period
+                average = factor * values / (2.0 if kind == "shadows" else 1.0)
+            self._averages[setting] = average
+        return average
+
+
+def _shift(values: np.ndarray, k: int) -> np.ndarray:
+    """Shift values k slots later, filling with NaN (False for masks)."""
+    shifted = np.full_like(values, False if values.dtype == np.bool_ else np.nan)
+    shifted[k:] = values[: max(len(values) - k, 0)]
+    return shifted
+
+
+def _lookback(*settings: str, candles: int = 1) -> int:
+    """TA-Lib lookback: longest averaging period of `settings` plus the earlier candles of the pattern."""
+    return max(_CANDLE_SETTINGS[setting][1] for setting in settings) + candles - 1
+
+
+def _signal(
+    size: int,
+    bullish: Optional[np.ndarray] = None,
+    bearish: Optional[np.ndarray] = None,
+    warmup: int = 0,
+    strength: int = 100,
+) -> np.ndarray:
+    """Combine pattern masks into a +strength / -strength / 0 array, zero for the first `warmup` candles."""
+    result = np.zeros(size, dtype=np.int32)
+    if bearish is not None:
+        result[bearish] = -strength
+    if bullish is not None:
+        result[bullish] = strength
+    result[:warmup] = 0
+    return result
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Elementwise quotient; division by zero yields inf/NaN without warnings."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return numerator / denominator
+
+
+def _hammer_shape(f: _CandleFeatures) -> np.ndarray:
+    """Lower shadow at least 2x the body, upper shadow at most 10% of the range."""
+    # A zero body counts as 0.1% of the range to keep the shadow ratio finite
+    body = np.where(f.body == 0, 0.001 * f.range, f.body)
+    lower_shadow_ratio = np.where(body > 0, _ratio(f.lower_shadow, body), 0.0)
+    upper_shadow_ratio = _ratio(f.upper_shadow, f.range)
+    return (f.range != 0) & (lower_shadow_ratio >= 2.0) & (upper_shadow_ratio <= 0.1)
+
+
+def _doji(f: _CandleFeatures) -> np.ndarray:
+    # Doji threshold: body should be at most 10% of the range; +100 as neutral (ta-lib convention)
+    return _signal(f.size, bullish=(f.range != 0) & (_ratio(f.body, f.range) <= 0.1))
+
+
+def _hammer(f: _CandleFeatures) -> np.ndarray:
+    return _signal(f.size, bullish=_hammer_shape(f))
+
+
+def _hangingman(f: _CandleFeatures) -> np.ndarray:
+    # Same shape as the hammer; bearish reversal signal when at top
+    return _signal(f.size, bearish=_hammer_shape(f))
+
+
+def _shootingstar(f: _CandleFeatures) -> np.ndarray:
+    # Opposite of the hammer: long upper shadow, lower shadow at most 10% of the range
+    body = np.where(f.body == 0, 0.001 * f.range, f.body)
+    upper_shadow_ratio = np.where(body > 0, _ratio(f.upper_shadow, body), 0.0)
+    lower_shadow_ratio = _ratio(f.lower_shadow, f.range)
+    return _signal(f.size, bearish=(f.range != 0) & (upper_shadow_ratio >= 2.0) & (lower_shadow_ratio <= 0.1))
+
+
+def _engulfing(f: _CandleFeatures) -> np.ndarray:
+    prev = f.lag(1)
+    engulfs = (f.body_high > prev.body_high) & (f.body_low < prev.body_low)
+    return _signal(
+        f.size,
+        bullish=engulfs & ~prev.bullish & f.bullish,
+        bearish=engulfs & prev.bullish & ~f.bullish,
+        warmup=1,
+    )
+
+
+def _harami(f: _CandleFeatures) -> np.ndarray:
+    prev = f.lag(1)
+    contained = (f.body_high < prev.body_high) & (f.body_low > prev.body_low)
+    return _signal(
+        f.size,
+        bullish=contained & ~prev.bullish & f.bullish,
+        bearish=contained & prev.bullish & ~f.bullish,
+        warmup=1,
+    )
+
+
+def _piercing(f: _CandleFeatures) -> np.ndarray:
+    prev = f.lag(1)
+    # Opens below the previous low, closes above the previous body midpoint but below its open
+    midpoint = prev.close + (prev.body / 2)
+    pattern = prev.bearish & f.bullish & (f.open < prev.low) & (f.close > midpoint) & (f.close < prev.open)
+    return _signal(f.size, bullish=pattern, warmup=1)
+
+
+def _darkcloudcover(f: _CandleFeatures) -> np.ndarray:
+    prev = f.lag(1)
+    # Opens above the previous high, closes below the previous body midpoint but above its open
+    midpoint = prev.open + (prev.body / 2)
+    pattern = prev.bullish & f.bearish & (f.open > prev.high) & (f.close < midpoint) & (f.close > prev.open)
+    return _signal(f.size, bearish=pattern, warmup=1)
+
+
+def _star(f: _CandleFeatures, bullish: bool) -> np.ndarray:
+    """Morning star (bullish) or evening star mask, written as negated rejections like the scalar rules."""
+    first, star = f.lag(2), f.lag(1)
+    midpoint = (first.open + first.close) / 2
+    # First candle has a substantial body (>= 50% of range); star body within 30% of it
+    pattern = (first.range != 0) & ~(_ratio(first.body, first.range) < 0.5) & ~(star.body > first.body * 0.3)
+    # Third candle has a substantial body
+    pattern &= ~(f.body < first.body * 0.5)
+    if bullish:
+        # Gap down, then a bullish candle closing above the first midpoint
+        return pattern & first.bearish & ~(star.body_high >= first.close) & f.bullish & ~(f.close <= midpoint)
+    # Gap up, then a bearish candle closing below the first midpoint
+    return pattern & first.bullish & ~(star.body_low <= first.close) & f.bearish & ~(f.close >= midpoint)
+
+
+def _morningstar(f: _CandleFeatures) -> np.ndarray:
+    return _signal(f.size, bullish=_star(f, bullish=True), warmup=2)
+
+
+def _eveningstar(f: _CandleFeatures) -> np.ndarray:
+    return _signal(f.size, bearish=_star(f, bullish=False), warmup=2)
+
 
-def _body_size(open_price: float, close_price: float) -> float:
-    """Calculate the body size of a candle."""
-    return abs(close_price - open_price)
+# TA-Lib patterns. Each mirrors TA-Lib's rule for one candle, written over the
+# whole array; candle settings are compared through `average`, and the warm-up
+# is TA-Lib's lookback.
 
 
-def _upper_shadow(high: float, open_price: float, close_price: float) -> float:
-    """Calculate the upper shadow of a candle."""
-    return high - max(open_price, close_price)
+def _body_gap_up(later: _CandleFeatures, earlier: _CandleFeatures) -> np.ndarray:
+    return later.body_low > earlier.body_high
 
 
-def _lower_shadow(low: float, open_price: float, close_price: float) -> float:
-    """Calculate the lower shadow of a candle."""
-    return min(open_price, close_price) - low
+def _body_gap_down(later: _CandleFeatures, earlier: _CandleFeatures) -> np.ndarray:
+    return later.body_high < earlier.body_low
 
 
-def _candle_range(high: float, low: float) -> float:
-    """Calculate the full range of a candle."""
-    return high - low
+def _candle_gap_up(later: _CandleFeatures, earlier: _CandleFeatures) -> np.ndarray:
+    return later.low > earlier.high
 
 
-def _is_bullish(open_price: float, close_price: float) -> bool:
-    """Check if a candle is bullish (close > open)."""
-    return close_price > open_price
+def _candle_gap_down(later: _CandleFeatures, earlier: _CandleFeatures) -> np.ndarray:
+    return later.high < earlier.low
 
 
-def _is_bearish(open_price: float, close_price: float) -> bool:
-    """Check if a candle is bearish (close < open)."""
-    return close_price < open_price
+def _near(values: np.ndarray, reference: np.ndarray, tolerance: np.ndarray) -> np.ndarray:
+    """Values within `tolerance` of `reference`, bounds included."""
+    return (values <= reference + tolerance) & (values >= reference - tolerance)
+
+
+def _shaven(c: _CandleFeatures) -> np.ndarray:
+    """Both shadows very short (marubozu shape, any body)."""
+    return (c.upper_shadow < c.average("shadow_very_short")) & (c.lower_shadow < c.average("shadow_very_short"))
+
+
+def _long_marubozu(c: _CandleFeatures) -> np.ndarray:
+    return (c.body > c.average("body_long")) & _shaven(c)
+
+
+def _colored(f: _CandleFeatures, pattern: np.ndarray, white: np.ndarray, warmup: int) -> np.ndarray:
+    """+100 where the pattern's deciding candle is white, -100 where it is black."""
+    return _signal(f.size, bullish=pattern & white, bearish=pattern & ~white, warmup=warmup)
+
+
+def _twocrows(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = (
+        c2.white
+        & (c2.body > c2.average("body_long"))
+        & ~c1.white
+        & _body_gap_up(c1, c2)
+        # Opens within the second body, closes within the first
+        & ~f.white
+        & (f.open < c1.open)
+        & (f.open > c1.close)
+        & (f.close > c2.open)
+        & (f.close < c2.close)
+    )
+    return _signal(f.size, bearish=pattern, warmup=_lookback("body_long", candles=3))
+
+
+def _threeblackcrows(f: _CandleFeatures) -> np.ndarray:
+    c3, c2, c1 = f.lag(3), f.lag(2), f.lag(1)
+    pattern = c3.white & (c3.high > c2.close)
+    for c in (c2, c1, f):
+        pattern &= ~c.white & (c.lower_shadow < c.average("shadow_very_short"))
+    # Each crow opens within the previous body and closes lower
+    pattern &= (c1.open < c2.open) & (c1.open > c2.close) & (f.open < c1.open) & (f.open > c1.close)
+    pattern &= (c2.close > c1.close) & (c1.close > f.close)
+    return _signal(f.size, bearish=pattern, warmup=_lookback("shadow_very_short", candles=4))
+
+
+def _threeinside(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    harami = (
+        (c2.body > c2.average("body_long"))
+        & (c1.body <= c1.average("body_short"))
+        & (c1.body_high < c2.body_high)
+        & (c1.body_low > c2.body_low)
+    )
+    return _signal(
+        f.size,
+        bullish=harami & ~c2.white & f.white & (f.close > c2.open),
+        bearish=harami & c2.white & ~f.white & (f.close < c2.open),
+        warmup=_lookback("body_short", "body_long", candles=3),
+    )
+
+
+def _threelinestrike(f: _CandleFeatures) -> np.ndarray:
+    c3, c2, c1 = f.lag(3), f.lag(2), f.lag(1)
+    # Three same-colored candles, each opening within or near the previous body
+    pattern = (c3.white == c2.white) & (c2.white == c1.white) & (f.white != c1.white)
+    pattern &= (c2.open >= c3.body_low - c3.average("near")) & (c2.open <= c3.body_high + c3.average("near"))
+    pattern &= (c1.open >= c2.body_low - c2.average("near")) & (c1.open <= c2.body_high + c2.average("near"))
+    # The fourth candle opens beyond the third close and strikes back past the first open
+    rising = c1.white & (c1.close > c2.close) & (c2.close > c3.close) & (f.open > c1.close) & (f.close < c3.open)
+    falling = ~c1.white & (c1.close < c2.close) & (c2.close < c3.close) & (f.open < c1.close) & (f.close > c3.open)
+    return _signal(f.size, bullish=pattern & rising, bearish=pattern & falling, warmup=_lookback("near", candles=4))
+
+
+def _threeoutside(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    return _signal(
+        f.size,
+        bullish=c1.white & ~c2.white & (c1.close > c2.open) & (c1.open < c2.close) & (f.close > c1.close),
+        bearish=~c1.white & c2.white & (c1.open > c2.close) & (c1.close < c2.open) & (f.close < c1.close),
+        warmup=3,
+    )
+
+
+def _threestarsinsouth(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = ~c2.white & ~c1.white & ~f.white
+    # Long body with a long lower shadow
+    pattern &= (c2.body > c2.average("body_long")) & (c2.lower_shadow > c2.average("shadow_long"))
+    # Smaller candle opening within the first range, low above the first low, with a lower shadow
+    pattern &= (
+        (c1.body < c2.body)
+        & (c1.open > c2.close)
+        & (c1.open <= c2.high)
+        & (c1.low < c2.close)
+        & (c1.low >= c2.low)
+        & (c1.lower_shadow > c1.average("shadow_very_short"))
+    )
+    # Small shaven marubozu engulfed by the second range
+    pattern &= (f.body < f.average("body_short")) & _shaven(f) & (f.low > c1.low) & (f.high < c1.high)
+    return _signal(
+        f.size,
+        bullish=pattern,
+        warmup=_lookback("shadow_very_short", "shadow_long", "body_long", "body_short", candles=3),
+    )
+
+
+def _threewhitesoldiers(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = (f.close > c1.close) & (c1.close > c2.close)
+    for c in (c2, c1, f):
+        pattern &= c.white & (c.upper_shadow < c.average("shadow_very_short"))
+    # Each opens within or near the previous body, with a body not far shorter
+    pattern &= (c1.open > c2.open) & (c1.open <= c2.close + c2.average("near"))
+    pattern &= (f.open > c1.open) & (f.open <= c1.close + c1.average("near"))
+    pattern &= (c1.body > c2.body - c2.average("far")) & (f.body > c1.body - c1.average("far"))
+    pattern &= f.body > f.average("body_short")
+    return _signal(
+        f.size,
+        bullish=pattern,
+        warmup=_lookback("shadow_very_short", "body_short", "far", "near", candles=3),
+    )
+
+
+def _abandonedbaby(f: _CandleFeatures, penetration: float = 0.3) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = (
+        (c2.body > c2.average("body_long")) & (c1.body <= c1.average("body_doji")) & (f.body > f.average("body_short"))
+    )
+    # The doji gaps away from both neighbours; the third candle closes well into the first body
+    bearish = (
+        c2.white
+        & ~f.white
+        & (f.close < c2.close - c2.body * penetration)
+        & _candle_gap_up(c1, c2)
+        & _candle_gap_down(f, c1)
+    )
+    bullish = (
+        ~c2.white
+        & f.white
+        & (f.close > c2.close + c2.body * penetration)
+        & _candle_gap_down(c1, c2)
+        & _candle_gap_up(f, c1)
+    )
+    return _signal(
+        f.size,
+        bullish=pattern & bullish,
+        bearish=pattern & bearish,
+        warmup=_lookback("body_doji", "body_long", "body_short", candles=3),
+    )
+
+
+def _advanceblock(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    advance = (
+        c2.white
+        & c1.white
+        & f.white
+        & (f.close > c1.close)
+        & (c1.close > c2.close)
+        & (c1.open > c2.open)
+        & (c1.open <= c2.close + c2.average("near"))
+        & (f.open > c1.open)
+        & (f.open <= c1.close + c1.average("near"))
+        & (c2.body > c2.average("body_long"))
+        & (c2.upper_shadow < c2.average("shadow_short"))
+    )
+    # Signs of weakening: shrinking bodies or growing upper shadows
+    weakening = (
+        ((c1.body < c2.body - c2.average("far")) & (f.body < c1.body + c1.average("near")))
+        | (f.body < c1.body - c1.average("far"))
+        | (
+            (f.body < c1.body)
+            & (c1.body < c2.body)
+            & ((f.upper_shadow > f.average("shadow_short")) | (c1.upper_shadow > c1.average("shadow_short")))
+        )
+        | ((f.body < c1.body) & (f.upper_shadow > f.average("shadow_long")))
+    )
+    return _signal(
+        f.size,
+        bearish=advance & weakening,
+        warmup=_lookback("shadow_long", "shadow_short", "far", "near", "body_long", candles=3),
+    )
+
+
+def _belthold(f: _CandleFeatures) -> np.ndarray:
+    long_body = f.body > f.average("body_long")
+    shadow_very_short = f.average("shadow_very_short")
+    return _signal(
+        f.size,
+        bullish=long_body & f.white & (f.lower_shadow < shadow_very_short),
+        bearish=long_body & ~f.white & (f.upper_shadow < shadow_very_short),
+        warmup=_lookback("body_long", "shadow_very_short"),
+    )
+
+
+def _breakaway(f: _CandleFeatures) -> np.ndarray:
+    c4, c3, c2, c1 = f.lag(4), f.lag(3), f.lag(2), f.lag(1)
+    pattern = (
+        (c4.body > c4.average("body_long")) & (c4.white == c3.white) & (c3.white == c1.white) & (c1.white != f.white)
+    )
+    # Gap in the trend direction, two more candles extending it, then a close inside the gap
+    bullish = (
+        ~c4.white
+        & _body_gap_down(c3, c4)
+        & (c2.high < c3.high)
+        & (c2.low < c3.low)
+        & (c1.high < c2.high)
+        & (c1.low < c2.low)
+        & (f.close > c3.open)
+        & (f.close < c4.close)
+    )
+    bearish = (
+        c4.white
+        & _body_gap_up(c3, c4)
+        & (c2.high > c3.high)
+        & (c2.low > c3.low)
+        & (c1.high > c2.high)
+        & (c1.low > c2.low)
+        & (f.close < c3.open)
+        & (f.close > c4.close)
+    )
+    return _signal(
+        f.size, bullish=pattern & bullish, bearish=pattern & bearish, warmup=_lookback("body_long", candles=5)
+    )
+
+
+def _closingmarubozu(f: _CandleFeatures) -> np.ndarray:
+    long_body = f.body > f.average("body_long")
+    shadow_very_short = f.average("shadow_very_short")
+    return _signal(
+        f.size,
+        bullish=long_body & f.white & (f.upper_shadow < shadow_very_short),
+        bearish=long_body & ~f.white & (f.lower_shadow < shadow_very_short),
+        warmup=_lookback("body_long", "shadow_very_short"),
+    )
+
+
+def _concealbabyswall(f: _CandleFeatures) -> np.ndarray:
+    c3, c2, c1 = f.lag(3), f.lag(2), f.lag(1)
+    pattern = ~c3.white & ~c2.white & ~c1.white & ~f.white & _shaven(c3) & _shaven(c2)
+    # Third candle gaps down but its upper shadow reaches into the second body
+    pattern &= _body_gap_down(c1, c2) & (c1.upper_shadow > c1.average("shadow_very_short")) & (c1.high > c2.close)
+    # Fourth candle engulfs the third, shadows included
+    pattern &= (f.high > c1.high) & (f.low < c1.low)
+    return _signal(f.size, bullish=pattern, warmup=_lookback("shadow_very_short", candles=4))
+
+
+def _counterattack(f: _CandleFeatures) -> np.ndarray:
+    c1 = f.lag(1)
+    pattern = (
+        (c1.white != f.white)
+        & (c1.body > c1.average("body_long"))
+        & (f.body > f.average("body_long"))
+        & _near(f.close, c1.close, c1.average("equal"))
+    )
+    return _colored(f, pattern, f.white, _lookback("equal", "body_long", candles=2))
+
+
+def _dojistar(f: _CandleFeatures) -> np.ndarray:
+    c1 = f.lag(1)
+    pattern = (c1.body > c1.average("body_long")) & (f.body <= f.average("body_doji"))
+    return _signal(
+        f.size,
+        bullish=pattern & ~c1.white & _body_gap_down(f, c1),
+        bearish=pattern & c1.white & _body_gap_up(f, c1),
+        warmup=_lookback("body_doji", "body_long", candles=2),
+    )
+
+
+def _dragonflydoji(f: _CandleFeatures) -> np.ndarray:
+    shadow_very_short = f.average("shadow_very_short")
+    pattern = (
+        (f.body <= f.average("body_doji")) & (f.upper_shadow < shadow_very_short) & (f.lower_shadow > shadow_very_short)
+    )
+    return _signal(f.size, bullish=pattern, warmup=_lookback("body_doji", "shadow_very_short"))
+
+
+def _eveningdojistar(f: _CandleFeatures, penetration: float = 0.3) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = (
+        (c2.body > c2.average("body_long"))
+        & c2.white
+        & (c1.body <= c1.average("body_doji"))
+        & _body_gap_up(c1, c2)
+        & (f.body > f.average("body_short"))
+        & ~f.white
+        & (f.close < c2.close - c2.body * penetration)
+    )
+    return _signal(f.size, bearish=pattern, warmup=_lookback("body_doji", "body_long", "body_short", candles=3))
+
+
+def _gapsidesidewhite(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    # Two white candles of similar size and open, both beyond a gap from the first candle
+    pattern = (
+        c1.white & f.white & _near(f.body, c1.body, c1.average("near")) & _near(f.open, c1.open, c1.average("equal"))
+    )
+    return _signal(
+        f.size,
+        bullish=pattern & _body_gap_up(c1, c2) & _body_gap_up(f, c2),
+        bearish=pattern & _body_gap_down(c1, c2) & _body_gap_down(f, c2),
+        warmup=_lookback("near", "equal", candles=3),
+    )
+
+
+def _gravestonedoji(f: _CandleFeatures) -> np.ndarray:
+    shadow_very_short = f.average("shadow_very_short")
+    pattern = (
+        (f.body <= f.average("body_doji")) & (f.lower_shadow < shadow_very_short) & (f.upper_shadow > shadow_very_short)
+    )
+    return _signal(f.size, bullish=pattern, warmup=_lookback("body_doji", "shadow_very_short"))
+
+
+def _haramicross(f: _CandleFeatures) -> np.ndarray:
+    c1 = f.lag(1)
+    pattern = (c1.body > c1.average("body_long")) & (f.body <= f.average("body_doji"))
+    inside = (f.body_high < c1.body_high) & (f.body_low > c1.body_low)
+    # A doji touching the edge of the first body scores 80 instead of 100
+    touching = (f.body_high <= c1.body_high) & (f.body_low >= c1.body_low) & ~inside
+    warmup = _lookback("body_doji", "body_long", candles=2)
+    return _signal(
+        f.size, bullish=pattern & inside & ~c1.white, bearish=pattern & inside & c1.white, warmup=warmup
+    ) + _signal(
+        f.size,
+        bullish=pattern & touching & ~c1.white,
+        bearish=pattern & touching & c1.white,
+        warmup=warmup,
+        strength=80,
+    )
+
+
+def _highwave(f: _CandleFeatures) -> np.ndarray:
+    shadow_very_long = f.average("shadow_very_long")
+    pattern = (
+        (f.body < f.average("body_short")) & (f.upper_shadow > shadow_very_long) & (f.lower_shadow > shadow_very_long)
+    )
+    return _colored(f, pattern, f.white, _lookback("body_short", "shadow_very_long"))
+
+
+def _hikkake_signal(f: _CandleFeatures, bullish: np.ndarray, bearish: np.ndarray, warmup: int) -> np.ndarray:
+    """
+    ±100 on each hikkake bar, ±200 on the bar confirming it.
+
+    A hikkake is confirmed by the first of the next three closes beyond the
+    high (bullish) or low (bearish) of the candle before it, unless a newer
+    hikkake appears first. Each offset is resolved for all pending patterns at
+    once, so the loop runs three times whatever the series length.
+    """
+    setup = bullish | bearish
+    result = _signal(f.size, bullish=bullish, bearish=bearish)
+    pending = setup.copy()
+    for offset in (1, 2, 3):
+        start = np.flatnonzero(pending[: max(f.size - offset, 0)])
+        end = start + offset
+        superseded = setup[end]
+        pending[start[superseded]] = False
+        start, end = start[~superseded], end[~superseded]
+
+        up = bullish[start]
+        confirmed = np.where(up, f.close[end] > f.high[start - 1], f.close[end] < f.low[start - 1])
+        result[end[confirmed]] = np.where(up[confirmed], 200, -200)
+        pending[start[confirmed]] = False
+    result[:warmup] = 0
+    return result
+
+
+def _hikkake(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    inside_bar = (c1.high < c2.high) & (c1.low > c2.low)
+    return _hikkake_signal(
+        f,
+        bullish=inside_bar & (f.high < c1.high) & (f.low < c1.low),
+        bearish=inside_bar & (f.high > c1.high) & (f.low > c1.low),
+        warmup=5,
+    )
+
+
+def _hikkakemod(f: _CandleFeatures) -> np.ndarray:
+    c3, c2, c1 = f.lag(3), f.lag(2), f.lag(1)
+    # Two nested inside bars; the second candle closes near the end the breakout fails from
+    inside_bars = (c2.high < c3.high) & (c2.low > c3.low) & (c1.high < c2.high) & (c1.low > c2.low)
+    near = c2.average("near")
+    return _hikkake_signal(
+        f,
+        bullish=inside_bars & (f.high < c1.high) & (f.low < c1.low) & (c2.close <= c2.low + near),
+        bearish=inside_bars & (f.high > c1.high) & (f.low > c1.low) & (c2.close >= c2.high - near),
+        warmup=_lookback("near", candles=6),
+    )
+
+
+def _homingpigeon(f: _CandleFeatures) -> np.ndarray:
+    c1 = f.lag(1)
+    pattern = (
+        ~c1.white
+        & ~f.white
+        & (c1.body > c1.average("body_long"))
+        & (f.body <= f.average("body_short"))
+        & (f.open < c1.open)
+        & (f.close > c1.close)
+    )
+    return _signal(f.size, bullish=pattern, warmup=_lookback("body_short", "body_long", candles=2))
+
+
+def _identicalthreecrows(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = (c2.close > c1.close) & (c1.close > f.close)
+    for c in (c2, c1, f):
+        pattern &= ~c.white & (c.lower_shadow < c.average("shadow_very_short"))
+    # Each crow opens at (about) the previous close
+    pattern &= _near(c1.open, c2.close, c2.average("equal")) & _near(f.open, c1.close, c1.average("equal"))
+    return _signal(f.size, bearish=pattern, warmup=_lookback("shadow_very_short", "equal", candles=3))
+
+
+def _neck(f: _CandleFeatures) -> tuple[_CandleFeatures, np.ndarray]:
+    """Previous candle and the shared start of the neck lines: long black, then white opening below its low."""
+    c1 = f.lag(1)
+    return c1, ~c1.white & (c1.body > c1.average("body_long")) & f.white & (f.open < c1.low)
+
+
+def _inneck(f: _CandleFeatures) -> np.ndarray:
+    c1, pattern = _neck(f)
+    pattern &= (f.close <= c1.close + c1.average("equal")) & (f.close >= c1.close)
+    return _signal(f.size, bearish=pattern, warmup=_lookback("equal", "body_long", candles=2))
+
+
+def _invertedhammer(f: _CandleFeatures) -> np.ndarray:
+    c1 = f.lag(1)
+    pattern = (
+        (f.body < f.average("body_short"))
+        & (f.upper_shadow > f.average("shadow_long"))
+        & (f.lower_shadow < f.average("shadow_very_short"))
+        & _body_gap_down(f, c1)
+    )
+    return _signal(
+        f.size, bullish=pattern, warmup=_lookback("body_short", "shadow_long", "shadow_very_short", candles=2)
+    )
+
+
+def _kicking_pattern(f: _CandleFeatures) -> tuple[_CandleFeatures, np.ndarray]:
+    """Previous candle and the kicking mask: opposite marubozu gapping away from each other."""
+    c1 = f.lag(1)
+    gap = np.where(c1.white, _candle_gap_down(f, c1), _candle_gap_up(f, c1))
+    return c1, (c1.white != f.white) & _long_marubozu(c1) & _long_marubozu(f) & gap
+
+
+def _kicking(f: _CandleFeatures) -> np.ndarray:
+    _, pattern = _kicking_pattern(f)
+    return _colored(f, pattern, f.white, _lookback("shadow_very_short", "body_long", candles=2))
+
+
+def _kickingbylength(f: _CandleFeatures) -> np.ndarray:
+    c1, pattern = _kicking_pattern(f)
+    # The longer marubozu decides the direction
+    longer_white = np.where(f.body > c1.body, f.white, c1.white)
+    return _colored(f, pattern, longer_white, _lookback("shadow_very_short", "body_long", candles=2))
+
+
+def _ladderbottom(f: _CandleFeatures) -> np.ndarray:
+    c4, c3, c2, c1 = f.lag(4), f.lag(3), f.lag(2), f.lag(1)
+    # Three black candles with consecutively lower opens and closes
+    pattern = (
+        ~c4.white
+        & ~c3.white
+        & ~c2.white
+        & (c4.open > c3.open)
+        & (c3.open > c2.open)
+        & (c4.close > c3.close)
+        & (c3.close > c2.close)
+    )
+    # A black candle with an upper shadow, then a white candle opening above its body and closing above its high
+    pattern &= ~c1.white & (c1.upper_shadow > c1.average("shadow_very_short"))
+    pattern &= f.white & (f.open > c1.open) & (f.close > c1.high)
+    return _signal(f.size, bullish=pattern, warmup=_lookback("shadow_very_short", candles=5))
+
+
+def _longleggeddoji(f: _CandleFeatures) -> np.ndarray:
+    shadow_long = f.average("shadow_long")
+    pattern = (f.body <= f.average("body_doji")) & ((f.lower_shadow > shadow_long) | (f.upper_shadow > shadow_long))
+    return _signal(f.size, bullish=pattern, warmup=_lookback("body_doji", "shadow_long"))
+
+
+def _longline(f: _CandleFeatures) -> np.ndarray:
+    shadow_short = f.average("shadow_short")
+    pattern = (f.body > f.average("body_long")) & (f.upper_shadow < shadow_short) & (f.lower_shadow < shadow_short)
+    return _colored(f, pattern, f.white, _lookback("body_long", "shadow_short"))
+
+
+def _marubozu(f: _CandleFeatures) -> np.ndarray:
+    return _colored(f, _long_marubozu(f), f.white, _lookback("body_long", "shadow_very_short"))
+
+
+def _matchinglow(f: _CandleFeatures) -> np.ndarray:
+    c1 = f.lag(1)
+    pattern = ~c1.white & ~f.white & _near(f.close, c1.close, c1.average("equal"))
+    return _signal(f.size, bullish=pattern, warmup=_lookback("equal", candles=2))
+
+
+def _mathold(f: _CandleFeatures, penetration: float = 0.5) -> np.ndarray:
+    c4, c3, c2, c1 = f.lag(4), f.lag(3), f.lag(2), f.lag(1)
+    # Long white candle, then three small candles, the first black and gapping up
+    pattern = (c4.body > c4.average("body_long")) & c4.white & ~c3.white & f.white & _body_gap_up(c3, c4)
+    for c in (c3, c2, c1):
+        pattern &= c.body < c.average("body_short")
+    # The reaction holds within the first body and keeps falling
+    floor = c4.close - c4.body * penetration
+    pattern &= (c2.body_low < c4.close) & (c1.body_low < c4.close) & (c2.body_low > floor) & (c1.body_low > floor)
+    pattern &= (c2.body_high < c3.open) & (c1.body_high < c2.body_high)
+    # A white candle resumes the trend above the reaction highs
+    pattern &= (f.open > c1.close) & (f.close > np.maximum(np.maximum(c3.high, c2.high), c1.high))
+    return _signal(f.size, bullish=pattern, warmup=_lookback("body_short", "body_long", candles=5))
+
+
+def _morningdojistar(f: _CandleFeatures, penetration: float = 0.3) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = (
+        (c2.body > c2.average("body_long"))
+        & ~c2.white
+        & (c1.body <= c1.average("body_doji"))
+        & _body_gap_down(c1, c2)
+        & (f.body > f.average("body_short"))
+        & f.white
+        & (f.close > c2.close + c2.body * penetration)
+    )
+    return _signal(f.size, bullish=pattern, warmup=_lookback("body_doji", "body_long", "body_short", candles=3))
+
+
+def _onneck(f: _CandleFeatures) -> np.ndarray:
+    c1, pattern = _neck(f)
+    pattern &= _near(f.close, c1.low, c1.average("equal"))
+    return _signal(f.size, bearish=pattern, warmup=_lookback("equal", "body_long", candles=2))
+
+
+def _rickshawman(f: _CandleFeatures) -> np.ndarray:
+    shadow_long = f.average("shadow_long")
+    near = f.average("near")
+    midpoint = f.low + f.range / 2
+    pattern = (
+        (f.body <= f.average("body_doji"))
+        & (f.lower_shadow > shadow_long)
+        & (f.upper_shadow > shadow_long)
+        # Body near the middle of the range
+        & (f.body_low <= midpoint + near)
+        & (f.body_high >= midpoint - near)
+    )
+    return _signal(f.size, bullish=pattern, warmup=_lookback("body_doji", "shadow_long", "near"))
+
+
+def _risefallthreemethods(f: _CandleFeatures) -> np.ndarray:
+    c4, c3, c2, c1 = f.lag(4), f.lag(3), f.lag(2), f.lag(1)
+    pattern = (c4.body > c4.average("body_long")) & (f.body > f.average("body_long"))
+    pattern &= (c4.white != c3.white) & (c3.white == c2.white) & (c2.white == c1.white) & (c1.white != f.white)
+    # Three small counter-trend candles with bodies within the first range
+    for c in (c3, c2, c1):
+        pattern &= (c.body < c.average("body_short")) & (c.body_low < c4.high) & (c.body_high > c4.low)
+    # Oriented so larger means further along the trend of the first candle
+    trend = np.where(c4.white, 1.0, -1.0)
+    pattern &= (c2.close * trend < c3.close * trend) & (c1.close * trend < c2.close * trend)
+    pattern &= (f.open * trend > c1.close * trend) & (f.close * trend > c4.close * trend)
+    return _colored(f, pattern, c4.white, _lookback("body_short", "body_long", candles=5))
+
+
+def _separatinglines(f: _CandleFeatures) -> np.ndarray:
+    c1 = f.lag(1)
+    shadow_very_short = f.average("shadow_very_short")
+    pattern = (c1.white != f.white) & _near(f.open, c1.open, c1.average("equal")) & (f.body > f.average("body_long"))
+    return _signal(
+        f.size,
+        bullish=pattern & f.white & (f.lower_shadow < shadow_very_short),
+        bearish=pattern & ~f.white & (f.upper_shadow < shadow_very_short),
+        warmup=_lookback("shadow_very_short", "body_long", "equal", candles=2),
+    )
+
+
+def _shortline(f: _CandleFeatures) -> np.ndarray:
+    shadow_short = f.average("shadow_short")
+    pattern = (f.body < f.average("body_short")) & (f.upper_shadow < shadow_short) & (f.lower_shadow < shadow_short)
+    return _colored(f, pattern, f.white, _lookback("body_short", "shadow_short"))
+
+
+def _spinningtop(f: _CandleFeatures) -> np.ndarray:
+    pattern = (f.body < f.average("body_short")) & (f.upper_shadow > f.body) & (f.lower_shadow > f.body)
+    return _colored(f, pattern, f.white, _lookback("body_short"))
+
+
+def _stalledpattern(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = c2.white & c1.white & f.white & (f.close > c1.close) & (c1.close > c2.close)
+    # Two long white candles, the second opening within or near the first body
+    pattern &= (c2.body > c2.average("body_long")) & (c1.body > c1.average("body_long"))
+    pattern &= (c1.upper_shadow < c1.average("shadow_very_short")) & (c1.open > c2.open)
+    pattern &= c1.open <= c2.close + c2.average("near")
+    # A small candle riding on the shoulder of the second
+    pattern &= (f.body < f.average("body_short")) & (f.open >= c1.close - f.body - c1.average("near"))
+    return _signal(
+        f.size,
+        bearish=pattern,
+        warmup=_lookback("body_long", "body_short", "shadow_very_short", "near", candles=3),
+    )
+
+
+def _sticksandwich(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = ~c2.white & c1.white & ~f.white & (c1.low > c2.close) & _near(f.close, c2.close, c2.average("equal"))
+    return _signal(f.size, bullish=pattern, warmup=_lookback("equal", candles=3))
+
+
+def _takuri(f: _CandleFeatures) -> np.ndarray:
+    pattern = (
+        (f.body <= f.average("body_doji"))
+        & (f.upper_shadow < f.average("shadow_very_short"))
+        & (f.lower_shadow > f.average("shadow_very_long"))
+    )
+    return _signal(f.size, bullish=pattern, warmup=_lookback("body_doji", "shadow_very_short", "shadow_very_long"))
+
+
+def _tasukigap(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    # The third candle opens within the second body and closes inside the gap; similar body sizes
+    similar = np.abs(c1.body - f.body) < c1.average("near")
+    bullish = (
+        _body_gap_up(c1, c2)
+        & c1.white
+        & ~f.white
+        & (f.open < c1.close)
+        & (f.open > c1.open)
+        & (f.close < c1.open)
+        & (f.close > c2.body_high)
+    )
+    bearish = (
+        _body_gap_down(c1, c2)
+        & ~c1.white
+        & f.white
+        & (f.open < c1.open)
+        & (f.open > c1.close)
+        & (f.close > c1.open)
+        & (f.close < c2.body_low)
+    )
+    return _signal(f.size, bullish=bullish & similar, bearish=bearish & similar, warmup=_lookback("near", candles=3))
+
+
+def _thrusting(f: _CandleFeatures) -> np.ndarray:
+    c1, pattern = _neck(f)
+    # Closes into the first body, but not above its midpoint
+    pattern &= (f.close > c1.close + c1.average("equal")) & (f.close <= c1.close + c1.body * 0.5)
+    return _signal(f.size, bearish=pattern, warmup=_lookback("equal", "body_long", candles=2))
+
+
+def _tristar(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    # TA-Lib measures all three dojis against the average before the first
+    body_doji = c2.average("body_doji")
+    pattern = (c2.body <= body_doji) & (c1.body <= body_doji) & (f.body <= body_doji)
+    return _signal(
+        f.size,
+        bullish=pattern & _body_gap_down(c1, c2) & (f.body_low > c1.body_low),
+        bearish=pattern & _body_gap_up(c1, c2) & (f.body_high < c1.body_high),
+        warmup=_lookback("body_doji", candles=3),
+    )
+
+
+def _uniquethreeriver(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = (c2.body > c2.average("body_long")) & ~c2.white
+    # Black harami with a lower low, then a small white candle opening above that low
+    pattern &= ~c1.white & (c1.close > c2.close) & (c1.open <= c2.open) & (c1.low < c2.low)
+    pattern &= (f.body < f.average("body_short")) & f.white & (f.open > c1.low)
+    return _signal(f.size, bullish=pattern, warmup=_lookback("body_short", "body_long", candles=3))
+
+
+def _upsidegaptwocrows(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    pattern = (
+        c2.white
+        & (c2.body > c2.average("body_long"))
+        & ~c1.white
+        & (c1.body <= c1.average("body_short"))
+        & _body_gap_up(c1, c2)
+        # Engulfs the first crow but closes above the first candle
+        & ~f.white
+        & (f.open > c1.open)
+        & (f.close < c1.close)
+        & (f.close > c2.close)
+    )
+    return _signal(f.size, bearish=pattern, warmup=_lookback("body_short", "body_long", candles=3))
+
+
+def _xsidegapthreemethods(f: _CandleFeatures) -> np.ndarray:
+    c2, c1 = f.lag(2), f.lag(1)
+    # Opposite candle opening within the second body and closing within the first
+    pattern = (
+        (c2.white == c1.white)
+        & (c1.white != f.white)
+        & (f.open < c1.body_high)
+        & (f.open > c1.body_low)
+        & (f.close < c2.body_high)
+        & (f.close > c2.body_low)
+    )
+    return _signal(
+        f.size,
+        bullish=pattern & c2.white & _body_gap_up(c1, c2),
+        bearish=pattern & ~c2.white & _body_gap_down(c1, c2),
+        warmup=2,
+    )
 
 
 def CDLDOJI(
@@ -73,31 +1055,7 @@ def CDLDOJI(
     Returns:
         Array with +100 (bullish doji), -100 (bearish doji), or 0 (no pattern)
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
-
-    result = np.zeros(n, dtype=np.int32)
-
-    # Doji threshold: body should be less than 10% of the range
-    doji_threshold = 0.1
-
-    for i in range(n):
-        candle_range = _candle_range(high[i], low[i])
-
-        if candle_range == 0:
-            continue
-
-        body = _body_size(open_arr[i], close[i])
-        body_ratio = body / candle_range
-
-        if body_ratio <= doji_threshold:
-            # Doji detected - return +100 as neutral (ta-lib convention)
-            result[i] = 100
-
-    return result
+    return _doji(_CandleFeatures(open_arr, high, low, close))
 
 
 def CDLHAMMER(
@@ -123,39 +1081,7 @@ def CDLHAMMER(
     Returns:
         Array with +100 (hammer), or 0 (no pattern)
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
-
-    result = np.zeros(n, dtype=np.int32)
-
-    for i in range(n):
-        candle_range = _candle_range(high[i], low[i])
-
-        if candle_range == 0:
-            continue
-
-        body = _body_size(open_arr[i], close[i])
-        lower_shadow = _lower_shadow(low[i], open_arr[i], close[i])
-        upper_shadow = _upper_shadow(high[i], open_arr[i], close[i])
-
-        # Hammer criteria:
-        # 1. Lower shadow at least 2x the body
-        # 2. Upper shadow very small (less than 10% of range)
-        # 3. Body in upper portion of range
-
-        if body == 0:
-            body = 0.001 * candle_range  # Prevent division by zero
-
-        lower_shadow_ratio = lower_shadow / body if body > 0 else 0
-        upper_shadow_ratio = upper_shadow / candle_range
-
-        if lower_shadow_ratio >= 2.0 and upper_shadow_ratio <= 0.1:
-            result[i] = 100
-
-    return result
+    return _hammer(_CandleFeatures(open_arr, high, low, close))
 
 
 def CDLENGULFING(
@@ -182,42 +1108,7 @@ def CDLENGULFING(
     Returns:
         Array with +100 (bullish engulfing), -100 (bearish engulfing), or 0 (no pattern)
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
-
-    result = np.zeros(n, dtype=np.int32)
-
-    if n < 2:
-        return result
-
-    for i in range(1, n):
-        prev_open = open_arr[i - 1]
-        prev_close = close[i - 1]
-        curr_open = open_arr[i]
-        curr_close = close[i]
-
-        prev_is_bullish = prev_close > prev_open
-        curr_is_bullish = curr_close > curr_open
-
-        prev_body_high = max(prev_open, prev_close)
-        prev_body_low = min(prev_open, prev_close)
-        curr_body_high = max(curr_open, curr_close)
-        curr_body_low = min(curr_open, curr_close)
-
-        # Bullish Engulfing: prev bearish, curr bullish, curr engulfs prev
-        if not prev_is_bullish and curr_is_bullish:
-            if curr_body_high > prev_body_high and curr_body_low < prev_body_low:
-                result[i] = 100
-
-        # Bearish Engulfing: prev bullish, curr bearish, curr engulfs prev
-        elif prev_is_bullish and not curr_is_bullish:
-            if curr_body_high > prev_body_high and curr_body_low < prev_body_low:
-                result[i] = -100
-
-    return result
+    return _engulfing(_CandleFeatures(open_arr, high, low, close))
 
 
 def CDLSHOOTINGSTAR(
@@ -244,39 +1135,7 @@ def CDLSHOOTINGSTAR(
     Returns:
         Array with -100 (shooting star), or 0 (no pattern)
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
-
-    result = np.zeros(n, dtype=np.int32)
-
-    for i in range(n):
-        candle_range = _candle_range(high[i], low[i])
-
-        if candle_range == 0:
-            continue
-
-        body = _body_size(open_arr[i], close[i])
-        lower_shadow = _lower_shadow(low[i], open_arr[i], close[i])
-        upper_shadow = _upper_shadow(high[i], open_arr[i], close[i])
-
-        # Shooting Star criteria (opposite of hammer):
-        # 1. Upper shadow at least 2x the body
-        # 2. Lower shadow very small (less than 10% of range)
-        # 3. Body in lower portion of range
-
-        if body == 0:
-            body = 0.001 * candle_range  # Prevent division by zero
-
-        upper_shadow_ratio = upper_shadow / body if body > 0 else 0
-        lower_shadow_ratio = lower_shadow / candle_range
-
-        if upper_shadow_ratio >= 2.0 and lower_shadow_ratio <= 0.1:
-            result[i] = -100
-
-    return result
+    return _shootingstar(_CandleFeatures(open_arr, high, low, close))
 
 
 def CDLHANGINGMAN(
@@ -306,39 +1165,7 @@ def CDLHANGINGMAN(
     Returns:
         Array with -100 (hanging man), or 0 (no pattern)
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
-
-    result = np.zeros(n, dtype=np.int32)
-
-    for i in range(n):
-        candle_range = _candle_range(high[i], low[i])
-
-        if candle_range == 0:
-            continue
-
-        body = _body_size(open_arr[i], close[i])
-        lower_shadow = _lower_shadow(low[i], open_arr[i], close[i])
-        upper_shadow = _upper_shadow(high[i], open_arr[i], close[i])
-
-        # Hanging Man has same shape as hammer
-        # 1. Lower shadow at least 2x the body
-        # 2. Upper shadow very small (less than 10% of range)
-
-        if body == 0:
-            body = 0.001 * candle_range
-
-        lower_shadow_ratio = lower_shadow / body if body > 0 else 0
-        upper_shadow_ratio = upper_shadow / candle_range
-
-        if lower_shadow_ratio >= 2.0 and upper_shadow_ratio <= 0.1:
-            # Return -100 as it's a bearish reversal signal when at top
-            result[i] = -100
-
-    return result
+    return _hangingman(_CandleFeatures(open_arr, high, low, close))
 
 
 def CDLHARAMI(
@@ -365,43 +1192,7 @@ def CDLHARAMI(
     Returns:
         Array with +100 (bullish harami), -100 (bearish harami), or 0 (no pattern)
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
-
-    result = np.zeros(n, dtype=np.int32)
-
-    if n < 2:
-        return result
-
-    for i in range(1, n):
-        prev_open = open_arr[i - 1]
-        prev_close = close[i - 1]
-        curr_open = open_arr[i]
-        curr_close = close[i]
-
-        prev_is_bullish = _is_bullish(prev_open, prev_close)
-        curr_is_bullish = _is_bullish(curr_open, curr_close)
-
-        prev_body_high = max(prev_open, prev_close)
-        prev_body_low = min(prev_open, prev_close)
-        curr_body_high = max(curr_open, curr_close)
-        curr_body_low = min(curr_open, curr_close)
-
-        # Check if current body is contained within previous body
-        is_contained = curr_body_high < prev_body_high and curr_body_low > prev_body_low
-
-        if is_contained:
-            # Bullish Harami: prev bearish, curr bullish
-            if not prev_is_bullish and curr_is_bullish:
-                result[i] = 100
-            # Bearish Harami: prev bullish, curr bearish
-            elif prev_is_bullish and not curr_is_bullish:
-                result[i] = -100
-
-    return result
+    return _harami(_CandleFeatures(open_arr, high, low, close))
 
 
 def CDLPIERCING(
@@ -427,41 +1218,7 @@ def CDLPIERCING(
     Returns:
         Array with +100 (piercing line), or 0 (no pattern)
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
-
-    result = np.zeros(n, dtype=np.int32)
-
-    if n < 2:
-        return result
-
-    for i in range(1, n):
-        prev_open = open_arr[i - 1]
-        prev_close = close[i - 1]
-        curr_open = open_arr[i]
-        curr_close = close[i]
-
-        prev_is_bearish = _is_bearish(prev_open, prev_close)
-        curr_is_bullish = _is_bullish(curr_open, curr_close)
-
-        if not prev_is_bearish or not curr_is_bullish:
-            continue
-
-        prev_body = _body_size(prev_open, prev_close)
-        prev_midpoint = prev_close + (prev_body / 2)  # For bearish: close < open
-
-        # Piercing Line criteria:
-        # 1. Previous candle is bearish
-        # 2. Current candle is bullish
-        # 3. Current opens below previous low
-        # 4. Current closes above midpoint of previous body but below previous open
-        if curr_open < low[i - 1] and curr_close > prev_midpoint and curr_close < prev_open:
-            result[i] = 100
-
-    return result
+    return _piercing(_CandleFeatures(open_arr, high, low, close))
 
 
 def CDLMORNINGSTAR(
@@ -487,89 +1244,99 @@ def CDLMORNINGSTAR(
     Returns:
         Array with +100 (morning star), or 0 (no pattern)
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
+    return _morningstar(_CandleFeatures(open_arr, high, low, close))
 
-    result = np.zeros(n, dtype=np.int32)
 
-    if n < 3:
-        return result
+def CDLEVENINGSTAR(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Evening Star Pattern (3-bar bearish reversal).
 
-    for i in range(2, n):
-        # Day 1 (first): Large bearish candle
-        day1_open = open_arr[i - 2]
-        day1_close = close[i - 2]
-        day1_body = _body_size(day1_open, day1_close)
-        day1_range = _candle_range(high[i - 2], low[i - 2])
-        day1_is_bearish = _is_bearish(day1_open, day1_close)
+    A three-candle pattern indicating a potential bearish reversal:
+    1. First candle: Large bullish candle
+    2. Second candle: Small body (star) that gaps up from first
+    3. Third candle: Large bearish candle that closes below first candle's midpoint
 
-        # Day 2 (star): Small body
-        day2_open = open_arr[i - 1]
-        day2_close = close[i - 1]
-        day2_body = _body_size(day2_open, day2_close)
-        day2_body_high = max(day2_open, day2_close)
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
 
-        # Day 3 (current): Large bullish candle
-        day3_open = open_arr[i]
-        day3_close = close[i]
-        day3_body = _body_size(day3_open, day3_close)
-        day3_is_bullish = _is_bullish(day3_open, day3_close)
+    Returns:
+        Array with -100 (evening star), or 0 (no pattern)
+    """
+    return _eveningstar(_CandleFeatures(open_arr, high, low, close))
 
-        if day1_range == 0:
-            continue
 
-        # Criteria:
-        # 1. Day 1 is bearish with substantial body (> 50% of range)
-        # 2. Day 2 has small body (< 30% of day 1 body) and gaps down
-        # 3. Day 3 is bullish and closes above day 1 midpoint
+def CDLDARKCLOUDCOVER(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Dark Cloud Cover Pattern (2-bar bearish reversal).
 
-        day1_midpoint = (day1_open + day1_close) / 2
-        day1_body_ratio = day1_body / day1_range
+    A two-candle bearish reversal pattern:
+    1. First candle: Large bullish candle
+    2. Second candle: Opens above first's high (gap up), closes below first's midpoint
 
-        # Check day 1 is substantial bearish
-        if not day1_is_bearish or day1_body_ratio < 0.5:
-            continue
+    This is the bearish counterpart to the Piercing Line pattern.
 
-        # Check day 2 is small body (star) and gaps down
-        if day2_body > day1_body * 0.3:
-            continue
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
 
-        # Gap down check: day2 body high should be below day1 close
-        if day2_body_high >= day1_close:
-            continue
+    Returns:
+        Array with -100 (dark cloud cover), or 0 (no pattern)
+    """
+    return _darkcloudcover(_CandleFeatures(open_arr, high, low, close))
 
-        # Check day 3 is bullish and closes above day 1 midpoint
-        if not day3_is_bullish:
-            continue
 
-        if day3_close <= day1_midpoint:
-            continue
+def CDL2CROWS(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Two Crows Pattern (3-bar bearish reversal).
 
-        # Day 3 should have substantial body
-        if day3_body < day1_body * 0.5:
-            continue
+    1. First candle: Long white candle
+    2. Second candle: Black candle whose body gaps up
+    3. Third candle: Black candle opening within the second body and
+       closing within the first body
 
-        result[i] = 100
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
 
-    return result
+    Returns:
+        Array with -100 (two crows), or 0 (no pattern)
+    """
+    return _twocrows(_CandleFeatures(open_arr, high, low, close))
 
 
-def CDLEVENINGSTAR(
+def CDL3BLACKCROWS(
     open_arr: np.ndarray,
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
 ) -> np.ndarray:
     """
-    Evening Star Pattern (3-bar bearish reversal).
+    Three Black Crows Pattern (4-bar bearish reversal).
 
-    A three-candle pattern indicating a potential bearish reversal:
-    1. First candle: Large bullish candle
-    2. Second candle: Small body (star) that gaps up from first
-    3. Third candle: Large bearish candle that closes below first candle's midpoint
+    After a white candle, three black candles with very short lower shadows,
+    each opening within the previous body and closing lower.
 
     Args:
         open_arr: Array of opening prices
@@ -578,92 +1345,123 @@ def CDLEVENINGSTAR(
         close: Array of closing prices
 
     Returns:
-        Array with -100 (evening star), or 0 (no pattern)
+        Array with -100 (three black crows), or 0 (no pattern)
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
+    return _threeblackcrows(_CandleFeatures(open_arr, high, low, close))
 
-    result = np.zeros(n, dtype=np.int32)
 
-    if n < 3:
-        return result
-
-    for i in range(2, n):
-        # Day 1 (first): Large bullish candle
-        day1_open = open_arr[i - 2]
-        day1_close = close[i - 2]
-        day1_body = _body_size(day1_open, day1_close)
-        day1_range = _candle_range(high[i - 2], low[i - 2])
-        day1_is_bullish = _is_bullish(day1_open, day1_close)
+def CDL3INSIDE(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Three Inside Up/Down Pattern (3-bar reversal).
 
-        # Day 2 (star): Small body
-        day2_open = open_arr[i - 1]
-        day2_close = close[i - 1]
-        day2_body = _body_size(day2_open, day2_close)
-        day2_body_low = min(day2_open, day2_close)
+    A harami (long candle followed by a short candle inside its body)
+    confirmed by a third candle closing beyond the first candle's open.
 
-        # Day 3 (current): Large bearish candle
-        day3_open = open_arr[i]
-        day3_close = close[i]
-        day3_body = _body_size(day3_open, day3_close)
-        day3_is_bearish = _is_bearish(day3_open, day3_close)
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
 
-        if day1_range == 0:
-            continue
+    Returns:
+        Array with +100 (three inside up), -100 (three inside down), or 0 (no pattern)
+    """
+    return _threeinside(_CandleFeatures(open_arr, high, low, close))
 
-        # Criteria:
-        # 1. Day 1 is bullish with substantial body (> 50% of range)
-        # 2. Day 2 has small body (< 30% of day 1 body) and gaps up
-        # 3. Day 3 is bearish and closes below day 1 midpoint
 
-        day1_midpoint = (day1_open + day1_close) / 2
-        day1_body_ratio = day1_body / day1_range
+def CDL3LINESTRIKE(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Three-Line Strike Pattern (4-bar).
 
-        # Check day 1 is substantial bullish
-        if not day1_is_bullish or day1_body_ratio < 0.5:
-            continue
+    Three candles of the same color, each opening within or near the previous
+    body and closing further along the trend, followed by an opposite candle
+    that opens beyond the third close and closes back past the first open.
 
-        # Check day 2 is small body (star) and gaps up
-        if day2_body > day1_body * 0.3:
-            continue
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
 
-        # Gap up check: day2 body low should be above day1 close
-        if day2_body_low <= day1_close:
-            continue
+    Returns:
+        Array with +100 (three white candles struck down), -100 (three black candles struck up),
+        or 0 (no pattern)
+    """
+    return _threelinestrike(_CandleFeatures(open_arr, high, low, close))
 
-        # Check day 3 is bearish and closes below day 1 midpoint
-        if not day3_is_bearish:
-            continue
 
-        if day3_close >= day1_midpoint:
-            continue
+def CDL3OUTSIDE(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Three Outside Up/Down Pattern (3-bar reversal).
 
-        # Day 3 should have substantial body
-        if day3_body < day1_body * 0.5:
-            continue
+    An engulfing pattern confirmed by a third candle closing beyond the
+    engulfing candle's close.
 
-        result[i] = -100
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
 
-    return result
+    Returns:
+        Array with +100 (three outside up), -100 (three outside down), or 0 (no pattern)
+    """
+    return _threeoutside(_CandleFeatures(open_arr, high, low, close))
 
 
-def CDLDARKCLOUDCOVER(
+def CDL3STARSINSOUTH(
     open_arr: np.ndarray,
     high: np.ndarray,
     low: np.ndarray,
     close: np.ndarray,
 ) -> np.ndarray:
     """
-    Dark Cloud Cover Pattern (2-bar bearish reversal).
+    Three Stars In The South Pattern (3-bar bullish reversal).
 
-    A two-candle bearish reversal pattern:
-    1. First candle: Large bullish candle
-    2. Second candle: Opens above first's high (gap up), closes below first's midpoint
+    1. First candle: Long black candle with a long lower shadow
+    2. Second candle: Smaller black candle opening within the first range,
+       with a higher low and a lower shadow
+    3. Third candle: Small black marubozu inside the second candle's range
 
-    This is the bearish counterpart to the Piercing Line pattern.
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (three stars in the south), or 0 (no pattern)
+    """
+    return _threestarsinsouth(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDL3WHITESOLDIERS(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Three Advancing White Soldiers Pattern (3-bar bullish reversal).
+
+    Three white candles with very short upper shadows and consecutively higher
+    closes, each opening within or near the previous body, none much shorter
+    than the one before.
 
     Args:
         open_arr: Array of opening prices
@@ -672,43 +1470,1178 @@ def CDLDARKCLOUDCOVER(
         close: Array of closing prices
 
     Returns:
-        Array with -100 (dark cloud cover), or 0 (no pattern)
+        Array with +100 (three white soldiers), or 0 (no pattern)
+    """
+    return _threewhitesoldiers(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLABANDONEDBABY(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float = 0.3,
+) -> np.ndarray:
     """
-    open_arr = np.asarray(open_arr, dtype=np.float64)
-    high = np.asarray(high, dtype=np.float64)
-    low = np.asarray(low, dtype=np.float64)
-    close = np.asarray(close, dtype=np.float64)
-    n = len(close)
+    Abandoned Baby Pattern (3-bar reversal).
 
-    result = np.zeros(n, dtype=np.int32)
+    1. First candle: Long candle
+    2. Second candle: Doji whose whole range gaps away from the first candle
+    3. Third candle: Opposite candle gapping away from the doji and closing
+       well into the first body
 
-    if n < 2:
-        return result
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+        penetration: Fraction of the first candle's body the last close must reach into (default 0.3)
 
-    for i in range(1, n):
-        prev_open = open_arr[i - 1]
-        prev_close = close[i - 1]
-        curr_open = open_arr[i]
-        curr_close = close[i]
+    Returns:
+        Array with +100 (bullish abandoned baby), -100 (bearish abandoned baby), or 0 (no pattern)
+    """
+    return _abandonedbaby(_CandleFeatures(open_arr, high, low, close), penetration)
 
-        prev_is_bullish = _is_bullish(prev_open, prev_close)
-        curr_is_bearish = _is_bearish(curr_open, curr_close)
 
-        if not prev_is_bullish or not curr_is_bearish:
-            continue
+def CDLADVANCEBLOCK(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Advance Block Pattern (3-bar bearish).
 
-        prev_body = _body_size(prev_open, prev_close)
-        prev_midpoint = prev_open + (prev_body / 2)  # For bullish: open < close
+    Three advancing white candles, the first long, that show weakening: shrinking
+    bodies or lengthening upper shadows.
 
-        # Dark Cloud Cover criteria:
-        # 1. Previous candle is bullish
-        # 2. Current candle is bearish
-        # 3. Current opens above previous high (gap up)
-        # 4. Current closes below midpoint of previous body but above previous open
-        if curr_open > high[i - 1] and curr_close < prev_midpoint and curr_close > prev_open:
-            result[i] = -100
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
 
-    return result
+    Returns:
+        Array with -100 (advance block), or 0 (no pattern)
+    """
+    return _advanceblock(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLBELTHOLD(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Belt-hold Pattern.
+
+    A long candle opening at its extreme: a white candle with a very short
+    lower shadow or a black candle with a very short upper shadow.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (bullish belt-hold), -100 (bearish belt-hold), or 0 (no pattern)
+    """
+    return _belthold(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLBREAKAWAY(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Breakaway Pattern (5-bar reversal).
+
+    1. First candle: Long candle
+    2. Second candle: Same color, body gapping in the trend direction
+    3. Third and fourth candles: Extend the trend with higher (lower) highs
+       and lows, the fourth of the same color
+    4. Fifth candle: Opposite color, closing inside the gap
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (bullish breakaway), -100 (bearish breakaway), or 0 (no pattern)
+    """
+    return _breakaway(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLCLOSINGMARUBOZU(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Closing Marubozu Pattern.
+
+    A long candle with no shadow at its close: a white candle with a very short
+    upper shadow or a black candle with a very short lower shadow.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (white closing marubozu), -100 (black closing marubozu), or 0 (no pattern)
+    """
+    return _closingmarubozu(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLCONCEALBABYSWALL(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Concealing Baby Swallow Pattern (4-bar bullish reversal).
+
+    1. First and second candles: Black marubozu
+    2. Third candle: Black candle gapping down whose upper shadow reaches into
+       the second body
+    3. Fourth candle: Black candle engulfing the third, shadows included
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (concealing baby swallow), or 0 (no pattern)
+    """
+    return _concealbabyswall(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLCOUNTERATTACK(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Counterattack Pattern (2-bar reversal).
+
+    Two long candles of opposite color closing at the same price.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (bullish counterattack), -100 (bearish counterattack), or 0 (no pattern)
+    """
+    return _counterattack(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLDOJISTAR(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Doji Star Pattern (2-bar reversal).
+
+    A long candle followed by a doji whose body gaps in the trend direction.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (after a black candle), -100 (after a white candle), or 0 (no pattern)
+    """
+    return _dojistar(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLDRAGONFLYDOJI(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Dragonfly Doji Pattern.
+
+    A doji with a very short upper shadow and a lower shadow that is not very short.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (dragonfly doji), or 0 (no pattern)
+    """
+    return _dragonflydoji(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLEVENINGDOJISTAR(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float = 0.3,
+) -> np.ndarray:
+    """
+    Evening Doji Star Pattern (3-bar bearish reversal).
+
+    1. First candle: Long white candle
+    2. Second candle: Doji whose body gaps up
+    3. Third candle: Black candle closing well into the first body
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+        penetration: Fraction of the first candle's body the last close must reach into (default 0.3)
+
+    Returns:
+        Array with -100 (evening doji star), or 0 (no pattern)
+    """
+    return _eveningdojistar(_CandleFeatures(open_arr, high, low, close), penetration)
+
+
+def CDLGAPSIDESIDEWHITE(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Up/Down-gap Side-by-side White Lines Pattern (3-bar continuation).
+
+    Two white candles of similar size opening at about the same price, both
+    with bodies beyond a gap from the first candle.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (upside gap), -100 (downside gap), or 0 (no pattern)
+    """
+    return _gapsidesidewhite(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLGRAVESTONEDOJI(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Gravestone Doji Pattern.
+
+    A doji with a very short lower shadow and an upper shadow that is not very short.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (gravestone doji, ta-lib convention), or 0 (no pattern)
+    """
+    return _gravestonedoji(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLHARAMICROSS(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Harami Cross Pattern (2-bar reversal).
+
+    A long candle followed by a doji within its body. A doji touching the
+    edge of the first body scores 80 instead of 100.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100/+80 (after a black candle), -100/-80 (after a white candle), or 0 (no pattern)
+    """
+    return _haramicross(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLHIGHWAVE(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    High-Wave Candle Pattern.
+
+    A short body with very long upper and lower shadows.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (white high-wave), -100 (black high-wave), or 0 (no pattern)
+    """
+    return _highwave(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLHIKKAKE(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Hikkake Pattern (3-bar, with confirmation).
+
+    An inside bar followed by a candle breaking out of it with a lower high and
+    lower low (bullish) or higher high and higher low (bearish). A close beyond
+    the inside bar's high (low) within the next three bars confirms the pattern.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100/-100 on the pattern bar, +200/-200 on the confirmation bar,
+        or 0 (no pattern)
+    """
+    return _hikkake(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLHIKKAKEMOD(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Modified Hikkake Pattern (4-bar, with confirmation).
+
+    Like the hikkake, but with two nested inside bars and the second candle
+    closing near its low (bullish) or high (bearish).
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100/-100 on the pattern bar, +200/-200 on the confirmation bar,
+        or 0 (no pattern)
+    """
+    return _hikkakemod(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLHOMINGPIGEON(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Homing Pigeon Pattern (2-bar bullish reversal).
+
+    A long black candle followed by a short black candle inside its body.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (homing pigeon), or 0 (no pattern)
+    """
+    return _homingpigeon(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLIDENTICAL3CROWS(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Identical Three Crows Pattern (3-bar bearish reversal).
+
+    Three black candles with very short lower shadows and lower closes, each
+    opening at about the previous close.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with -100 (identical three crows), or 0 (no pattern)
+    """
+    return _identicalthreecrows(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLINNECK(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    In-Neck Pattern (2-bar bearish continuation).
+
+    A long black candle followed by a white candle opening below its low and
+    closing at or slightly above its close.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with -100 (in-neck), or 0 (no pattern)
+    """
+    return _inneck(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLINVERTEDHAMMER(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Inverted Hammer Pattern (2-bar bullish reversal).
+
+    A small body gapping down with a long upper shadow and a very short lower shadow.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (inverted hammer), or 0 (no pattern)
+    """
+    return _invertedhammer(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLKICKING(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Kicking Pattern (2-bar).
+
+    A marubozu followed by an opposite marubozu gapping away from it.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (white second candle), -100 (black second candle), or 0 (no pattern)
+    """
+    return _kicking(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLKICKINGBYLENGTH(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Kicking Pattern, bull/bear determined by the longer marubozu (2-bar).
+
+    A marubozu followed by an opposite marubozu gapping away from it.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (longer marubozu white), -100 (longer marubozu black), or 0 (no pattern)
+    """
+    return _kickingbylength(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLLADDERBOTTOM(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Ladder Bottom Pattern (5-bar bullish reversal).
+
+    Three black candles with lower opens and closes, a black candle with an
+    upper shadow, then a white candle opening above its body and closing above
+    its high.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (ladder bottom), or 0 (no pattern)
+    """
+    return _ladderbottom(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLLONGLEGGEDDOJI(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Long Legged Doji Pattern.
+
+    A doji with a long upper or lower shadow.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (long legged doji), or 0 (no pattern)
+    """
+    return _longleggeddoji(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLLONGLINE(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Long Line Candle Pattern.
+
+    A long body with short upper and lower shadows.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (white long line), -100 (black long line), or 0 (no pattern)
+    """
+    return _longline(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLMARUBOZU(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Marubozu Pattern.
+
+    A long body with very short upper and lower shadows.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (white marubozu), -100 (black marubozu), or 0 (no pattern)
+    """
+    return _marubozu(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLMATCHINGLOW(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Matching Low Pattern (2-bar bullish reversal).
+
+    Two black candles closing at the same price.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (matching low), or 0 (no pattern)
+    """
+    return _matchinglow(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLMATHOLD(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float = 0.5,
+) -> np.ndarray:
+    """
+    Mat Hold Pattern (5-bar bullish continuation).
+
+    1. First candle: Long white candle
+    2. Second to fourth candles: Small candles, the first black and gapping up,
+       falling while holding within the first body
+    3. Fifth candle: White candle opening above the fourth close and closing
+       above the reaction highs
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+        penetration: Fraction of the first candle's body the last close must reach into (default 0.5)
+
+    Returns:
+        Array with +100 (mat hold), or 0 (no pattern)
+    """
+    return _mathold(_CandleFeatures(open_arr, high, low, close), penetration)
+
+
+def CDLMORNINGDOJISTAR(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    penetration: float = 0.3,
+) -> np.ndarray:
+    """
+    Morning Doji Star Pattern (3-bar bullish reversal).
+
+    1. First candle: Long black candle
+    2. Second candle: Doji whose body gaps down
+    3. Third candle: White candle closing well into the first body
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+        penetration: Fraction of the first candle's body the last close must reach into (default 0.3)
+
+    Returns:
+        Array with +100 (morning doji star), or 0 (no pattern)
+    """
+    return _morningdojistar(_CandleFeatures(open_arr, high, low, close), penetration)
+
+
+def CDLONNECK(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    On-Neck Pattern (2-bar bearish continuation).
+
+    A long black candle followed by a white candle opening below its low and
+    closing at about that low.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with -100 (on-neck), or 0 (no pattern)
+    """
+    return _onneck(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLRICKSHAWMAN(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Rickshaw Man Pattern.
+
+    A long legged doji with long shadows on both sides and its body near the
+    middle of the range.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (rickshaw man), or 0 (no pattern)
+    """
+    return _rickshawman(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLRISEFALL3METHODS(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Rising/Falling Three Methods Pattern (5-bar continuation).
+
+    A long candle, three small counter-trend candles within its range, then a
+    long candle of the first color closing beyond the first close.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (rising three methods), -100 (falling three methods), or 0 (no pattern)
+    """
+    return _risefallthreemethods(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLSEPARATINGLINES(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Separating Lines Pattern (2-bar continuation).
+
+    A candle followed by an opposite long belt-hold opening at the same price.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (bullish separating lines), -100 (bearish separating lines), or 0 (no pattern)
+    """
+    return _separatinglines(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLSHORTLINE(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Short Line Candle Pattern.
+
+    A short body with short upper and lower shadows.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (white short line), -100 (black short line), or 0 (no pattern)
+    """
+    return _shortline(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLSPINNINGTOP(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Spinning Top Pattern.
+
+    A short body with both shadows longer than the body.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (white spinning top), -100 (black spinning top), or 0 (no pattern)
+    """
+    return _spinningtop(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLSTALLEDPATTERN(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Stalled Pattern (3-bar bearish reversal).
+
+    Two long white candles, the second opening within or near the first body,
+    followed by a small white candle riding on the second candle's shoulder.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with -100 (stalled pattern), or 0 (no pattern)
+    """
+    return _stalledpattern(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLSTICKSANDWICH(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Stick Sandwich Pattern (3-bar bullish reversal).
+
+    A black candle, a white candle trading above its close, and a black candle
+    closing at the same price as the first.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (stick sandwich), or 0 (no pattern)
+    """
+    return _sticksandwich(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLTAKURI(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Takuri Pattern (Dragonfly Doji with very long lower shadow).
+
+    A doji with a very short upper shadow and a very long lower shadow.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (takuri), or 0 (no pattern)
+    """
+    return _takuri(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLTASUKIGAP(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Tasuki Gap Pattern (3-bar continuation).
+
+    Two candles of the trend's color with a gap between their bodies, then an
+    opposite candle of similar size opening within the second body and closing
+    inside the gap.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (upside tasuki gap), -100 (downside tasuki gap), or 0 (no pattern)
+    """
+    return _tasukigap(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLTHRUSTING(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Thrusting Pattern (2-bar bearish continuation).
+
+    A long black candle followed by a white candle opening below its low and
+    closing into its body, but not above the body midpoint.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with -100 (thrusting), or 0 (no pattern)
+    """
+    return _thrusting(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLTRISTAR(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Tristar Pattern (3-bar reversal).
+
+    Three dojis, the second gapping away from the first and the third turning back.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (bullish tristar), -100 (bearish tristar), or 0 (no pattern)
+    """
+    return _tristar(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLUNIQUE3RIVER(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Unique 3 River Pattern (3-bar bullish reversal).
+
+    1. First candle: Long black candle
+    2. Second candle: Black harami with a lower low
+    3. Third candle: Small white candle opening above the second low
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (unique 3 river), or 0 (no pattern)
+    """
+    return _uniquethreeriver(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLUPSIDEGAP2CROWS(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Upside Gap Two Crows Pattern (3-bar bearish reversal).
+
+    1. First candle: Long white candle
+    2. Second candle: Small black candle whose body gaps up
+    3. Third candle: Black candle engulfing the second and closing above the
+       first close
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with -100 (upside gap two crows), or 0 (no pattern)
+    """
+    return _upsidegaptwocrows(_CandleFeatures(open_arr, high, low, close))
+
+
+def CDLXSIDEGAP3METHODS(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Upside/Downside Gap Three Methods Pattern (3-bar continuation).
+
+    Two candles of the trend's color with a gap between their bodies, then an
+    opposite candle opening within the second body and closing within the first,
+    filling the gap.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+
+    Returns:
+        Array with +100 (upside gap three methods), -100 (downside gap three methods), or 0 (no pattern)
+    """
+    return _xsidegapthreemethods(_CandleFeatures(open_arr, high, low, close))
+
+
+_PATTERNS: dict[str, Callable[[_CandleFeatures], np.ndarray]] = {
+    "CDLDOJI": _doji,
+    "CDLHAMMER": _hammer,
+    "CDLENGULFING": _engulfing,
+    "CDLSHOOTINGSTAR": _shootingstar,
+    "CDLHANGINGMAN": _hangingman,
+    "CDLHARAMI": _harami,
+    "CDLPIERCING": _piercing,
+    "CDLMORNINGSTAR": _morningstar,
+    "CDLEVENINGSTAR": _eveningstar,
+    "CDLDARKCLOUDCOVER": _darkcloudcover,
+    "CDL2CROWS": _twocrows,
+    "CDL3BLACKCROWS": _threeblackcrows,
+    "CDL3INSIDE": _threeinside,
+    "CDL3LINESTRIKE": _threelinestrike,
+    "CDL3OUTSIDE": _threeoutside,
+    "CDL3STARSINSOUTH": _threestarsinsouth,
+    "CDL3WHITESOLDIERS": _threewhitesoldiers,
+    "CDLABANDONEDBABY": _abandonedbaby,
+    "CDLADVANCEBLOCK": _advanceblock,
+    "CDLBELTHOLD": _belthold,
+    "CDLBREAKAWAY": _breakaway,
+    "CDLCLOSINGMARUBOZU": _closingmarubozu,
+    "CDLCONCEALBABYSWALL": _concealbabyswall,
+    "CDLCOUNTERATTACK": _counterattack,
+    "CDLDOJISTAR": _dojistar,
+    "CDLDRAGONFLYDOJI": _dragonflydoji,
+    "CDLEVENINGDOJISTAR": _eveningdojistar,
+    "CDLGAPSIDESIDEWHITE": _gapsidesidewhite,
+    "CDLGRAVESTONEDOJI": _gravestonedoji,
+    "CDLHARAMICROSS": _haramicross,
+    "CDLHIGHWAVE": _highwave,
+    "CDLHIKKAKE": _hikkake,
+    "CDLHIKKAKEMOD": _hikkakemod,
+    "CDLHOMINGPIGEON": _homingpigeon,
+    "CDLIDENTICAL3CROWS": _identicalthreecrows,
+    "CDLINNECK": _inneck,
+    "CDLINVERTEDHAMMER": _invertedhammer,
+    "CDLKICKING": _kicking,
+    "CDLKICKINGBYLENGTH": _kickingbylength,
+    "CDLLADDERBOTTOM": _ladderbottom,
+    "CDLLONGLEGGEDDOJI": _longleggeddoji,
+    "CDLLONGLINE": _longline,
+    "CDLMARUBOZU": _marubozu,
+    "CDLMATCHINGLOW": _matchinglow,
+    "CDLMATHOLD": _mathold,
+    "CDLMORNINGDOJISTAR": _morningdojistar,
+    "CDLONNECK": _onneck,
+    "CDLRICKSHAWMAN": _rickshawman,
+    "CDLRISEFALL3METHODS": _risefallthreemethods,
+    "CDLSEPARATINGLINES": _separatinglines,
+    "CDLSHORTLINE": _shortline,
+    "CDLSPINNINGTOP": _spinningtop,
+    "CDLSTALLEDPATTERN": _stalledpattern,
+    "CDLSTICKSANDWICH": _sticksandwich,
+    "CDLTAKURI": _takuri,
+    "CDLTASUKIGAP": _tasukigap,
+    "CDLTHRUSTING": _thrusting,
+    "CDLTRISTAR": _tristar,
+    "CDLUNIQUE3RIVER": _uniquethreeriver,
+    "CDLUPSIDEGAP2CROWS": _upsidegaptwocrows,
+    "CDLXSIDEGAP3METHODS": _xsidegapthreemethods,
+}
+
+
+def CDL_ALL(
+    open_arr: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    patterns: Optional[Iterable[str]] = None,
+) -> dict[str, np.ndarray]:
+    """
+    Evaluate candlestick patterns in one pass over shared features.
+
+    Body, range, shadow and direction arrays (and their shifted copies) are
+    computed once and reused by every pattern, which is cheaper than calling
+    each CDL* function separately when scanning many symbols.
+
+    Args:
+        open_arr: Array of opening prices
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of closing prices
+        patterns: Names of the patterns to evaluate (e.g. ["CDLDOJI", "CDLHAMMER"]);
+            all patterns if omitted
+
+    Returns:
+        Dict mapping each pattern name to its +100 / -100 / 0 array
+
+    Raises:
+        ValueError: If a pattern name is unknown
+    """
+    names = list(_PATTERNS) if patterns is None else list(patterns)
+    unknown = [name for name in names if name not in _PATTERNS]
+    if unknown:
+        raise ValueError(f"Unknown candlestick patterns: {', '.join(unknown)}")
+
+    features = _CandleFeatures(open_arr, high, low, close)
+    return {name: _PATTERNS[name](features) for name in names}
 
 
 __all__ = [
@@ -722,4 +2655,56 @@ __all__ = [
     "CDLMORNINGSTAR",
     "CDLEVENINGSTAR",
     "CDLDARKCLOUDCOVER",
+    "CDL2CROWS",
+    "CDL3BLACKCROWS",
+    "CDL3INSIDE",
+    "CDL3LINESTRIKE",
+    "CDL3OUTSIDE",
+    "CDL3STARSINSOUTH",
+    "CDL3WHITESOLDIERS",
+    "CDLABANDONEDBABY",
+    "CDLADVANCEBLOCK",
+    "CDLBELTHOLD",
+    "CDLBREAKAWAY",
+    "CDLCLOSINGMARUBOZU",
+    "CDLCONCEALBABYSWALL",
+    "CDLCOUNTERATTACK",
+    "CDLDOJISTAR",
+    "CDLDRAGONFLYDOJI",
+    "CDLEVENINGDOJISTAR",
+    "CDLGAPSIDESIDEWHITE",
+    "CDLGRAVESTONEDOJI",
+    "CDLHARAMICROSS",
+    "CDLHIGHWAVE",
+    "CDLHIKKAKE",
+    "CDLHIKKAKEMOD",
+    "CDLHOMINGPIGEON",
+    "CDLIDENTICAL3CROWS",
+    "CDLINNECK",
+    "CDLINVERTEDHAMMER",
+    "CDLKICKING",
+    "CDLKICKINGBYLENGTH",
+    "CDLLADDERBOTTOM",
+    "CDLLONGLEGGEDDOJI",
+    "CDLLONGLINE",
+    "CDLMARUBOZU",
+    "CDLMATCHINGLOW",
+    "CDLMATHOLD",
+    "CDLMORNINGDOJISTAR",
+    "CDLONNECK",
+    "CDLRICKSHAWMAN",
+    "CDLRISEFALL3METHODS",
+    "CDLSEPARATINGLINES",
+    "CDLSHORTLINE",
+    "CDLSPINNINGTOP",
+    "CDLSTALLEDPATTERN",
+    "CDLSTICKSANDWICH",
+    "CDLTAKURI",
+    "CDLTASUKIGAP",
+    "CDLTHRUSTING",
+    "CDLTRISTAR",
+    "CDLUNIQUE3RIVER",
+    "CDLUPSIDEGAP2CROWS",
+    "CDLXSIDEGAP3METHODS",
+    "CDL_ALL",
 ]
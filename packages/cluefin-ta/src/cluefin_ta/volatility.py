@@ -9,7 +9,7 @@ Functions:
 
 import numpy as np
 
-from cluefin_ta._core import true_range_loop, wilder_smooth
+from cluefin_ta import _core
 
 
 def TRANGE(
@@ -41,7 +41,7 @@ def TRANGE(
     if n < 2:
         return np.full(n, np.nan)
 
-    return true_range_loop(high, low, close)
+    return _core.true_range_loop(high, low, close)
 
 
 def ATR(
@@ -79,7 +79,7 @@ def ATR(
     initial_atr = np.mean(tr[1 : timeperiod + 1])
 
     # Apply Wilder's smoothing
-    return wilder_smooth(tr, timeperiod, initial_atr, timeperiod)
+    return _core.wilder_smooth(tr, timeperiod, initial_atr, timeperiod)
 
 
 def NATR(
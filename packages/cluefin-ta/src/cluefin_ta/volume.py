@@ -9,7 +9,7 @@ Functions:
 
 import numpy as np
 
-from cluefin_ta._core import ad_loop, obv_loop
+from cluefin_ta import _core
 
 
 def OBV(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
@@ -36,7 +36,7 @@ def OBV(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
             result[0] = volume[0]
         return result
 
-    return obv_loop(close, volume)
+    return _core.obv_loop(close, volume)
 
 
 def AD(
@@ -70,7 +70,7 @@ def AD(
     if n < 1:
         return np.zeros(n, dtype=np.float64)
 
-    return ad_loop(high, low, close, volume)
+    return _core.ad_loop(high, low, close, volume)
 
 
 def ADOSC(
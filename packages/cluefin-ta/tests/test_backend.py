@@ -0,0 +1,152 @@
+"""
+Tests for kernel backend selection and the Numba-compiled kernels.
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import cluefin_ta
+from cluefin_ta import _core
+from cluefin_ta._core import numpy_impl
+
+requires_numba = pytest.mark.skipif("numba" not in _core.available_backends(), reason="Numba is not installed")
+
+
+@pytest.fixture
+def restore_backend():
+    """Restore the backend active before the test."""
+    backend = cluefin_ta.get_backend()
+    yield
+    cluefin_ta.set_backend(backend)
+
+
+@pytest.fixture
+def krw_ohlcv():
+    """Long OHLCV series at KRW price levels, with flat bars and zero ranges."""
+    rng = np.random.default_rng(7)
+    n = 5000
+    close = np.round(70000 * np.cumprod(1 + rng.standard_normal(n) * 0.02), -1)
+    close[100:110] = close[99]
+    high = close + np.round(np.abs(rng.standard_normal(n)) * 500, -1)
+    low = close - np.round(np.abs(rng.standard_normal(n)) * 500, -1)
+    high[200:205] = low[200:205] = close[200:205]
+    volume = rng.integers(1, 1_000_000, n).astype(np.float64)
+    return {"high": high, "low": low, "close": close, "volume": volume}
+
+
+class TestBackendSelection:
+    """Tests for set_backend / get_backend."""
+
+    def test_numpy_backend_uses_reference_kernels(self, restore_backend):
+        cluefin_ta.set_backend("numpy")
+
+        assert cluefin_ta.get_backend() == "numpy"
+        assert _core.ema_loop is numpy_impl.ema_loop
+        assert _core.kama_loop is numpy_impl.kama_loop
+
+    def test_auto_prefers_numba_when_installed(self, restore_backend):
+        cluefin_ta.set_backend("auto")
+
+        expected = "numba" if "numba" in _core.available_backends() else "numpy"
+        assert cluefin_ta.get_backend() == expected
+        assert cluefin_ta.available_backends()[-1] == expected
+
+    def test_unknown_backend_raises(self, restore_backend):
+        with pytest.raises(ValueError):
+            cluefin_ta.set_backend("cython")
+
+    @pytest.mark.skipif("numba" in _core.available_backends(), reason="Numba is installed")
+    def test_numba_backend_without_numba_raises(self, restore_backend):
+        with pytest.raises(ImportError):
+            cluefin_ta.set_backend("numba")
+
+    def test_numpy_backend_does_not_import_numba(self):
+        code = "import sys, cluefin_ta; print(cluefin_ta.get_backend(), 'numba' in sys.modules)"
+        env = {**os.environ, "CLUEFIN_TA_BACKEND": "numpy"}
+
+        result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+
+        assert result.stdout.split() == ["numpy", "False"]
+
+    @requires_numba
+    def test_numba_backend_replaces_sequential_kernels_only(self, restore_backend):
+        cluefin_ta.set_backend("numba")
+
+        assert _core.ema_loop is _core.numba_impl.ema_loop
+        assert _core.dx_loop is _core.numba_impl.dx_loop
+        # Already vectorized kernels stay on NumPy.
+        assert _core.rolling_std is numpy_impl.rolling_std
+        assert _core.true_range_loop is numpy_impl.true_range_loop
+
+
+@requires_numba
+class TestNumbaKernels:
+    """Compiled kernels must match the NumPy reference bit for bit."""
+
+    @pytest.mark.parametrize("period", [2, 14, 30])
+    def test_kernels_match_reference(self, krw_ohlcv, period):
+        high, low, close, volume = krw_ohlcv["high"], krw_ohlcv["low"], krw_ohlcv["close"], krw_ohlcv["volume"]
+        prev_close = np.concatenate(([np.nan], close[:-1]))
+        typical = (high + low + close) / 3.0
+        cases = {
+            "ema_loop": (close, period, 2.0 / (period + 1), np.mean(close[:period])),
+            "wilder_smooth": (close, period, np.mean(close[:period]), period - 1),
+            "rolling_minmax": (high, low, period),
+            "obv_loop": (close, volume),
+            "ad_loop": (high, low, close, volume),
+            "kama_loop": (close, period, 2.0 / 3, 2.0 / 31),
+            "dx_loop": (high, low, prev_close, period),
+            "mfi_loop": (typical, volume, period),
+        }
+
+        for name, args in cases.items():
+            expected = getattr(numpy_impl, name)(*args)
+            actual = getattr(_core.numba_impl, name)(*args)
+            if isinstance(expected, tuple):
+                for expected_part, actual_part in zip(expected, actual, strict=True):
+                    np.testing.assert_array_equal(actual_part, expected_part, err_msg=name)
+            else:
+                np.testing.assert_array_equal(actual, expected, err_msg=name)
+
+    def test_indicators_match_across_backends(self, krw_ohlcv, restore_backend):
+        high, low, close, volume = krw_ohlcv["high"], krw_ohlcv["low"], krw_ohlcv["close"], krw_ohlcv["volume"]
+        indicators = {
+            "EMA": lambda: cluefin_ta.EMA(close, 20),
+            "KAMA": lambda: cluefin_ta.KAMA(close, 10),
+            "RSI": lambda: cluefin_ta.RSI(close, 14),
+            "ATR": lambda: cluefin_ta.ATR(high, low, close, 14),
+            "ADX": lambda: cluefin_ta.ADX(high, low, close, 14),
+            "MFI": lambda: cluefin_ta.MFI(high, low, close, volume, 14),
+            "STOCH": lambda: cluefin_ta.STOCH(high, low, close),
+            "OBV": lambda: cluefin_ta.OBV(close, volume),
+            "AD": lambda: cluefin_ta.AD(high, low, close, volume),
+        }
+
+        cluefin_ta.set_backend("numpy")
+        expected = {name: indicator() for name, indicator in indicators.items()}
+        cluefin_ta.set_backend("numba")
+
+        for name, indicator in indicators.items():
+            np.testing.assert_array_equal(np.asarray(indicator()), np.asarray(expected[name]), err_msg=name)
+
+    def test_rolling_minmax_nan_windows_match_reference(self):
+        high = np.arange(30, dtype=np.float64)
+        high[[5, 17]] = np.nan
+        low = high - 1.0
+
+        for expected, actual in zip(
+            numpy_impl.rolling_minmax(high, low, 4), _core.numba_impl.rolling_minmax(high, low, 4), strict=True
+        ):
+            np.testing.assert_array_equal(actual, expected)
+
+    def test_short_inputs_return_nan(self):
+        close = np.array([1.0, 2.0])
+
+        assert np.isnan(_core.numba_impl.ema_loop(close, 5, 1 / 3, 1.0)).all()
+        assert np.isnan(_core.numba_impl.wilder_smooth(close, 5, 1.0, 4)).all()
+        assert np.isnan(_core.numba_impl.kama_loop(close, 5, 2 / 3, 2 / 31)).all()
+        assert _core.numba_impl.obv_loop(close[:0], close[:0]).shape == (0,)
@@ -3,8 +3,13 @@ Tests for candlestick pattern recognition.
 """
 
 import numpy as np
+import pytest
 
+import cluefin_ta
 from cluefin_ta import (
+    CDL3STARSINSOUTH,
+    CDL_ALL,
+    CDLABANDONEDBABY,
     CDLDARKCLOUDCOVER,
     CDLDOJI,
     CDLENGULFING,
@@ -12,11 +17,36 @@ from cluefin_ta import (
     CDLHAMMER,
     CDLHANGINGMAN,
     CDLHARAMI,
+    CDLHIKKAKE,
+    CDLMARUBOZU,
     CDLMORNINGSTAR,
     CDLPIERCING,
     CDLSHOOTINGSTAR,
 )
 
+# Ten quiet candles (body 1, range 2) that set TA-Lib's candle-setting averages.
+CONTEXT = [(100.0, 101.5, 99.5, 101.0)] * 10
+
+TALIB_PATTERNS = cluefin_ta.pattern.__all__[cluefin_ta.pattern.__all__.index("CDL2CROWS") : -1]
+
+
+def _candles(rows):
+    """Split (open, high, low, close) rows after the context candles into arrays."""
+    return tuple(np.array(column) for column in zip(*(CONTEXT + rows), strict=True))
+
+
+@pytest.fixture
+def tick_ohlcv():
+    """Long OHLC series rounded to a price tick, so bodies and shadows hit the settings' boundaries."""
+    rng = np.random.default_rng(3)
+    n = 5000
+    close = np.round(100 * np.cumprod(1 + rng.standard_normal(n) * 0.02), 1)
+    open_arr = np.round(np.concatenate(([close[0]], close[:-1])) * (1 + rng.standard_normal(n) * 0.01), 1)
+    wick = rng.choice([0.0, 0.002, 0.01], n)
+    high = np.round(np.maximum(open_arr, close) * (1 + np.abs(rng.standard_normal(n)) * wick), 1)
+    low = np.round(np.minimum(open_arr, close) * (1 - np.abs(rng.standard_normal(n)) * wick), 1)
+    return open_arr, high, low, close
+
 
 class TestCDLDOJI:
     """Tests for Doji pattern."""
@@ -529,3 +559,147 @@ class TestCDLDARKCLOUDCOVER:
 
         result = CDLDARKCLOUDCOVER(open_arr, high, low, close)
         assert result[0] == 0
+
+
+class TestCDLALL:
+    """Tests for evaluating every pattern over shared features."""
+
+    def test_cdl_all_matches_individual_functions(self, sample_ohlcv):
+        """Verify CDL_ALL returns exactly what each CDL* function returns."""
+        args = (sample_ohlcv["open"], sample_ohlcv["high"], sample_ohlcv["low"], sample_ohlcv["close"])
+
+        results = CDL_ALL(*args)
+
+        assert list(results) == [name for name in cluefin_ta.pattern.__all__ if name != "CDL_ALL"]
+        for name, result in results.items():
+            np.testing.assert_array_equal(result, getattr(cluefin_ta, name)(*args), err_msg=name)
+            assert result.dtype == np.int32
+
+    def test_cdl_all_subset(self):
+        """Test evaluating selected patterns only."""
+        open_arr = np.array([110.0, 98.0, 99.0])
+        high = np.array([111.0, 99.0, 108.0])
+        low = np.array([99.0, 97.0, 98.0])
+        close = np.array([100.0, 98.5, 107.0])
+
+        results = CDL_ALL(open_arr, high, low, close, patterns=["CDLMORNINGSTAR", "CDLDOJI"])
+
+        assert list(results) == ["CDLMORNINGSTAR", "CDLDOJI"]
+        assert results["CDLMORNINGSTAR"].tolist() == [0, 0, 100]
+
+    def test_cdl_all_unknown_pattern(self):
+        """Test that unknown pattern names are rejected."""
+        with pytest.raises(ValueError):
+            CDL_ALL(np.ones(3), np.ones(3), np.ones(3), np.ones(3), patterns=["CDLNOPE"])
+
+    def test_cdl_all_empty_input(self):
+        """Test empty arrays produce empty results."""
+        empty = np.array([], dtype=np.float64)
+
+        results = CDL_ALL(empty, empty, empty, empty)
+
+        assert all(len(result) == 0 for result in results.values())
+
+
+class TestTALibPatterns:
+    """Tests for the patterns following TA-Lib's candle settings."""
+
+    @pytest.mark.parametrize("name", TALIB_PATTERNS)
+    def test_matches_talib(self, tick_ohlcv, name):
+        """Verify each pattern matches ta-lib output."""
+        talib = pytest.importorskip("talib")
+
+        expected = getattr(talib, name)(*tick_ohlcv)
+        actual = getattr(cluefin_ta, name)(*tick_ohlcv)
+
+        np.testing.assert_array_equal(actual, expected)
+
+    @pytest.mark.parametrize(
+        ("name", "rows", "expected"),
+        [
+            (
+                "CDL3WHITESOLDIERS",
+                [(101.0, 104.1, 100.8, 104.0), (103.0, 106.1, 102.9, 106.0), (105.5, 108.6, 105.4, 108.5)],
+                [0, 0, 100],
+            ),
+            (
+                "CDL3BLACKCROWS",
+                [
+                    (106.0, 110.0, 105.9, 109.0),
+                    (108.5, 108.6, 105.4, 105.5),
+                    (106.0, 106.1, 102.9, 103.0),
+                    (103.5, 103.6, 100.4, 100.5),
+                ],
+                [0, 0, 0, -100],
+            ),
+            ("CDLMARUBOZU", [(100.0, 104.0, 100.0, 104.0), (104.0, 104.0, 100.0, 100.0)], [100, -100]),
+            ("CDLSPINNINGTOP", [(100.0, 101.0, 99.0, 100.2)], [100]),
+            ("CDLKICKING", [(104.0, 104.0, 100.0, 100.0), (105.0, 109.0, 105.0, 109.0)], [0, 100]),
+            ("CDLKICKINGBYLENGTH", [(106.0, 106.0, 100.0, 100.0), (107.0, 109.0, 107.0, 109.0)], [0, -100]),
+            (
+                "CDLTASUKIGAP",
+                [(100.0, 101.1, 99.9, 101.0), (102.0, 104.1, 101.9, 104.0), (103.5, 103.6, 101.4, 101.5)],
+                [0, 0, 100],
+            ),
+            (
+                "CDLABANDONEDBABY",
+                [(106.0, 106.1, 100.9, 101.0), (99.0, 99.5, 98.5, 99.0), (100.0, 104.2, 99.8, 104.0)],
+                [0, 0, 100],
+            ),
+            (
+                "CDL3STARSINSOUTH",
+                [(110.0, 110.0, 99.0, 105.0), (108.0, 108.5, 102.0, 106.0), (104.0, 104.1, 103.4, 103.5)],
+                [0, 0, 100],
+            ),
+            (
+                "CDLHARAMICROSS",
+                [(100.0, 106.5, 99.5, 106.0), (106.0, 106.2, 105.6, 106.0)],
+                [0, -80],
+            ),
+        ],
+    )
+    def test_constructed_patterns(self, name, rows, expected):
+        """Test detection on hand-built candles after a quiet context."""
+        result = getattr(cluefin_ta, name)(*_candles(rows))
+
+        assert result[len(CONTEXT) :].tolist() == expected
+
+    def test_hikkake_confirmation(self):
+        """Test that a close above the inside bar's high confirms a bullish hikkake with +200."""
+        rows = [
+            (100.0, 105.0, 95.0, 101.0),
+            (100.0, 103.0, 97.0, 101.0),  # Inside bar
+            (99.0, 102.0, 96.0, 98.0),  # False breakdown: lower high and lower low
+            (99.0, 102.5, 98.0, 102.0),  # Not yet above the inside bar's high
+            (99.0, 104.0, 98.0, 103.5),  # Confirmation
+            (103.0, 106.0, 102.0, 105.0),  # Already confirmed
+        ]
+
+        result = CDLHIKKAKE(*_candles(rows))
+
+        assert result[len(CONTEXT) :].tolist() == [0, 0, 100, 0, 200, 0]
+
+    def test_penetration_parameter(self):
+        """Test that a deeper required penetration rejects the abandoned baby."""
+        rows = [(106.0, 106.1, 100.9, 101.0), (99.0, 99.5, 98.5, 99.0), (100.0, 104.2, 99.8, 104.0)]
+
+        assert CDLABANDONEDBABY(*_candles(rows))[-1] == 100
+        assert CDLABANDONEDBABY(*_candles(rows), penetration=0.7)[-1] == 0
+
+    def test_warmup_is_zero(self):
+        """Test that candles within TA-Lib's lookback never signal."""
+        open_arr, high, low, close = _candles(CONTEXT[:5])
+        # The same white marubozu inside the 10-candle lookback and after it
+        for index in (5, 12):
+            open_arr[index], high[index], low[index], close[index] = 100.0, 104.0, 100.0, 104.0
+
+        result = CDLMARUBOZU(open_arr, high, low, close)
+
+        assert result[5] == 0
+        assert result[12] == 100
+
+    def test_short_input(self):
+        """Test inputs shorter than the lookback return zeros."""
+        result = CDL3STARSINSOUTH(np.ones(5), np.ones(5) * 2, np.zeros(5), np.ones(5))
+
+        assert result.tolist() == [0] * 5
@@ -0,0 +1,128 @@
+"""
+Tests for the O(n) sliding-window kernels.
+"""
+
+import numpy as np
+import pytest
+from numpy.lib.stride_tricks import sliding_window_view
+
+from cluefin_ta._core import window
+
+PERIODS = [1, 2, 3, 7, 16, 50]
+
+
+@pytest.fixture
+def tied_prices():
+    """KRW-level prices on a coarse tick grid, so windows hold ties."""
+    rng = np.random.default_rng(11)
+    return 1e8 + rng.integers(0, 20, 503).astype(np.float64) * 10
+
+
+def _brute(data, period, reduce):
+    expected = np.full(len(data), np.nan)
+    expected[period - 1 :] = reduce(sliding_window_view(data, period))
+    return expected
+
+
+class TestRollingAggregates:
+    """Kernels against brute-force reductions over every window."""
+
+    @pytest.mark.parametrize("period", PERIODS)
+    def test_sum_mean_var(self, tied_prices, period):
+        np.testing.assert_allclose(
+            window.rolling_sum(tied_prices, period), _brute(tied_prices, period, lambda w: w.sum(axis=1)), rtol=1e-13
+        )
+        np.testing.assert_allclose(
+            window.rolling_mean(tied_prices, period), _brute(tied_prices, period, lambda w: w.mean(axis=1)), rtol=1e-13
+        )
+        np.testing.assert_allclose(
+            window.rolling_var(tied_prices, period),
+            _brute(tied_prices, period, lambda w: w.var(axis=1)),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+    @pytest.mark.parametrize("period", PERIODS)
+    def test_weighted_sum(self, tied_prices, period):
+        weights = np.arange(1, period + 1)
+        expected = _brute(tied_prices, period, lambda w: (w * weights).sum(axis=1))
+
+        np.testing.assert_allclose(window.rolling_weighted_sum(tied_prices, period), expected, rtol=1e-13)
+
+    @pytest.mark.parametrize("period", PERIODS)
+    def test_min_max_are_exact(self, tied_prices, period):
+        np.testing.assert_array_equal(
+            window.rolling_max(tied_prices, period), _brute(tied_prices, period, lambda w: w.max(axis=1))
+        )
+        np.testing.assert_array_equal(
+            window.rolling_min(tied_prices, period), _brute(tied_prices, period, lambda w: w.min(axis=1))
+        )
+
+    @pytest.mark.parametrize("period", PERIODS)
+    def test_arg_extremes_prefer_most_recent_tie(self, tied_prices, period):
+        starts = np.arange(len(tied_prices) - period + 1)
+        windows = sliding_window_view(tied_prices, period)
+        expected_max = np.full(len(tied_prices), np.nan)
+        expected_min = np.full(len(tied_prices), np.nan)
+        expected_max[period - 1 :] = starts + period - 1 - np.argmax(windows[:, ::-1], axis=1)
+        expected_min[period - 1 :] = starts + period - 1 - np.argmin(windows[:, ::-1], axis=1)
+
+        np.testing.assert_array_equal(window.rolling_argmax(tied_prices, period), expected_max)
+        np.testing.assert_array_equal(window.rolling_argmin(tied_prices, period), expected_min)
+
+    @pytest.mark.parametrize("q", [0, 30, 50, 100])
+    def test_percentile(self, tied_prices, q):
+        expected = _brute(tied_prices, 20, lambda w: np.percentile(w, q, axis=1))
+
+        np.testing.assert_allclose(window.rolling_percentile(tied_prices, 20, q), expected, rtol=1e-15)
+
+
+class TestWindowEdgeCases:
+    """Short inputs, invalid arguments, NaN handling and precision."""
+
+    def test_short_input_is_all_nan(self):
+        for kernel in (window.rolling_sum, window.rolling_var, window.rolling_max, window.rolling_argmax):
+            assert np.isnan(kernel(np.array([1.0, 2.0]), 3)).all()
+
+    def test_invalid_arguments_raise(self):
+        with pytest.raises(ValueError):
+            window.rolling_sum(np.ones(5), 0)
+        with pytest.raises(ValueError):
+            window.rolling_percentile(np.ones(5), 2, 101)
+
+    def test_nan_only_affects_windows_containing_it(self):
+        data = np.arange(40, dtype=np.float64)
+        data[10] = np.nan
+
+        for kernel in (
+            window.rolling_sum,
+            window.rolling_var,
+            window.rolling_weighted_sum,
+            window.rolling_max,
+            window.rolling_min,
+            window.rolling_argmax,
+            window.rolling_argmin,
+        ):
+            result = kernel(data, 4)
+            assert not np.isnan(result[3:10]).any(), kernel.__name__
+            assert np.isnan(result[10:14]).all(), kernel.__name__
+            assert not np.isnan(result[14:]).any(), kernel.__name__
+
+    def test_arg_extremes_ignore_nan_outside_the_window(self):
+        data = np.array([1.0, 2.0, np.nan, 1.0, 2.0, 3.0, 4.0])
+
+        np.testing.assert_array_equal(
+            window.rolling_argmax(data, 3), [np.nan, np.nan, np.nan, np.nan, np.nan, 5.0, 6.0]
+        )
+        np.testing.assert_array_equal(
+            window.rolling_argmin(data, 3), [np.nan, np.nan, np.nan, np.nan, np.nan, 3.0, 4.0]
+        )
+
+    def test_variance_keeps_precision_at_large_price_levels(self):
+        rng = np.random.default_rng(5)
+        data = 1e9 + rng.standard_normal(50_000) * 0.01
+        expected = sliding_window_view(data, 20).std(axis=1)
+
+        result = np.sqrt(window.rolling_var(data, 20))[19:]
+
+        np.testing.assert_allclose(result, expected, rtol=1e-6)